@@ -1,4 +1,8 @@
 import os
+import io
+import mmap
+import pickle
+import hashlib
 from xml.etree import ElementTree
 from .errors import ParseError
 from .errors import Error
@@ -7,6 +11,7 @@ from . import can
 from . import diagnostics
 import textparser
 import diskcache
+from ..version import __version__
 
 # Remove once less users are using the old package structure.
 from .can import *
@@ -73,21 +78,44 @@ def _load_file_cache(filename,
                      encoding,
                      frame_id_mask,
                      strict,
-                     cache_dir):
+                     cache_dir,
+                     cache_size_limit,
+                     lazy):
     with open(filename, 'rb') as fin:
-        key = fin.read()
+        key = hashlib.sha256(fin.read()).hexdigest()
+
+    key = (key,
+           __version__,
+           database_format,
+           encoding,
+           frame_id_mask,
+           strict,
+           lazy)
+
+    if cache_size_limit is None:
+        settings = {}
+    else:
+        settings = {'size_limit': cache_size_limit}
+
+    with diskcache.Cache(cache_dir, **settings) as cache:
+        fin = cache.get(key, read=True)
 
-    cache = diskcache.Cache(cache_dir)
+        if fin is not None:
+            with fin:
+                with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return pickle.loads(data)
 
-    try:
-        return cache[key]
-    except KeyError:
         with fopen(filename, 'r', encoding=encoding) as fin:
             database = load(fin,
                             database_format,
                             frame_id_mask,
-                            strict)
-        cache[key] = database
+                            strict,
+                            lazy)
+
+        # The pickled database includes the codecs of all messages.
+        cache.set(key,
+                  io.BytesIO(pickle.dumps(database, pickle.HIGHEST_PROTOCOL)),
+                  read=True)
 
         return database
 
@@ -97,7 +125,9 @@ def load_file(filename,
               encoding=None,
               frame_id_mask=None,
               strict=True,
-              cache_dir=None):
+              cache_dir=None,
+              cache_size_limit=None,
+              lazy=False):
     """Open, read and parse given database file and return a
     :class:`can.Database<.can.Database>` or
     :class:`diagnostics.Database<.diagnostics.Database>` object with
@@ -147,11 +177,17 @@ def load_file(filename,
 
     `cache_dir` specifies the database cache location in the file
     system. Give as ``None`` to disable the cache. By default the
-    cache is disabled. The cache key is the contents of given
-    file. Using a cache will significantly reduce the load time when
-    reloading the same file. The cache directory is automatically
-    created if it does not exist. Remove the cache directory
-    `cache_dir` to clear the cache.
+    cache is disabled. The cache key is a hash of the contents of
+    given file, the cantools version and the load options. Using a
+    cache will significantly reduce the load time when reloading the
+    same file. The cache directory is automatically created if it does
+    not exist. Remove the cache directory `cache_dir` to clear the
+    cache.
+
+    `cache_size_limit` is the approximate maximum size of the cache in
+    bytes. Least recently stored databases are evicted when the limit
+    is exceeded. If ``None``, the limit of an existing cache is kept,
+    and is 1 GB for new caches.
 
     See :func:`~cantools.database.load_string()` for descriptions of
     other arguments.
@@ -177,14 +213,17 @@ def load_file(filename,
             return load(fin,
                         database_format,
                         frame_id_mask,
-                        strict)
+                        strict,
+                        lazy)
     else:
         return _load_file_cache(filename,
                                 database_format,
                                 encoding,
                                 frame_id_mask,
                                 strict,
-                                cache_dir)
+                                cache_dir,
+                                cache_size_limit,
+                                lazy)
 
 
 def dump_file(database,
@@ -228,7 +267,8 @@ def dump_file(database,
 def load(fp,
          database_format=None,
          frame_id_mask=None,
-         strict=True):
+         strict=True,
+         lazy=False):
     """Read and parse given database file-like object and return a
     :class:`can.Database<.can.Database>` or
     :class:`diagnostics.Database<.diagnostics.Database>` object with
@@ -252,13 +292,15 @@ def load(fp,
     return load_string(fp.read(),
                        database_format,
                        frame_id_mask,
-                       strict)
+                       strict,
+                       lazy)
 
 
 def load_string(string,
                 database_format=None,
                 frame_id_mask=None,
-                strict=True):
+                strict=True,
+                lazy=False):
     """Parse given database string and return a
     :class:`can.Database<.can.Database>` or
     :class:`diagnostics.Database<.diagnostics.Database>` object with
@@ -269,7 +311,7 @@ def load_string(string,
     format.
 
     See :class:`can.Database<.can.Database>` for a description of
-    `strict`.
+    `strict` and `lazy`.
 
     Raises an
     :class:`~cantools.database.UnsupportedDatabaseFormatError`
@@ -296,7 +338,8 @@ def load_string(string,
 
     def load_can_database(fmt):
         db = can.Database(frame_id_mask=frame_id_mask,
-                          strict=strict)
+                          strict=strict,
+                          lazy=lazy)
 
         if fmt == 'arxml':
             db.add_arxml_string(string)
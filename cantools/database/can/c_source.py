@@ -67,7 +67,7 @@ extern "C" {{
 
 {structs}
 {declarations}
-
+{dispatch_declarations}
 #ifdef __cplusplus
 }}
 #endif
@@ -115,6 +115,7 @@ SOURCE_FMT = '''\
 
 {helpers}\
 {definitions}\
+{dispatch_definitions}\
 '''
 
 FUZZER_SOURCE_FMT = '''\
@@ -574,6 +575,124 @@ int {database_name}_{message_name}_unpack(
 }}
 '''
 
+DISPATCH_DECLARATIONS_FMT = '''\
+/**
+ * Frame id, length, extended flag and cycle time of a message. The
+ * cycle time is zero(0) if not given in the database.
+ */
+struct {database_name}_message_descriptor_t {{
+    uint32_t frame_id;
+    uint8_t length;
+    bool is_extended;
+    uint32_t cycle_time_ms;
+}};
+
+/**
+ * Storage for any message in the database.
+ */
+union {database_name}_message_t {{
+{union_members}
+}};
+
+/* Number of messages in the database. */
+#define {database_name_upper}_MESSAGES_LENGTH ({messages_length}u)
+
+/**
+ * Message descriptors sorted by frame id.
+ */
+extern const struct {database_name}_message_descriptor_t
+{database_name}_message_descriptors[{database_name_upper}_MESSAGES_LENGTH];
+
+/**
+ * Find the descriptor of the message with given frame id using a
+ * binary search in the descriptors table.
+ *
+ * @param[in] frame_id Frame id of the message.
+ *
+ * @return Message descriptor, or NULL if not found.
+ */
+const struct {database_name}_message_descriptor_t *
+{database_name}_message_descriptor_by_frame_id(uint32_t frame_id);
+
+/**
+ * Unpack the message with given frame id.
+ *
+ * @param[in] frame_id Frame id of the message.
+ * @param[out] dst_p Object to unpack the message into.
+ * @param[in] src_p Message to unpack.
+{size_parameter_comment}\
+ *
+ * @return zero(0) or negative error code.
+ */
+int {database_name}_unpack_by_frame_id(
+    uint32_t frame_id,
+    union {database_name}_message_t *dst_p,
+{size_parameter_declaration});
+'''
+
+DISPATCH_DEFINITIONS_FMT = '''
+const struct {database_name}_message_descriptor_t
+{database_name}_message_descriptors[{database_name_upper}_MESSAGES_LENGTH] = {{
+{descriptors}
+}};
+
+const struct {database_name}_message_descriptor_t *
+{database_name}_message_descriptor_by_frame_id(uint32_t frame_id)
+{{
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    low = 0;
+    high = {database_name_upper}_MESSAGES_LENGTH;
+
+    while (low < high) {{
+        middle = (low + ((high - low) / 2u));
+
+        if ({database_name}_message_descriptors[middle].frame_id < frame_id) {{
+            low = (middle + 1u);
+        }} else {{
+            high = middle;
+        }}
+    }}
+
+    if ((low < {database_name_upper}_MESSAGES_LENGTH)
+        && ({database_name}_message_descriptors[low].frame_id == frame_id)) {{
+        return (&{database_name}_message_descriptors[low]);
+    }}
+
+    return (NULL);
+}}
+
+int {database_name}_unpack_by_frame_id(
+    uint32_t frame_id,
+    union {database_name}_message_t *dst_p,
+{size_parameter_declaration})
+{{
+{dispatch_unused}\
+    switch (frame_id) {{
+
+{dispatch_cases}
+    default:
+        break;
+    }}
+
+    return (-EINVAL);
+}}
+'''
+
+DISPATCH_CASE_FMT = '''\
+    case {frame_id_define}:
+        return ({database_name}_{message_name}_unpack(
+                    &dst_p->{message_name},
+                    {arguments}));
+'''
+
+DISPATCH_EMPTY_CASE_FMT = '''\
+    case {frame_id_define}:
+        return (0);
+'''
+
 SIGN_EXTENSION_FMT = '''
     if (({name} & (1{suffix} << {shift})) != 0{suffix}) {{
         {name} |= 0x{mask:x}{suffix};
@@ -1152,6 +1271,17 @@ def _format_unpack_code_signal(message,
         body_lines.append(line)
         helper_kinds.add((shift_direction, signal.type_length))
 
+    if signal.is_signed and not signal.is_float:
+        mask = ((1 << (signal.type_length - signal.length)) - 1)
+
+        if mask != 0:
+            mask <<= signal.length
+            formatted = SIGN_EXTENSION_FMT.format(name=signal.snake_name,
+                                                  shift=signal.length - 1,
+                                                  mask=mask,
+                                                  suffix=signal.conversion_type_suffix)
+            body_lines.extend(formatted.splitlines())
+
     if signal.is_float:
         conversion = '    memcpy(&dst_p->{0}, &{0}, sizeof(dst_p->{0}));'.format(signal.snake_name)
     elif signal.as_float:
@@ -1169,16 +1299,6 @@ def _format_unpack_code_signal(message,
         else:
             conversion = f'    dst_p->{signal.snake_name} = {message.parent}_{message.snake_name}_{signal.snake_name}_decode(({signal.type_name}){signal.snake_name});'
     elif signal.is_signed:
-        mask = ((1 << (signal.type_length - signal.length)) - 1)
-
-        if mask != 0:
-            mask <<= signal.length
-            formatted = SIGN_EXTENSION_FMT.format(name=signal.snake_name,
-                                                  shift=signal.length - 1,
-                                                  mask=mask,
-                                                  suffix=signal.conversion_type_suffix)
-            body_lines.extend(formatted.splitlines())
-
         conversion = '    dst_p->{0} = (int{1}_t){0};'.format(signal.snake_name,
                                                               signal.type_length)
     else:
@@ -1613,6 +1733,98 @@ def _generate_definitions(database_name, messages, args):
     return '\n'.join(definitions), (pack_helper_kinds, unpack_helper_kinds)
 
 
+def _generate_dispatch(database_name, messages, args):
+    """Generate the message descriptors table and the frame id
+    dispatcher declarations and definitions. Nothing is generated
+    for a database without messages, as C does not allow empty arrays
+    and unions.
+
+    """
+
+    if not messages:
+        return '', ''
+
+    union_members = []
+    descriptors = []
+    cases = []
+    dispatched_frame_ids = set()
+
+    for message in messages:
+        union_members.append('    struct {}_{}_t {};'.format(
+            database_name,
+            message.snake_name,
+            message.snake_name))
+
+    for message in sorted(messages, key=lambda message: message.frame_id):
+        frame_id_define = '{}_{}_FRAME_ID'.format(database_name.upper(),
+                                                  message.snake_name.upper())
+        descriptors.append('    {{ {}, {}u, {}, {}u }}'.format(
+            frame_id_define,
+            message.length,
+            'true' if message.is_extended_frame else 'false',
+            _get(message.cycle_time, 0)))
+
+        if not message.has_receivers:
+            continue
+
+        # Messages sharing a frame id are only dispatched to the first
+        # one, as duplicated cases are not allowed in a switch.
+        if message.frame_id in dispatched_frame_ids:
+            continue
+
+        dispatched_frame_ids.add(message.frame_id)
+
+        if message.length == 0:
+            case = DISPATCH_EMPTY_CASE_FMT.format(
+                frame_id_define=frame_id_define)
+        else:
+            if args.no_size_and_memset:
+                arguments = 'src_p'
+            else:
+                arguments = 'src_p,\n                    size'
+
+            case = DISPATCH_CASE_FMT.format(database_name=database_name,
+                                            message_name=message.snake_name,
+                                            frame_id_define=frame_id_define,
+                                            arguments=arguments)
+
+        cases.append(case)
+
+    if args.no_size_and_memset:
+        size_parameter_comment = ''
+        size_parameter_declaration = '    const uint8_t *src_p'
+    else:
+        size_parameter_comment = ' * @param[in] size Size of src_p.\n'
+        size_parameter_declaration = '    const uint8_t *src_p,\n    size_t size'
+
+    dispatch_unused = ''
+
+    if not cases:
+        dispatch_unused = '    (void)dst_p;\n    (void)src_p;\n'
+
+        if not args.no_size_and_memset:
+            dispatch_unused += '    (void)size;\n'
+
+        dispatch_unused += '\n'
+
+    declarations = DISPATCH_DECLARATIONS_FMT.format(
+        database_name=database_name,
+        database_name_upper=database_name.upper(),
+        messages_length=len(messages),
+        union_members='\n'.join(union_members),
+        size_parameter_comment=size_parameter_comment,
+        size_parameter_declaration=size_parameter_declaration)
+    definitions = DISPATCH_DEFINITIONS_FMT.format(
+        database_name=database_name,
+        database_name_upper=database_name.upper(),
+        descriptors=',\n'.join(descriptors),
+        size_parameter_declaration=size_parameter_declaration,
+        dispatch_unused=dispatch_unused,
+        dispatch_cases='\n'.join(cases))
+
+    return declarations, definitions
+
+
 def _generate_helpers_kind(kinds, left_format, right_format):
     formats = {
         'left': left_format,
@@ -1733,6 +1945,10 @@ def generate(database,
                                                       messages,
                                                       args)
     helpers = _generate_helpers(helper_kinds)
+    dispatch_declarations, dispatch_definitions = _generate_dispatch(
+        database_name,
+        messages,
+        args)
 
     header = HEADER_FMT.format(version=__version__,
                                date=date,
@@ -1743,13 +1959,15 @@ def generate(database,
                                frame_cycle_time_defines=frame_cycle_time_defines,
                                choices_defines=choices_defines,
                                structs=structs,
-                               declarations=declarations)
+                               declarations=declarations,
+                               dispatch_declarations=dispatch_declarations)
 
     source = SOURCE_FMT.format(version=__version__,
                                date=date,
                                header=header_name,
                                helpers=helpers,
-                               definitions=definitions)
+                               definitions=definitions,
+                               dispatch_definitions=dispatch_definitions)
 
     fuzzer_source, fuzzer_makefile = _generate_fuzzer_source(
         database_name,
@@ -7,11 +7,19 @@ from .formats import sym
 from .internal_database import InternalDatabase
 from ...compat import fopen
 from .c_source import camel_to_snake_case
+from ... import j1939
 import os
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum number of frame ids in the frame id lookup cache. The cache
+# is cleared when full, to bound its size also when receiving many
+# unknown frame ids.
+FRAME_ID_CACHE_SIZE = 65536
+
+_MISSING = object()
+
 
 class Database(object):
     """This class contains all messages, signals and definitions of a CAN
@@ -25,6 +33,11 @@ class Database(object):
     If `strict` is ``True`` an exception is raised if any signals are
     overlapping or if they don't fit in their message.
 
+    If `lazy` is ``True`` the codecs of loaded messages are created,
+    and `strict` checks are done, when each message is first encoded
+    or decoded. This makes loading large databases faster, but an
+    exception may be raised later than at load time.
+
     """
 
     def __init__(self,
@@ -34,12 +47,15 @@ class Database(object):
                  version=None,
                  dbc_specifics=None,
                  frame_id_mask=None,
-                 strict=True):
+                 strict=True,
+                 lazy=False):
         self._messages = messages if messages else []
         self._nodes = nodes if nodes else []
         self._buses = buses if buses else []
         self._name_to_message = {}
         self._frame_id_to_message = {}
+        self._pgn_to_message = {}
+        self._frame_id_cache = {}
         self._version = version
         self._dbc = dbc_specifics
 
@@ -48,6 +64,7 @@ class Database(object):
 
         self._frame_id_mask = frame_id_mask
         self._strict = strict
+        self._lazy = lazy
         self.refresh()
 
     @property
@@ -102,15 +119,25 @@ class Database(object):
     def dbc(self, value):
         self._dbc = value
 
-    def add_arxml(self, fp):
+    def add_arxml(self, fp, jobs=1, streaming=False):
         """Read and parse ARXML data from given file-like object and add the
         parsed data to the database.
 
+        If `streaming` is ``True``, the data is parsed incrementally
+        and only the elements needed to load the messages of system
+        ARXML data are kept in memory. ECU extracts can not be
+        streamed.
+
         """
 
-        self.add_arxml_string(fp.read())
+        if streaming:
+            self._add_arxml_database(
+                arxml.load(fp, self._strict, self._lazy, jobs))
+        else:
+            self.add_arxml_string(fp.read(), jobs)
 
-    def add_arxml_file(self, filename, encoding='utf-8'):
+    def add_arxml_file(self, filename, encoding='utf-8', jobs=1,
+                       streaming=False):
         """Open, read and parse ARXML data from given file and add the parsed
         data to the database.
 
@@ -119,16 +146,22 @@ class Database(object):
         """
 
         with fopen(filename, 'r', encoding=encoding) as fin:
-            self.add_arxml(fin)
+            self.add_arxml(fin, jobs, streaming)
 
-    def add_arxml_string(self, string):
+    def add_arxml_string(self, string, jobs=1):
         """Parse given ARXML data string and add the parsed data to the
         database.
 
+        Messages of system ARXML data are loaded by `jobs` worker
+        processes if greater than one. This requires processes to be
+        forked, otherwise the messages are loaded in this process.
+
         """
 
-        database = arxml.load_string(string, self._strict)
+        self._add_arxml_database(
+            arxml.load_string(string, self._strict, self._lazy, jobs))
 
+    def _add_arxml_database(self, database):
         self._messages += database.messages
         self._nodes = database.nodes
         self._buses = database.buses
@@ -172,7 +205,7 @@ class Database(object):
 
         """
 
-        database = dbc.load_string(string, self._strict)
+        database = dbc.load_string(string, self._strict, self._lazy)
 
         self._messages += database.messages
         self._nodes = database.nodes
@@ -206,7 +239,7 @@ class Database(object):
 
         """
 
-        database = kcd.load_string(string, self._strict)
+        database = kcd.load_string(string, self._strict, self._lazy)
 
         self._messages += database.messages
         self._nodes = database.nodes
@@ -240,7 +273,7 @@ class Database(object):
 
         """
 
-        database = sym.load_string(string, self._strict)
+        database = sym.load_string(string, self._strict, self._lazy)
 
         self._messages += database.messages
         self._nodes = database.nodes
@@ -273,6 +306,22 @@ class Database(object):
         self._name_to_message[message.name] = message
         self._frame_id_to_message[masked_frame_id] = message
 
+        # J1939 messages are also found by their parameter group
+        # number, ignoring priority, source address and destination
+        # address of the frame id.
+        if message.protocol == 'j1939' and j1939.is_frame_id(message.frame_id):
+            pgn = j1939.pgn_from_frame_id(message.frame_id)
+
+            if pgn in self._pgn_to_message:
+                LOGGER.warning(
+                    "Overwriting message '%s' with '%s' in the PGN to message "
+                    "dictionary because they have identical PGNs 0x%x.",
+                    self._pgn_to_message[pgn].name,
+                    message.name,
+                    pgn)
+
+            self._pgn_to_message[pgn] = message
+
     def as_dbc_string(self):
         """Return the database as a string formatted as a DBC file.
 
@@ -305,9 +354,54 @@ class Database(object):
     def get_message_by_frame_id(self, frame_id):
         """Find the message object for given frame id `frame_id`.
 
+        The frame id is masked with the database frame id mask
+        before it is compared to the frame ids of the messages. J1939
+        messages are also found by their parameter group number, that
+        is, independently of priority, source address and destination
+        address.
+
+        Raises a ``KeyError`` exception if no message is found. Use
+        :meth:`.find_message_by_frame_id()` to get ``None`` instead.
+
+        """
+
+        message = self.find_message_by_frame_id(frame_id)
+
+        if message is None:
+            raise KeyError(frame_id)
+
+        return message
+
+    def find_message_by_frame_id(self, frame_id):
+        """Same as :meth:`.get_message_by_frame_id()`, but returns ``None``
+        instead of raising an exception if no message is found, as
+        this is much faster for frame ids not in the database.
+
         """
 
-        return self._frame_id_to_message[frame_id & self._frame_id_mask]
+        message = self._frame_id_cache.get(frame_id, _MISSING)
+
+        if message is _MISSING:
+            message = self._frame_id_to_message.get(
+                frame_id & self._frame_id_mask)
+
+            if message is None and self._pgn_to_message:
+                if j1939.is_frame_id(frame_id):
+                    message = self._pgn_to_message.get(
+                        j1939.pgn_from_frame_id(frame_id))
+
+            if len(self._frame_id_cache) >= FRAME_ID_CACHE_SIZE:
+                self._frame_id_cache.clear()
+
+            self._frame_id_cache[frame_id] = message
+
+        return message
+
+    def _get_message_by_frame_id_or_name(self, frame_id_or_name):
+        if isinstance(frame_id_or_name, str):
+            return self._name_to_message[frame_id_or_name]
+        else:
+            return self.get_message_by_frame_id(frame_id_or_name)
 
     def get_node_by_name(self, name):
         """Find the node object for given name `name`.
@@ -355,10 +449,7 @@ class Database(object):
 
         """
 
-        try:
-            message = self._frame_id_to_message[frame_id_or_name]
-        except KeyError:
-            message = self._name_to_message[frame_id_or_name]
+        message = self._get_message_by_frame_id_or_name(frame_id_or_name)
 
         return message.encode(data, scaling, padding, strict)
 
@@ -383,10 +474,7 @@ class Database(object):
 
         """
 
-        try:
-            message = self._frame_id_to_message[frame_id_or_name]
-        except KeyError:
-            message = self._name_to_message[frame_id_or_name]
+        message = self._get_message_by_frame_id_or_name(frame_id_or_name)
 
         return message.decode(data, decode_choices, scaling)
 
@@ -401,6 +489,8 @@ class Database(object):
 
         self._name_to_message = {}
         self._frame_id_to_message = {}
+        self._pgn_to_message = {}
+        self._frame_id_cache = {}
 
         for message in self._messages:
             message.refresh(self._strict)
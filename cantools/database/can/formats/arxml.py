@@ -2,6 +2,7 @@
 
 import re
 import logging
+import multiprocessing
 from decimal import Decimal
 
 from xml.etree import ElementTree
@@ -26,9 +27,11 @@ def parse_int_string(in_string):
     return int(in_string, 0) # autodetect the base
 
 class SystemLoader(object):
-    def __init__(self, root, strict):
+    def __init__(self, root, strict, lazy=False, jobs=1):
         self._root = root
         self._strict = strict
+        self._lazy = lazy
+        self._jobs = jobs
 
         m = re.match('^\\{(.*)\\}AUTOSAR$', self._root.tag)
 
@@ -67,7 +70,8 @@ class SystemLoader(object):
         if self.autosar_version_major != 4 and self.autosar_version_major != 3:
             raise ValueError('This class only supports AUTOSAR versions 3 and 4')
 
-        self._arxml_reference_cache = {}
+        # Index from absolute ARXML path to element, created on first use.
+        self._arxml_reference_index = None
 
     def autosar_version_newer(self, major, minor=None, patch=None):
         """Returns true iff the AUTOSAR version specified in the ARXML it at
@@ -109,7 +113,7 @@ class SystemLoader(object):
 
     def load(self):
         buses = []
-        messages = []
+        can_frame_triggerings = []
         version = None
 
         # recursively extract all CAN clusters of all AUTOSAR packages
@@ -119,7 +123,7 @@ class SystemLoader(object):
             for package in package_list.iterfind('./ns:AR-PACKAGE',
                                                  self._xml_namespaces):
                 # deal with the package contents
-                self._load_package_contents(package, messages)
+                self._load_package_contents(package, can_frame_triggerings)
 
                 # load all sub-packages
                 if self.autosar_version_newer(4):
@@ -141,12 +145,43 @@ class SystemLoader(object):
             handle_package_list(self._root.find("./ns:TOP-LEVEL-PACKAGES",
                                                 self._xml_namespaces))
 
+        messages = self._load_messages(can_frame_triggerings)
+
         return InternalDatabase(messages,
                                 [],
                                 buses,
                                 version)
 
-    def _load_package_contents(self, package_elem, messages):
+    def _load_messages(self, can_frame_triggerings):
+        """Load the messages of given frame triggerings, in worker processes
+        if more than one job is given and processes can be forked.
+
+        """
+
+        if (self._jobs <= 1
+            or len(can_frame_triggerings) <= 1
+            or 'fork' not in multiprocessing.get_all_start_methods()):
+            return [self._load_message(can_frame_triggering)
+                    for can_frame_triggering in can_frame_triggerings]
+
+        global _worker_state
+
+        # The workers inherit the loader, the element tree and the
+        # reference index when forked. Only the loaded messages are
+        # pickled.
+        self._get_arxml_reference_index()
+        _worker_state = (self, can_frame_triggerings)
+        chunksize = max(len(can_frame_triggerings) // (4 * self._jobs), 1)
+
+        try:
+            with multiprocessing.get_context('fork').Pool(self._jobs) as pool:
+                return pool.map(_load_message_in_worker,
+                                range(len(can_frame_triggerings)),
+                                chunksize)
+        finally:
+            _worker_state = None
+
+    def _load_package_contents(self, package_elem, can_frame_triggerings):
         # This code extracts the information about CAN clusters of an
         # individual AR package. TODO: deal with the individual buses
         if self.autosar_version_newer(4):
@@ -177,11 +212,8 @@ class SystemLoader(object):
                     '*&CAN-FRAME-TRIGGERING'
                 ]
 
-        can_frame_triggerings = \
-            self._get_arxml_children(package_elem, frame_triggerings_spec)
-
-        for can_frame_triggering in can_frame_triggerings:
-            messages.append(self._load_message(can_frame_triggering))
+        can_frame_triggerings.extend(
+            self._get_arxml_children(package_elem, frame_triggerings_spec))
 
     def _load_message(self, can_frame_triggering):
         """Load given message and return a message object.
@@ -267,7 +299,8 @@ class SystemLoader(object):
                        signals=signals,
                        comment=comments,
                        bus_name=None,
-                       strict=self._strict)
+                       strict=self._strict,
+                       lazy=self._lazy)
 
     def _load_message_name(self, can_frame_triggering):
         return self._get_unique_arxml_child(can_frame_triggering,
@@ -749,12 +782,19 @@ class SystemLoader(object):
 
         is_absolute_path = arxml_path.startswith('/')
 
-        if is_absolute_path and arxml_path in self._arxml_reference_cache:
-            # absolute paths are globally unique and thus can be cached
-            return self._arxml_reference_cache[arxml_path]
+        if is_absolute_path:
+            # absolute paths are globally unique and thus can be
+            # looked up in the index
+            result = self._get_arxml_reference_index().get(arxml_path)
+
+            if (result is not None
+                and child_tag_name is not None
+                and result.tag != f'{{{self.xml_namespace}}}{child_tag_name}'):
+                result = None
+
+            return result
 
         # TODO (?): for relative paths, we need to find the corresponding package tag for each base element!
-        base_elem = self._root if is_absolute_path else base_elem
         if not base_elem:
             raise ValueError(
                 'Tried to dereference a relative ARXML path without '
@@ -792,12 +832,42 @@ class SystemLoader(object):
                 'ELEMENTS',
                 "{}/[ns:SHORT-NAME='{}']".format(child_tag_name, short_names[-1]) ]
 
-        result = base_elem.find(make_xpath(location), self._xml_namespaces)
+        return base_elem.find(make_xpath(location), self._xml_namespaces)
 
-        if is_absolute_path:
-            self._arxml_reference_cache[arxml_path] = result
+    def _get_arxml_reference_index(self):
+        """Return an index from the absolute ARXML path of all elements
+        with a short name to the element, created in a single pass over
+        the tree.
 
-        return result
+        The path of an element is the path of its closest ancestor
+        with a short name, followed by its own short name. If many
+        elements have the same path, the first one is used.
+        """
+
+        if self._arxml_reference_index is not None:
+            return self._arxml_reference_index
+
+        index = {}
+        short_name_tag = f'{{{self.xml_namespace}}}SHORT-NAME'
+        stack = [(self._root, '')]
+
+        while stack:
+            elem, path = stack.pop()
+
+            for child_elem in elem:
+                if child_elem.tag == short_name_tag:
+                    path = f'{path}/{child_elem.text}'
+                    index.setdefault(path, elem)
+                    break
+
+            # Reversed to visit the elements in document order.
+            stack.extend([(child_elem, path)
+                          for child_elem in reversed(elem)
+                          if len(child_elem) > 0])
+
+        self._arxml_reference_index = index
+
+        return index
 
     def _follow_arxml3_const_reference(self, base_elem, arxml_const_path, child_tag_name):
         """This method is does the same as _follow_arxml_ref() but for constant specifications.
@@ -983,6 +1053,127 @@ class SystemLoader(object):
                                                 '&BASE-TYPE'
                                             ])
 
+# The elements kept by the StreamingSystemLoader, except for the
+# elements nested in them. Constants are kept as AUTOSAR 4 constant
+# specifications, and signal groups, data types and units are
+# referenced by signals.
+STREAMING_ELEMENT_TAGS = frozenset([
+    'CAN-FRAME-TRIGGERING',
+    'CAN-FRAME',
+    'FRAME',
+    'I-SIGNAL-I-PDU',
+    'SIGNAL-I-PDU',
+    'I-SIGNAL',
+    'I-SIGNAL-GROUP',
+    'SYSTEM-SIGNAL',
+    'SYSTEM-SIGNAL-GROUP',
+    'COMPU-METHOD',
+    'CONSTANT-SPECIFICATION',
+    'SW-BASE-TYPE',
+    'UNIT',
+    'BOOLEAN-TYPE',
+    'INTEGER-TYPE',
+    'REAL-TYPE',
+    'OPAQUE-TYPE'
+])
+
+
+class StreamingSystemLoader(SystemLoader):
+    """Loads a system ARXML document parsed incrementally from given
+    ``ElementTree.iterparse()`` start and end events.
+
+    Only the elements in ``STREAMING_ELEMENT_TAGS`` and their
+    sub-elements are kept while parsing, all other elements are
+    cleared when their end tag is reached. References are resolved
+    using an index of the absolute paths of the kept elements, built
+    while parsing.
+
+    """
+
+    def __init__(self, events, strict, lazy=False, jobs=1):
+        self._events = events
+        _, root = next(events)
+        super().__init__(root, strict, lazy, jobs)
+
+    def load(self):
+        can_frame_triggerings = self._parse()
+        messages = self._load_messages(can_frame_triggerings)
+
+        return InternalDatabase(messages,
+                                [],
+                                [],
+                                None)
+
+    def _parse(self):
+        """Parse the remaining events and return all CAN frame triggerings
+        in document order.
+
+        """
+
+        namespace = f'{{{self.xml_namespace}}}'
+        kept_tags = {namespace + tag for tag in STREAMING_ELEMENT_TAGS}
+        short_name_tag = namespace + 'SHORT-NAME'
+        can_frame_triggering_tag = namespace + 'CAN-FRAME-TRIGGERING'
+        ecuc_value_collection_tag = namespace + 'ECUC-VALUE-COLLECTION'
+        can_frame_triggerings = []
+        index = {}
+
+        # One entry [path, is_named] per open element, where path is
+        # the path of the closest named ancestor until the short name
+        # of the element is parsed. The first entry is the root's.
+        stack = [['', False]]
+        kept_depth = 0
+
+        for event, elem in self._events:
+            if event == 'start':
+                if elem.tag in kept_tags:
+                    kept_depth += 1
+                elif elem.tag == ecuc_value_collection_tag:
+                    raise ValueError(
+                        'ECU extracts cannot be loaded incrementally.')
+
+                stack.append([stack[-1][0], False])
+                continue
+
+            path, is_named = stack.pop()
+
+            if elem.tag == short_name_tag:
+                parent = stack[-1]
+
+                if not parent[1]:
+                    parent[0] = f'{parent[0]}/{elem.text}'
+                    parent[1] = True
+
+            if kept_depth > 0:
+                if is_named:
+                    index.setdefault(path, elem)
+
+                if elem.tag in kept_tags:
+                    kept_depth -= 1
+
+                    if elem.tag == can_frame_triggering_tag:
+                        can_frame_triggerings.append(elem)
+            else:
+                # Kept elements are not nested in the element any
+                # longer, but still referenced by the index.
+                elem.clear()
+
+        self._arxml_reference_index = index
+
+        return can_frame_triggerings
+
+
+# The loader and frame triggerings of a SystemLoader loading messages
+# in forked worker processes.
+_worker_state = None
+
+
+def _load_message_in_worker(index):
+    loader, can_frame_triggerings = _worker_state
+
+    return loader._load_message(can_frame_triggerings[index])
+
+
 # The ARXML XML namespace for the EcuExtractLoader
 NAMESPACE = 'http://autosar.org/schema/r4.0'
 NAMESPACES = {'ns': NAMESPACE}
@@ -1019,9 +1210,10 @@ REFERENCE_VALUES_XPATH = make_xpath([
 
 class EcuExtractLoader(object):
 
-    def __init__(self, root, strict):
+    def __init__(self, root, strict, lazy=False):
         self.root = root
         self.strict = strict
+        self.lazy = lazy
 
     def load(self):
         buses = []
@@ -1142,7 +1334,8 @@ class EcuExtractLoader(object):
                        signals=signals,
                        comment=comments,
                        bus_name=None,
-                       strict=self.strict)
+                       strict=self.strict,
+                       lazy=self.lazy)
 
     def load_message_tx(self, com_pdu_id_ref):
         return self.load_message_rx_tx(com_pdu_id_ref,
@@ -1344,9 +1537,26 @@ def is_ecu_extract(root):
     return ecuc_value_collection is not None
 
 
-def load_string(string, strict=True):
+def load(fp, strict=True, lazy=False, jobs=1):
+    """Parse ARXML data incrementally from given file-like object or file
+    name, keeping only the elements needed to load the messages in
+    memory.
+
+    ECU extracts are not supported, use :func:`load_string()` instead.
+
+    """
+
+    events = ElementTree.iterparse(fp, events=('start', 'end'))
+
+    return StreamingSystemLoader(events, strict, lazy, jobs).load()
+
+
+def load_string(string, strict=True, lazy=False, jobs=1):
     """Parse given ARXML format string.
 
+    Messages of system ARXML files are loaded by `jobs` worker
+    processes if greater than one, where supported.
+
     """
 
     root = ElementTree.fromstring(string)
@@ -1373,6 +1583,6 @@ def load_string(string, strict=True):
                     ROOT_TAG,
                     root.tag))
 
-        return EcuExtractLoader(root, strict).load()
+        return EcuExtractLoader(root, strict, lazy).load()
     else:
-        return SystemLoader(root, strict).load()
+        return SystemLoader(root, strict, lazy, jobs).load()
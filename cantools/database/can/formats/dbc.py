@@ -123,6 +123,45 @@ ATTRIBUTE_DEFINITION_LONG_SIGNAL_NAME = AttributeDefinition(
     type_name='STRING')
 
 
+KEYWORDS = set([
+    'BA_',
+    'BA_DEF_',
+    'BA_DEF_DEF_',
+    'BA_DEF_DEF_REL_',
+    'BA_DEF_REL_',
+    'BA_DEF_SGTYPE_',
+    'BA_REL_',
+    'BA_SGTYPE_',
+    'BO_',
+    'BO_TX_BU_',
+    'BS_',
+    'BU_',
+    'BU_BO_REL_',
+    'BU_EV_REL_',
+    'BU_SG_REL_',
+    'CAT_',
+    'CAT_DEF_',
+    'CM_',
+    'ENVVAR_DATA_',
+    'EV_',
+    'EV_DATA_',
+    'FILTER',
+    'NS_',
+    'NS_DESC_',
+    'SG_',
+    'SG_MUL_VAL_',
+    'SGTYPE_',
+    'SGTYPE_VAL_',
+    'SIG_GROUP_',
+    'SIG_TYPE_REF_',
+    'SIG_VALTYPE_',
+    'SIGTYPE_VALTYPE_',
+    'VAL_',
+    'VAL_TABLE_',
+    'VERSION'
+])
+
+
 def to_int(value):
     return int(Decimal(value))
 
@@ -130,44 +169,6 @@ def to_int(value):
 class Parser(textparser.Parser):
 
     def tokenize(self, string):
-        keywords = set([
-            'BA_',
-            'BA_DEF_',
-            'BA_DEF_DEF_',
-            'BA_DEF_DEF_REL_',
-            'BA_DEF_REL_',
-            'BA_DEF_SGTYPE_',
-            'BA_REL_',
-            'BA_SGTYPE_',
-            'BO_',
-            'BO_TX_BU_',
-            'BS_',
-            'BU_',
-            'BU_BO_REL_',
-            'BU_EV_REL_',
-            'BU_SG_REL_',
-            'CAT_',
-            'CAT_DEF_',
-            'CM_',
-            'ENVVAR_DATA_',
-            'EV_',
-            'EV_DATA_',
-            'FILTER',
-            'NS_',
-            'NS_DESC_',
-            'SG_',
-            'SG_MUL_VAL_',
-            'SGTYPE_',
-            'SGTYPE_VAL_',
-            'SIG_GROUP_',
-            'SIG_TYPE_REF_',
-            'SIG_VALTYPE_',
-            'SIGTYPE_VALTYPE_',
-            'VAL_',
-            'VAL_TABLE_',
-            'VERSION'
-        ])
-
         names = {
             'LPAREN': '(',
             'RPAREN': ')',
@@ -212,7 +213,7 @@ class Parser(textparser.Parser):
             elif kind != 'MISMATCH':
                 value = mo.group(kind)
 
-                if value in keywords:
+                if value in KEYWORDS:
                     kind = value
 
                 if kind in names:
@@ -344,6 +345,440 @@ class Parser(textparser.Parser):
                 version))
 
 
+# A token of the fast parser, found in order of precedence. White
+# space and comments are skipped. Tokens not matching any other
+# expression are single characters, rejected by the fast parser.
+FAST_TOKEN_RE = re.compile(r'[ \r\n\t]+'
+                           r'|//.*?\n'
+                           r'|([-+]?\d+\.?\d*(?:[eE][+-]?\d+)?'
+                           r'|[A-Za-z0-9_]+'
+                           r'|"(?:\\"|[^"])*?"'
+                           r'|.)',
+                           re.DOTALL)
+
+FAST_PUNCTUATION_KINDS = {
+    '(': '(',
+    ')': ')',
+    '[': '[',
+    ']': ']',
+    ',': ',',
+    '@': '@',
+    ';': ';',
+    ':': ':',
+    '|': '|',
+    '+': '+/-',
+    '-': '+/-'
+}
+
+FAST_WORD_START = set('abcdefghijklmnopqrstuvwxyz'
+                      'ABCDEFGHIJKLMNOPQRSTUVWXYZ_')
+
+FAST_DIGITS = set('0123456789')
+
+FAST_SIGNAL_KINDS = [
+    ':', 'NUMBER', '|', 'NUMBER', '@', 'NUMBER', '+/-',
+    '(', 'NUMBER', ',', 'NUMBER', ')',
+    '[', 'NUMBER', '|', 'NUMBER', ']',
+    'STRING'
+]
+
+FAST_ENVIRONMENT_VARIABLE_KINDS = [
+    'EV_', 'WORD', ':', 'NUMBER',
+    '[', 'NUMBER', '|', 'NUMBER', ']',
+    'STRING', 'NUMBER', 'NUMBER', 'WORD', 'WORD', ';'
+]
+
+
+class FastParserError(Exception):
+    pass
+
+
+def _get_fast_token_kind(value):
+    """Returns the kind of given token value, or ``None`` if it does not
+    match any :class:`Parser` token.
+
+    """
+
+    char = value[0]
+
+    if char == '"':
+        return 'STRING' if len(value) > 1 else None
+    elif char in FAST_DIGITS or (char in '+-' and len(value) > 1):
+        return 'NUMBER'
+    elif char in FAST_WORD_START:
+        return value if value in KEYWORDS else 'WORD'
+    else:
+        return FAST_PUNCTUATION_KINDS.get(value)
+
+
+class FastParser(object):
+    """A hand-written single pass parser creating the same parse tree as
+    :class:`Parser`, but many times faster.
+
+    :class:`FastParserError` is raised if the string can not be
+    parsed. Use :class:`Parser` to get a detailed error message.
+
+    """
+
+    def __init__(self):
+        self._kinds = None
+        self._values = None
+        self._pos = 0
+        self._statement_parsers = {
+            'BO_': self._parse_message,
+            'CM_': self._parse_comment,
+            'BA_DEF_': self._parse_attribute_definition,
+            'VAL_TABLE_': self._parse_value_table,
+            'VAL_': self._parse_choice,
+            'BA_': self._parse_attribute,
+            'BA_REL_': self._parse_attribute_rel,
+            'BA_DEF_REL_': self._parse_attribute_definition_rel,
+            'BA_DEF_DEF_': self._parse_attribute_definition_default,
+            'BA_DEF_DEF_REL_': self._parse_attribute_definition_default,
+            'SIG_GROUP_': self._parse_signal_group,
+            'SIG_VALTYPE_': self._parse_signal_type,
+            'SG_MUL_VAL_': self._parse_signal_multiplexer_values,
+            'BO_TX_BU_': self._parse_message_add_sender,
+            'EV_': self._parse_environment_variable,
+            'BU_': self._parse_nodes,
+            'NS_': self._parse_ns,
+            'BS_': self._parse_bs,
+            'VERSION': self._parse_version
+        }
+
+    def parse(self, string):
+        values = FAST_TOKEN_RE.findall(string)
+        values = [value for value in values if value]
+        kind_cache = {}
+        kinds = []
+
+        for value in values:
+            try:
+                kinds.append(kind_cache[value])
+            except KeyError:
+                kind = _get_fast_token_kind(value)
+                kind_cache[value] = kind
+                kinds.append(kind)
+
+        # End of input markers, so that a few tokens beyond the
+        # current position can be inspected without bounds checks.
+        kinds += 2 * ['__EOF__']
+        self._kinds = kinds
+        self._values = values
+        self._pos = 0
+        tokens = {}
+
+        while True:
+            kind = kinds[self._pos]
+
+            if kind == '__EOF__' and tokens:
+                break
+
+            try:
+                parse_statement = self._statement_parsers[kind]
+            except (KeyError, TypeError):
+                raise FastParserError()
+
+            statement = parse_statement()
+
+            try:
+                tokens[kind].append(statement)
+            except KeyError:
+                tokens[kind] = [statement]
+
+        return tokens
+
+    def _error(self):
+        raise FastParserError()
+
+    def _next(self, kind):
+        """Returns the value of the next token, which must be of given kind.
+
+        """
+
+        pos = self._pos
+
+        if self._kinds[pos] != kind:
+            self._error()
+
+        self._pos = pos + 1
+        value = self._values[pos]
+
+        if kind == 'STRING':
+            value = value[1:-1].replace('\\"', '"')
+
+        return value
+
+    def _next_of(self, kinds):
+        """Returns the values of the next tokens, which must be of given
+        kinds.
+
+        """
+
+        pos = self._pos
+        end = pos + len(kinds)
+
+        if self._kinds[pos:end] != kinds:
+            self._error()
+
+        self._pos = end
+
+        return [
+            value[1:-1].replace('\\"', '"') if kind == 'STRING' else value
+            for kind, value in zip(kinds, self._values[pos:end])
+        ]
+
+    def _next_number_or_string(self):
+        if self._kinds[self._pos] == 'NUMBER':
+            return self._next('NUMBER')
+        else:
+            return self._next('STRING')
+
+    def _next_list(self, kind):
+        """Returns the values of the next tokens of given kind.
+
+        """
+
+        values = []
+
+        while self._kinds[self._pos] == kind:
+            values.append(self._next(kind))
+
+        return values
+
+    def _next_delimited_list(self, kind):
+        """Returns the values of the next comma separated tokens of given
+        kind, at least one.
+
+        """
+
+        values = [self._next(kind)]
+
+        while (self._kinds[self._pos] == ','
+               and self._kinds[self._pos + 1] == kind):
+            self._pos += 1
+            values.append(self._next(kind))
+
+        return values
+
+    def _next_number_string_pairs(self):
+        pairs = []
+
+        while self._kinds[self._pos] == 'NUMBER':
+            pairs.append([self._next('NUMBER'), self._next('STRING')])
+
+        return pairs
+
+    def _parse_version(self):
+        return [self._next('VERSION'), self._next('STRING')]
+
+    def _parse_ns(self):
+        statement = [self._next('NS_'), self._next(':')]
+        kinds = self._kinds
+        values = []
+
+        # All tokens until the next token followed by a colon.
+        while kinds[self._pos + 1] != ':':
+            if kinds[self._pos] in [None, '__EOF__']:
+                self._error()
+
+            values.append(self._next(kinds[self._pos]))
+
+        if kinds[self._pos] in [None, '__EOF__']:
+            self._error()
+
+        statement.append(values)
+
+        return statement
+
+    def _parse_bs(self):
+        return [self._next('BS_'), self._next(':')]
+
+    def _parse_nodes(self):
+        return [self._next('BU_'), self._next(':'), self._next_list('WORD')]
+
+    def _parse_message(self):
+        message = self._next_of(['BO_', 'NUMBER', 'WORD', ':', 'NUMBER', 'WORD'])
+        signals = []
+        kinds = self._kinds
+
+        while kinds[self._pos] == 'SG_':
+            signal = [self._next('SG_')]
+
+            if kinds[self._pos + 1] == 'WORD':
+                signal.append([self._next('WORD'), self._next('WORD')])
+            else:
+                signal.append([self._next('WORD')])
+
+            signal += self._next_of(FAST_SIGNAL_KINDS)
+            signal.append(self._next_delimited_list('WORD'))
+            signals.append(signal)
+
+        message.append(signals)
+
+        return message
+
+    def _parse_environment_variable(self):
+        return self._next_of(FAST_ENVIRONMENT_VARIABLE_KINDS)
+
+    def _parse_comment(self):
+        comment = [self._next('CM_')]
+        kind = self._kinds[self._pos]
+
+        if kind == 'SG_':
+            comment.append(self._next_of(['SG_', 'NUMBER', 'WORD', 'STRING']))
+        elif kind == 'BO_':
+            comment.append(self._next_of(['BO_', 'NUMBER', 'STRING']))
+        elif kind == 'EV_':
+            comment.append(self._next_of(['EV_', 'WORD', 'STRING']))
+        elif kind == 'BU_':
+            comment.append(self._next_of(['BU_', 'WORD', 'STRING']))
+        else:
+            comment.append(self._next('STRING'))
+
+        comment.append(self._next(';'))
+
+        return comment
+
+    def _parse_attribute_definition(self):
+        definition = [self._next('BA_DEF_')]
+        kind = self._kinds[self._pos]
+
+        if kind in ['SG_', 'BO_', 'EV_', 'BU_']:
+            definition.append([self._next(kind)])
+        else:
+            definition.append([])
+
+        definition.append(self._next('STRING'))
+        definition.append(self._next('WORD'))
+
+        if self._kinds[self._pos] == 'STRING':
+            definition.append([self._next_delimited_list('STRING')])
+        else:
+            definition.append([self._next_list('NUMBER')])
+
+        definition.append(self._next(';'))
+
+        return definition
+
+    def _parse_attribute_definition_default(self):
+        return [
+            self._next(self._kinds[self._pos]),
+            self._next('STRING'),
+            self._next_number_or_string(),
+            self._next(';')
+        ]
+
+    def _parse_attribute(self):
+        attribute = [self._next('BA_'), self._next('STRING')]
+        items = []
+
+        while True:
+            kind = self._kinds[self._pos]
+
+            if kind == 'BO_':
+                items.append(self._next_of(['BO_', 'NUMBER']))
+            elif kind == 'SG_':
+                items.append(self._next_of(['SG_', 'NUMBER', 'WORD']))
+            elif kind == 'BU_':
+                items.append(self._next_of(['BU_', 'WORD']))
+            elif kind == 'EV_':
+                items.append(self._next_of(['EV_', 'WORD']))
+            else:
+                break
+
+        attribute.append(items)
+        attribute.append(self._next_number_or_string())
+        attribute.append(self._next(';'))
+
+        return attribute
+
+    def _parse_attribute_definition_rel(self):
+        definition = [self._next('BA_DEF_REL_')]
+
+        if self._kinds[self._pos] == 'BU_SG_REL_':
+            definition.append([self._next('BU_SG_REL_')])
+        else:
+            definition.append([])
+
+        definition.append(self._next('STRING'))
+        definition.append(self._next('WORD'))
+
+        if self._kinds[self._pos] == 'STRING':
+            definition.append(self._next_delimited_list('STRING'))
+        else:
+            definition.append([self._next('NUMBER')]
+                              + self._next_list('NUMBER'))
+
+        definition.append(self._next(';'))
+
+        return definition
+
+    def _parse_attribute_rel(self):
+        attribute = self._next_of(
+            ['BA_REL_', 'STRING', 'BU_SG_REL_', 'WORD', 'SG_', 'NUMBER', 'WORD'])
+        attribute.append(self._next_number_or_string())
+        attribute.append(self._next(';'))
+
+        return attribute
+
+    def _parse_choice(self):
+        choice = [self._next('VAL_')]
+
+        if self._kinds[self._pos] == 'NUMBER':
+            choice.append([self._next('NUMBER')])
+        else:
+            choice.append([])
+
+        choice.append(self._next('WORD'))
+        choice.append(self._next_number_string_pairs())
+        choice.append(self._next(';'))
+
+        return choice
+
+    def _parse_value_table(self):
+        return [
+            self._next('VAL_TABLE_'),
+            self._next('WORD'),
+            self._next_number_string_pairs(),
+            self._next(';')
+        ]
+
+    def _parse_signal_type(self):
+        return self._next_of(
+            ['SIG_VALTYPE_', 'NUMBER', 'WORD', ':', 'NUMBER', ';'])
+
+    def _parse_signal_multiplexer_values(self):
+        values = self._next_of(['SG_MUL_VAL_', 'NUMBER', 'WORD', 'WORD'])
+        ranges = [self._next_of(['NUMBER', 'NUMBER'])]
+
+        while self._kinds[self._pos:self._pos + 3] == [',', 'NUMBER', 'NUMBER']:
+            self._pos += 1
+            ranges.append(self._next_of(['NUMBER', 'NUMBER']))
+
+        values.append(ranges)
+        values.append(self._next(';'))
+
+        return values
+
+    def _parse_message_add_sender(self):
+        return [
+            self._next('BO_TX_BU_'),
+            self._next('NUMBER'),
+            self._next(':'),
+            self._next_delimited_list('WORD'),
+            self._next(';')
+        ]
+
+    def _parse_signal_group(self):
+        signal_group = self._next_of(
+            ['SIG_GROUP_', 'NUMBER', 'WORD', 'NUMBER', ':'])
+        signal_group.append(self._next_list('WORD'))
+        signal_group.append(self._next(';'))
+
+        return signal_group
+
+
 class DbcSpecifics(object):
 
     def __init__(self,
@@ -1304,6 +1739,7 @@ def _load_messages(tokens,
                    signal_types,
                    signal_multiplexer_values,
                    strict,
+                   lazy,
                    bus_name,
                    signal_groups):
     """Load messages.
@@ -1459,6 +1895,7 @@ def _load_messages(tokens,
                     signals=signals,
                     comment=get_comment(frame_id_dbc),
                     strict=strict,
+                    lazy=lazy,
                     protocol=get_protocol(frame_id_dbc),
                     bus_name=bus_name,
                     signal_groups=get_signal_groups(frame_id_dbc)))
@@ -1696,12 +2133,17 @@ def get_definitions_dict(definitions, defaults):
     return result
 
 
-def load_string(string, strict=True):
+def load_string(string, strict=True, lazy=False):
     """Parse given string.
 
     """
 
-    tokens = Parser().parse(string)
+    try:
+        tokens = FastParser().parse(string)
+    except FastParserError:
+        # Parse again to either raise an error with the location of
+        # the problem, or accept the string as the grammar does.
+        tokens = Parser().parse(string)
 
     comments = _load_comments(tokens)
     definitions = _load_attribute_definitions(tokens)
@@ -1724,6 +2166,7 @@ def load_string(string, strict=True):
                               signal_types,
                               signal_multiplexer_values,
                               strict,
+                              lazy,
                               bus.name if bus else None,
                               signal_groups)
     nodes = _load_nodes(tokens, comments, attributes, attribute_definitions)
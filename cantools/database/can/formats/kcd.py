@@ -167,7 +167,7 @@ def _load_multiplex_element(mux, nodes):
     return signals
 
 
-def _load_message_element(message, bus_name, nodes, strict):
+def _load_message_element(message, bus_name, nodes, strict, lazy):
     """Load given message element and return a message object.
 
     """
@@ -239,7 +239,8 @@ def _load_message_element(message, bus_name, nodes, strict):
                    signals=signals,
                    comment=notes,
                    bus_name=bus_name,
-                   strict=strict)
+                   strict=strict,
+                   lazy=lazy)
 
 
 def _indent_xml(element, indent, level=0):
@@ -453,7 +454,7 @@ def dump_string(database):
         return ElementTree.tostring(network_definition)
 
 
-def load_string(string, strict=True):
+def load_string(string, strict=True, lazy=False):
     """Parse given KCD format string.
 
     """
@@ -485,7 +486,8 @@ def load_string(string, strict=True):
             messages.append(_load_message_element(message,
                                                   bus_name,
                                                   nodes,
-                                                  strict))
+                                                  strict,
+                                                  lazy))
 
     return InternalDatabase(messages,
                             [
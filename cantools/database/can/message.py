@@ -1,18 +1,56 @@
 # A CAN message.
 
-import binascii
+import sys
+import struct
 from copy import deepcopy
 
 from ..utils import format_or
 from ..utils import start_bit
+from ..utils import is_integral
+from ..utils import is_integer_scaling
+from ..utils import encode_field
 from ..utils import encode_data
 from ..utils import decode_data
+from ..utils import create_batch_rows
+from ..utils import unpack_data_batch
+from ..utils import decode_data_batch
+from ..utils import mask_data_batch
 from ..utils import create_encode_decode_formats
 from ..errors import Error
 from ..errors import EncodeError
 from ..errors import DecodeError
 
 
+_FLOAT_UNPACKERS = {
+    16: struct.Struct('>e').unpack,
+    32: struct.Struct('>f').unpack,
+    64: struct.Struct('>d').unpack
+}
+
+_FLOAT_PACKERS = {
+    16: struct.Struct('>e').pack,
+    32: struct.Struct('>f').pack,
+    64: struct.Struct('>d').pack
+}
+
+# Largest finite values of the float formats. Other values are packed
+# by the generic encoder.
+_FLOAT_MAXIMUMS = {
+    16: 65504.0,
+    32: 3.4028234663852886e+38,
+    64: sys.float_info.max
+}
+
+# Integers in this range are exactly representable as floats.
+_FLOAT_EXACT_INTEGER = 2 ** 53
+
+# Scaled values below this limit are within 0.25 of their nearest
+# integer also when calculated with floats, given that the distance to
+# the nearest integer is less than 0.25 with floats. Otherwise
+# Decimal arithmetic is used for exact rounding.
+_FLOAT_SCALED_LIMIT = 2 ** 40
+
+
 class Message(object):
     """A CAN message with frame id, comment, signals and other
     information.
@@ -20,6 +58,11 @@ class Message(object):
     If `strict` is ``True`` an exception is raised if any signals are
     overlapping or if they don't fit in the message.
 
+    If `lazy` is ``True`` the codecs and the signal tree are created,
+    and `strict` checks are done, when first needed, for example when
+    the message is first encoded or decoded, instead of by
+    :meth:`.refresh()`.
+
     """
 
     def __init__(self,
@@ -36,7 +79,8 @@ class Message(object):
                  bus_name=None,
                  signal_groups=None,
                  strict=True,
-                 protocol=None):
+                 protocol=None,
+                 lazy=False):
         frame_id_bit_length = frame_id.bit_length()
 
         if is_extended_frame:
@@ -75,8 +119,12 @@ class Message(object):
         self._bus_name = bus_name
         self._signal_groups = signal_groups
         self._codecs = None
+        self._decoders = None
+        self._encoders = None
         self._signal_tree = None
         self._strict = strict
+        self._refresh_strict = strict
+        self._lazy = lazy
         self._protocol = protocol
         self.refresh()
 
@@ -333,7 +381,7 @@ class Message(object):
 
         """
 
-        return self._signal_tree
+        return self._get_codecs()[1]
 
     def _get_mux_number(self, decoded, signal_name):
         mux = decoded[signal_name]
@@ -411,6 +459,238 @@ class Message(object):
 
         return encoded, padding_mask
 
+    def _create_encoder_node(self, node, scaling, strict, source):
+        """Append the Python source of a function encoding given codec node
+        to `source`, and return the function name and its constants.
+
+        The function returns ``None`` if the data cannot be encoded
+        with the fast path, which makes the caller fall back to the
+        generic encoder.
+
+        """
+
+        name = '_encode_{}'.format(len(source))
+        constants = {}
+        lines = [
+            'def {}(data):'.format(name),
+            '    big = 0',
+            '    little = 0',
+            '    padding = {}'.format(node['formats'].padding_mask)
+        ]
+        source.append(lines)
+
+        def constant(prefix, value):
+            key = '{}_{}_{}'.format(prefix, name, len(constants))
+            constants[key] = value
+
+            return key
+
+        def is_exact_float(value):
+            return (isinstance(value, float)
+                    or (isinstance(value, int)
+                        and abs(value) <= _FLOAT_EXACT_INTEGER))
+
+        def append_range_check(signal, indent):
+            if not (strict and scaling):
+                return
+
+            if signal.minimum is not None:
+                lines.append('{}if value < {}:'.format(
+                    indent,
+                    constant('MINIMUM', signal.minimum)))
+                lines.append('{}    return None'.format(indent))
+
+            if signal.maximum is not None:
+                lines.append('{}if value > {}:'.format(
+                    indent,
+                    constant('MAXIMUM', signal.maximum)))
+                lines.append('{}    return None'.format(indent))
+
+        for bit_field in node['formats'].bit_fields:
+            signal = bit_field.data
+            lines.append('    value = data[{!r}]'.format(signal.name))
+            lines.append('    if value.__class__ is str:')
+
+            if signal.choices:
+                lines.append('        value = {}(value)'.format(
+                    constant('NUMBER', signal.choice_string_to_number)))
+            else:
+                lines.append('        return None')
+
+            if not scaling:
+                pass
+            elif signal.is_float:
+                lines.append('    else:')
+                append_range_check(signal, '        ')
+                lines.append('        value = (value - {}) / {}'.format(
+                    constant('OFFSET', signal.offset),
+                    constant('SCALE', signal.scale)))
+            else:
+                slow = '{}({}, data, True)'.format(
+                    constant('ENCODE_FIELD', encode_field),
+                    constant('SIGNAL', signal))
+                is_integral_scaling = (is_integral(signal.scale)
+                                       and is_integral(signal.offset)
+                                       and signal.scale != 0)
+
+                if is_integral_scaling:
+                    lines.append('    elif value.__class__ is int:')
+                    append_range_check(signal, '        ')
+                    lines.append(
+                        '        value, remainder = divmod(value - {}, {})'.format(
+                            int(signal.offset),
+                            int(signal.scale)))
+                    lines.append('        if remainder:')
+                    lines.append('            value = {}'.format(slow))
+
+                if is_exact_float(signal.scale) and is_exact_float(signal.offset):
+                    if is_integral_scaling:
+                        float_types = (float, )
+                    else:
+                        float_types = (float, int)
+
+                    lines.append('    elif (value.__class__ in {}'.format(
+                        constant('FLOAT_TYPES', float_types)))
+                    lines.append('          and -{0} <= value <= {0}):'.format(
+                        _FLOAT_EXACT_INTEGER))
+                    append_range_check(signal, '        ')
+                    lines.append('        scaled = (value - {}) / {}'.format(
+                        constant('OFFSET', float(signal.offset)),
+                        constant('SCALE', float(signal.scale))))
+                    lines.append('        if -{0} < scaled < {0}:'.format(
+                        _FLOAT_SCALED_LIMIT))
+                    lines.append('            value = round(scaled)')
+                    lines.append('            if abs(scaled - value) >= 0.25:')
+                    lines.append('                value = {}'.format(slow))
+                    lines.append('        else:')
+                    lines.append('            value = {}'.format(slow))
+
+                lines.append('    else:')
+                append_range_check(signal, '        ')
+                lines.append('        value = {}'.format(slow))
+
+            if signal.byte_order == 'big_endian':
+                packed = 'big'
+            else:
+                packed = 'little'
+
+            if signal.is_float:
+                lines.append(
+                    '    if value.__class__ is not float '
+                    'and value.__class__ is not int:')
+                lines.append('        return None')
+                lines.append('    if not -{0} <= value <= {0}:'.format(
+                    constant('FLOAT_MAXIMUM', _FLOAT_MAXIMUMS[signal.length])))
+                lines.append('        return None')
+                lines.append(
+                    "    {} |= int.from_bytes({}(value), 'big') << {}".format(
+                        packed,
+                        constant('PACK', _FLOAT_PACKERS[signal.length]),
+                        bit_field.shift))
+            else:
+                if signal.is_signed:
+                    minimum = -(1 << (signal.length - 1))
+                    maximum = (1 << (signal.length - 1)) - 1
+                else:
+                    minimum = 0
+                    maximum = bit_field.mask
+
+                lines.append('    if value.__class__ is not int:')
+                lines.append('        return None')
+                lines.append('    if not {} <= value <= {}:'.format(minimum,
+                                                                   maximum))
+                lines.append('        return None')
+                lines.append('    {} |= (value & {}) << {}'.format(
+                    packed,
+                    bit_field.mask,
+                    bit_field.shift))
+
+        multiplexers = node['multiplexers']
+
+        for signal_name in multiplexers:
+            signal = self.get_signal_by_name(signal_name)
+            mux_nodes = {}
+
+            for mux, mux_node in multiplexers[signal_name].items():
+                mux_name, mux_constants = self._create_encoder_node(mux_node,
+                                                                    scaling,
+                                                                    strict,
+                                                                    source)
+                mux_nodes[mux] = mux_name
+                constants.update(mux_constants)
+
+            lines.append('    mux = data[{!r}]'.format(signal_name))
+            lines.append('    if mux.__class__ is str:')
+
+            if signal.choices:
+                lines.append('        mux = {}(mux)'.format(
+                    constant('NUMBER', signal.choice_string_to_number)))
+            else:
+                lines.append('        return None')
+            lines.append('    encode_mux = {}.get(mux)'.format(
+                constant('NODES', mux_nodes)))
+            lines.append('    if encode_mux is None:')
+            lines.append('        return None')
+            lines.append('    encoded = encode_mux(data)')
+            lines.append('    if encoded is None:')
+            lines.append('        return None')
+            lines.append('    big |= encoded[0]')
+            lines.append('    little |= encoded[1]')
+            lines.append('    padding &= encoded[2]')
+
+        lines.append('    return big, little, padding')
+
+        return name, constants
+
+    def _create_encoder(self, scaling, strict):
+        """Create a function encoding data as an integer of this message's
+        length, with all masks, shifts and scaling precomputed. The
+        function returns the encoded integer and its padding mask, or
+        ``None`` if the generic encoder must be used.
+
+        Returns ``None`` instead of a function if the generic encoder
+        must always be used, as for messages with signals outside the
+        payload.
+
+        """
+
+        node = self._get_codecs()[0]
+
+        if not self._is_in_payload(node):
+            return None
+
+        source = []
+        name, constants = self._create_encoder_node(node,
+                                                    scaling,
+                                                    strict,
+                                                    source)
+        lines = [
+            'def encode(data):',
+            '    encoded = {}(data)'.format(name),
+            '    if encoded is None:',
+            '        return None',
+            '    big, little, padding = encoded'
+        ]
+
+        if any(signal.byte_order == 'little_endian'
+               for signal in self._signals):
+            lines.append(
+                "    big |= int.from_bytes(little.to_bytes({}, 'little'), "
+                "'big')".format(self._length))
+
+        lines.append('    return big, padding')
+        source.append(lines)
+        namespace = dict(constants)
+        exec('\n\n'.join(['\n'.join(lines) for lines in source]), namespace)
+
+        # Replace multiplexed node function names with the functions.
+        for key, value in constants.items():
+            if key.startswith('NODES_'):
+                for mux, mux_name in value.items():
+                    value[mux] = namespace[mux_name]
+
+        return namespace['encode']
+
     def encode(self, data, scaling=True, padding=False, strict=True):
         """Encode given data as a message of this type.
 
@@ -427,18 +707,36 @@ class Message(object):
 
         """
 
-        encoded, padding_mask = self._encode(self._codecs,
-                                             data,
-                                             scaling,
-                                             strict)
+        key = (scaling, strict)
+
+        try:
+            encoder = self._encoders[key]
+        except KeyError:
+            encoder = self._create_encoder(scaling, strict)
+            self._encoders[key] = encoder
+
+        # Anything unusual, including invalid data, is left to the
+        # generic encoder, which also reports errors.
+        if encoder is None:
+            encoded = None
+        else:
+            try:
+                encoded = encoder(data)
+            except (KeyError, TypeError, ValueError, OverflowError):
+                encoded = None
+
+        if encoded is None:
+            encoded = self._encode(self._get_codecs()[0],
+                                   data,
+                                   scaling,
+                                   strict)
+
+        encoded, padding_mask = encoded
 
         if padding:
             encoded |= padding_mask
 
-        encoded |= (0x80 << (8 * self._length))
-        encoded = hex(encoded)[4:].rstrip('L')
-
-        return binascii.unhexlify(encoded)[:self._length]
+        return encoded.to_bytes(self._length, 'big')
 
     def _decode(self, node, data, decode_choices, scaling):
         decoded = decode_data(data,
@@ -466,6 +764,221 @@ class Message(object):
 
         return decoded
 
+    def _has_selected_signals(self, node, selected):
+        if any([signal.name in selected for signal in node['signals']]):
+            return True
+
+        return any([self._has_selected_signals(mux_node, selected)
+                    for mux_nodes in node['multiplexers'].values()
+                    for mux_node in mux_nodes.values()])
+
+    def _create_decoder_node(self,
+                             node,
+                             decode_choices,
+                             scaling,
+                             selected,
+                             source):
+        """Append the Python source of a function decoding given codec node
+        to `source`, and return the function name and its constants.
+
+        Only signals in `selected` are decoded, and multiplexers needed
+        to find them, or all signals if `selected` is ``None``.
+
+        """
+
+        name = '_decode_{}'.format(len(source))
+        constants = {}
+        lines = ['def {}(big, little, decoded):'.format(name)]
+        source.append(lines)
+
+        def constant(prefix, value):
+            key = '{}_{}_{}'.format(prefix, name, len(constants))
+            constants[key] = value
+
+            return key
+
+        multiplexers = node['multiplexers']
+
+        if selected is not None:
+            multiplexers = {
+                signal_name: mux_nodes
+                for signal_name, mux_nodes in multiplexers.items()
+                if any([self._has_selected_signals(mux_node, selected)
+                        for mux_node in mux_nodes.values()])
+            }
+
+        for bit_field in node['formats'].bit_fields:
+            signal = bit_field.data
+
+            if (selected is not None
+                and signal.name not in selected
+                and signal.name not in multiplexers):
+                continue
+
+            if signal.byte_order == 'big_endian':
+                packed = 'big'
+            else:
+                packed = 'little'
+
+            lines.append('    value = ({} >> {}) & {}'.format(packed,
+                                                            bit_field.shift,
+                                                            bit_field.mask))
+
+            if signal.is_float:
+                lines.append(
+                    "    value = {}(value.to_bytes({}, 'big'))[0]".format(
+                        constant('FLOAT', _FLOAT_UNPACKERS[signal.length]),
+                        signal.length // 8))
+            elif signal.is_signed:
+                sign = (1 << (signal.length - 1))
+                lines.append('    value = (value ^ {0}) - {0}'.format(sign))
+
+            if not scaling:
+                value = 'value'
+            elif is_integer_scaling(signal):
+                value = 'int({} * value + {})'.format(
+                    constant('SCALE', signal.scale),
+                    constant('OFFSET', signal.offset))
+            elif (not signal.is_float
+                  and type(signal.scale) is int
+                  and type(signal.offset) is int
+                  and signal.scale == 1
+                  and signal.offset == 0):
+                value = 'value'
+            else:
+                value = '{} * value + {}'.format(
+                    constant('SCALE', signal.scale),
+                    constant('OFFSET', signal.offset))
+
+            if decode_choices and signal.choices:
+                choices = constant('CHOICES', signal.choices)
+                value = '{0}[value] if value in {0} else {1}'.format(choices,
+                                                                     value)
+
+            lines.append('    decoded[{!r}] = {}'.format(signal.name, value))
+
+        for signal_name in multiplexers:
+            signal = self.get_signal_by_name(signal_name)
+            mux_nodes = {}
+
+            for mux, mux_node in multiplexers[signal_name].items():
+                mux_name, mux_constants = self._create_decoder_node(
+                    mux_node,
+                    decode_choices,
+                    scaling,
+                    selected,
+                    source)
+                mux_nodes[mux] = mux_name
+                constants.update(mux_constants)
+
+            mux_nodes = constant('NODES', mux_nodes)
+            lines.append('    mux = decoded[{!r}]'.format(signal_name))
+
+            if decode_choices and signal.choices:
+                lines.append('    if isinstance(mux, str):')
+                lines.append('        mux = {}(mux)'.format(
+                    constant('MUX_NUMBER', signal.choice_string_to_number)))
+
+            lines.append('    try:')
+            lines.append('        decode_mux = {}[mux]'.format(mux_nodes))
+            lines.append('    except KeyError:')
+            lines.append('        raise DecodeError({}.format(mux))'.format(
+                constant('MUX_ERROR',
+                         'expected multiplexer id {}, but got {{}}'.format(
+                             format_or(multiplexers[signal_name])))))
+            lines.append('    decode_mux(big, little, decoded)')
+
+        if len(lines) == 1:
+            lines.append('    pass')
+
+        return name, constants
+
+    def _is_in_payload(self, node):
+        """Returns ``True`` if all bit fields of given codec node, and its
+        multiplexed nodes, are within the payload of this message. The
+        formats of overlapping signals may also be longer than the
+        payload.
+
+        """
+
+        number_of_bits = 8 * self._length
+        formats = node['formats']
+
+        if formats.big_endian.calcsize() > number_of_bits:
+            return False
+
+        if formats.little_endian.calcsize() > number_of_bits:
+            return False
+
+        for bit_field in formats.bit_fields:
+            if bit_field.shift < 0:
+                return False
+
+            if bit_field.shift + bit_field.data.length > number_of_bits:
+                return False
+
+        return all([self._is_in_payload(mux_node)
+                    for mux_nodes in node['multiplexers'].values()
+                    for mux_node in mux_nodes.values()])
+
+    def _create_decoder(self, decode_choices, scaling, selected):
+        """Create a function decoding data of this message's length into
+        given dictionary, with all masks, shifts, scaling and choices
+        precomputed.
+
+        Messages with signals outside the payload, only possible in
+        non-strict databases, are decoded by the generic decoder, which
+        raises an error.
+
+        """
+
+        node = self._get_codecs()[0]
+
+        if not self._is_in_payload(node):
+            def decode(data, decoded):
+                decoded.update(self._decode(node,
+                                            data,
+                                            decode_choices,
+                                            scaling))
+
+                return decoded
+
+            return decode
+
+        source = []
+        name, constants = self._create_decoder_node(self._get_codecs()[0],
+                                                    decode_choices,
+                                                    scaling,
+                                                    selected,
+                                                    source)
+        byte_orders = set(signal.byte_order for signal in self._signals)
+        lines = ['def decode(data, decoded):']
+
+        if 'big_endian' in byte_orders:
+            lines.append("    big = int.from_bytes(data, 'big')")
+        else:
+            lines.append('    big = 0')
+
+        if 'little_endian' in byte_orders:
+            lines.append("    little = int.from_bytes(data, 'little')")
+        else:
+            lines.append('    little = 0')
+
+        lines.append('    {}(big, little, decoded)'.format(name))
+        lines.append('    return decoded')
+        source.append(lines)
+        namespace = dict(constants)
+        namespace['DecodeError'] = DecodeError
+        exec('\n\n'.join(['\n'.join(lines) for lines in source]), namespace)
+
+        # Replace multiplexed node function names with the functions.
+        for key, value in constants.items():
+            if key.startswith('NODES_'):
+                for mux, mux_name in value.items():
+                    value[mux] = namespace[mux_name]
+
+        return namespace['decode']
+
     def decode(self, data, decode_choices=True, scaling=True):
         """Decode given data as a message of this type.
 
@@ -482,7 +995,169 @@ class Message(object):
 
         data = data[:self._length]
 
-        return self._decode(self._codecs, data, decode_choices, scaling)
+        if len(data) < self._length:
+            return self._decode(self._get_codecs()[0],
+                                data,
+                                decode_choices,
+                                scaling)
+
+        return self._get_decoder(decode_choices, scaling)(data, {})
+
+    def decode_into(self,
+                    data,
+                    out,
+                    decode_choices=True,
+                    scaling=True,
+                    signals=None):
+        """Decode given data as a message of this type into given
+        dictionary `out`, and return it. `data` is a bytes-like object,
+        for example a ``bytearray`` or ``memoryview``, and is not
+        copied.
+
+        Existing entries in `out` are overwritten, but not removed, so
+        the same dictionary can be reused for every frame. For
+        multiplexed messages this means that signals of previously
+        decoded multiplexer ids are kept.
+
+        `signals` is an optional collection of names of signals to
+        decode. Other signals are not decoded, except multiplexers
+        needed to find given signals. Give it as ``None`` to decode all
+        signals.
+
+        See :meth:`decode()` for a description of the other arguments.
+
+        >>> foo = db.get_message_by_name('Foo')
+        >>> decoded = {}
+        >>> foo.decode_into(bytearray(b'\\x01\\x45\\x23\\x00\\x11'), decoded)
+        {'Bar': 1, 'Fum': 5.0}
+
+        """
+
+        if len(data) != self._length:
+            data = memoryview(data)[:self._length]
+
+            if len(data) < self._length:
+                out.update(self._decode(self._get_codecs()[0],
+                                        data,
+                                        decode_choices,
+                                        scaling))
+
+                return out
+
+        return self._get_decoder(decode_choices, scaling, signals)(data, out)
+
+    def _get_decoder(self, decode_choices, scaling, selected=None):
+        if selected is not None:
+            selected = frozenset(selected)
+
+        key = (decode_choices, scaling, selected)
+
+        try:
+            return self._decoders[key]
+        except KeyError:
+            decoder = self._create_decoder(decode_choices, scaling, selected)
+            self._decoders[key] = decoder
+
+            return decoder
+
+    def _decode_batch(self, node, rows, present, scaling):
+        unpacked = unpack_data_batch(rows, node['formats'])
+        decoded = {
+            name: (value, present)
+            for name, value in decode_data_batch(unpacked,
+                                                 node['signals'],
+                                                 scaling).items()
+        }
+        choices = {
+            signal.name: (unpacked[signal.name], present)
+            for signal in node['signals']
+            if signal.choices
+        }
+        multiplexers = node['multiplexers']
+
+        for signal in multiplexers:
+            mux = unpacked[signal]
+
+            for mux_id, mux_node in multiplexers[signal].items():
+                mux_present = (mux == mux_id)
+
+                if present is not None:
+                    mux_present &= present
+
+                mux_decoded, mux_choices = self._decode_batch(mux_node,
+                                                              rows,
+                                                              mux_present,
+                                                              scaling)
+
+                for columns, mux_columns in [(decoded, mux_decoded),
+                                             (choices, mux_choices)]:
+                    for name, (value, value_present) in mux_columns.items():
+                        if name in columns:
+                            value_present = (value_present | columns[name][1])
+
+                        columns[name] = (value, value_present)
+
+        return decoded, choices
+
+    def _unpresent_batch(self, columns):
+        if self.is_multiplexed():
+            return {
+                name: mask_data_batch(value, present)
+                for name, (value, present) in columns.items()
+            }
+        else:
+            return {name: value for name, (value, _) in columns.items()}
+
+    def decode_batch(self, data, scaling=True, return_choices=False):
+        """Decode many frames of this message at once. Requires the
+        ``numpy`` package, and that all signals are at most 64 bits.
+
+        `data` is either a sequence of byte strings, or a contiguous
+        bytes-like object or ``numpy`` array of frames, each
+        :attr:`length` bytes long. Returns a dictionary of signal name
+        to ``numpy`` array with one value per frame.
+
+        If `scaling` is ``False`` no scaling of signals is performed.
+
+        If `return_choices` is ``True`` a tuple of the dictionary above
+        and a dictionary of signal name to raw integer values, for all
+        signals with choices, is returned. The raw values are keys of
+        :attr:`Signal.choices<.Signal.choices>`.
+
+        Signals in multiplexed messages are returned as
+        ``numpy.ma.MaskedArray`` objects, masked in frames where the
+        signal is not present. Multiplexer ids are matched against the
+        raw multiplexer signal values.
+
+        >>> foo = db.get_message_by_name('Foo')
+        >>> foo.decode_batch([b'\\x01\\x45\\x23\\x00\\x11',
+        ...                   b'\\x02\\x45\\x23\\x00\\x11'])
+        {'Bar': array([1, 2]), 'Fum': array([5., 5.])}
+
+        """
+
+        node = self._get_codecs()[0]
+
+        if not self._is_in_payload(node):
+            raise ValueError('Short data.')
+
+        for signal in self._signals:
+            if signal.length > 64:
+                raise DecodeError(
+                    'Signal {} is {} bits, but at most 64 bits can be batch '
+                    'decoded.'.format(signal.name, signal.length))
+
+        rows = create_batch_rows(data, self._length)
+        decoded, choices = self._decode_batch(node,
+                                              rows,
+                                              None,
+                                              scaling)
+        decoded = self._unpresent_batch(decoded)
+
+        if return_choices:
+            return decoded, self._unpresent_batch(choices)
+        else:
+            return decoded
 
     def get_signal_by_name(self, name):
         for signal in self._signals:
@@ -504,7 +1179,7 @@ class Message(object):
 
         """
 
-        return bool(self._codecs['multiplexers'])
+        return bool(self._get_codecs()[0]['multiplexers'])
 
     def _check_signal(self, message_bits, signal):
         signal_bits = signal.length * [signal.name]
@@ -523,8 +1198,8 @@ class Message(object):
 
             signal_bits = []
 
-            for i in range(0, len(reversed_signal_bits), 8):
-                signal_bits = reversed_signal_bits[i:i + 8] + signal_bits
+            for i in reversed(range(0, len(reversed_signal_bits), 8)):
+                signal_bits += reversed_signal_bits[i:i + 8]
 
         # Check that the signal fits in the message.
         if len(signal_bits) > len(message_bits):
@@ -579,6 +1254,25 @@ class Message(object):
                         signal.length,
                         self.name))
 
+    def _get_codecs(self):
+        """Returns the codecs and the signal tree, created first if the
+        message is lazy and they are not yet created.
+
+        """
+
+        if self._codecs is None:
+            codecs = self._create_codec()
+            signal_tree = self._create_signal_tree(codecs)
+
+            if self._refresh_strict:
+                message_bits = 8 * self.length * [None]
+                self._check_signal_tree(message_bits, signal_tree)
+
+            self._codecs = codecs
+            self._signal_tree = signal_tree
+
+        return self._codecs, self._signal_tree
+
     def refresh(self, strict=None):
         """Refresh the internal message state.
 
@@ -589,16 +1283,27 @@ class Message(object):
 
         """
 
-        self._check_signal_lengths()
-        self._codecs = self._create_codec()
-        self._signal_tree = self._create_signal_tree(self._codecs)
-
         if strict is None:
             strict = self._strict
 
-        if strict:
-            message_bits = 8 * self.length * [None]
-            self._check_signal_tree(message_bits, self.signal_tree)
+        self._check_signal_lengths()
+        self._codecs = None
+        self._decoders = {}
+        self._encoders = {}
+        self._signal_tree = None
+        self._refresh_strict = strict
+
+        if not self._lazy:
+            self._get_codecs()
+
+    def __getstate__(self):
+        # Generated encoders and decoders cannot be pickled. They are
+        # created again when needed.
+        state = self.__dict__.copy()
+        state['_decoders'] = {}
+        state['_encoders'] = {}
+
+        return state
 
     def __repr__(self):
         return "message('{}', 0x{:x}, {}, {}, {})".format(
@@ -2,6 +2,7 @@ import sys
 import time
 
 from ...version import __version__
+from ..errors import Error
 
 from .c_source import Message
 
@@ -18,6 +19,8 @@ QT_HEADER_FMT = '''\
 #include <QObject>
 #include <QVariant>
 #include <QByteArray>
+#include <QVector>
+#include <QAbstractListModel>
 
 #include <{entity_frame_type}>
 #include "{database_name}.h"
@@ -25,6 +28,7 @@ QT_HEADER_FMT = '''\
 
 #include <QTimer>
 #include <QDateTime>
+#include <QElapsedTimer>
 
 class {database_name}QtSignals;
 class {database_name}QtMessage;
@@ -74,6 +78,10 @@ class {database_name}QtMessage : public QObject
 signals:
     void on_valid(QDateTime t);
 
+    // Emitted at most once per received frame when notifications are
+    // batched, with one bit set per changed signal.
+    void frameUpdated(qint64 timestamp, quint64 changed);
+
 public:
     {database_name}QtMessage({specific_parameters_definitions} uint frameId, bool is_extended, uint length, uint cycle_time) : 
         {specific_parameters_initializations} m_frameId(frameId), m_length(length), is_extended(is_extended), m_cycle_time(cycle_time), m_valid(false) {{}}
@@ -86,21 +94,172 @@ public:
     const uint m_cycle_time;
     qint64 m_timestamp;
     bool m_valid;
+    quint64 m_changed = 0;
+    bool m_notified = false;
+    qint64 m_notified_time = 0;
+    qint64 m_deadline = 0;
+    bool m_scheduled = false;
 
 public:
 
     void send_frame(QByteArray payload, bool is_extended);
     
     virtual void received(const {entity_frame_type} &frame) = 0;
-    void check_exipiration_timestamp(qint64 now) {{
-        // qDebug() << m_cycle_time << "," << now - m_timestamp;
-        if ((m_cycle_time > 0) && (now - m_timestamp > m_cycle_time)) {{
-            if (m_valid) {{
-                m_valid = false;
-                emit on_valid(QDateTime::fromMSecsSinceEpoch(m_timestamp));
-            }}
+
+    // Notify given changed signals, or delay the notification if the
+    // last one is less than interval milliseconds ago.
+    void notify(quint64 changed, qint64 interval) {{
+        m_changed |= changed;
+        flush_notification(monotonic_time(), interval);
+    }}
+
+    // Notify pending changes, unless the last notification is less
+    // than interval milliseconds before now.
+    void flush_notification(qint64 now, qint64 interval) {{
+        if (m_changed == 0) {{
+            return;
+        }}
+
+        if (m_notified && (now - m_notified_time < interval)) {{
+            return;
+        }}
+
+        m_notified = true;
+        m_notified_time = now;
+        emit frameUpdated(m_timestamp, m_changed);
+        m_changed = 0;
+    }}
+
+    // Milliseconds on the monotonic clock of the validity timers.
+    static qint64 monotonic_time();
+
+    // Restart the timer invalidating the message if not received
+    // again within its cycle time.
+    void restart_validity_timer();
+
+    void expire() {{
+        if (m_valid) {{
+            m_valid = false;
+            emit on_valid(QDateTime::fromMSecsSinceEpoch(m_timestamp));
+        }}
+    }}
+}};
+
+/*
+ * Read access to the history of a signal, oldest sample first.
+ */
+class {database_name}SignalHistory {{
+public:
+    virtual ~{database_name}SignalHistory() {{}}
+    virtual int count() const = 0;
+    virtual qint64 timestamp(int index) const = 0;
+    virtual QVariant value(int index) const = 0;
+}};
+
+/*
+ * List model exposing the history of a signal to QML, with the roles
+ * timestamp (in milliseconds since epoch) and value. The samples are
+ * read from the history when requested, never copied.
+ */
+class {database_name}SignalHistoryModel : public QAbstractListModel {{
+
+    Q_OBJECT
+
+public:
+    enum Roles {{
+        TimestampRole = Qt::UserRole + 1,
+        ValueRole
+    }};
+
+    {database_name}SignalHistoryModel(const {database_name}SignalHistory *history) :
+        m_history(history) {{}}
+
+    int rowCount(const QModelIndex &parent = QModelIndex()) const override {{
+        return parent.isValid() ? 0 : m_history->count();
+    }}
+
+    QVariant data(const QModelIndex &index, int role) const override {{
+        if (!index.isValid() || (index.row() >= m_history->count())) {{
+            return QVariant();
+        }}
+
+        switch (role) {{
+        case TimestampRole:
+            return m_history->timestamp(index.row());
+        case ValueRole:
+            return m_history->value(index.row());
+        default:
+            return QVariant();
+        }}
+    }}
+
+    QHash<int, QByteArray> roleNames() const override {{
+        return {{{{TimestampRole, "timestamp"}}, {{ValueRole, "value"}}}};
+    }}
+
+    void begin_remove_first() {{ beginRemoveRows(QModelIndex(), 0, 0); }}
+    void end_remove_first() {{ endRemoveRows(); }}
+    void begin_append() {{ beginInsertRows(QModelIndex(), m_history->count(), m_history->count()); }}
+    void end_append() {{ endInsertRows(); }}
+
+    void last_changed() {{
+        QModelIndex last = index(m_history->count() - 1);
+        emit dataChanged(last, last);
+    }}
+
+private:
+    const {database_name}SignalHistory *m_history;
+}};
+
+/*
+ * Preallocated ring buffer of the latest capacity samples of a
+ * signal. A sample less than decimation milliseconds after the
+ * latest sample only replaces its value.
+ */
+template <typename T>
+class {database_name}SignalHistoryBuffer : public {database_name}SignalHistory {{
+public:
+    {database_name}SignalHistoryBuffer(int capacity, qint64 decimation) :
+        m_samples(capacity), m_decimation(decimation), m_first(0), m_count(0) {{}}
+
+    int count() const override {{ return m_count; }}
+    qint64 timestamp(int index) const override {{ return sample(index).timestamp; }}
+    QVariant value(int index) const override {{ return QVariant::fromValue(sample(index).value); }}
+
+    void append(qint64 t, T value, {database_name}SignalHistoryModel &model) {{
+        if ((m_count > 0) && (t - sample(m_count - 1).timestamp < m_decimation)) {{
+            sample(m_count - 1).value = value;
+            model.last_changed();
+            return;
         }}
+
+        if (m_count == m_samples.size()) {{
+            model.begin_remove_first();
+            m_first = (m_first + 1) % m_samples.size();
+            m_count--;
+            model.end_remove_first();
+        }}
+
+        model.begin_append();
+        sample(m_count).timestamp = t;
+        sample(m_count).value = value;
+        m_count++;
+        model.end_append();
     }}
+
+private:
+    struct Sample {{
+        qint64 timestamp;
+        T value;
+    }};
+
+    const Sample &sample(int index) const {{ return m_samples[(m_first + index) % m_samples.size()]; }}
+    Sample &sample(int index) {{ return m_samples[(m_first + index) % m_samples.size()]; }}
+
+    QVector<Sample> m_samples;
+    const qint64 m_decimation;
+    int m_first;
+    int m_count;
 }};
 
 /*
@@ -111,6 +270,8 @@ class QVariantHistorySignal{database_name}: public QVariantSignal{database_name}
 
     Q_OBJECT
 
+    Q_PROPERTY({database_name}SignalHistoryModel* history READ history CONSTANT)
+
 private slots:
     void update(QDateTime t);
     void update_valid(QDateTime t);
@@ -122,7 +283,14 @@ public:
         QObject::connect(this->parent, &{database_name}QtMessage::on_valid, this, &QVariantHistorySignal{database_name}::update_valid);
     }}
 
-    QList<QPair<QDateTime, QVariant>> m_data;
+    virtual {database_name}SignalHistoryModel *history() = 0;
+
+    void record(qint64 t) {{
+        append_history(t);
+    }}
+
+protected:
+    virtual void append_history(qint64 t) = 0;
 }};
 
 {signals_classes_declarations}
@@ -156,6 +324,72 @@ public:
 
 {messages_classes_declarations}
 
+/**
+ * Timer wheel invalidating messages not received within their cycle
+ * time, measured with a monotonic clock. Receiving a message only
+ * moves its deadline, and advancing the wheel only checks the
+ * messages in the slots passed since the previous advance.
+ */
+class {database_name}QtValidityTimers
+{{
+public:
+    {database_name}QtValidityTimers() : m_slots({validity_timers_slots}), m_time(0) {{
+        m_clock.start();
+    }}
+
+    qint64 elapsed() const {{
+        return m_clock.elapsed();
+    }}
+
+    void restart({database_name}QtMessage *message) {{
+        message->m_deadline = m_clock.elapsed() + message->m_cycle_time;
+
+        if (!message->m_scheduled) {{
+            schedule(message);
+        }}
+    }}
+
+    void advance() {{
+        qint64 now = m_clock.elapsed();
+        qint64 first = (now / {validity_timers_resolution} - {validity_timers_slots}) * {validity_timers_resolution};
+
+        // All slots are checked once at most.
+        if (first > m_time) {{
+            m_time = first;
+        }}
+
+        while (m_time + {validity_timers_resolution} <= now) {{
+            m_time += {validity_timers_resolution};
+            m_due.swap(m_slots[(m_time / {validity_timers_resolution}) % {validity_timers_slots}]);
+
+            for ({database_name}QtMessage *message : m_due) {{
+                message->m_scheduled = false;
+
+                if (message->m_deadline < m_time) {{
+                    message->expire();
+                }} else {{
+                    schedule(message);
+                }}
+            }}
+
+            m_due.clear();
+        }}
+    }}
+
+private:
+    void schedule({database_name}QtMessage *message) {{
+        qint64 tick = (qMax(message->m_deadline, m_time + 1) + {validity_timers_resolution} - 1) / {validity_timers_resolution};
+
+        m_slots[tick % {validity_timers_slots}].append(message);
+        message->m_scheduled = true;
+    }}
+
+    QElapsedTimer m_clock;
+    QVector<QVector<{database_name}QtMessage*>> m_slots;
+    QVector<{database_name}QtMessage*> m_due;
+    qint64 m_time;
+}};
+
 /**
  * Class that groups all messages
  */
@@ -175,14 +409,14 @@ private:
 
 public slots:
     void periodic_check_validity() {{
-        qint64 now = QDateTime::currentMSecsSinceEpoch();
-        // qint64 deltat = now - m_timestamp;
-
 {messages_check_validity}
+        m_validity_timers.advance();
     }}
 
 public:
     QMap<uint, {database_name}QtMessage*> map;
+    {database_name}QtValidityTimers m_validity_timers;
+    {messages_variables}
     static {database_name}QtMessages& instance() {{
         static {database_name}QtMessages * _instance = nullptr;
         if ( _instance == nullptr ) {{
@@ -210,23 +444,81 @@ void QVariantSignal_{signal_name}::send(QVariant x) {{
 QT_SIGNALS_RECEIVED_CODE_FMT = '''\
         x = {database_name}_{message_name}_{signal_name}_decode(store.{signal_name});
         if (signals_store.m_{signal_name}->m_val != x) {{
+            signals_store.m_{signal_name}->m_val = x;
             emit signals_store.m_{signal_name}->on_change(QDateTime::fromMSecsSinceEpoch(m_timestamp));
+#ifdef {debug_define}
             qDebug() << hex << "m_{signal_name}=" << signals_store.m_{signal_name}->m_val;
+#endif
         }}
 '''
 
 QT_SIGNALS_RECEIVED_CODE_WITHOUT_ENCDEC_FMT = '''\
         if (signals_store.m_{signal_name}->m_val != store.{signal_name}) {{
+            signals_store.m_{signal_name}->m_val = store.{signal_name};
             emit signals_store.m_{signal_name}->on_change(QDateTime::fromMSecsSinceEpoch(m_timestamp));
+#ifdef {debug_define}
             qDebug() << hex << "m_{signal_name}=" << signals_store.m_{signal_name}->m_val;
+#endif
         }}
 '''
 
+QT_SIGNALS_RECEIVED_BATCHED_CODE_FMT = '''\
+        if (!m_stored || (store.{signal_name} != previous_store.{signal_name})) {{
+            signals_store.m_{signal_name}->m_val = {signal_value};
+            changed |= {signal_name}_changed;
+{signal_record_history}#ifdef {debug_define}
+            qDebug() << hex << "m_{signal_name}=" << signals_store.m_{signal_name}->m_val;
+#endif
+        }}
+'''
+
+QT_BATCHED_NOTIFICATION_CODE_FMT = '''\
+        previous_store = store;
+        m_stored = true;
+        notify(changed, {notification_interval});
+'''
+
+QT_BATCHED_MESSAGE_MEMBERS_FMT = '''\
+    {signals_changed_bits}
+    struct {database_name}_{message_name}_t previous_store;
+    bool m_stored = false;
+'''
+
+QT_SIGNAL_CLASS_DECLARATION_FMT = '''\
+class QVariantSignal_{signal_name} : public QVariantSignal{database_name} {{
+    using QVariantSignal{database_name}::QVariantSignal{database_name};
+    void send(QVariant x);
+}};
+'''
+
+QT_HISTORY_SIGNAL_CLASS_DECLARATION_FMT = '''\
+class QVariantSignal_{signal_name} : public QVariantHistorySignal{database_name} {{
+public:
+    QVariantSignal_{signal_name}({database_name}QtMessage *p, QVariant max, QVariant min, QVariant precision, QString unit) :
+        QVariantHistorySignal{database_name}(p, max, min, precision, unit),
+        m_history({history_capacity}, {history_decimation}),
+        m_history_model(&m_history) {{}}
+
+    {database_name}SignalHistoryModel *history() {{ return &m_history_model; }}
+
+private:
+    void send(QVariant x);
+
+    void append_history(qint64 t) {{
+        m_history.append(t, m_val.value<{history_type}>(), m_history_model);
+    }}
+
+    {database_name}SignalHistoryBuffer<{history_type}> m_history;
+    {database_name}SignalHistoryModel m_history_model;
+}};
+'''
+
 QT_MESSAGES_CLASSES_DECLARATIONS_FMT = '''\
-class {database_name}QtMessage_{message_name} : public {database_name}QtMessage
+class {database_name}QtMessage_{message_name} final : public {database_name}QtMessage
 {{
     using {database_name}QtMessage::{database_name}QtMessage;
 
+public:
     void received(const {entity_frame_type} &frame) {{
         {database_name}QtSignals &signals_store = {database_name}QtSignals::instance();
 
@@ -237,6 +529,10 @@ class {database_name}QtMessage_{message_name} : public {database_name}QtMessage
             emit on_valid(QDateTime::fromMSecsSinceEpoch(m_timestamp));
         }}
 
+        if (m_cycle_time > 0) {{
+            restart_validity_timer();
+        }}
+
         if (is_extended != {frame_is_extended}) return;
         if (m_length != static_cast<uint>({frame_length_function})) return;
 
@@ -246,12 +542,11 @@ class {database_name}QtMessage_{message_name} : public {database_name}QtMessage
                     );
 
 {signals_received_code}
-
+{notification_code}
     }}
 
-public:
     struct {database_name}_{message_name}_t store;
-}};
+{message_members}}};
 '''
 
 QT_SOURCE_FMT = '''\
@@ -268,7 +563,7 @@ QT_SOURCE_FMT = '''\
 #include <QDebug>
 
 void QVariantHistorySignal{database_name}::update(QDateTime t) {{
-    m_data.append(QPair<QDateTime, QVariant>(t, m_val));
+    append_history(t.toMSecsSinceEpoch());
 }}
 
 void QVariantHistorySignal{database_name}::update_valid(QDateTime t) {{
@@ -290,11 +585,25 @@ void QVariantHistorySignal{database_name}::update_valid(QDateTime t) {{
 {signals_send_methods}
 
 void {database_name}QtMessages::can_receive_frame_callback(const {entity_frame_type} &frame) {{
-    {database_name}QtMessage *msg;
     uint offset = 0;
     {frame_id_offset_calculation}
-    msg = {database_name}QtMessages::instance().map.value(offset + {frame_id_function}, nullptr);
-    if (msg) msg->received(frame);
+
+    // Frames are dispatched to the final message classes, so
+    // received() is not called virtually. Frames not in the database
+    // are ignored.
+    switch (offset + {frame_id_function}) {{
+{messages_dispatch_cases}
+    default:
+        break;
+    }}
+}}
+
+void {database_name}QtMessage::restart_validity_timer() {{
+    {database_name}QtMessages::instance().m_validity_timers.restart(this);
+}}
+
+qint64 {database_name}QtMessage::monotonic_time() {{
+    return {database_name}QtMessages::instance().m_validity_timers.elapsed();
 }}
 
 void {database_name}QtMessage::send_frame(QByteArray payload, bool is_extended) {{
@@ -313,6 +622,56 @@ void {database_name}QtMessage::send_frame(QByteArray payload, bool is_extended)
 }}
 '''
 
+def _is_persistent(signal):
+    # 0: NoPersistent 1: StoreWhenChange 2: StoreEveryPeriodSec
+    persistent_attribute = signal.dbc.attributes.get("PersistentType", None)
+    persistent_attribute = persistent_attribute.value if persistent_attribute else 0
+
+    return persistent_attribute == 1
+
+
+def _get_validity_timers_size(messages):
+    """Returns the slot resolution in milliseconds and the number of
+    slots of the validity timer wheel, so that a slot is a fraction of
+    the shortest cycle time and the wheel covers the longest.
+
+    """
+
+    cycle_times = [message.cycle_time for message in messages if message.cycle_time]
+
+    if not cycle_times:
+        return 1, 1
+
+    resolution = max(min(cycle_times) // 4, 1)
+    slots = 1
+
+    while slots * resolution <= max(cycle_times) and slots < 4096:
+        slots *= 2
+
+    return resolution, slots
+
+
+def _get_notification_interval(message, args):
+    """Returns the minimum time in milliseconds between batched
+    notifications of given message. The MaxNotificationRate message
+    attribute overrides the command line option.
+
+    """
+
+    rate = message.dbc.attributes.get("MaxNotificationRate", None)
+    rate = rate.value if rate else args.max_notification_rate
+
+    if not rate:
+        return 0
+
+    if rate < 0:
+        raise Error(
+            "MaxNotificationRate of message {} must be positive, but got "
+            "{}.".format(message.name, rate))
+
+    return int(round(1000 / rate))
+
+
 """
     return: 
 	signals_classes_declarations x signal
@@ -330,6 +689,8 @@ def _generate_qt_declarations(database_name, messages, signals, args):
     messages_classes_declarations = list()
     messages_instantations = list()
     messages_check_validity = list()
+    messages_variables = list()
+    messages_dispatch_cases = dict()
 
     for signal in signals:
         signal.database_name = database_name
@@ -337,21 +698,69 @@ def _generate_qt_declarations(database_name, messages, signals, args):
         signals_properties.append("Q_PROPERTY(QVariantSignal%(database_name)s* %(snake_name)s MEMBER m_%(snake_name)s CONSTANT)" % signal.__dict__)
 
     
+    debug_define = '{}_QT_DEBUG'.format(database_name.upper())
+
     for message in messages:
         message.database_name = database_name
 
+        # Signals in message order, which is also the order of the
+        # changed bits of batched notifications.
+        used_signals = [signal for signal in message.signals
+                        if signal in message.used_signals]
         signals_received_code = list()
-        for signal in message.used_signals:
-            if args.no_floating_point_numbers:
-                MY_QT_SIGNALS_RECEIVED_CODE_FMT = QT_SIGNALS_RECEIVED_CODE_WITHOUT_ENCDEC_FMT
-            else:
-                MY_QT_SIGNALS_RECEIVED_CODE_FMT = QT_SIGNALS_RECEIVED_CODE_FMT
-            signals_received_code.append(MY_QT_SIGNALS_RECEIVED_CODE_FMT.format(
+        notification_code = ""
+        message_members = ""
+
+        if args.batch_notifications:
+            if len(used_signals) > 64:
+                raise Error(
+                    "Batched notifications support at most 64 signals, but "
+                    "message {} has {}.".format(message.name, len(used_signals)))
+
+            signals_changed_bits = list()
+            signals_received_code.append("        quint64 changed = 0;\n")
+
+            for bit, signal in enumerate(used_signals):
+                signals_changed_bits.append("static const quint64 {signal_name}_changed = (quint64(1) << {bit});".format(
+                    signal_name=signal.snake_name,
+                    bit=bit))
+
+                if args.no_floating_point_numbers:
+                    signal_value = "store.{}".format(signal.snake_name)
+                else:
+                    signal_value = "{}_{}_{}_decode(store.{})".format(database_name,
+                                                                     message.snake_name,
+                                                                     signal.snake_name,
+                                                                     signal.snake_name)
+
+                signals_received_code.append(QT_SIGNALS_RECEIVED_BATCHED_CODE_FMT.format(
+                    database_name=database_name,
+                    signal_name=signal.snake_name,
+                    signal_value=signal_value,
+                    signal_record_history="            signals_store.m_{}->record(m_timestamp);\n".format(signal.snake_name) if _is_persistent(signal) else "",
+                    debug_define=debug_define))
+
+            notification_code = QT_BATCHED_NOTIFICATION_CODE_FMT.format(
+                notification_interval=_get_notification_interval(message, args))
+            message_members = QT_BATCHED_MESSAGE_MEMBERS_FMT.format(
                 database_name=database_name,
                 message_name=message.snake_name,
-    	        signal_name=signal.snake_name
-    	    ))
-            
+                signals_changed_bits='\n    '.join(signals_changed_bits))
+        else:
+            signals_received_code.append("        QVariant x;\n")
+
+            for signal in used_signals:
+                if args.no_floating_point_numbers:
+                    MY_QT_SIGNALS_RECEIVED_CODE_FMT = QT_SIGNALS_RECEIVED_CODE_WITHOUT_ENCDEC_FMT
+                else:
+                    MY_QT_SIGNALS_RECEIVED_CODE_FMT = QT_SIGNALS_RECEIVED_CODE_FMT
+                signals_received_code.append(MY_QT_SIGNALS_RECEIVED_CODE_FMT.format(
+                    database_name=database_name,
+                    message_name=message.snake_name,
+                    signal_name=signal.snake_name,
+                    debug_define=debug_define
+                ))
+
         if args.for_modbus:
             s = QT_MESSAGES_CLASSES_DECLARATIONS_FMT.format(
                 database_name=database_name,
@@ -360,6 +769,8 @@ def _generate_qt_declarations(database_name, messages, signals, args):
                 message_is_extended=str(message.is_extended_frame).lower(),
                 message_length=message.length,
                 signals_received_code='\n'.join(signals_received_code),
+                notification_code=notification_code,
+                message_members=message_members,
                 entity_frame_type="QModbusReply",
                 frame_length_function="frame.result().valueCount() * 2",
                 frame_length_parameter="" if args.no_size_and_memset else ",\n                    static_cast<size_t>(frame.result().valueCount() * 2)",
@@ -375,6 +786,8 @@ def _generate_qt_declarations(database_name, messages, signals, args):
                 message_is_extended=str(message.is_extended_frame).lower(),
                 message_length=message.length,
                 signals_received_code='\n'.join(signals_received_code),
+                notification_code=notification_code,
+                message_members=message_members,
                 entity_frame_type="QCanBusFrame",
                 frame_length_function="frame.payload().length()",
                 frame_length_parameter="" if args.no_size_and_memset else ",\n                    static_cast<size_t>(frame.payload().length())",
@@ -385,38 +798,76 @@ def _generate_qt_declarations(database_name, messages, signals, args):
             
         messages_classes_declarations.append(s)
 
-        messages_instantations.append("        map[{message_id}] = new {database_name}QtMessage_{message_name}({specific_parameters_values} {message_id}, {message_is_extended}, {message_length}, {message_cycle_time});".format(
+        messages_variables.append("{database_name}QtMessage_{message_name} *m_message_{message_name};".format(
+            database_name=database_name,
+            message_name=message.snake_name))
+
+        # A later message with the same frame id replaces the earlier
+        # one, both in the map and in the dispatch switch.
+        messages_dispatch_cases[message.frame_id] = "    case {message_id}:\n        m_message_{message_name}->received(frame);\n        break;".format(
+            message_id=hex(message.frame_id),
+            message_name=message.snake_name)
+
+        messages_instantations.append("        map[{message_id}] = m_message_{message_name} = new {database_name}QtMessage_{message_name}({specific_parameters_values} {message_id}, {message_is_extended}, {message_length}, {message_cycle_time});".format(
             database_name=database_name,
             message_name=message.snake_name,
             message_id=hex(message.frame_id),
             message_length=message.length,
             message_is_extended=str(message.is_extended_frame).lower(),
-            message_cycle_time=message.cycle_time,
+            message_cycle_time=message.cycle_time or 0,
             specific_parameters_values=("%s," % message.node.dbc.attributes.get("StationAddress", 1).value) if args.for_modbus else ""
             ))
 
-        if (message.cycle_time != 0):
-            messages_check_validity.append('        map[{message_id}]->check_exipiration_timestamp(now);'.format(
-                message_id=hex(message.frame_id),
+        if args.batch_notifications:
+            messages_check_validity.append('        m_message_{message_name}->flush_notification(now, {notification_interval});'.format(
+                message_name=message.snake_name,
+                notification_interval=_get_notification_interval(message, args)
                 ))
         
     for signal in signals:
         signal.database_name = database_name
-        # Use class QVariantHistorySignal_xxx when adopting m_map and saving of values
-        # Use class QVariantSignal_xxx otherwise (without m_map)
-        # 0: NoPersistent 1: StoreWhenChange 2: StoreEveryPeriodSec
-        persistent_attribute = signal.dbc.attributes.get("PersistentType", None)
-        persistent_attribute = persistent_attribute.value if persistent_attribute else 0
-        signal.history_type = "History" if persistent_attribute == 1 else ""
-
-        signals_classes_declarations.append("""
-class QVariantSignal_%(snake_name)s : public QVariant%(history_type)sSignal%(database_name)s {
-    using QVariant%(history_type)sSignal%(database_name)s::QVariant%(history_type)sSignal%(database_name)s;
-    void send(QVariant x);
-};
-""" % signal.__dict__)
+        # Use class QVariantHistorySignal_xxx when saving values in a history
+        # Use class QVariantSignal_xxx otherwise (without history)
+        if _is_persistent(signal):
+            # The HistoryCapacity and HistoryDecimation attributes
+            # override the command line options per signal.
+            history_capacity = signal.dbc.attributes.get("HistoryCapacity", None)
+            history_capacity = history_capacity.value if history_capacity else args.history_capacity
+            history_decimation = signal.dbc.attributes.get("HistoryDecimation", None)
+            history_decimation = history_decimation.value if history_decimation else args.history_decimation
+
+            if history_capacity < 1:
+                raise Error(
+                    "HistoryCapacity of signal {} must be at least 1, but "
+                    "got {}.".format(signal.name, history_capacity))
+
+            if history_decimation < 0:
+                raise Error(
+                    "HistoryDecimation of signal {} must be at least 0, but "
+                    "got {}.".format(signal.name, history_decimation))
+
+            s = QT_HISTORY_SIGNAL_CLASS_DECLARATION_FMT.format(
+                database_name=database_name,
+                signal_name=signal.snake_name,
+                history_capacity=history_capacity,
+                history_decimation=history_decimation,
+                history_type=signal.real_type_name if args.no_floating_point_numbers else "double")
+        else:
+            s = QT_SIGNAL_CLASS_DECLARATION_FMT.format(
+                database_name=database_name,
+                signal_name=signal.snake_name)
+
+        signals_classes_declarations.append(s)
     
-    return '\n'.join(signals_classes_declarations), '\n    '.join(signals_properties), '\n    '.join(signals_variables), '\n'.join(messages_classes_declarations), '\n'.join(messages_instantations), '\n'.join(messages_check_validity)
+    messages_dispatch_cases = [messages_dispatch_cases[frame_id]
+                               for frame_id in sorted(messages_dispatch_cases)]
+
+    if messages_check_validity:
+        messages_check_validity.insert(
+            0,
+            '        qint64 now = m_validity_timers.elapsed();\n')
+
+    return '\n'.join(signals_classes_declarations), '\n    '.join(signals_properties), '\n    '.join(signals_variables), '\n'.join(messages_classes_declarations), '\n'.join(messages_instantations), '\n'.join(messages_check_validity), '\n    '.join(messages_variables), '\n'.join(messages_dispatch_cases)
 
 
 """
@@ -531,9 +982,10 @@ def generate_qt(database,
         messages_qt.add(msg)
 
     include_guard = '{}_QT_H'.format(database_name.upper())
+    validity_timers_resolution, validity_timers_slots = _get_validity_timers_size(messages_qt)
 
     # H
-    signals_classes_declarations, signals_properties, signals_variables, messages_classes_declarations, messages_instantations, messages_check_validity = _generate_qt_declarations(
+    signals_classes_declarations, signals_properties, signals_variables, messages_classes_declarations, messages_instantations, messages_check_validity, messages_variables, messages_dispatch_cases = _generate_qt_declarations(
 			       database_name,
                    messages_qt,
                    signals_qt,
@@ -550,6 +1002,9 @@ def generate_qt(database,
 			       messages_classes_declarations=messages_classes_declarations,
 			       messages_instantations=messages_instantations,
                    messages_check_validity=messages_check_validity,
+                   validity_timers_resolution=validity_timers_resolution,
+                   validity_timers_slots=validity_timers_slots,
+                   messages_variables=messages_variables,
                    entity_frame_type="QModbusReply" if args.for_modbus else "QCanBusFrame",
                    specific_parameters_definitions="uint stationAddress," if args.for_modbus else "",
                    specific_parameters_declarations="const uint m_stationAddress;" if args.for_modbus else "",
@@ -577,6 +1032,7 @@ def generate_qt(database,
                    database_name=database_name,
                    signals_instantiations=signals_instantiations,
 			       signals_send_methods=signals_send_methods,
+                   messages_dispatch_cases=messages_dispatch_cases,
                    entity_frame_type="QModbusReply" if args.for_modbus else "QCanBusFrame",
                    frame_id_function="static_cast<uint>(frame.result().startAddress())" if args.for_modbus else "frame.frameId()",
                    frame_has_send_frame="0" if args.for_modbus else "1",
@@ -9,14 +9,35 @@ try:
 except ImportError:
     import bitstruct
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .errors import Error
+from .errors import DecodeError
+
 
 Formats = namedtuple('Formats',
                      [
                          'big_endian',
                          'little_endian',
-                         'padding_mask'
+                         'padding_mask',
+                         'bit_fields'
                      ])
 
+# Position of a signal in the payload. `shift` is the bit offset of
+# the signal's least significant bit in the payload read as a big
+# endian (for big endian signals) or little endian (for little endian
+# signals) integer, and `mask` has the signal's lowest `length` bits
+# set.
+BitField = namedtuple('BitField',
+                      [
+                          'data',
+                          'shift',
+                          'mask'
+                      ])
+
 
 def format_or(items):
     items = [str(item) for item in items]
@@ -45,7 +66,7 @@ def start_bit(data):
         return data.start
 
 
-def _encode_field(field, data, scaling):
+def encode_field(field, data, scaling):
     value = data[field.name]
 
     if isinstance(value, str):
@@ -61,6 +82,22 @@ def _encode_field(field, data, scaling):
         return value
 
 
+def _is_integer_float(value):
+    return isinstance(value, float) and value.is_integer()
+
+
+def is_integer_scaling(field):
+    """Returns ``True`` if scaled values of given field are converted to
+    ``int``, that is, if the field is not a float and both scale and
+    offset are integer valued floats.
+
+    """
+
+    return (not field.is_float
+            and _is_integer_float(field.scale)
+            and _is_integer_float(field.offset))
+
+
 def _decode_field(field, value, decode_choices, scaling):
     if decode_choices:
         try:
@@ -68,15 +105,11 @@ def _decode_field(field, value, decode_choices, scaling):
         except (KeyError, TypeError):
             pass
 
-    is_int = \
-        lambda x: x is isinstance(x, int) or (isinstance(x, float) and x.is_integer())
     if scaling:
-        if field.is_float \
-           or not is_int(field.scale) \
-           or not is_int(field.offset):
-            return (field.scale * value + field.offset)
-        else:
+        if is_integer_scaling(field):
             return int(field.scale * value + field.offset)
+        else:
+            return (field.scale * value + field.offset)
     else:
         return value
 
@@ -86,13 +119,13 @@ def encode_data(data, fields, formats, scaling):
         return 0
 
     unpacked = {
-        field.name: _encode_field(field, data, scaling)
+        field.name: encode_field(field, data, scaling)
         for field in fields
     }
     big_packed = formats.big_endian.pack(unpacked)
-    little_packed = formats.little_endian.pack(unpacked)[::-1]
-    packed_union = int(binascii.hexlify(big_packed), 16)
-    packed_union |= int(binascii.hexlify(little_packed), 16)
+    little_packed = formats.little_endian.pack(unpacked)
+    packed_union = int.from_bytes(big_packed, 'big')
+    packed_union |= int.from_bytes(little_packed, 'little')
 
     return packed_union
 
@@ -196,6 +229,19 @@ def create_encode_decode_formats(datas, number_of_bytes):
 
         return fmt(items), value, names(items)
 
+    def create_bit_fields():
+        bit_fields = []
+
+        for data in datas:
+            if data.byte_order == 'big_endian':
+                shift = format_length - (start_bit(data) + data.length)
+            else:
+                shift = data.start
+
+            bit_fields.append(BitField(data, shift, (1 << data.length) - 1))
+
+        return bit_fields
+
     big_fmt, big_padding_mask, big_names = create_big()
     little_fmt, little_padding_mask, little_names = create_little()
 
@@ -211,4 +257,151 @@ def create_encode_decode_formats(datas, number_of_bytes):
 
     return Formats(big_compiled,
                    little_compiled,
-                   big_padding_mask & little_padding_mask)
+                   big_padding_mask & little_padding_mask,
+                   create_bit_fields())
+
+
+def is_integral(value):
+    return (isinstance(value, int)
+            or (isinstance(value, float) and value.is_integer()))
+
+
+def create_batch_rows(data, number_of_bytes):
+    """Return given payloads as a two dimensional ``numpy.uint8`` array
+    with one row of `number_of_bytes` bytes per frame.
+
+    `data` is either a sequence of byte strings, or a contiguous
+    buffer (bytes-like or ``numpy`` array) of frames laid out back to
+    back.
+
+    """
+
+    if numpy is None:
+        raise Error('The numpy package is required for batch decoding.')
+
+    if isinstance(data, numpy.ndarray):
+        rows = data.view(numpy.uint8)
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        rows = numpy.frombuffer(data, dtype=numpy.uint8)
+    else:
+        payloads = [bytes(payload[:number_of_bytes]) for payload in data]
+
+        for payload in payloads:
+            if len(payload) != number_of_bytes:
+                raise DecodeError(
+                    'Expected {} bytes per frame, but got {}.'.format(
+                        number_of_bytes,
+                        len(payload)))
+
+        rows = numpy.frombuffer(b''.join(payloads), dtype=numpy.uint8)
+
+        return rows.reshape(len(payloads), number_of_bytes)
+
+    if rows.ndim == 1:
+        if number_of_bytes == 0 or rows.size % number_of_bytes != 0:
+            raise DecodeError(
+                'Expected a multiple of {} bytes, but got {}.'.format(
+                    number_of_bytes,
+                    rows.size))
+
+        rows = rows.reshape(-1, number_of_bytes)
+    elif rows.ndim != 2 or rows.shape[1] < number_of_bytes:
+        raise DecodeError(
+            'Expected frames of {} bytes, but got an array of shape {}.'.format(
+                number_of_bytes,
+                rows.shape))
+
+    return rows[:, :number_of_bytes]
+
+
+def _unpack_batch(rows, bit_field):
+    """Extract the raw value of given bit field from every row as a
+    ``numpy`` array.
+
+    """
+
+    field = bit_field.data
+    number_of_bytes = rows.shape[1]
+    first = bit_field.shift // 8
+    last = (bit_field.shift + field.length - 1) // 8
+    value = numpy.zeros(len(rows), dtype=numpy.uint64)
+
+    for position in range(first, last + 1):
+        if field.byte_order == 'big_endian':
+            index = number_of_bytes - 1 - position
+        else:
+            index = position
+
+        column = rows[:, index].astype(numpy.uint64)
+        shift = 8 * position - bit_field.shift
+
+        if shift >= 0:
+            value |= (column << numpy.uint64(shift))
+        else:
+            value |= (column >> numpy.uint64(-shift))
+
+    value &= numpy.uint64(bit_field.mask)
+
+    if field.is_float:
+        if field.length == 16:
+            value = value.astype(numpy.uint16).view(numpy.float16)
+        elif field.length == 32:
+            value = value.astype(numpy.uint32).view(numpy.float32)
+        else:
+            value = value.view(numpy.float64)
+    elif field.is_signed:
+        if field.length == 64:
+            value = value.view(numpy.int64)
+        else:
+            sign = 1 << (field.length - 1)
+            value = (value.astype(numpy.int64) ^ sign) - sign
+
+    return value
+
+
+def unpack_data_batch(rows, formats):
+    """Extract the raw values of all fields in given formats from every
+    row of given ``numpy.uint8`` array.
+
+    """
+
+    return {
+        bit_field.data.name: _unpack_batch(rows, bit_field)
+        for bit_field in formats.bit_fields
+    }
+
+
+def decode_data_batch(unpacked, fields, scaling):
+    """Scale given unpacked raw values of given fields.
+
+    """
+
+    decoded = {}
+
+    for field in fields:
+        value = unpacked[field.name]
+
+        if scaling:
+            if field.is_float \
+               or not is_integral(field.scale) \
+               or not is_integral(field.offset):
+                value = value.astype(numpy.float64) * field.scale + field.offset
+            elif field.scale != 1 or field.offset != 0:
+                value = (value.astype(numpy.int64) * int(field.scale)
+                         + int(field.offset))
+
+        decoded[field.name] = value
+
+    return decoded
+
+
+def mask_data_batch(value, present):
+    """Return given values as a masked array, masked where `present` is
+    ``False``. `present` ``None`` means present in all rows.
+
+    """
+
+    if present is None:
+        present = True
+
+    return numpy.ma.MaskedArray(value, mask=numpy.logical_not(present))
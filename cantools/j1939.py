@@ -135,6 +135,15 @@ def pgn_unpack(pgn):
     return PGN(*bitstruct.unpack('u1u1u8u8', packed))
 
 
+def is_frame_id(frame_id):
+    """Returns ``True`` if given integer is a valid 29 bits frame id,
+    ``False`` otherwise.
+
+    """
+
+    return (0 <= frame_id <= 0x1fffffff)
+
+
 def pgn_from_frame_id(frame_id):
     """Get the parameter group number (PGN) from given frame id.
 
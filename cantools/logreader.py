@@ -1,7 +1,22 @@
 import re
 import enum
+import mmap
 import binascii
+import calendar
 import datetime
+from collections import namedtuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .errors import Error
+
+
+# Approximate number of bytes scanned at a time by parsers created
+# with Parser.from_file().
+CHUNK_SIZE = 1024 * 1024
 
 
 class TimestampFormat(enum.Enum):
@@ -14,6 +29,23 @@ class TimestampFormat(enum.Enum):
     MISSING = 3
 
 
+# Maximum number of data bytes in a frame of a table created by
+# read_table().
+TABLE_DATA_SIZE = 64
+
+
+FrameTable = namedtuple('FrameTable',
+                        [
+                            'timestamp',
+                            'timestamp_format',
+                            'channel',
+                            'channels',
+                            'frame_id',
+                            'dlc',
+                            'data'
+                        ])
+
+
 class DataFrame:
     """Container for a parsed log entry (ie. a CAN frame)."""
 
@@ -21,20 +53,40 @@ class DataFrame:
                  frame_id: int,
                  data: bytes,
                  timestamp: datetime.datetime,
-                 timestamp_format: TimestampFormat):
+                 timestamp_format: TimestampFormat,
+                 seconds: float = None):
         """Constructor for DataFrame
 
         :param channel: A string representation of the channel, eg. 'can0'
         :param frame_id: The numeric CAN frame ID :param data: The actual data
         :param timestamp: A timestamp, datetime.datetime if absolute, or
-            datetime.timedelta if relative, None if missing
+            datetime.timedelta if relative, None if missing or if it shall
+            be created from `seconds` on demand
         :param timestamp_format: The format of the timestamp
+        :param seconds: The timestamp in seconds, since epoch if absolute,
+            None if missing
         : """
         self.channel = channel
         self.frame_id = frame_id
         self.data = data
-        self.timestamp = timestamp
+        self._timestamp = timestamp
         self.timestamp_format = timestamp_format
+        self.seconds = seconds
+
+    @property
+    def timestamp(self):
+        if self._timestamp is None and self.seconds is not None:
+            if self.timestamp_format == TimestampFormat.RELATIVE:
+                self._timestamp = datetime.timedelta(seconds=self.seconds)
+            else:
+                self._timestamp = datetime.datetime.utcfromtimestamp(
+                    self.seconds)
+
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value):
+        self._timestamp = value
 
 
 class BasePattern:
@@ -44,11 +96,39 @@ class BasePattern:
         if mo:
             return clz.unpack(mo)
 
+    @classmethod
+    def match_bytes(clz, line):
+        """Same as match(), but for a line as bytes. The timestamp of the
+        returned frame is only created if accessed.
+
+        """
+
+        mo = clz.bytes_pattern.match(line)
+        if mo:
+            return clz.unpack_bytes(mo)
+
+    @classmethod
+    def unpack_bytes(clz, match_object):
+        channel, frame_id, data = match_object.group('channel',
+                                                     'can_id',
+                                                     'can_data')
+        channel = channel.decode('ascii')
+        frame_id = int(frame_id, 16)
+        data = binascii.unhexlify(data.replace(b' ', b''))
+        seconds, timestamp_format = clz.unpack_seconds(match_object)
+
+        return DataFrame(channel=channel, frame_id=frame_id, data=data, timestamp=None, timestamp_format=timestamp_format, seconds=seconds)
+
 
 class CandumpDefaultPattern(BasePattern):
     # vcan0  1F0   [8]  00 00 00 00 00 00 1B C1
     pattern = re.compile(
         r'^\s*?(?P<channel>[a-zA-Z0-9]+)\s+(?P<can_id>[0-9A-F]+)\s+\[\d+\]\s*(?P<can_data>[0-9A-F ]*)$')
+    bytes_pattern = re.compile(pattern.pattern.encode('ascii'))
+
+    @staticmethod
+    def unpack_seconds(match_object):
+        return None, TimestampFormat.MISSING
 
     @staticmethod
     def unpack(match_object):
@@ -67,6 +147,17 @@ class CandumpTimestampedPattern(BasePattern):
     # (000.000000)  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
     pattern = re.compile(
         r'^\s*?\((?P<timestamp>[\d.]+)\)\s+(?P<channel>[a-zA-Z0-9]+)\s+(?P<can_id>[0-9A-F]+)\s+\[\d+\]\s*(?P<can_data>[0-9A-F ]*)$')
+    bytes_pattern = re.compile(pattern.pattern.encode('ascii'))
+
+    @staticmethod
+    def unpack_seconds(match_object):
+        seconds = float(match_object.group('timestamp'))
+        if seconds < 662688000:
+            timestamp_format = TimestampFormat.RELATIVE
+        else:
+            timestamp_format = TimestampFormat.ABSOLUTE
+
+        return seconds, timestamp_format
 
     @staticmethod
     def unpack(match_object):
@@ -84,7 +175,7 @@ class CandumpTimestampedPattern(BasePattern):
             timestamp = datetime.datetime.utcfromtimestamp(seconds)
             timestamp_format = TimestampFormat.ABSOLUTE
 
-        return DataFrame(channel=channel, frame_id=frame_id, data=data, timestamp=timestamp, timestamp_format=timestamp_format)
+        return DataFrame(channel=channel, frame_id=frame_id, data=data, timestamp=timestamp, timestamp_format=timestamp_format, seconds=seconds)
 
 
 class CandumpDefaultLogPattern(BasePattern):
@@ -92,6 +183,11 @@ class CandumpDefaultLogPattern(BasePattern):
     # (1613656104.501098) can2 14C##16A0FFE00606E022400000000000000A0FFFF00FFFF25000600000000000000FE
     pattern = re.compile(
         r'^\s*?\((?P<timestamp>[\d.]+)\)\s+(?P<channel>[a-zA-Z0-9]+)\s+(?P<can_id>[0-9A-F]+)#(#[0-9A-F])?(?P<can_data>[0-9A-F]*)$')
+    bytes_pattern = re.compile(pattern.pattern.encode('ascii'))
+
+    @staticmethod
+    def unpack_seconds(match_object):
+        return float(match_object.group('timestamp')), TimestampFormat.ABSOLUTE
 
     @staticmethod
     def unpack(match_object):
@@ -100,16 +196,32 @@ class CandumpDefaultLogPattern(BasePattern):
         data = match_object.group('can_data')
         data = data.replace(' ', '')
         data = binascii.unhexlify(data)
-        timestamp = datetime.datetime.utcfromtimestamp(float(match_object.group('timestamp')))
+        seconds = float(match_object.group('timestamp'))
+        timestamp = datetime.datetime.utcfromtimestamp(seconds)
         timestamp_format = TimestampFormat.ABSOLUTE
 
-        return DataFrame(channel=channel, frame_id=frame_id, data=data, timestamp=timestamp, timestamp_format=timestamp_format)
+        return DataFrame(channel=channel, frame_id=frame_id, data=data, timestamp=timestamp, timestamp_format=timestamp_format, seconds=seconds)
 
 
 class CandumpAbsoluteLogPattern(BasePattern):
     # (2020-12-19 12:04:45.485261)  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
     pattern = re.compile(
         r'^\s*?\((?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+)\)\s+(?P<channel>[a-zA-Z0-9]+)\s+(?P<can_id>[0-9A-F]+)\s+\[\d+\]\s*(?P<can_data>[0-9A-F ]*)$')
+    bytes_pattern = re.compile(pattern.pattern.encode('ascii'))
+
+    @staticmethod
+    def unpack_seconds(match_object):
+        # Faster than strptime(). Same format as in unpack().
+        timestamp = match_object.group('timestamp')
+        seconds = calendar.timegm((int(timestamp[0:4]),
+                                   int(timestamp[5:7]),
+                                   int(timestamp[8:10]),
+                                   int(timestamp[11:13]),
+                                   int(timestamp[14:16]),
+                                   int(timestamp[17:19])))
+        seconds += float(timestamp[19:])
+
+        return seconds, TimestampFormat.ABSOLUTE
 
     @staticmethod
     def unpack(match_object):
@@ -120,8 +232,9 @@ class CandumpAbsoluteLogPattern(BasePattern):
         data = binascii.unhexlify(data)
         timestamp = datetime.datetime.strptime(match_object.group('timestamp'), "%Y-%m-%d %H:%M:%S.%f")
         timestamp_format = TimestampFormat.ABSOLUTE
+        seconds, _ = CandumpAbsoluteLogPattern.unpack_seconds(match_object)
 
-        return DataFrame(channel=channel, frame_id=frame_id, data=data, timestamp=timestamp, timestamp_format=timestamp_format)
+        return DataFrame(channel=channel, frame_id=frame_id, data=data, timestamp=timestamp, timestamp_format=timestamp_format, seconds=seconds)
 
 
 class Parser:
@@ -133,19 +246,77 @@ class Parser:
     >>> with open('candump.log') as fd:
             for frame in cantools.logreader.Parser(fd):
                 print(f'{frame.timestamp}: {frame.frame_id}')
+
+    Large log files are faster parsed by a parser created with
+    :meth:`from_file()`, which also supports seeking.
+
+    >>> with cantools.logreader.Parser.from_file('candump.log') as parser:
+            parser.seek_timestamp(1594172461.968006)
+            for frame in parser:
+                print(f'{frame.seconds}: {frame.frame_id}')
     """
 
+    PATTERNS = [
+        CandumpDefaultPattern,
+        CandumpTimestampedPattern,
+        CandumpDefaultLogPattern,
+        CandumpAbsoluteLogPattern
+    ]
+
     def __init__(self, stream=None):
         self.stream = stream
         self.pattern = None
+        self._mmap = None
+        self._offset = 0
+
+    @classmethod
+    def from_file(cls, filename):
+        """Create a parser of given log file. The file is memory mapped and
+        scanned in chunks of bytes, and timestamps of parsed frames
+        are only converted to :class:`datetime.datetime` or
+        :class:`datetime.timedelta` objects if accessed. Use
+        :meth:`close()` or the parser as a context manager to unmap
+        the file.
+
+        """
+
+        parser = cls()
+
+        with open(filename, 'rb') as fin:
+            try:
+                parser._mmap = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                parser._mmap = b''
+
+        return parser
+
+    def close(self):
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     @staticmethod
     def detect_pattern(line):
-        for p in [CandumpDefaultPattern, CandumpTimestampedPattern, CandumpDefaultLogPattern, CandumpAbsoluteLogPattern]:
+        for p in Parser.PATTERNS:
             mo = p.pattern.match(line)
             if mo:
                 return p
 
+    @staticmethod
+    def detect_bytes_pattern(line):
+        for p in Parser.PATTERNS:
+            mo = p.bytes_pattern.match(line)
+            if mo:
+                return p
+
     def parse(self, line):
         if self.pattern is None:
             self.pattern = self.detect_pattern(line)
@@ -153,12 +324,177 @@ class Parser:
             return None
         return self.pattern.match(line)
 
+    def parse_bytes(self, line):
+        if self.pattern is None:
+            self.pattern = self.detect_bytes_pattern(line)
+        if self.pattern is None:
+            return None
+        return self.pattern.match_bytes(line)
+
+    def seek_line(self, line_number):
+        """Continue parsing at given zero based line number of the file. Only
+        supported by parsers created with :meth:`from_file()`.
+
+        """
+
+        data = self._get_mmap()
+        offset = 0
+
+        for _ in range(line_number):
+            offset = data.find(b'\n', offset)
+
+            if offset == -1:
+                offset = len(data)
+                break
+
+            offset += 1
+
+        self._offset = offset
+
+    def seek_timestamp(self, seconds):
+        """Continue parsing at the first frame with a timestamp greater than
+        or equal to given timestamp in seconds, as found in the
+        ``seconds`` attribute of parsed frames. The timestamps in the
+        file must be in ascending order. Only supported by parsers
+        created with :meth:`from_file()`.
+
+        """
+
+        data = self._get_mmap()
+        low = 0
+        high = len(data)
+
+        # Binary search over line start offsets. Only a few lines
+        # around the middle of the remaining range are parsed in each
+        # step.
+        while low < high:
+            start = data.rfind(b'\n', low, (low + high) // 2) + 1
+
+            if start == 0:
+                start = low
+
+            frame_seconds, frame_start, frame_end = self._find_seconds(start,
+                                                                       high)
+
+            if frame_seconds is None:
+                high = start
+            elif frame_seconds >= seconds:
+                high = frame_start
+            else:
+                low = frame_end
+
+        self._offset = low
+
+    def _find_seconds(self, offset, stop):
+        """Returns the timestamp in seconds, start offset and end offset of
+        the first timestamped frame starting at or after given offset,
+        but before `stop`.
+
+        """
+
+        data = self._mmap
+
+        while offset < stop:
+            end = data.find(b'\n', offset)
+
+            if end == -1:
+                end = len(data)
+            else:
+                end += 1
+
+            frame = self.parse_bytes(data[offset:end].strip(b'\r\n'))
+
+            if frame is not None and frame.seconds is not None:
+                return frame.seconds, offset, end
+
+            offset = end
+
+        return None, None, None
+
+    def _get_mmap(self):
+        if self._mmap is None:
+            raise ValueError(
+                'Seeking is only supported by parsers created with '
+                'Parser.from_file().')
+
+        return self._mmap
+
+    def _read_chunk(self):
+        """Returns the complete lines of the next chunk of the file, and the
+        offset after them, or ``None`` at the end of the file.
+
+        """
+
+        data = self._mmap
+        size = len(data)
+
+        if self._offset >= size:
+            return None
+
+        stop = self._offset + CHUNK_SIZE
+
+        if stop < size:
+            stop = data.find(b'\n', stop)
+
+            if stop == -1:
+                stop = size
+            else:
+                stop += 1
+        else:
+            stop = size
+
+        lines = data[self._offset:stop].split(b'\n')
+
+        if lines[-1] == b'':
+            del lines[-1]
+
+        return lines, stop
+
+    def _iterlines_bytes(self, keep_unknowns):
+        match = None
+        unpack = None
+
+        while True:
+            chunk = self._read_chunk()
+
+            if chunk is None:
+                break
+
+            lines, stop = chunk
+            offset = self._offset
+
+            for line in lines:
+                offset += len(line) + 1
+                self._offset = offset
+                line = line.strip(b'\r\n')
+
+                if match is None:
+                    frame = self.parse_bytes(line)
+
+                    if self.pattern is not None:
+                        match = self.pattern.bytes_pattern.match
+                        unpack = self.pattern.unpack_bytes
+                else:
+                    mo = match(line)
+                    frame = unpack(mo) if mo else None
+
+                if frame:
+                    yield line, frame
+                elif keep_unknowns:
+                    yield line, None
+
+            self._offset = stop
+
     def iterlines(self, keep_unknowns=False):
         """Returns an generator that yields (str, DataFrame) tuples with the
         raw log entry and a parsed log entry. If keep_unknowns=True, (str,
         None) tuples will be returned for log entries that couldn't be decoded.
         If keep_unknowns=False, non-parseable log entries is discarded.
         """
+        if self._mmap is not None:
+            for line, frame in self._iterlines_bytes(keep_unknowns):
+                yield line.decode('utf-8', 'replace'), frame
+            return
         if self.stream is None:
             return
         while True:
@@ -177,5 +513,134 @@ class Parser:
     def __iter__(self):
         """Returns DataFrame log entries. Non-parseable log entries is
         discarded."""
+        if self._mmap is not None:
+            for _, frame in self._iterlines_bytes(False):
+                yield frame
+            return
         for _, frame in self.iterlines():
             yield frame
+
+
+def _read_table_chunk(lines, pattern, channels):
+    """Returns the columns of the frames in given lines, all with given
+    pattern.
+
+    """
+
+    match = pattern.bytes_pattern.match
+    unpack_seconds = pattern.unpack_seconds
+    unhexlify = binascii.unhexlify
+    timestamps = []
+    channel_codes = []
+    frame_ids = []
+    dlcs = []
+    payloads = []
+
+    for line in lines:
+        mo = match(line.strip(b'\r\n'))
+
+        if mo is None:
+            continue
+
+        channel, frame_id, data = mo.group('channel', 'can_id', 'can_data')
+        data = unhexlify(data.replace(b' ', b''))
+
+        if len(data) > TABLE_DATA_SIZE:
+            continue
+
+        try:
+            channel_codes.append(channels[channel])
+        except KeyError:
+            channels[channel] = len(channels)
+            channel_codes.append(channels[channel])
+
+        # Missing timestamps (None) are converted to NaN by numpy.
+        seconds, _ = unpack_seconds(mo)
+        timestamps.append(seconds)
+        frame_ids.append(int(frame_id, 16))
+        dlcs.append(len(data))
+        payloads.append(data.ljust(TABLE_DATA_SIZE, b'\x00'))
+
+    return (numpy.array(timestamps, dtype=numpy.float64),
+            numpy.array(channel_codes, dtype=numpy.uint16),
+            numpy.array(frame_ids, dtype=numpy.uint32),
+            numpy.array(dlcs, dtype=numpy.uint8),
+            numpy.frombuffer(b''.join(payloads), dtype=numpy.uint8).reshape(
+                -1, TABLE_DATA_SIZE))
+
+
+def read_table(filename):
+    """Read all frames in given log file into a :class:`FrameTable` of
+    ``numpy`` arrays, one element or row per frame:
+
+    - ``timestamp``: Timestamps in seconds as ``numpy.float64``, NaN
+      if missing. Absolute timestamps are seconds since epoch.
+
+    - ``timestamp_format``: The :class:`TimestampFormat` of the first
+      frame, or ``TimestampFormat.MISSING`` if there are no frames.
+
+    - ``channel``: Channel codes as ``numpy.uint16``, indexes in
+      ``channels``.
+
+    - ``channels``: A list of channel names, eg. ``['vcan0']``.
+
+    - ``frame_id``: Frame ids as ``numpy.uint32``.
+
+    - ``dlc``: Number of data bytes as ``numpy.uint8``.
+
+    - ``data``: Data as a two dimensional ``numpy.uint8`` array with
+      64 columns, padded with zeros.
+
+    The format of the log file is detected as by :class:`Parser`. The
+    file is read in chunks, without creating a :class:`DataFrame` per
+    frame. Frames with more than 64 data bytes are discarded.
+
+    """
+
+    if numpy is None:
+        raise Error('The numpy package is required to read tables.')
+
+    channels = {}
+    columns = []
+    timestamp_format = TimestampFormat.MISSING
+
+    with Parser.from_file(filename) as parser:
+        while True:
+            chunk = parser._read_chunk()
+
+            if chunk is None:
+                break
+
+            lines, parser._offset = chunk
+
+            if parser.pattern is None:
+                for index, line in enumerate(lines):
+                    mo = parser.parse_bytes(line.strip(b'\r\n'))
+
+                    if mo is not None:
+                        timestamp_format = mo.timestamp_format
+                        lines = lines[index:]
+                        break
+                else:
+                    continue
+
+            columns.append(_read_table_chunk(lines, parser.pattern, channels))
+
+    if columns:
+        timestamp, channel, frame_id, dlc, data = [
+            numpy.concatenate(column) for column in zip(*columns)
+        ]
+    else:
+        timestamp = numpy.zeros(0, dtype=numpy.float64)
+        channel = numpy.zeros(0, dtype=numpy.uint16)
+        frame_id = numpy.zeros(0, dtype=numpy.uint32)
+        dlc = numpy.zeros(0, dtype=numpy.uint8)
+        data = numpy.zeros((0, TABLE_DATA_SIZE), dtype=numpy.uint8)
+
+    return FrameTable(timestamp,
+                      timestamp_format,
+                      channel,
+                      [name.decode('ascii') for name in channels],
+                      frame_id,
+                      dlc,
+                      data)
@@ -1,28 +1,264 @@
 import argparse
+import codecs
 import sys
+import binascii
+import multiprocessing
 from argparse_addons import Integer
 
 from .. import database
 from .. import logreader
-from .utils import format_message_by_frame_id
+from .utils import format_message
+from .utils import format_decoded_message
 
-def _do_decode(args):
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Approximate number of bytes of input lines read and decoded at a
+# time.
+BLOCK_SIZE = 1024 * 1024
+
+
+class _Decoder(object):
+    """Decodes blocks of log lines, returning the output of each block as
+    a single string.
+
+    """
+
+    def __init__(self, dbase, decode_choices, single_line):
+        self._dbase = dbase
+        self._decode_choices = decode_choices
+        self._single_line = single_line
+
+    def decode_block(self, lines, pattern):
+        """Decode given lines, all with given logreader pattern, or ``None``
+        if the pattern is not yet known.
+
+        """
+
+        output = [line.strip('\r\n') for line in lines]
+
+        if pattern is None:
+            return _join_lines(output)
+
+        # Group frames by frame id to decode all frames of a message at
+        # once.
+        groups = {}
+        match = pattern.pattern.match
+
+        for index, line in enumerate(output):
+            mo = match(line)
+
+            if mo is None:
+                continue
+
+            frame_id = int(mo.group('can_id'), 16)
+            data = binascii.unhexlify(mo.group('can_data').replace(' ', ''))
+
+            try:
+                groups[frame_id].append((index, data))
+            except KeyError:
+                groups[frame_id] = [(index, data)]
+
+        for frame_id, frames in groups.items():
+            message = self._dbase.find_message_by_frame_id(frame_id)
+
+            if message is None:
+                formatted = len(frames) * [
+                    ' Unknown frame id {0} (0x{0:x})'.format(frame_id)
+                ]
+            else:
+                formatted = self._format_frames(message,
+                                                [data for _, data in frames])
+
+            for (index, _), text in zip(frames, formatted):
+                output[index] += ' ::' + text
+
+        return _join_lines(output)
+
+    def _format_frames(self, message, datas):
+        """Format given payloads of given message.
+
+        Payloads of non-multiplexed messages are decoded at once with
+        :meth:`Message.decode_batch()<cantools.database.can.Message.decode_batch>`
+        if ``numpy`` is installed. Other payloads, and payloads shorter
+        than the message, are decoded one at a time.
+
+        """
+
+        formatted = len(datas) * [None]
+
+        if numpy is not None and not message.is_multiplexed():
+            indexes = [
+                index
+                for index, data in enumerate(datas)
+                if len(data) >= message.length
+            ]
+
+            try:
+                decoded = self._decode_batch(message,
+                                             [datas[index] for index in indexes])
+            except (ValueError, database.DecodeError):
+                # Signals outside the payload or longer than 64 bits.
+                decoded = []
+
+            for index, decoded_signals in zip(indexes, decoded):
+                formatted[index] = format_decoded_message(message,
+                                                          decoded_signals,
+                                                          self._single_line)
+
+        for index, text in enumerate(formatted):
+            if text is None:
+                formatted[index] = format_message(message,
+                                                  datas[index],
+                                                  self._decode_choices,
+                                                  self._single_line)
+
+        return formatted
+
+    def _decode_batch(self, message, datas):
+        """Decode given payloads of given non-multiplexed message at once,
+        returning a list of decoded signals dictionaries, as returned by
+        :meth:`Message.decode()<cantools.database.can.Message.decode>`.
+
+        """
+
+        if not datas:
+            return []
+
+        decoded, raw = message.decode_batch(datas, return_choices=True)
+        columns = {name: value.tolist() for name, value in decoded.items()}
+
+        if self._decode_choices:
+            for name, values in raw.items():
+                choices = message.get_signal_by_name(name).choices
+                column = columns[name]
+
+                for index, value in enumerate(values.tolist()):
+                    if value in choices:
+                        column[index] = choices[value]
+
+        return [
+            {name: column[index] for name, column in columns.items()}
+            for index in range(len(datas))
+        ]
+
+
+def _join_lines(lines):
+    return ''.join([line + '\n' for line in lines])
+
+
+def _read_available_lines(stream):
+    """Yield lists of lines read from given stream. Each list contains the
+    lines available without blocking, up to about `BLOCK_SIZE` bytes, so
+    a slowly written stream, for example a live candump, is not held
+    back waiting for a full block.
+
+    """
+
+    try:
+        read1 = stream.buffer.read1
+    except AttributeError:
+        # In-memory streams never block.
+        while True:
+            lines = stream.readlines(BLOCK_SIZE)
+
+            if not lines:
+                break
+
+            yield lines
+
+        return
+
+    # Read the binary buffer of the stream, as it returns the bytes
+    # available without blocking, which includes bytes already
+    # buffered by previous reads.
+    decoder = codecs.getincrementaldecoder(stream.encoding or 'utf-8')(
+        stream.errors or 'strict')
+    rest = ''
+
+    while True:
+        data = read1(BLOCK_SIZE)
+        text = rest + decoder.decode(data, final=not data)
+
+        if not data:
+            if text:
+                yield [text]
+
+            break
+
+        lines = text.split('\n')
+        rest = lines.pop()
+
+        if lines:
+            yield [line + '\n' for line in lines]
+
+
+def _read_blocks(stream):
+    """Yield blocks of lines read from given stream together with the log
+    pattern of the lines, which is detected as in
+    :class:`logreader.Parser<cantools.logreader.Parser>`.
+
+    """
+
+    pattern = None
+
+    for lines in _read_available_lines(stream):
+        if pattern is None:
+            for index, line in enumerate(lines):
+                pattern = logreader.Parser.detect_pattern(line.strip('\r\n'))
+
+                if pattern is not None:
+                    if index > 0:
+                        yield lines[:index], None
+
+                    lines = lines[index:]
+                    break
+
+        yield lines, pattern
+
+
+_worker_decoder = None
+
+
+def _init_worker(args):
+    global _worker_decoder
+
+    _worker_decoder = _create_decoder(args)
+
+
+def _decode_block_in_worker(block):
+    return _worker_decoder.decode_block(*block)
+
+
+def _create_decoder(args):
     dbase = database.load_file(args.database,
                                encoding=args.encoding,
                                frame_id_mask=args.frame_id_mask,
                                strict=not args.no_strict)
-    decode_choices = not args.no_decode_choices
-    parser = logreader.Parser(sys.stdin)
-    for line, frame in parser.iterlines(keep_unknowns=True):
-        if frame is not None:
-            line += ' ::'
-            line += format_message_by_frame_id(dbase,
-                                               frame.frame_id,
-                                               frame.data,
-                                               decode_choices,
-                                               args.single_line)
 
-        print(line)
+    return _Decoder(dbase, not args.no_decode_choices, args.single_line)
+
+
+def _do_decode(args):
+    blocks = _read_blocks(sys.stdin)
+
+    if args.jobs > 1:
+        with multiprocessing.Pool(args.jobs,
+                                  initializer=_init_worker,
+                                  initargs=(args, )) as pool:
+            # Blocks are decoded in parallel, but output in input order.
+            for output in pool.imap(_decode_block_in_worker, blocks):
+                sys.stdout.write(output)
+                sys.stdout.flush()
+    else:
+        decoder = _create_decoder(args)
+
+        for lines, pattern in blocks:
+            sys.stdout.write(decoder.decode_block(lines, pattern))
+            sys.stdout.flush()
 
 
 def add_subparser(subparsers):
@@ -52,6 +288,12 @@ def add_subparser(subparsers):
         help=('Only compare selected frame id bits to find the message in the '
               'database. By default the candump and database frame ids must '
               'be equal for a match.'))
+    decode_parser.add_argument(
+        '-j', '--jobs',
+        type=Integer(1),
+        default=1,
+        help=('Number of worker processes decoding blocks of input lines in '
+              'parallel. The output order is preserved.'))
     decode_parser.add_argument(
         'database',
         help='Database file.')
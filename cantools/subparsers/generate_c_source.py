@@ -1,6 +1,7 @@
 import argparse
 import os
 import os.path
+from argparse_addons import Integer
 
 from .. import database
 from ..database.can.c_source import generate
@@ -8,6 +9,16 @@ from ..database.can.doc_source import  generate_rst, generate_redmine
 from ..database.can.qt_source import generate_qt
 
 
+def _positive_float(string):
+    value = float(string)
+
+    if not value > 0:
+        raise argparse.ArgumentTypeError(
+            '{} is not a positive number'.format(string))
+
+    return value
+
+
 def _do_generate_qt_source(args):
     dbase = database.load_file(args.infile,
                                encoding=args.encoding,
@@ -26,13 +37,19 @@ def _do_generate_qt_source(args):
         args.signals,
 	    args)
 
-    with open(filename_h, 'w') as fout:
+    os.makedirs(args.output_directory, exist_ok=True)
+
+    path_h = os.path.join(args.output_directory, filename_h)
+
+    with open(path_h, 'w') as fout:
         fout.write(header)
 
-    with open(filename_c, 'w') as fout:
+    path_c = os.path.join(args.output_directory, filename_c)
+
+    with open(path_c, 'w') as fout:
         fout.write(source)
 
-    print('Successfully generated {} and {}.'.format(filename_h, filename_c))
+    print('Successfully generated {} and {}.'.format(path_h, path_c))
 
 def _do_generate_pdf_source(args):
     dbase = database.load_file(args.infile,
@@ -116,7 +133,7 @@ def _do_generate_c_source(args):
 
         fuzzer_path_mk = os.path.join(args.output_directory, fuzzer_filename_mk)
 
-        with open(fuzzer_filename_mk, 'w') as fout:
+        with open(fuzzer_path_mk, 'w') as fout:
             fout.write(fuzzer_makefile)
 
         print('Successfully generated {} and {}.'.format(fuzzer_path_c,
@@ -167,6 +184,10 @@ def add_common_c_qt_subparser(parser):
         '--no-range-check',
         action='store_true',
         help='Skip range checks.')
+    parser.add_argument(
+        '-o', '--output-directory',
+        default='.',
+        help='Directory in which to write output files.')
 
 def add_c_subparser(subparsers):
     generate_c_source_parser = subparsers.add_parser(
@@ -185,10 +206,6 @@ def add_c_subparser(subparsers):
         '--only-nodes',
         default='',
         help='Parse only the CAN-NODES specified, separated by comma (default is all nodes).')
-    generate_c_source_parser.add_argument(
-        '-o', '--output-directory',
-        default='.',
-        help='Directory in which to write output files.')
 
     generate_c_source_parser.set_defaults(func=_do_generate_c_source)
     
@@ -206,6 +223,32 @@ def add_qt_subparser(subparsers):
         '--for-modbus',
         action='store_true',
         help='Generates code for use with modbus in place of canbus.')
+    generate_qt_source.add_argument(
+        '--history-capacity',
+        type=Integer(1),
+        default=1000,
+        help=('Number of latest values stored per persistent signal. The '
+              'HistoryCapacity signal attribute overrides it (default: 1000).'))
+    generate_qt_source.add_argument(
+        '--history-decimation',
+        type=Integer(0),
+        default=0,
+        help=('Minimum time in milliseconds between stored values of '
+              'persistent signals. A value changing sooner replaces the '
+              'latest stored value. The HistoryDecimation signal attribute '
+              'overrides it (default: 0).'))
+    generate_qt_source.add_argument(
+        '--batch-notifications',
+        action='store_true',
+        help=('Notify changed signals once per received frame with the '
+              'frameUpdated signal of the message instead of one on_change '
+              'signal per changed signal.'))
+    generate_qt_source.add_argument(
+        '--max-notification-rate',
+        type=_positive_float,
+        help=('Maximum number of batched notifications per second and '
+              'message. The MaxNotificationRate message attribute overrides '
+              'it.'))
     generate_qt_source.set_defaults(func=_do_generate_qt_source)
     
     return generate_qt_source
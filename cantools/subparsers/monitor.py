@@ -8,8 +8,22 @@ import queue
 import can
 from argparse_addons import Integer
 from .. import database
-from .utils import format_message
-from .utils import format_multiplexed_name
+from .utils import format_decoded_message
+from .utils import format_decoded_multiplexed_name
+
+
+# Maximum number of received frames waiting to be processed by the
+# user interface. Frames received when full are dropped.
+QUEUE_SIZE = 65536
+
+# Minimum time in seconds a frame rate is calculated over.
+RATE_PERIOD = 1.0
+
+# Width of the frame rate column.
+RATE_WIDTH = 10
+
+# Indentation of message lines following the first one.
+INDENT = (12 + 1 + RATE_WIDTH + 2) * ' '
 
 
 class QuitError(Exception):
@@ -30,16 +44,26 @@ class Monitor(can.Listener):
         self._filter = ''
         self._filter_cursor_pos = 0
         self._compiled_filter = None
+        self._frames = {}
         self._formatted_messages = {}
+        self._modified_messages = set()
+        self._rates = {}
+        self._decoded_signals = {}
         self._playing = True
         self._modified = True
         self._show_filter = False
-        self._queue = queue.Queue()
+        self._queue = queue.Queue(QUEUE_SIZE)
         self._nrows, self._ncols = stdscr.getmaxyx()
         self._received = 0
         self._discarded = 0
+        self._dropped = 0
         self._basetime = None
         self._page_first_row = 0
+        self._refresh_period = 1 / args.refresh_rate
+        self._redraw_time = float('-inf')
+        self._redraw_pending = False
+        self._rows = {}
+        self._drawn_rows = None
 
         stdscr.keypad(True)
         stdscr.nodelay(True)
@@ -81,27 +105,32 @@ class Monitor(can.Listener):
             time.sleep(0.05)
 
     def tick(self, max_num_keys=-1):
-        modified = self.update()
-
-        if modified:
-            self.redraw()
+        now = time.monotonic()
+
+        if self.update():
+            self._redraw_pending = True
+        elif self._frames and now >= self._redraw_time + RATE_PERIOD:
+            # Redraw now and then when idle as well, for the rates of
+            # messages no longer received to decay.
+            self._redraw_pending = True
+
+        # Redraw at most at the refresh rate, independent of how often
+        # frames are received.
+        if self._redraw_pending:
+            if now >= self._redraw_time + self._refresh_period:
+                self.redraw(now)
+                self._redraw_pending = False
+                self._redraw_time = now
 
         self.process_user_input(max_num_keys)
 
-    def redraw(self):
-        # Clear the screen.
-        self._stdscr.clear()
-
-        # Draw everything.
+    def redraw(self, now):
+        # Draw everything into rows, which are compared to the rows
+        # already on the screen by draw_changed_rows().
+        self._rows = {}
         self.draw_stats(0)
         self.draw_title(1)
 
-        lines = []
-
-        for name in self._filtered_sorted_message_names:
-            for line in self._formatted_messages[name]:
-                lines.append(line)
-
         # Only render the visible screen. We only have (self._nrows - 3)
         # available rows to draw on, due to the persistent TUI features that
         # are drawn:
@@ -115,21 +144,168 @@ class Monitor(can.Listener):
         # make sure that we don't overshoot the last line of
         # content. this is a bit of a hack, because manipulation of
         # the controls is not supposed to happen within this method
-        if len(lines) < self._page_first_row + num_actual_usable_rows:
-            self._page_first_row = max(0, len(lines) - num_actual_usable_rows)
+        num_lines = sum([self.number_of_lines(name)
+                         for name in self._filtered_sorted_message_names])
+
+        if num_lines < self._page_first_row + num_actual_usable_rows:
+            self._page_first_row = max(0, num_lines - num_actual_usable_rows)
 
-        for line in lines[self._page_first_row:self._page_first_row + num_actual_usable_rows]:
+        for line in self.visible_lines(num_actual_usable_rows, now):
             self.addstr(row, 0, line)
             row += 1
 
         self.draw_menu(self._nrows - 1)
+        self.draw_changed_rows()
 
         # Refresh the screen.
         self._stdscr.refresh()
 
+    def draw_changed_rows(self):
+        """Only draw rows that differ from what is already on the
+        screen. The whole screen is cleared and drawn the first time
+        and after a resize.
+
+        """
+
+        if self._drawn_rows is None:
+            self._stdscr.clear()
+            self._drawn_rows = {}
+
+        for row in sorted(set(self._rows) | set(self._drawn_rows)):
+            segments = self._rows.get(row, [])
+
+            if segments == self._drawn_rows.get(row):
+                continue
+
+            if row in self._drawn_rows:
+                # Clear the previous contents.
+                try:
+                    self._stdscr.move(row, 0)
+                    self._stdscr.clrtoeol()
+                except curses.error:
+                    pass
+
+            for col, text, color in segments:
+                try:
+                    if color is None:
+                        self._stdscr.addstr(row, col, text)
+                    else:
+                        self._stdscr.addstr(row, col, text, color)
+                except curses.error:
+                    pass
+
+            if segments:
+                self._drawn_rows[row] = segments
+            else:
+                del self._drawn_rows[row]
+
+    def number_of_lines(self, name):
+        """Returns the number of lines of given message, as last formatted.
+
+        """
+
+        if self._single_line:
+            return 1
+
+        try:
+            return len(self._formatted_messages[name])
+        except KeyError:
+            return len(self.format_message(name))
+
+    def visible_lines(self, num_rows, now):
+        """Returns the lines of the visible messages. Only visible messages
+        received since last formatted are formatted again. The timestamp
+        and rate of each message are added to its first line.
+
+        """
+
+        lines = []
+        first_row = self._page_first_row
+        last_row = first_row + num_rows
+        row = 0
+
+        for name in self._filtered_sorted_message_names:
+            if row >= last_row:
+                break
+
+            num_lines = self.number_of_lines(name)
+
+            if row + num_lines > first_row:
+                if name in self._modified_messages:
+                    formatted = self.format_message(name)
+                else:
+                    formatted = self._formatted_messages[name]
+
+                formatted = ([self.format_prefix(name, now) + formatted[0]]
+                             + formatted[1:])
+                lines += formatted[max(first_row - row, 0):last_row - row]
+                num_lines = len(formatted)
+
+            row += num_lines
+
+        return lines
+
+    def format_message(self, name):
+        """Decode and format the last received frame of given message,
+        without its timestamp and rate.
+
+        """
+
+        message, data, _ = self._frames[name]
+
+        # Decode into the same dictionary for every frame to not
+        # allocate one per formatted frame.
+        decoded_signals = self._decoded_signals
+        decoded_signals.clear()
+
+        try:
+            message.decode_into(data, decoded_signals)
+        except Exception as e:
+            formatted = ' ' + str(e)
+        else:
+            formatted = format_decoded_message(message,
+                                               decoded_signals,
+                                               self._single_line)
+
+        if self._single_line:
+            formatted = [formatted]
+        else:
+            lines = formatted.splitlines()
+            formatted = [' ' + lines[1]]
+            formatted += [INDENT + line for line in lines[2:]]
+
+        self._formatted_messages[name] = formatted
+        self._modified_messages.discard(name)
+
+        return formatted
+
+    def format_prefix(self, name, now):
+        """Format the timestamp and rate of given message.
+
+        """
+
+        timestamp = self._frames[name][2]
+        _, _, rate, received = self._rates[name]
+
+        if rate is None:
+            rate = ''
+        else:
+            # The rate decays while the message is not received, as it
+            # is otherwise only calculated when received.
+            elapsed = now - received
+
+            if elapsed > 0:
+                rate = min(rate, 1 / elapsed)
+
+            rate = '{:.1f} Hz'.format(rate)
+
+        return '{:12.3f} {:>{}} '.format(timestamp, rate, RATE_WIDTH)
+
     def draw_stats(self, row):
         status_text = \
             f'Received: {self._received}, Discarded: {self._discarded}, Errors: 0'
+        if self._dropped:
+            status_text += f', Dropped: {self._dropped}'
         if self._filter:
             status_text += f', Filter: {self._filter}'
         self.addstr(row, 0, status_text)
@@ -137,7 +313,7 @@ class Monitor(can.Listener):
     def draw_title(self, row):
         self.addstr_color(row,
                           0,
-                          self.stretch('   TIMESTAMP  MESSAGE'),
+                          self.stretch('   TIMESTAMP       RATE  MESSAGE'),
                           curses.color_pair(1))
 
     def draw_menu(self, row):
@@ -187,16 +363,10 @@ class Monitor(can.Listener):
                               curses.color_pair(2))
 
     def addstr(self, row, col, text):
-        try:
-            self._stdscr.addstr(row, col, text)
-        except curses.error:
-            pass
+        self._rows.setdefault(row, []).append((col, text, None))
 
     def addstr_color(self, row, col, text, color):
-        try:
-            self._stdscr.addstr(row, col, text, color)
-        except curses.error:
-            pass
+        self._rows.setdefault(row, []).append((col, text, color))
 
     def stretch(self, text):
         return text + ' ' * (self._ncols - len(text))
@@ -222,9 +392,13 @@ class Monitor(can.Listener):
         elif key == 'r':
             self._playing = True
             self._filtered_sorted_message_names = []
+            self._frames = {}
             self._formatted_messages = {}
+            self._modified_messages = set()
+            self._rates = {}
             self._received = 0
             self._discarded = 0
+            self._dropped = 0
             self._basetime = None
             self._filter = ''
             self._compiled_filter = None
@@ -345,12 +519,12 @@ class Monitor(can.Listener):
         self.compile_filter()
         self._filtered_sorted_message_names = []
 
-        for name in self._formatted_messages:
+        for name in self._frames:
             self.insort_filtered(name)
 
         self._modified = True
 
-    def try_update_message(self):
+    def try_update_message(self, received):
         message = self._queue.get_nowait()
         frame_id = message.arbitration_id
         data = message.data
@@ -362,9 +536,9 @@ class Monitor(can.Listener):
         timestamp -= self._basetime
         self._received += 1
 
-        try:
-            message = self._dbase.get_message_by_frame_id(frame_id)
-        except KeyError:
+        message = self._dbase.find_message_by_frame_id(frame_id)
+
+        if message is None:
             self._discarded += 1
             return
 
@@ -375,37 +549,54 @@ class Monitor(can.Listener):
         name = message.name
 
         if message.is_multiplexed():
-            # Handle the case where a multiplexer index is used that isn't
-            # specified in the DBC file (ie. outside of the range). In this
-            # case, we just discard the message, like we do when the CAN
-            # message ID or length doesn't match what's specified in the DBC.
+            # The row of a multiplexed message depends on its
+            # multiplexer values, so it is decoded once here. It is
+            # formatted when drawn.
+            decoded_signals = self._decoded_signals
+            decoded_signals.clear()
+
             try:
-                name = format_multiplexed_name(message, data, True)
+                message.decode_into(data, decoded_signals)
             except database.DecodeError:
+                # Handle the case where a multiplexer index is used that
+                # isn't specified in the DBC file (ie. outside of the
+                # range). In this case, we just discard the message, like
+                # we do when the CAN message ID or length doesn't match
+                # what's specified in the DBC.
                 self._discarded += 1
                 return
+            else:
+                name = format_decoded_multiplexed_name(message,
+                                                       decoded_signals)
 
-        if self._single_line:
-            formatted = format_message(message, data, True, True)
-            self._formatted_messages[name] = [
-                '{:12.3f} {}'.format(timestamp, formatted)
-            ]
+        if name not in self._frames:
+            self._rates[name] = [timestamp, 0, None, received]
+            self.insort_filtered(name)
         else:
-            formatted = format_message(message, data, True, False)
-            lines = formatted.splitlines()
-            formatted = ['{:12.3f}  {}'.format(timestamp, lines[1])]
-            formatted += [14 * ' ' + line for line in lines[2:]]
-            self._formatted_messages[name] = formatted
+            self.update_rate(name, timestamp, received)
 
-        if name not in self._filtered_sorted_message_names:
-            self.insort_filtered(name)
+        # Only the last frame of each message is kept.
+        self._frames[name] = (message, data, timestamp)
+        self._modified_messages.add(name)
+
+    def update_rate(self, name, timestamp, received):
+        rate = self._rates[name]
+        rate[1] += 1
+        rate[3] = received
+        elapsed = timestamp - rate[0]
+
+        if elapsed >= RATE_PERIOD:
+            rate[0] = timestamp
+            rate[2] = rate[1] / elapsed
+            rate[1] = 0
 
     def update_messages(self):
         modified = False
+        received = time.monotonic()
 
         try:
             while True:
-                self.try_update_message()
+                self.try_update_message(received)
                 modified = True
         except queue.Empty:
             pass
@@ -424,6 +615,7 @@ class Monitor(can.Listener):
 
         if curses.is_term_resized(self._nrows, self._ncols):
             self._nrows, self._ncols = self._stdscr.getmaxyx()
+            self._drawn_rows = None
             modified = True
 
         return modified
@@ -434,7 +626,10 @@ class Monitor(can.Listener):
                           name)
 
     def on_message_received(self, msg):
-        self._queue.put(msg)
+        try:
+            self._queue.put_nowait(msg)
+        except queue.Full:
+            self._dropped += 1
 
 
 def _do_monitor(args):
@@ -484,6 +679,11 @@ def add_subparser(subparsers):
         '-f', '--fd',
         action='store_true',
         help='Python CAN CAN-FD bus.')
+    monitor_parser.add_argument(
+        '-r', '--refresh-rate',
+        type=Integer(1),
+        default=20,
+        help='Maximum number of screen redraws per second.')
     monitor_parser.add_argument(
         'database',
         help='Database file.')
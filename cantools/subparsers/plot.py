@@ -51,13 +51,18 @@ All signals (independent of the subplot and vertical axis) share the same horizo
 
 import sys
 import re
+import io
 import binascii
 import struct
 import datetime
 import argparse
+import contextlib
+import multiprocessing
 from argparse_addons import Integer
 try:
     from matplotlib import pyplot as plt
+    from matplotlib import dates as mdates
+    import numpy as np
 except ImportError:
     plt = None
 
@@ -67,6 +72,10 @@ from .. import errors
 
 PYPLOT_BASE_COLORS = "bgrcmykwC"
 
+# Approximate number of bytes of input lines parsed and decoded at a
+# time by a worker process.
+BLOCK_SIZE = 1024 * 1024
+
 
 class MatplotlibNotInstalledError(errors.Error):
 
@@ -332,7 +341,6 @@ def _do_decode(args):
                                encoding=args.encoding,
                                frame_id_mask=args.frame_id_mask,
                                strict=not args.no_strict)
-    re_format = None
     timestamp_parser = TimestampParser(args)
     if args.show_invalid_syntax:
         # we cannot use a timestamp if we have failed to parse the line
@@ -345,14 +353,38 @@ def _do_decode(args):
 
     plotter = Plotter(dbase, args)
 
-    line_number = 1
-    while True:
-        line = sys.stdin.readline()
+    if args.jobs > 1:
+        with multiprocessing.Pool(args.jobs,
+                                  initializer=_init_worker,
+                                  initargs=(args, )) as pool:
+            blocks = _read_blocks(sys.stdin, timestamp_parser)
+
+            # Blocks are decoded in parallel, but merged in input order.
+            for chunk in pool.imap(_parse_block_in_worker, blocks):
+                stopped = plotter.add_chunk(chunk)
+
+                if stopped:
+                    break
+    else:
+        _parse_lines(iter(sys.stdin.readline, ''),
+                     1,
+                     None,
+                     timestamp_parser,
+                     plotter)
+
+    plotter.plot(timestamp_parser.get_label())
 
-        # Break at EOF.
-        if not line:
-            break
 
+def _parse_lines(lines, line_number, re_format, timestamp_parser, plotter):
+    '''
+    Parses given lines, the first one with the given line number,
+    and passes the data to the plotter.
+    The input format is detected on the first valid line if re_format is None.
+    Returns True if the stop time was reached.
+    '''
+    args = timestamp_parser.args
+
+    for line in lines:
         line = line.strip('\r\n')
         if not line:
             continue
@@ -378,7 +410,7 @@ def _do_decode(args):
                 line_number += 1
                 continue
             elif args.stop is not None and timestamp > args.stop:
-                break
+                return True
             plotter.add_msg(timestamp, frame_id, data)
         elif RE_DECODE.match(line):
             continue
@@ -387,7 +419,99 @@ def _do_decode(args):
 
         line_number += 1
 
-    plotter.plot(timestamp_parser.get_label())
+    return False
+
+
+def _read_blocks(stream, timestamp_parser):
+    '''
+    Yields blocks of lines read from the given stream, together with
+    the line number of the first line, the input format and the timestamp parser.
+    Only counts the lines, which is much faster than parsing them.
+    The input format and the timestamp type are detected on the first valid line,
+    as in _parse_lines.
+    '''
+    re_format = None
+    line_number = 1
+
+    while True:
+        lines = stream.readlines(BLOCK_SIZE)
+
+        if not lines:
+            break
+
+        block = (lines, line_number, re_format, timestamp_parser)
+
+        for line in lines:
+            line = line.strip('\r\n')
+            if not line:
+                continue
+
+            if re_format is None:
+                mo = RE_CANDUMP.match(line) or RE_CANDUMP_LOG.match(line)
+
+                if mo:
+                    re_format = mo.re
+                    timestamp_parser.parse_timestamp(mo.group('time'), line_number)
+                elif RE_DECODE.match(line):
+                    continue
+            elif RE_DECODE.match(line) and not re_format.match(line):
+                continue
+
+            line_number += 1
+
+        yield block
+
+
+_worker_dbase = None
+
+
+def _init_worker(args):
+    global _worker_dbase
+
+    _worker_dbase = database.load_file(args.database,
+                                       encoding=args.encoding,
+                                       frame_id_mask=args.frame_id_mask,
+                                       strict=not args.no_strict)
+
+
+def _parse_block_in_worker(block):
+    lines, line_number, re_format, timestamp_parser = block
+    plotter = Plotter(_worker_dbase, timestamp_parser.args)
+    output = io.StringIO()
+
+    # Error messages are printed by the main process in input order.
+    with contextlib.redirect_stdout(output):
+        stopped = _parse_lines(lines,
+                               line_number,
+                               re_format,
+                               timestamp_parser,
+                               plotter)
+
+    return plotter.get_chunk(output.getvalue(), stopped)
+
+
+def _to_array(values):
+    '''
+    Converts the given list of values to a NumPy array.
+    Numbers mixed with None (NaN) give a float array,
+    strings and other objects an object array.
+    The type of the first value is kept, i.e. line numbers
+    mixed with floats (breaks) give an object array.
+    '''
+    array = np.array(values)
+
+    if array.dtype.kind == 'O':
+        try:
+            array = np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            pass
+
+    if array.dtype.kind == 'f' and not isinstance(values[0], float):
+        array = np.array(values, dtype=object)
+    elif array.dtype.kind not in 'biuf':
+        array = np.array(values, dtype=object)
+
+    return array
 
 
 class Plotter:
@@ -410,26 +534,60 @@ class Plotter:
         self.ignore_unknown_frames = args.ignore_unknown_frames
         self.ignore_invalid_data = args.ignore_invalid_data
         self.output_filename = args.output_file
-        self.signals = Signals(args.signals, args.case_sensitive, args.break_time, args, args.auto_color_ylabels)
+        self.signals = Signals(args.signals, args.case_sensitive, args.break_time, args, args.auto_color_ylabels, args.max_points)
+
+        # The signal patterns are resolved against the database once,
+        # instead of matching every decoded signal of every frame.
+        self.message_plans = {message.name: self.create_plan(message) for message in dbase.messages}
+        self.frame_id_plans = {}
 
         self.x_invalid_syntax = []
         self.x_unknown_frames = []
         self.x_invalid_data = []
 
+    def create_plan(self, message):
+        '''
+        Returns the given message, the names of its signals to be plotted
+        and a dict mapping them to the full signal names.
+        '''
+        names = {}
+        for signal in message.signals:
+            full_name = message.name + '.' + signal.name
+            if self.signals.is_displayed_signal(full_name):
+                names[signal.name] = full_name
+
+        return message, frozenset(names), names
+
     # ------- while reading data -------
 
     def add_msg(self, timestamp, frame_id, data):
         try:
-            message = self.dbase.get_message_by_frame_id(frame_id)
+            plan = self.frame_id_plans[frame_id]
         except KeyError:
+            try:
+                message = self.dbase.get_message_by_frame_id(frame_id)
+            except KeyError:
+                plan = None
+            else:
+                plan = self.message_plans[message.name]
+            self.frame_id_plans[frame_id] = plan
+
+        if plan is None:
             if self.show_unknown_frames:
                 self.x_unknown_frames.append(timestamp)
             if not self.ignore_unknown_frames:
                 print('Unknown frame id {0} (0x{0:x})'.format(frame_id))
             return
 
+        message, selected, names = plan
+
+        # Frames without signals to be plotted are not decoded at all,
+        # unless they are too short, to report them as invalid data.
+        if not selected and len(data) >= message.length:
+            return
+
         try:
-            decoded_signals = message.decode(data, self.decode_choices)
+            decoded_signals = message.decode_into(data, {}, self.decode_choices, signals=selected)
         except Exception as e:
             if self.show_invalid_data:
                 self.x_invalid_data.append(timestamp)
@@ -437,11 +595,10 @@ class Plotter:
                 print('Failed to parse data of frame id {0} (0x{0:x}): {1}'.format(frame_id, e))
             return
 
-        for signal in decoded_signals:
-            x = timestamp
-            y = decoded_signals[signal]
-            signal = message.name + '.' + signal
-            self.signals.add_value(signal, x, y)
+        # Multiplexers are decoded even if not selected.
+        for signal, y in decoded_signals.items():
+            if signal in names:
+                self.signals.add_value(names[signal], timestamp, y)
 
     def failed_to_parse_line(self, timestamp, line):
         if self.show_invalid_syntax:
@@ -449,6 +606,40 @@ class Plotter:
         if not self.ignore_invalid_syntax:
             print("Failed to parse line: %r" % line)
 
+    def get_chunk(self, output, stopped):
+        '''
+        Returns the data of a block of lines decoded by a worker process,
+        to be passed to add_chunk of the plotter in the main process.
+        '''
+        values = {
+            signal: graph.get_values()
+            for signal, graph in self.signals.values.items()
+        }
+
+        return (output,
+                values,
+                self.x_invalid_syntax,
+                self.x_unknown_frames,
+                self.x_invalid_data,
+                stopped)
+
+    def add_chunk(self, chunk):
+        '''
+        Adds the data of a block of lines decoded by a worker process.
+        Returns True if the stop time was reached.
+        '''
+        output, values, x_invalid_syntax, x_unknown_frames, x_invalid_data, stopped = chunk
+        sys.stdout.write(output)
+
+        for signal, (x, y) in values.items():
+            self.signals.add_values(signal, x, y)
+
+        self.x_invalid_syntax.extend(x_invalid_syntax)
+        self.x_unknown_frames.extend(x_unknown_frames)
+        self.x_invalid_data.extend(x_invalid_data)
+
+        return stopped
+
     # ------- at end -------
 
     def plot(self, xlabel):
@@ -494,9 +685,10 @@ class Signals:
 
     # ------- initialization -------
 
-    def __init__(self, signals, case_sensitive, break_time, global_subplot_args, auto_color_ylabels):
+    def __init__(self, signals, case_sensitive, break_time, global_subplot_args, auto_color_ylabels, max_points=None):
         self.args = signals
         self.global_subplot_args = global_subplot_args
+        self.max_points = max_points
         self.signals = []
         self.values = {}
         self.re_flags = 0 if case_sensitive else re.I
@@ -592,23 +784,40 @@ class Signals:
     # ------- while reading data -------
 
     def add_value(self, signal, x, y):
-        if not self.is_displayed_signal(signal):
-            return
-
+        '''
+        Adds a value of the given signal, which must be displayed.
+        '''
         if signal not in self.values:
             graph = Graph()
             self.values[signal] = graph
         else:
             graph = self.values[signal]
-            last_x = graph.x[-1]
+            last_x = graph.last_x
             if self.break_time_uninit:
                 self.init_break_time(type(x))
             if self.break_time and last_x + self.break_time < x:
                 x_break = last_x + self.half_break_time
-                graph.x.append(x_break)
-                graph.y.append(None)
-        graph.x.append(x)
-        graph.y.append(y)
+                graph.append(x_break, None)
+        graph.append(x, y)
+
+    def add_values(self, signal, x, y):
+        '''
+        Adds NumPy arrays of values of the given signal decoded by a worker process.
+        Breaks within the arrays have already been inserted by the worker.
+        '''
+        if signal not in self.values:
+            graph = Graph()
+            self.values[signal] = graph
+        else:
+            graph = self.values[signal]
+            last_x = graph.last_x
+            if self.break_time_uninit:
+                self.init_break_time(type(x[0]))
+            if self.break_time and last_x + self.break_time < x[0]:
+                x_break = last_x + self.half_break_time
+                x_break = _to_array([last_x, x_break])[1:]
+                graph.extend(x_break, _to_array([None]))
+        graph.extend(x, y)
 
     def is_displayed_signal(self, signal):
         return self.reo.match(signal)
@@ -653,13 +862,20 @@ class Signals:
                 else:
                     graph.plotted_signal = sgo
 
-                x = graph.x
-                y = graph.y
-                if axis_format_uninitialized and x:
+                x, y = graph.get_values()
+                if axis_format_uninitialized and len(x) > 0:
                     if isinstance(x[0], float):
                         splot.axes.xaxis.set_major_formatter(lambda x,pos: str(datetime.timedelta(seconds=x)))
                     axis_format_uninitialized = False
+                decimator = None
+                if self.max_points is not None and sgo.plt_func == 'plot':
+                    decimator = Decimator.create(x, y, self.max_points)
+                    if decimator is not None:
+                        x, y = decimator.get_values()
                 l = getattr(splot, sgo.plt_func)(x, y, sgo.fmt, label=signal_name)
+                if decimator is not None:
+                    decimator.lines.extend(l)
+                    splot.callbacks.connect('xlim_changed', decimator.on_xlim_changed)
                 color = self.subplot_args[(sgo.subplot, sgo.axis)].color
                 if color is not None and self.contains_no_color(sgo.fmt):
                     for p in l:
@@ -740,6 +956,108 @@ class Signals:
         return False
 
 
+class Decimator:
+
+    '''
+    Downsamples the values of a plotted line to about max_points points.
+    The values are divided into intervals of equal length
+    and the minimum and maximum value of each interval are kept,
+    so that peaks are still visible.
+    Breaks (NaN values) are always kept.
+
+    When the limits of the horizontal axis change, i.e. when zooming,
+    the visible values are downsampled again from the full resolution values.
+    '''
+
+    # ------- initialization -------
+
+    @classmethod
+    def create(cls, x, y, max_points):
+        '''
+        Returns a Decimator for the given values, or None if they
+        don't need to be downsampled or are not numbers.
+        '''
+        if len(x) <= max_points:
+            return None
+
+        x_numbers = cls.to_numbers(x)
+        y_numbers = cls.to_numbers(y)
+        if x_numbers is None or y_numbers is None:
+            return None
+
+        return cls(x, y, x_numbers, y_numbers, max_points)
+
+    @staticmethod
+    def to_numbers(values):
+        if values.dtype.kind in 'biuf':
+            return values.astype(float)
+
+        try:
+            return np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            pass
+
+        try:
+            return mdates.date2num(values)
+        except (TypeError, ValueError, AttributeError):
+            return None
+
+    def __init__(self, x, y, x_numbers, y_numbers, max_points):
+        self.x = x
+        self.y = y
+        self.x_numbers = x_numbers
+        self.y_numbers = y_numbers
+        self.max_points = max_points
+        self.lines = []
+
+    # ------- while plotting -------
+
+    def get_values(self, start=0, stop=None):
+        '''
+        Returns the downsampled x and y values between the given indices.
+        '''
+        if stop is None:
+            stop = len(self.x)
+        indices = self.decimate(start, stop)
+
+        return self.x[indices], self.y[indices]
+
+    def decimate(self, start, stop):
+        length = stop - start
+        if length <= self.max_points:
+            return np.arange(start, stop)
+
+        # Two points (minimum and maximum) are kept per interval.
+        intervals = max(self.max_points // 2, 1)
+        interval_length = -(-length // intervals)
+        y = np.full(intervals * interval_length, np.nan)
+        y[:length] = self.y_numbers[start:stop]
+        breaks = np.isnan(y)
+        shape = (intervals, interval_length)
+        offsets = np.arange(intervals) * interval_length
+        minimums = np.where(breaks, np.inf, y).reshape(shape).argmin(axis=1) + offsets
+        maximums = np.where(breaks, -np.inf, y).reshape(shape).argmax(axis=1) + offsets
+        indices = np.concatenate([[0, length - 1],
+                                  minimums,
+                                  maximums,
+                                  np.flatnonzero(breaks)])
+        indices = np.unique(indices)
+        indices = indices[indices < length]
+
+        return indices + start
+
+    def on_xlim_changed(self, axes):
+        xmin, xmax = axes.get_xlim()
+
+        # One more point on each side to draw the lines to the borders.
+        start = max(np.searchsorted(self.x_numbers, xmin, 'left') - 1, 0)
+        stop = min(np.searchsorted(self.x_numbers, xmax, 'right') + 1, len(self.x))
+        x, y = self.get_values(start, stop)
+
+        for line in self.lines:
+            line.set_data(x, y)
+
+
 class Signal:
 
     '''
@@ -778,15 +1096,54 @@ class Graph:
     to avoid undesired replotting of the same data in case the user gives two regex
     matching the same signal, one more specific to match a certain signal with a special format
     and one more generic matching the rest with another format.
+
+    The values are stored in chunks of NumPy arrays, in input order.
+    x and y store the latest values until there are CHUNK_SIZE of them.
     '''
 
-    __slots__ = ('x', 'y', 'plotted_signal')
+    CHUNK_SIZE = 4096
+
+    __slots__ = ('x', 'y', 'chunks', 'last_x', 'plotted_signal')
 
     def __init__(self):
         self.x = []
         self.y = []
+        self.chunks = []
+        self.last_x = None
         self.plotted_signal = None
 
+    def append(self, x, y):
+        self.x.append(x)
+        self.y.append(y)
+        self.last_x = x
+        if len(self.x) == self.CHUNK_SIZE:
+            self.flush()
+
+    def extend(self, x, y):
+        '''
+        Adds NumPy arrays of values.
+        '''
+        self.flush()
+        self.chunks.append((x, y))
+        self.last_x = x[-1]
+
+    def flush(self):
+        if self.x:
+            self.chunks.append((_to_array(self.x), _to_array(self.y)))
+            self.x = []
+            self.y = []
+
+    def get_values(self):
+        '''
+        Returns all x and y values as NumPy arrays.
+        '''
+        self.flush()
+        if len(self.chunks) > 1:
+            self.chunks = [(np.concatenate([x for x, _ in self.chunks]),
+                            np.concatenate([y for _, y in self.chunks]))]
+
+        return self.chunks[0]
+
 
 class RawDescriptionArgumentDefaultsHelpFormatter(
     argparse.RawDescriptionHelpFormatter, argparse.ArgumentDefaultsHelpFormatter):
@@ -871,6 +1228,21 @@ def add_subparser(subparsers):
         action='store_true',
         help='Don\'t print any error messages. This is an abbreviation for all --ignore-* options.')
 
+    decode_parser.add_argument(
+        '-j', '--jobs',
+        type=Integer(1),
+        default=1,
+        help=('Number of worker processes decoding blocks of input lines in '
+              'parallel.'))
+
+    decode_parser.add_argument(
+        '--max-points',
+        type=Integer(2),
+        help=('The maximum number of points plotted per signal (approximately). '
+              'Signals with more values are downsampled, keeping the minimum and '
+              'maximum value of each interval. Zooming in plots the visible values '
+              'with full resolution again, up to this number of points.'))
+
     decode_parser.add_argument(
         '-o', '--output-file',
         help='A file to write the plot to instead of displaying it in a window.')
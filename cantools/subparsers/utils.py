@@ -49,9 +49,9 @@ def format_message_by_frame_id(dbase,
                                data,
                                decode_choices,
                                single_line):
-    try:
-        message = dbase.get_message_by_frame_id(frame_id)
-    except KeyError:
+    message = dbase.find_message_by_frame_id(frame_id)
+
+    if message is None:
         return ' Unknown frame id {0} (0x{0:x})'.format(frame_id)
 
     return format_message(message, data, decode_choices, single_line)
@@ -63,6 +63,10 @@ def format_message(message, data, decode_choices, single_line):
     except Exception as e:
         return ' ' + str(e)
 
+    return format_decoded_message(message, decoded_signals, single_line)
+
+
+def format_decoded_message(message, decoded_signals, single_line):
     formatted_signals = _format_signals(message, decoded_signals)
 
     if single_line:
@@ -70,9 +74,14 @@ def format_message(message, data, decode_choices, single_line):
     else:
         return _format_message_multi_line(message, formatted_signals)
 
+
 def format_multiplexed_name(message, data, decode_choices):
     decoded_signals = message.decode(data, decode_choices)
 
+    return format_decoded_multiplexed_name(message, decoded_signals)
+
+
+def format_decoded_multiplexed_name(message, decoded_signals):
     # The idea here is that we rely on the sorted order of the Signals, and
     # then simply go through each possible Multiplexer and build a composite
     # key consisting of the Message name prepended to all the possible MUX
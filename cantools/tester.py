@@ -1,22 +1,25 @@
 # The tester module.
 
 import time
+import asyncio
+import threading
+from collections import deque
 
 try:
     from collections import UserDict
 except ImportError:
     from UserDict import UserDict
 
-try:
-    import queue
-except ImportError:
-    import Queue as queue
-
 import can
 
 from .errors import Error
 
 
+# Maximum number of received frames kept per message. The oldest
+# frame is dropped when a new frame is received into a full buffer.
+INPUT_BUFFER_SIZE = 1024
+
+
 class DecodedMessage(object):
     """A decoded message.
 
@@ -33,22 +36,121 @@ class Messages(dict):
         raise Error("invalid message name '{}'".format(key))
 
 
+class Inputs(object):
+    """Received frames in a ring buffer per message name. Frames are
+    numbered in reception order to discard older frames of other
+    messages when a message is expected.
+
+    Frames are decoded when expected, or when received if already
+    decoded for the `on_message` callback.
+
+    """
+
+    def __init__(self, names):
+        self._lock = threading.Lock()
+        self._number = 0
+        self._buffers = {}
+        self._conditions = {}
+
+        for name in names:
+            self._buffers[name] = deque(maxlen=INPUT_BUFFER_SIZE)
+            self._conditions[name] = threading.Condition(self._lock)
+
+    def put(self, name, data, signals):
+        """Put given frame of message `name`. `signals` are the decoded
+        signals, or ``None`` if not yet decoded.
+
+        """
+
+        with self._lock:
+            self._number += 1
+            self._buffers[name].append([self._number, data, signals])
+            self._conditions[name].notify_all()
+
+    def expect(self, message, signals, timeout, discard_other_messages):
+        buffer = self._buffers[message.database.name]
+        condition = self._conditions[message.database.name]
+
+        if timeout is not None:
+            end_time = time.time() + timeout
+
+        with self._lock:
+            # Number of the last frame matched against given signals.
+            # Each frame is only matched once.
+            checked_number = 0
+
+            while True:
+                for frame in buffer:
+                    if frame[0] <= checked_number:
+                        continue
+
+                    checked_number = frame[0]
+                    decoded = self._decode(message, frame)
+
+                    if decoded is None:
+                        continue
+
+                    if all([decoded[name] == signals[name] for name in signals]):
+                        buffer.remove(frame)
+
+                        if discard_other_messages:
+                            self._discard(checked_number)
+
+                        return decoded
+
+                if timeout is None:
+                    condition.wait()
+                else:
+                    remaining_time = end_time - time.time()
+
+                    if remaining_time <= 0:
+                        if discard_other_messages:
+                            self._discard(self._number + 1)
+
+                        return
+
+                    condition.wait(remaining_time)
+
+    def flush(self):
+        with self._lock:
+            for buffer in self._buffers.values():
+                buffer.clear()
+
+    def _decode(self, message, frame):
+        if frame[2] is None:
+            try:
+                frame[2] = message.decode(frame[1])
+            except Exception:
+                return
+
+        return frame[2]
+
+    def _discard(self, number):
+        """Discard all frames older than given frame number.
+
+        """
+
+        for buffer in self._buffers.values():
+            while buffer and buffer[0][0] < number:
+                buffer.popleft()
+
+
 class Listener(can.Listener):
 
-    def __init__(self, database, messages, input_queue, on_message):
+    def __init__(self, database, messages, inputs, on_message):
         self._database = database
         self._messages = messages
-        self._input_queue = input_queue
+        self._inputs = inputs
         self._on_message = on_message
 
     def on_message_received(self, msg):
         if msg.is_error_frame or msg.is_remote_frame:
             return
 
-        try:
-            database_message = self._database.get_message_by_frame_id(
-                msg.arbitration_id)
-        except KeyError:
+        database_message = self._database.find_message_by_frame_id(
+            msg.arbitration_id)
+
+        if database_message is None:
             return
 
         if database_message.name not in self._messages:
@@ -59,15 +161,42 @@ class Listener(can.Listener):
         if not message.enabled:
             return
 
-        decoded = DecodedMessage(database_message.name,
-                                 database_message.decode(msg.data,
-                                                         message.decode_choices,
-                                                         message.scaling))
+        self._put(message, msg.data)
+
+    def _put(self, message, data):
+        # Only decode now if needed by the callback. Other frames are
+        # decoded when expected.
+        if self._on_message:
+            signals = message.decode(data)
+            self._on_message(DecodedMessage(message.database.name, signals))
+        else:
+            signals = None
+
+        self._inputs.put(message.database.name, data, signals)
+
+
+class AsyncListener(Listener):
+    """Puts decoded messages in the input queue of each message, and
+    calls their subscribers. Called in the event loop.
+
+    """
+
+    def __init__(self, database, messages, on_message):
+        super(AsyncListener, self).__init__(database,
+                                            messages,
+                                            None,
+                                            on_message)
+
+    def _put(self, message, data):
+        decoded = DecodedMessage(message.database.name, message.decode(data))
 
         if self._on_message:
             self._on_message(decoded)
 
-        self._input_queue.put(decoded)
+        for callback in message.subscribers:
+            callback(decoded)
+
+        message._put_input(decoded)
 
 
 class Message(UserDict, object):
@@ -75,19 +204,17 @@ class Message(UserDict, object):
     def __init__(self,
                  database,
                  can_bus,
-                 input_list,
-                 input_queue,
+                 inputs,
                  decode_choices,
                  scaling,
                  padding):
         super(Message, self).__init__()
         self.database = database
         self._can_bus = can_bus
-        self._input_queue = input_queue
+        self._inputs = inputs
         self.decode_choices = decode_choices
         self.scaling = scaling
         self.padding = padding
-        self._input_list = input_list
         self.enabled = True
         self._can_message = None
         self._periodic_task = None
@@ -118,12 +245,96 @@ class Message(UserDict, object):
         if signals is None:
             signals = {}
 
+        return self._inputs.expect(self,
+                                   signals,
+                                   timeout,
+                                   discard_other_messages)
+
+    def decode(self, data):
+        return self.database.decode_into(data,
+                                         {},
+                                         self.decode_choices,
+                                         self.scaling)
+
+    def send_periodic_start(self):
+        if not self.enabled:
+            return
+
+        self._periodic_task = self._can_bus.send_periodic(
+            self._can_message,
+            self.database.cycle_time / 1000.0)
+
+    def send_periodic_stop(self):
+        if self._periodic_task is not None:
+            self._periodic_task.stop()
+            self._periodic_task = None
+
+    def _update_can_message(self):
+        arbitration_id = self.database.frame_id
+        extended_id = self.database.is_extended_frame
+        data = self.database.encode(self.data,
+                                    self.scaling,
+                                    self.padding)
+        self._can_message = can.Message(arbitration_id=arbitration_id,
+                                        extended_id=extended_id,
+                                        data=data)
+
+        if self._periodic_task is not None:
+            self._periodic_task.modify_data(self._can_message)
+
+    def _prepare_initial_signal_values(self):
+        initial_sig_values = dict()
+        for signal in self.database.signals:
+            minimum = 0 if not signal.minimum else signal.minimum
+            maximum = 0 if not signal.maximum else signal.maximum
+            if signal.initial:
+                # use initial signal value (if set)
+                initial_sig_values[signal.name] = signal.initial
+            elif minimum <= 0 <= maximum:
+                # use 0 if in allowed range
+                initial_sig_values[signal.name] = 0
+            else:
+                # set at least some default value
+                initial_sig_values[signal.name] = minimum
+        return initial_sig_values
+
+
+class AsyncMessage(Message):
+    """A message of an :class:`~cantools.tester.AsyncTester`, with its
+    own input queue.
+
+    """
+
+    def __init__(self,
+                 database,
+                 can_bus,
+                 decode_choices,
+                 scaling,
+                 padding):
+        super(AsyncMessage, self).__init__(database,
+                                           can_bus,
+                                           None,
+                                           decode_choices,
+                                           scaling,
+                                           padding)
+        self._input_list = []
+        self._input_queue = asyncio.Queue()
+        self.subscribers = []
+        self._periodic_sender = None
+
+    async def expect(self,
+                     signals=None,
+                     timeout=None,
+                     discard_other_messages=True):
+        if signals is None:
+            signals = {}
+
         decoded = self._expect_input_list(signals, discard_other_messages)
 
         if decoded is None:
-            decoded = self._expect_input_queue(signals,
-                                               timeout,
-                                               discard_other_messages)
+            decoded = await self._expect_input_queue(signals,
+                                                     timeout,
+                                                     discard_other_messages)
 
         return decoded
 
@@ -148,18 +359,33 @@ class Message(UserDict, object):
 
         return decoded
 
-    def _expect_input_queue(self, signals, timeout, discard_other_messages):
+    async def _expect_input_queue(self,
+                                  signals,
+                                  timeout,
+                                  discard_other_messages):
+        loop = asyncio.get_event_loop()
+
         if timeout is not None:
-            end_time = time.time() + timeout
-            remaining_time = timeout
-        else:
-            remaining_time = None
+            end_time = loop.time() + timeout
 
         while True:
             try:
-                message = self._input_queue.get(timeout=remaining_time)
-            except queue.Empty:
-                return
+                message = self._input_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                if timeout is None:
+                    message = await self._input_queue.get()
+                else:
+                    remaining_time = end_time - loop.time()
+
+                    if remaining_time <= 0:
+                        return
+
+                    try:
+                        message = await asyncio.wait_for(
+                            self._input_queue.get(),
+                            remaining_time)
+                    except asyncio.TimeoutError:
+                        return
 
             decoded = self._filter_expected_message(message, signals)
 
@@ -169,58 +395,76 @@ class Message(UserDict, object):
             if not discard_other_messages:
                 self._input_list.append(message)
 
-            if timeout is not None:
-                remaining_time = end_time - time.time()
-
-                if remaining_time <= 0:
-                    return
-
     def _filter_expected_message(self, message, signals):
         if message.name == self.database.name:
             if all([message.signals[name] == signals[name] for name in signals]):
                 return message.signals
 
-    def send_periodic_start(self):
+    async def send_periodic_start(self):
         if not self.enabled:
             return
 
-        self._periodic_task = self._can_bus.send_periodic(
-            self._can_message,
-            self.database.cycle_time / 1000.0)
+        if self._periodic_sender is None:
+            self._periodic_sender = asyncio.ensure_future(
+                self._send_periodic())
 
-    def send_periodic_stop(self):
-        if self._periodic_task is not None:
-            self._periodic_task.stop()
-            self._periodic_task = None
+    async def send_periodic_stop(self):
+        if self._periodic_sender is not None:
+            self._periodic_sender.cancel()
 
-    def _update_can_message(self):
-        arbitration_id = self.database.frame_id
-        extended_id = self.database.is_extended_frame
-        data = self.database.encode(self.data,
-                                    self.scaling,
-                                    self.padding)
-        self._can_message = can.Message(arbitration_id=arbitration_id,
-                                        extended_id=extended_id,
-                                        data=data)
+            try:
+                await self._periodic_sender
+            except asyncio.CancelledError:
+                pass
 
-        if self._periodic_task is not None:
-            self._periodic_task.modify_data(self._can_message)
+            self._periodic_sender = None
 
-    def _prepare_initial_signal_values(self):
-        initial_sig_values = dict()
-        for signal in self.database.signals:
-            minimum = 0 if not signal.minimum else signal.minimum
-            maximum = 0 if not signal.maximum else signal.maximum
-            if signal.initial:
-                # use initial signal value (if set)
-                initial_sig_values[signal.name] = signal.initial
-            elif minimum <= 0 <= maximum:
-                # use 0 if in allowed range
-                initial_sig_values[signal.name] = 0
-            else:
-                # set at least some default value
-                initial_sig_values[signal.name] = minimum
-        return initial_sig_values
+    async def _send_periodic(self):
+        loop = asyncio.get_event_loop()
+        period = self.database.cycle_time / 1000.0
+        send_time = loop.time()
+
+        # The last CAN message is sent, which is updated when signals
+        # are set. It is sent in an executor as sending may block. Sleep
+        # until the next send time to not drift.
+        while True:
+            await loop.run_in_executor(None,
+                                       self._can_bus.send,
+                                       self._can_message)
+            send_time += period
+            await asyncio.sleep(max(send_time - loop.time(), 0))
+
+    def _put_input(self, decoded):
+        self._input_queue.put_nowait(decoded)
+
+    def flush_input(self):
+        del self._input_list[:]
+
+        while not self._input_queue.empty():
+            self._input_queue.get_nowait()
+
+
+def _check_dut_and_bus_names(dut_name, database, bus_name):
+    # DUT name validation.
+    node_names = [node.name for node in database.nodes]
+
+    if not any([name == dut_name for name in node_names]):
+        raise Error(
+            "expected DUT name in {}, but got '{}'".format(node_names,
+                                                           dut_name))
+
+    # BUS name validation.
+    bus_names = [bus.name for bus in database.buses]
+
+    if len(bus_names) == 0:
+        if bus_name is not None:
+            raise Error(
+                "expected bus name None as there are no buses defined in "
+                "the database, but got '{}'".format(bus_name))
+    elif not any([name == bus_name for name in bus_names]):
+        raise Error(
+            "expected bus name in {}, but got '{}'".format(bus_names,
+                                                           bus_name))
 
 
 class Tester(object):
@@ -260,45 +504,25 @@ class Tester(object):
         self._bus_name = bus_name
         self._database = database
         self._can_bus = can_bus
-        self._input_list = []
-        self._input_queue = queue.Queue()
         self._messages = Messages()
         self._is_running = False
-
-        # DUT name validation.
-        node_names = [node.name for node in database.nodes]
-
-        if not any([name == dut_name for name in node_names]):
-            raise Error(
-                "expected DUT name in {}, but got '{}'".format(node_names,
-                                                               dut_name))
-
-        # BUS name validation.
-        bus_names = [bus.name for bus in database.buses]
-
-        if len(bus_names) == 0:
-            if bus_name is not None:
-                raise Error(
-                    "expected bus name None as there are no buses defined in "
-                    "the database, but got '{}'".format(bus_name))
-        elif not any([name == bus_name for name in bus_names]):
-            raise Error(
-                "expected bus name in {}, but got '{}'".format(bus_names,
-                                                               bus_name))
-
-        for message in database.messages:
-            if message.bus_name == bus_name:
-                self._messages[message.name] = Message(message,
-                                                       can_bus,
-                                                       self._input_list,
-                                                       self._input_queue,
-                                                       decode_choices,
-                                                       scaling,
-                                                       padding)
+        _check_dut_and_bus_names(dut_name, database, bus_name)
+        messages = [message
+                    for message in database.messages
+                    if message.bus_name == bus_name]
+        self._inputs = Inputs([message.name for message in messages])
+
+        for message in messages:
+            self._messages[message.name] = Message(message,
+                                                   can_bus,
+                                                   self._inputs,
+                                                   decode_choices,
+                                                   scaling,
+                                                   padding)
 
         listener = Listener(self._database,
                             self._messages,
-                            self._input_queue,
+                            self._inputs,
                             on_message)
         self._notifier = can.Notifier(can_bus, [listener])
 
@@ -402,11 +626,14 @@ class Tester(object):
 
         Give `timeout` as ``None`` to wait forever.
 
-        Messages are read from the input queue, and those not matching
-        given `message_name` and `signals` are discarded if
-        `discard_other_messages` is
+        Received messages are kept in an input buffer per message
+        name, holding at most the latest ``INPUT_BUFFER_SIZE``
+        messages. Only the buffer of given `message_name` is
+        searched. Messages not matching given `message_name` and
+        `signals`, received before the expected message, are discarded
+        if `discard_other_messages` is
         ``True``. :meth:`~cantools.tester.Tester.flush_input()` may be
-        called to discard all old messages in the input queue before
+        called to discard all old messages in the input buffers before
         calling the expect function.
 
         Returns the expected message, or ``None`` on timeout.
@@ -421,11 +648,198 @@ class Tester(object):
                                                    discard_other_messages)
 
     def flush_input(self):
-        """Flush, or discard, all messages in the input queue.
+        """Flush, or discard, all messages in the input buffers.
 
         """
 
-        del self._input_list[:]
+        self._inputs.flush()
 
-        while not self._input_queue.empty():
-            self._input_queue.get()
+
+class AsyncTester(object):
+    """Test given node `dut_name` on given CAN bus `bus_name` from an
+    :mod:`asyncio` event loop. Many testers, normally of different CAN
+    buses, can run in the same event loop.
+
+    Same as :class:`~cantools.tester.Tester`, but received messages
+    are put in an input queue per message, periodic messages are sent
+    by tasks in the event loop, and starting, stopping, enabling,
+    disabling and expecting are coroutines.
+
+    `loop` is the event loop the tester is used in, or ``None`` for
+    the current event loop.
+
+    >>> async def main():
+    ...     tester = cantools.tester.AsyncTester('PeriodicConsumer', database, can_bus, 'PeriodicBus')
+    ...     await tester.start()
+    ...     await tester.expect('Message2', {'Signal1': 13})
+
+    """
+
+    def __init__(self,
+                 dut_name,
+                 database,
+                 can_bus,
+                 bus_name=None,
+                 on_message=None,
+                 decode_choices=True,
+                 scaling=True,
+                 padding=False,
+                 loop=None):
+        self._dut_name = dut_name
+        self._bus_name = bus_name
+        self._database = database
+        self._can_bus = can_bus
+        self._messages = Messages()
+        self._is_running = False
+        _check_dut_and_bus_names(dut_name, database, bus_name)
+
+        if loop is None:
+            loop = asyncio.get_event_loop()
+
+        for message in database.messages:
+            if message.bus_name == bus_name:
+                self._messages[message.name] = AsyncMessage(message,
+                                                            can_bus,
+                                                            decode_choices,
+                                                            scaling,
+                                                            padding)
+
+        listener = AsyncListener(self._database,
+                                 self._messages,
+                                 on_message)
+        self._notifier = can.Notifier(can_bus, [listener], loop=loop)
+
+    async def start(self):
+        """Start the tester. Starts sending enabled periodic messages.
+
+        >>> await tester.start()
+
+        """
+
+        for message in self._messages.values():
+            if self._dut_name in message.database.senders:
+                continue
+
+            if not message.periodic:
+                continue
+
+            await message.send_periodic_start()
+
+        self._is_running = True
+
+    async def stop(self):
+        """Stop the tester. Periodic messages will not be sent after this
+        call. Call :meth:`~cantools.tester.AsyncTester.start()` to
+        resume a stopped tester.
+
+        >>> await tester.stop()
+
+        """
+
+        for message in self._messages.values():
+            await message.send_periodic_stop()
+
+        self._is_running = False
+
+    @property
+    def messages(self):
+        """Set and get signals in messages. See
+        :attr:`Tester.messages<cantools.tester.Tester.messages>`.
+
+        """
+
+        return self._messages
+
+    async def enable(self, message_name):
+        """Enable given message `message_name` and start sending it if its
+        periodic and the tester is running.
+
+        >>> await tester.enable('PeriodicMessage1')
+
+        """
+
+        message = self._messages[message_name]
+        message.enabled = True
+
+        if self._is_running and message.periodic:
+            await message.send_periodic_start()
+
+    async def disable(self, message_name):
+        """Disable given message `message_name` and stop sending it if its
+        periodic, enabled and the tester is running.
+
+        >>> await tester.disable('PeriodicMessage1')
+
+        """
+
+        message = self._messages[message_name]
+        message.enabled = False
+
+        if self._is_running and message.periodic:
+            await message.send_periodic_stop()
+
+    def send(self, message_name, signals=None):
+        """Send given message `message_name` and optional signals `signals`.
+
+        >>> tester.send('Message1', {'Signal2': 10})
+
+        """
+
+        self._messages[message_name].send(signals)
+
+    async def expect(self,
+                     message_name,
+                     signals=None,
+                     timeout=None,
+                     discard_other_messages=True):
+        """Expect given message `message_name` and signal values `signals`
+        within `timeout` seconds.
+
+        Give `signals` as ``None`` to expect any signal values.
+
+        Give `timeout` as ``None`` to wait forever.
+
+        Messages are read from the input queue of given message, and
+        those not matching given `signals` are discarded if
+        `discard_other_messages` is ``True``. Other messages are not
+        read.
+
+        Returns the expected message, or ``None`` on timeout.
+
+        >>> await tester.expect('Message2', {'Signal1': 13})
+        {'Signal1': 13, 'Signal2': 9}
+
+        """
+
+        return await self._messages[message_name].expect(
+            signals,
+            timeout,
+            discard_other_messages)
+
+    def subscribe(self, message_name, callback):
+        """Call given callback `callback` with a
+        :class:`~cantools.tester.DecodedMessage` instance for every
+        received enabled message `message_name`. The callback is
+        called in the event loop.
+
+        >>> tester.subscribe('Message2', print)
+
+        """
+
+        self._messages[message_name].subscribers.append(callback)
+
+    def unsubscribe(self, message_name, callback):
+        """Stop calling given callback `callback` for message
+        `message_name`.
+
+        """
+
+        self._messages[message_name].subscribers.remove(callback)
+
+    def flush_input(self):
+        """Flush, or discard, all messages in the input queues.
+
+        """
+
+        for message in self._messages.values():
+            message.flush_input()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+#
+# Script measuring the time it takes to load DBC files, both
+# tests/files/dbc/vehicle.dbc and synthetic files with many signals.
+#
+
+import os
+import timeit
+import argparse
+
+import cantools
+from cantools.database.can.formats import dbc
+
+
+SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+VEHICLE_DBC_PATH = os.path.join(SCRIPT_DIR,
+                                '..',
+                                '..',
+                                'tests',
+                                'files',
+                                'dbc',
+                                'vehicle.dbc')
+
+
+def create_synthetic_dbc(number_of_messages, signals_per_message):
+    """Create a DBC string with given number of messages with given
+    number of signals each. All signals have comments, attributes and
+    choices.
+
+    """
+
+    lines = [
+        'VERSION "1.0"',
+        '',
+        'NS_ :',
+        '',
+        'BS_:',
+        '',
+        'BU_: Sender Receiver',
+        ''
+    ]
+    comments = []
+    attributes = []
+    choices = []
+    signal_types = []
+    length = 4 * signals_per_message
+
+    for i in range(number_of_messages):
+        frame_id = 0x80000000 | i
+        lines.append(f'BO_ {frame_id} Message{i}: {length} Sender')
+
+        for j in range(signals_per_message):
+            name = f'Signal{i}_{j}'
+            lines.append(f' SG_ {name} : {32 * j}|32@1- (0.1,-5) [-100|100] '
+                         f'"km/h" Receiver')
+            comments.append(f'CM_ SG_ {frame_id} {name} "Signal {j} of '
+                            f'message {i}.";')
+            attributes.append(f'BA_ "GenSigStartValue" SG_ {frame_id} '
+                              f'{name} {j};')
+            choices.append(f'VAL_ {frame_id} {name} 0 "Off" 1 "On" ;')
+
+            if j % 2 == 0:
+                signal_types.append(f'SIG_VALTYPE_ {frame_id} {name} : 1;')
+
+        comments.append(f'CM_ BO_ {frame_id} "Message {i}.";')
+        attributes.append(f'BA_ "GenMsgCycleTime" BO_ {frame_id} 100;')
+        lines.append('')
+
+    lines += comments
+    lines += [
+        'BA_DEF_ BO_  "GenMsgCycleTime" INT 0 65535;',
+        'BA_DEF_ SG_  "GenSigStartValue" INT 0 65535;',
+        'BA_DEF_DEF_  "GenMsgCycleTime" 0;',
+        'BA_DEF_DEF_  "GenSigStartValue" 0;'
+    ]
+    lines += attributes
+    lines += choices
+    lines += signal_types
+
+    return '\n'.join(lines) + '\n'
+
+
+def benchmark(name, string, number):
+    elapsed = timeit.timeit(lambda: dbc.load_string(string), number=number)
+    print(f'{name}: {1000 * elapsed / number:.1f} ms per load')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure DBC load times.')
+    parser.add_argument('-n', '--number',
+                        type=int,
+                        default=3,
+                        help='Number of loads of each file.')
+    parser.add_argument('-m', '--messages',
+                        type=int,
+                        default=2000,
+                        help='Number of messages in the synthetic file.')
+    parser.add_argument('-s', '--signals',
+                        type=int,
+                        default=16,
+                        help='Number of signals per message in the synthetic '
+                        'file.')
+    args = parser.parse_args()
+
+    with open(VEHICLE_DBC_PATH, 'r', encoding='cp1252') as fin:
+        benchmark('vehicle.dbc', fin.read(), args.number)
+
+    benchmark(f'synthetic ({args.messages} messages, '
+              f'{args.messages * args.signals} signals)',
+              create_synthetic_dbc(args.messages, args.signals),
+              args.number)
+
+    print(f'cantools {cantools.__version__}')
+
+
+if __name__ == '__main__':
+    main()
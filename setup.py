@@ -34,6 +34,7 @@ setup(name='cantools',
       ],
       extras_require=dict(
           plot=['matplotlib'],
+          batch=['numpy'],
       ),
       test_suite="tests",
       entry_points = {
@@ -32,6 +32,9 @@
 
 #include "abs.h"
 
+#define encode_scale_offset(value, scale, offset) ((value - offset) * scale)
+#define decode_scale_offset(value, factor, offset) ((value * factor) + offset)
+
 static inline uint8_t pack_left_shift_u8(
     uint8_t value,
     uint8_t shift,
@@ -133,53 +136,70 @@ int abs_bremse_33_pack(
     const struct abs_bremse_33_t *src_p,
     size_t size)
 {
+    uint16_t whlspeed_fl;
+    uint16_t whlspeed_fr;
+    uint16_t whlspeed_rl;
+    uint16_t whlspeed_rr;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
     memset(&dst_p[0], 0, 8);
 
-    dst_p[0] |= pack_left_shift_u16(src_p->whlspeed_fl, 0u, 0xffu);
-    dst_p[1] |= pack_right_shift_u16(src_p->whlspeed_fl, 8u, 0xffu);
-    dst_p[2] |= pack_left_shift_u16(src_p->whlspeed_fr, 0u, 0xffu);
-    dst_p[3] |= pack_right_shift_u16(src_p->whlspeed_fr, 8u, 0xffu);
-    dst_p[4] |= pack_left_shift_u16(src_p->whlspeed_rl, 0u, 0xffu);
-    dst_p[5] |= pack_right_shift_u16(src_p->whlspeed_rl, 8u, 0xffu);
-    dst_p[6] |= pack_left_shift_u16(src_p->whlspeed_rr, 0u, 0xffu);
-    dst_p[7] |= pack_right_shift_u16(src_p->whlspeed_rr, 8u, 0xffu);
+    whlspeed_fl = (uint16_t)abs_bremse_33_whlspeed_fl_encode(src_p->whlspeed_fl);
+    dst_p[0] |= pack_left_shift_u16(whlspeed_fl, 0u, 0xffu);
+    dst_p[1] |= pack_right_shift_u16(whlspeed_fl, 8u, 0xffu);
+    whlspeed_fr = (uint16_t)abs_bremse_33_whlspeed_fr_encode(src_p->whlspeed_fr);
+    dst_p[2] |= pack_left_shift_u16(whlspeed_fr, 0u, 0xffu);
+    dst_p[3] |= pack_right_shift_u16(whlspeed_fr, 8u, 0xffu);
+    whlspeed_rl = (uint16_t)abs_bremse_33_whlspeed_rl_encode(src_p->whlspeed_rl);
+    dst_p[4] |= pack_left_shift_u16(whlspeed_rl, 0u, 0xffu);
+    dst_p[5] |= pack_right_shift_u16(whlspeed_rl, 8u, 0xffu);
+    whlspeed_rr = (uint16_t)abs_bremse_33_whlspeed_rr_encode(src_p->whlspeed_rr);
+    dst_p[6] |= pack_left_shift_u16(whlspeed_rr, 0u, 0xffu);
+    dst_p[7] |= pack_right_shift_u16(whlspeed_rr, 8u, 0xffu);
 
     return (8);
 }
-
 int abs_bremse_33_unpack(
     struct abs_bremse_33_t *dst_p,
     const uint8_t *src_p,
     size_t size)
 {
+    uint16_t whlspeed_fl;
+    uint16_t whlspeed_fr;
+    uint16_t whlspeed_rl;
+    uint16_t whlspeed_rr;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
-    dst_p->whlspeed_fl = unpack_right_shift_u16(src_p[0], 0u, 0xffu);
-    dst_p->whlspeed_fl |= unpack_left_shift_u16(src_p[1], 8u, 0xffu);
-    dst_p->whlspeed_fr = unpack_right_shift_u16(src_p[2], 0u, 0xffu);
-    dst_p->whlspeed_fr |= unpack_left_shift_u16(src_p[3], 8u, 0xffu);
-    dst_p->whlspeed_rl = unpack_right_shift_u16(src_p[4], 0u, 0xffu);
-    dst_p->whlspeed_rl |= unpack_left_shift_u16(src_p[5], 8u, 0xffu);
-    dst_p->whlspeed_rr = unpack_right_shift_u16(src_p[6], 0u, 0xffu);
-    dst_p->whlspeed_rr |= unpack_left_shift_u16(src_p[7], 8u, 0xffu);
+    whlspeed_fl = unpack_right_shift_u16(src_p[0], 0u, 0xffu);
+    whlspeed_fl |= unpack_left_shift_u16(src_p[1], 8u, 0xffu);
+    dst_p->whlspeed_fl = abs_bremse_33_whlspeed_fl_decode((uint16_t)whlspeed_fl);
+    whlspeed_fr = unpack_right_shift_u16(src_p[2], 0u, 0xffu);
+    whlspeed_fr |= unpack_left_shift_u16(src_p[3], 8u, 0xffu);
+    dst_p->whlspeed_fr = abs_bremse_33_whlspeed_fr_decode((uint16_t)whlspeed_fr);
+    whlspeed_rl = unpack_right_shift_u16(src_p[4], 0u, 0xffu);
+    whlspeed_rl |= unpack_left_shift_u16(src_p[5], 8u, 0xffu);
+    dst_p->whlspeed_rl = abs_bremse_33_whlspeed_rl_decode((uint16_t)whlspeed_rl);
+    whlspeed_rr = unpack_right_shift_u16(src_p[6], 0u, 0xffu);
+    whlspeed_rr |= unpack_left_shift_u16(src_p[7], 8u, 0xffu);
+    dst_p->whlspeed_rr = abs_bremse_33_whlspeed_rr_decode((uint16_t)whlspeed_rr);
 
     return (0);
 }
 
-uint16_t abs_bremse_33_whlspeed_fl_encode(double value)
+uint16_t abs_bremse_33_whlspeed_fl_encode(float value)
 {
-    return (uint16_t)(value / 0.015625);
+    return (uint16_t)(value / 0.015625f);
 }
 
-double abs_bremse_33_whlspeed_fl_decode(uint16_t value)
+float abs_bremse_33_whlspeed_fl_decode(uint16_t value)
 {
-    return ((double)value * 0.015625);
+    return ((float)value * 0.015625f);
 }
 
 bool abs_bremse_33_whlspeed_fl_is_in_range(uint16_t value)
@@ -187,14 +207,14 @@ bool abs_bremse_33_whlspeed_fl_is_in_range(uint16_t value)
     return (value <= 6400u);
 }
 
-uint16_t abs_bremse_33_whlspeed_fr_encode(double value)
+uint16_t abs_bremse_33_whlspeed_fr_encode(float value)
 {
-    return (uint16_t)(value / 0.015625);
+    return (uint16_t)(value / 0.015625f);
 }
 
-double abs_bremse_33_whlspeed_fr_decode(uint16_t value)
+float abs_bremse_33_whlspeed_fr_decode(uint16_t value)
 {
-    return ((double)value * 0.015625);
+    return ((float)value * 0.015625f);
 }
 
 bool abs_bremse_33_whlspeed_fr_is_in_range(uint16_t value)
@@ -202,14 +222,14 @@ bool abs_bremse_33_whlspeed_fr_is_in_range(uint16_t value)
     return (value <= 6400u);
 }
 
-uint16_t abs_bremse_33_whlspeed_rl_encode(double value)
+uint16_t abs_bremse_33_whlspeed_rl_encode(float value)
 {
-    return (uint16_t)(value / 0.015625);
+    return (uint16_t)(value / 0.015625f);
 }
 
-double abs_bremse_33_whlspeed_rl_decode(uint16_t value)
+float abs_bremse_33_whlspeed_rl_decode(uint16_t value)
 {
-    return ((double)value * 0.015625);
+    return ((float)value * 0.015625f);
 }
 
 bool abs_bremse_33_whlspeed_rl_is_in_range(uint16_t value)
@@ -217,14 +237,14 @@ bool abs_bremse_33_whlspeed_rl_is_in_range(uint16_t value)
     return (value <= 6400u);
 }
 
-uint16_t abs_bremse_33_whlspeed_rr_encode(double value)
+uint16_t abs_bremse_33_whlspeed_rr_encode(float value)
 {
-    return (uint16_t)(value / 0.015625);
+    return (uint16_t)(value / 0.015625f);
 }
 
-double abs_bremse_33_whlspeed_rr_decode(uint16_t value)
+float abs_bremse_33_whlspeed_rr_decode(uint16_t value)
 {
-    return ((double)value * 0.015625);
+    return ((float)value * 0.015625f);
 }
 
 bool abs_bremse_33_whlspeed_rr_is_in_range(uint16_t value)
@@ -247,7 +267,6 @@ int abs_bremse_10_pack(
 
     return (8);
 }
-
 int abs_bremse_10_unpack(
     struct abs_bremse_10_t *dst_p,
     const uint8_t *src_p,
@@ -278,7 +297,6 @@ int abs_bremse_11_pack(
 
     return (8);
 }
-
 int abs_bremse_11_unpack(
     struct abs_bremse_11_t *dst_p,
     const uint8_t *src_p,
@@ -309,7 +327,6 @@ int abs_bremse_12_pack(
 
     return (8);
 }
-
 int abs_bremse_12_unpack(
     struct abs_bremse_12_t *dst_p,
     const uint8_t *src_p,
@@ -340,7 +357,6 @@ int abs_bremse_13_pack(
 
     return (8);
 }
-
 int abs_bremse_13_unpack(
     struct abs_bremse_13_t *dst_p,
     const uint8_t *src_p,
@@ -371,7 +387,6 @@ int abs_drs_rx_id0_pack(
 
     return (8);
 }
-
 int abs_drs_rx_id0_unpack(
     struct abs_drs_rx_id0_t *dst_p,
     const uint8_t *src_p,
@@ -392,45 +407,54 @@ int abs_mm5_10_tx1_pack(
     const struct abs_mm5_10_tx1_t *src_p,
     size_t size)
 {
+    uint16_t ay1;
+    uint16_t yaw_rate;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
     memset(&dst_p[0], 0, 8);
 
-    dst_p[0] |= pack_left_shift_u16(src_p->yaw_rate, 0u, 0xffu);
-    dst_p[1] |= pack_right_shift_u16(src_p->yaw_rate, 8u, 0xffu);
-    dst_p[4] |= pack_left_shift_u16(src_p->ay1, 0u, 0xffu);
-    dst_p[5] |= pack_right_shift_u16(src_p->ay1, 8u, 0xffu);
+    yaw_rate = (uint16_t)abs_mm5_10_tx1_yaw_rate_encode(src_p->yaw_rate);
+    dst_p[0] |= pack_left_shift_u16(yaw_rate, 0u, 0xffu);
+    dst_p[1] |= pack_right_shift_u16(yaw_rate, 8u, 0xffu);
+    ay1 = (uint16_t)abs_mm5_10_tx1_ay1_encode(src_p->ay1);
+    dst_p[4] |= pack_left_shift_u16(ay1, 0u, 0xffu);
+    dst_p[5] |= pack_right_shift_u16(ay1, 8u, 0xffu);
 
     return (8);
 }
-
 int abs_mm5_10_tx1_unpack(
     struct abs_mm5_10_tx1_t *dst_p,
     const uint8_t *src_p,
     size_t size)
 {
+    uint16_t ay1;
+    uint16_t yaw_rate;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
-    dst_p->yaw_rate = unpack_right_shift_u16(src_p[0], 0u, 0xffu);
-    dst_p->yaw_rate |= unpack_left_shift_u16(src_p[1], 8u, 0xffu);
-    dst_p->ay1 = unpack_right_shift_u16(src_p[4], 0u, 0xffu);
-    dst_p->ay1 |= unpack_left_shift_u16(src_p[5], 8u, 0xffu);
+    yaw_rate = unpack_right_shift_u16(src_p[0], 0u, 0xffu);
+    yaw_rate |= unpack_left_shift_u16(src_p[1], 8u, 0xffu);
+    dst_p->yaw_rate = abs_mm5_10_tx1_yaw_rate_decode((uint16_t)yaw_rate);
+    ay1 = unpack_right_shift_u16(src_p[4], 0u, 0xffu);
+    ay1 |= unpack_left_shift_u16(src_p[5], 8u, 0xffu);
+    dst_p->ay1 = abs_mm5_10_tx1_ay1_decode((uint16_t)ay1);
 
     return (0);
 }
 
-uint16_t abs_mm5_10_tx1_yaw_rate_encode(double value)
+uint16_t abs_mm5_10_tx1_yaw_rate_encode(float value)
 {
-    return (uint16_t)((value - -163.84) / 0.005);
+    return (uint16_t)((value - -163.84f) / 0.005f);
 }
 
-double abs_mm5_10_tx1_yaw_rate_decode(uint16_t value)
+float abs_mm5_10_tx1_yaw_rate_decode(uint16_t value)
 {
-    return (((double)value * 0.005) + -163.84);
+    return (((float)value * 0.005f) + -163.84f);
 }
 
 bool abs_mm5_10_tx1_yaw_rate_is_in_range(uint16_t value)
@@ -438,14 +462,14 @@ bool abs_mm5_10_tx1_yaw_rate_is_in_range(uint16_t value)
     return (value <= 65534u);
 }
 
-uint16_t abs_mm5_10_tx1_ay1_encode(double value)
+uint16_t abs_mm5_10_tx1_ay1_encode(float value)
 {
-    return (uint16_t)((value - -4.1768) / 0.000127465);
+    return (uint16_t)((value - -4.1768f) / 0.000127465f);
 }
 
-double abs_mm5_10_tx1_ay1_decode(uint16_t value)
+float abs_mm5_10_tx1_ay1_decode(uint16_t value)
 {
-    return (((double)value * 0.000127465) + -4.1768);
+    return (((float)value * 0.000127465f) + -4.1768f);
 }
 
 bool abs_mm5_10_tx1_ay1_is_in_range(uint16_t value)
@@ -458,45 +482,54 @@ int abs_mm5_10_tx2_pack(
     const struct abs_mm5_10_tx2_t *src_p,
     size_t size)
 {
+    uint16_t ax1;
+    uint16_t roll_rate;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
     memset(&dst_p[0], 0, 8);
 
-    dst_p[0] |= pack_left_shift_u16(src_p->roll_rate, 0u, 0xffu);
-    dst_p[1] |= pack_right_shift_u16(src_p->roll_rate, 8u, 0xffu);
-    dst_p[4] |= pack_left_shift_u16(src_p->ax1, 0u, 0xffu);
-    dst_p[5] |= pack_right_shift_u16(src_p->ax1, 8u, 0xffu);
+    roll_rate = (uint16_t)abs_mm5_10_tx2_roll_rate_encode(src_p->roll_rate);
+    dst_p[0] |= pack_left_shift_u16(roll_rate, 0u, 0xffu);
+    dst_p[1] |= pack_right_shift_u16(roll_rate, 8u, 0xffu);
+    ax1 = (uint16_t)abs_mm5_10_tx2_ax1_encode(src_p->ax1);
+    dst_p[4] |= pack_left_shift_u16(ax1, 0u, 0xffu);
+    dst_p[5] |= pack_right_shift_u16(ax1, 8u, 0xffu);
 
     return (8);
 }
-
 int abs_mm5_10_tx2_unpack(
     struct abs_mm5_10_tx2_t *dst_p,
     const uint8_t *src_p,
     size_t size)
 {
+    uint16_t ax1;
+    uint16_t roll_rate;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
-    dst_p->roll_rate = unpack_right_shift_u16(src_p[0], 0u, 0xffu);
-    dst_p->roll_rate |= unpack_left_shift_u16(src_p[1], 8u, 0xffu);
-    dst_p->ax1 = unpack_right_shift_u16(src_p[4], 0u, 0xffu);
-    dst_p->ax1 |= unpack_left_shift_u16(src_p[5], 8u, 0xffu);
+    roll_rate = unpack_right_shift_u16(src_p[0], 0u, 0xffu);
+    roll_rate |= unpack_left_shift_u16(src_p[1], 8u, 0xffu);
+    dst_p->roll_rate = abs_mm5_10_tx2_roll_rate_decode((uint16_t)roll_rate);
+    ax1 = unpack_right_shift_u16(src_p[4], 0u, 0xffu);
+    ax1 |= unpack_left_shift_u16(src_p[5], 8u, 0xffu);
+    dst_p->ax1 = abs_mm5_10_tx2_ax1_decode((uint16_t)ax1);
 
     return (0);
 }
 
-uint16_t abs_mm5_10_tx2_roll_rate_encode(double value)
+uint16_t abs_mm5_10_tx2_roll_rate_encode(float value)
 {
-    return (uint16_t)((value - -163.84) / 0.005);
+    return (uint16_t)((value - -163.84f) / 0.005f);
 }
 
-double abs_mm5_10_tx2_roll_rate_decode(uint16_t value)
+float abs_mm5_10_tx2_roll_rate_decode(uint16_t value)
 {
-    return (((double)value * 0.005) + -163.84);
+    return (((float)value * 0.005f) + -163.84f);
 }
 
 bool abs_mm5_10_tx2_roll_rate_is_in_range(uint16_t value)
@@ -506,14 +539,14 @@ bool abs_mm5_10_tx2_roll_rate_is_in_range(uint16_t value)
     return (true);
 }
 
-uint16_t abs_mm5_10_tx2_ax1_encode(double value)
+uint16_t abs_mm5_10_tx2_ax1_encode(float value)
 {
-    return (uint16_t)((value - -4.1768) / 0.000127465);
+    return (uint16_t)((value - -4.1768f) / 0.000127465f);
 }
 
-double abs_mm5_10_tx2_ax1_decode(uint16_t value)
+float abs_mm5_10_tx2_ax1_decode(uint16_t value)
 {
-    return (((double)value * 0.000127465) + -4.1768);
+    return (((float)value * 0.000127465f) + -4.1768f);
 }
 
 bool abs_mm5_10_tx2_ax1_is_in_range(uint16_t value)
@@ -526,41 +559,46 @@ int abs_mm5_10_tx3_pack(
     const struct abs_mm5_10_tx3_t *src_p,
     size_t size)
 {
+    uint16_t az;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
     memset(&dst_p[0], 0, 8);
 
-    dst_p[4] |= pack_left_shift_u16(src_p->az, 0u, 0xffu);
-    dst_p[5] |= pack_right_shift_u16(src_p->az, 8u, 0xffu);
+    az = (uint16_t)abs_mm5_10_tx3_az_encode(src_p->az);
+    dst_p[4] |= pack_left_shift_u16(az, 0u, 0xffu);
+    dst_p[5] |= pack_right_shift_u16(az, 8u, 0xffu);
 
     return (8);
 }
-
 int abs_mm5_10_tx3_unpack(
     struct abs_mm5_10_tx3_t *dst_p,
     const uint8_t *src_p,
     size_t size)
 {
+    uint16_t az;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
-    dst_p->az = unpack_right_shift_u16(src_p[4], 0u, 0xffu);
-    dst_p->az |= unpack_left_shift_u16(src_p[5], 8u, 0xffu);
+    az = unpack_right_shift_u16(src_p[4], 0u, 0xffu);
+    az |= unpack_left_shift_u16(src_p[5], 8u, 0xffu);
+    dst_p->az = abs_mm5_10_tx3_az_decode((uint16_t)az);
 
     return (0);
 }
 
-uint16_t abs_mm5_10_tx3_az_encode(double value)
+uint16_t abs_mm5_10_tx3_az_encode(float value)
 {
-    return (uint16_t)((value - -4.1768) / 0.000127465);
+    return (uint16_t)((value - -4.1768f) / 0.000127465f);
 }
 
-double abs_mm5_10_tx3_az_decode(uint16_t value)
+float abs_mm5_10_tx3_az_decode(uint16_t value)
 {
-    return (((double)value * 0.000127465) + -4.1768);
+    return (((float)value * 0.000127465f) + -4.1768f);
 }
 
 bool abs_mm5_10_tx3_az_is_in_range(uint16_t value)
@@ -573,53 +611,70 @@ int abs_bremse_2_pack(
     const struct abs_bremse_2_t *src_p,
     size_t size)
 {
+    uint16_t whlspeed_fl_bremse2;
+    uint16_t whlspeed_fr_bremse2;
+    uint16_t whlspeed_rl_bremse2;
+    uint16_t whlspeed_rr_bremse2;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
     memset(&dst_p[0], 0, 8);
 
-    dst_p[0] |= pack_left_shift_u16(src_p->whlspeed_fl_bremse2, 0u, 0xffu);
-    dst_p[1] |= pack_right_shift_u16(src_p->whlspeed_fl_bremse2, 8u, 0xffu);
-    dst_p[2] |= pack_left_shift_u16(src_p->whlspeed_fr_bremse2, 0u, 0xffu);
-    dst_p[3] |= pack_right_shift_u16(src_p->whlspeed_fr_bremse2, 8u, 0xffu);
-    dst_p[4] |= pack_left_shift_u16(src_p->whlspeed_rl_bremse2, 0u, 0xffu);
-    dst_p[5] |= pack_right_shift_u16(src_p->whlspeed_rl_bremse2, 8u, 0xffu);
-    dst_p[6] |= pack_left_shift_u16(src_p->whlspeed_rr_bremse2, 0u, 0xffu);
-    dst_p[7] |= pack_right_shift_u16(src_p->whlspeed_rr_bremse2, 8u, 0xffu);
+    whlspeed_fl_bremse2 = (uint16_t)abs_bremse_2_whlspeed_fl_bremse2_encode(src_p->whlspeed_fl_bremse2);
+    dst_p[0] |= pack_left_shift_u16(whlspeed_fl_bremse2, 0u, 0xffu);
+    dst_p[1] |= pack_right_shift_u16(whlspeed_fl_bremse2, 8u, 0xffu);
+    whlspeed_fr_bremse2 = (uint16_t)abs_bremse_2_whlspeed_fr_bremse2_encode(src_p->whlspeed_fr_bremse2);
+    dst_p[2] |= pack_left_shift_u16(whlspeed_fr_bremse2, 0u, 0xffu);
+    dst_p[3] |= pack_right_shift_u16(whlspeed_fr_bremse2, 8u, 0xffu);
+    whlspeed_rl_bremse2 = (uint16_t)abs_bremse_2_whlspeed_rl_bremse2_encode(src_p->whlspeed_rl_bremse2);
+    dst_p[4] |= pack_left_shift_u16(whlspeed_rl_bremse2, 0u, 0xffu);
+    dst_p[5] |= pack_right_shift_u16(whlspeed_rl_bremse2, 8u, 0xffu);
+    whlspeed_rr_bremse2 = (uint16_t)abs_bremse_2_whlspeed_rr_bremse2_encode(src_p->whlspeed_rr_bremse2);
+    dst_p[6] |= pack_left_shift_u16(whlspeed_rr_bremse2, 0u, 0xffu);
+    dst_p[7] |= pack_right_shift_u16(whlspeed_rr_bremse2, 8u, 0xffu);
 
     return (8);
 }
-
 int abs_bremse_2_unpack(
     struct abs_bremse_2_t *dst_p,
     const uint8_t *src_p,
     size_t size)
 {
+    uint16_t whlspeed_fl_bremse2;
+    uint16_t whlspeed_fr_bremse2;
+    uint16_t whlspeed_rl_bremse2;
+    uint16_t whlspeed_rr_bremse2;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
-    dst_p->whlspeed_fl_bremse2 = unpack_right_shift_u16(src_p[0], 0u, 0xffu);
-    dst_p->whlspeed_fl_bremse2 |= unpack_left_shift_u16(src_p[1], 8u, 0xffu);
-    dst_p->whlspeed_fr_bremse2 = unpack_right_shift_u16(src_p[2], 0u, 0xffu);
-    dst_p->whlspeed_fr_bremse2 |= unpack_left_shift_u16(src_p[3], 8u, 0xffu);
-    dst_p->whlspeed_rl_bremse2 = unpack_right_shift_u16(src_p[4], 0u, 0xffu);
-    dst_p->whlspeed_rl_bremse2 |= unpack_left_shift_u16(src_p[5], 8u, 0xffu);
-    dst_p->whlspeed_rr_bremse2 = unpack_right_shift_u16(src_p[6], 0u, 0xffu);
-    dst_p->whlspeed_rr_bremse2 |= unpack_left_shift_u16(src_p[7], 8u, 0xffu);
+    whlspeed_fl_bremse2 = unpack_right_shift_u16(src_p[0], 0u, 0xffu);
+    whlspeed_fl_bremse2 |= unpack_left_shift_u16(src_p[1], 8u, 0xffu);
+    dst_p->whlspeed_fl_bremse2 = abs_bremse_2_whlspeed_fl_bremse2_decode((uint16_t)whlspeed_fl_bremse2);
+    whlspeed_fr_bremse2 = unpack_right_shift_u16(src_p[2], 0u, 0xffu);
+    whlspeed_fr_bremse2 |= unpack_left_shift_u16(src_p[3], 8u, 0xffu);
+    dst_p->whlspeed_fr_bremse2 = abs_bremse_2_whlspeed_fr_bremse2_decode((uint16_t)whlspeed_fr_bremse2);
+    whlspeed_rl_bremse2 = unpack_right_shift_u16(src_p[4], 0u, 0xffu);
+    whlspeed_rl_bremse2 |= unpack_left_shift_u16(src_p[5], 8u, 0xffu);
+    dst_p->whlspeed_rl_bremse2 = abs_bremse_2_whlspeed_rl_bremse2_decode((uint16_t)whlspeed_rl_bremse2);
+    whlspeed_rr_bremse2 = unpack_right_shift_u16(src_p[6], 0u, 0xffu);
+    whlspeed_rr_bremse2 |= unpack_left_shift_u16(src_p[7], 8u, 0xffu);
+    dst_p->whlspeed_rr_bremse2 = abs_bremse_2_whlspeed_rr_bremse2_decode((uint16_t)whlspeed_rr_bremse2);
 
     return (0);
 }
 
-uint16_t abs_bremse_2_whlspeed_fl_bremse2_encode(double value)
+uint16_t abs_bremse_2_whlspeed_fl_bremse2_encode(float value)
 {
-    return (uint16_t)(value / 0.015625);
+    return (uint16_t)(value / 0.015625f);
 }
 
-double abs_bremse_2_whlspeed_fl_bremse2_decode(uint16_t value)
+float abs_bremse_2_whlspeed_fl_bremse2_decode(uint16_t value)
 {
-    return ((double)value * 0.015625);
+    return ((float)value * 0.015625f);
 }
 
 bool abs_bremse_2_whlspeed_fl_bremse2_is_in_range(uint16_t value)
@@ -627,14 +682,14 @@ bool abs_bremse_2_whlspeed_fl_bremse2_is_in_range(uint16_t value)
     return (value <= 6400u);
 }
 
-uint16_t abs_bremse_2_whlspeed_fr_bremse2_encode(double value)
+uint16_t abs_bremse_2_whlspeed_fr_bremse2_encode(float value)
 {
-    return (uint16_t)(value / 0.015625);
+    return (uint16_t)(value / 0.015625f);
 }
 
-double abs_bremse_2_whlspeed_fr_bremse2_decode(uint16_t value)
+float abs_bremse_2_whlspeed_fr_bremse2_decode(uint16_t value)
 {
-    return ((double)value * 0.015625);
+    return ((float)value * 0.015625f);
 }
 
 bool abs_bremse_2_whlspeed_fr_bremse2_is_in_range(uint16_t value)
@@ -642,14 +697,14 @@ bool abs_bremse_2_whlspeed_fr_bremse2_is_in_range(uint16_t value)
     return (value <= 6400u);
 }
 
-uint16_t abs_bremse_2_whlspeed_rl_bremse2_encode(double value)
+uint16_t abs_bremse_2_whlspeed_rl_bremse2_encode(float value)
 {
-    return (uint16_t)(value / 0.015625);
+    return (uint16_t)(value / 0.015625f);
 }
 
-double abs_bremse_2_whlspeed_rl_bremse2_decode(uint16_t value)
+float abs_bremse_2_whlspeed_rl_bremse2_decode(uint16_t value)
 {
-    return ((double)value * 0.015625);
+    return ((float)value * 0.015625f);
 }
 
 bool abs_bremse_2_whlspeed_rl_bremse2_is_in_range(uint16_t value)
@@ -657,14 +712,14 @@ bool abs_bremse_2_whlspeed_rl_bremse2_is_in_range(uint16_t value)
     return (value <= 6400u);
 }
 
-uint16_t abs_bremse_2_whlspeed_rr_bremse2_encode(double value)
+uint16_t abs_bremse_2_whlspeed_rr_bremse2_encode(float value)
 {
-    return (uint16_t)(value / 0.015625);
+    return (uint16_t)(value / 0.015625f);
 }
 
-double abs_bremse_2_whlspeed_rr_bremse2_decode(uint16_t value)
+float abs_bremse_2_whlspeed_rr_bremse2_decode(uint16_t value)
 {
-    return ((double)value * 0.015625);
+    return ((float)value * 0.015625f);
 }
 
 bool abs_bremse_2_whlspeed_rr_bremse2_is_in_range(uint16_t value)
@@ -687,7 +742,6 @@ int abs_abs_switch_pack(
 
     return (8);
 }
-
 int abs_abs_switch_unpack(
     struct abs_abs_switch_t *dst_p,
     const uint8_t *src_p,
@@ -702,14 +756,14 @@ int abs_abs_switch_unpack(
     return (0);
 }
 
-uint8_t abs_abs_switch_abs_switchposition_encode(double value)
+uint8_t abs_abs_switch_abs_switchposition_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_abs_switch_abs_switchposition_decode(uint8_t value)
+float abs_abs_switch_abs_switchposition_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_abs_switch_abs_switchposition_is_in_range(uint8_t value)
@@ -732,7 +786,6 @@ int abs_bremse_30_pack(
 
     return (8);
 }
-
 int abs_bremse_30_unpack(
     struct abs_bremse_30_t *dst_p,
     const uint8_t *src_p,
@@ -764,7 +817,6 @@ int abs_bremse_31_pack(
 
     return (8);
 }
-
 int abs_bremse_31_unpack(
     struct abs_bremse_31_t *dst_p,
     const uint8_t *src_p,
@@ -780,14 +832,14 @@ int abs_bremse_31_unpack(
     return (0);
 }
 
-uint16_t abs_bremse_31_idle_time_encode(double value)
+uint16_t abs_bremse_31_idle_time_encode(float value)
 {
     return (uint16_t)(value);
 }
 
-double abs_bremse_31_idle_time_decode(uint16_t value)
+float abs_bremse_31_idle_time_decode(uint16_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_31_idle_time_is_in_range(uint16_t value)
@@ -802,14 +854,19 @@ int abs_bremse_32_pack(
     const struct abs_bremse_32_t *src_p,
     size_t size)
 {
+    uint8_t acc_fa;
+    uint8_t acc_ra;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
     memset(&dst_p[0], 0, 8);
 
-    dst_p[0] |= pack_left_shift_u8(src_p->acc_fa, 0u, 0xffu);
-    dst_p[1] |= pack_left_shift_u8(src_p->acc_ra, 0u, 0xffu);
+    acc_fa = (uint8_t)abs_bremse_32_acc_fa_encode(src_p->acc_fa);
+    dst_p[0] |= pack_left_shift_u8(acc_fa, 0u, 0xffu);
+    acc_ra = (uint8_t)abs_bremse_32_acc_ra_encode(src_p->acc_ra);
+    dst_p[1] |= pack_left_shift_u8(acc_ra, 0u, 0xffu);
     dst_p[4] |= pack_left_shift_u8(src_p->wheel_quality_fl, 0u, 0xffu);
     dst_p[5] |= pack_left_shift_u8(src_p->wheel_quality_fr, 0u, 0xffu);
     dst_p[6] |= pack_left_shift_u8(src_p->wheel_quality_rl, 0u, 0xffu);
@@ -817,18 +874,22 @@ int abs_bremse_32_pack(
 
     return (8);
 }
-
 int abs_bremse_32_unpack(
     struct abs_bremse_32_t *dst_p,
     const uint8_t *src_p,
     size_t size)
 {
+    uint8_t acc_fa;
+    uint8_t acc_ra;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
-    dst_p->acc_fa = unpack_right_shift_u8(src_p[0], 0u, 0xffu);
-    dst_p->acc_ra = unpack_right_shift_u8(src_p[1], 0u, 0xffu);
+    acc_fa = unpack_right_shift_u8(src_p[0], 0u, 0xffu);
+    dst_p->acc_fa = abs_bremse_32_acc_fa_decode((uint8_t)acc_fa);
+    acc_ra = unpack_right_shift_u8(src_p[1], 0u, 0xffu);
+    dst_p->acc_ra = abs_bremse_32_acc_ra_decode((uint8_t)acc_ra);
     dst_p->wheel_quality_fl = unpack_right_shift_u8(src_p[4], 0u, 0xffu);
     dst_p->wheel_quality_fr = unpack_right_shift_u8(src_p[5], 0u, 0xffu);
     dst_p->wheel_quality_rl = unpack_right_shift_u8(src_p[6], 0u, 0xffu);
@@ -837,14 +898,14 @@ int abs_bremse_32_unpack(
     return (0);
 }
 
-uint8_t abs_bremse_32_acc_fa_encode(double value)
+uint8_t abs_bremse_32_acc_fa_encode(float value)
 {
-    return (uint8_t)(value / 0.05);
+    return (uint8_t)(value / 0.05f);
 }
 
-double abs_bremse_32_acc_fa_decode(uint8_t value)
+float abs_bremse_32_acc_fa_decode(uint8_t value)
 {
-    return ((double)value * 0.05);
+    return ((float)value * 0.05f);
 }
 
 bool abs_bremse_32_acc_fa_is_in_range(uint8_t value)
@@ -852,14 +913,14 @@ bool abs_bremse_32_acc_fa_is_in_range(uint8_t value)
     return (value <= 200u);
 }
 
-uint8_t abs_bremse_32_acc_ra_encode(double value)
+uint8_t abs_bremse_32_acc_ra_encode(float value)
 {
-    return (uint8_t)(value / 0.05);
+    return (uint8_t)(value / 0.05f);
 }
 
-double abs_bremse_32_acc_ra_decode(uint8_t value)
+float abs_bremse_32_acc_ra_decode(uint8_t value)
 {
-    return ((double)value * 0.05);
+    return ((float)value * 0.05f);
 }
 
 bool abs_bremse_32_acc_ra_is_in_range(uint8_t value)
@@ -867,14 +928,14 @@ bool abs_bremse_32_acc_ra_is_in_range(uint8_t value)
     return (value <= 200u);
 }
 
-uint8_t abs_bremse_32_wheel_quality_fl_encode(double value)
+uint8_t abs_bremse_32_wheel_quality_fl_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_32_wheel_quality_fl_decode(uint8_t value)
+float abs_bremse_32_wheel_quality_fl_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_32_wheel_quality_fl_is_in_range(uint8_t value)
@@ -882,14 +943,14 @@ bool abs_bremse_32_wheel_quality_fl_is_in_range(uint8_t value)
     return (value <= 32u);
 }
 
-uint8_t abs_bremse_32_wheel_quality_fr_encode(double value)
+uint8_t abs_bremse_32_wheel_quality_fr_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_32_wheel_quality_fr_decode(uint8_t value)
+float abs_bremse_32_wheel_quality_fr_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_32_wheel_quality_fr_is_in_range(uint8_t value)
@@ -897,14 +958,14 @@ bool abs_bremse_32_wheel_quality_fr_is_in_range(uint8_t value)
     return (value <= 32u);
 }
 
-uint8_t abs_bremse_32_wheel_quality_rl_encode(double value)
+uint8_t abs_bremse_32_wheel_quality_rl_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_32_wheel_quality_rl_decode(uint8_t value)
+float abs_bremse_32_wheel_quality_rl_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_32_wheel_quality_rl_is_in_range(uint8_t value)
@@ -912,14 +973,14 @@ bool abs_bremse_32_wheel_quality_rl_is_in_range(uint8_t value)
     return (value <= 32u);
 }
 
-uint8_t abs_bremse_32_wheel_quality_rr_encode(double value)
+uint8_t abs_bremse_32_wheel_quality_rr_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_32_wheel_quality_rr_decode(uint8_t value)
+float abs_bremse_32_wheel_quality_rr_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_32_wheel_quality_rr_is_in_range(uint8_t value)
@@ -932,16 +993,21 @@ int abs_bremse_51_pack(
     const struct abs_bremse_51_t *src_p,
     size_t size)
 {
+    uint16_t ax1_abs_int;
+    uint16_t ay1_abs_int;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
     memset(&dst_p[0], 0, 8);
 
-    dst_p[0] |= pack_left_shift_u16(src_p->ax1_abs_int, 0u, 0xffu);
-    dst_p[1] |= pack_right_shift_u16(src_p->ax1_abs_int, 8u, 0xffu);
-    dst_p[2] |= pack_left_shift_u16(src_p->ay1_abs_int, 0u, 0xffu);
-    dst_p[3] |= pack_right_shift_u16(src_p->ay1_abs_int, 8u, 0xffu);
+    ax1_abs_int = (uint16_t)abs_bremse_51_ax1_abs_int_encode(src_p->ax1_abs_int);
+    dst_p[0] |= pack_left_shift_u16(ax1_abs_int, 0u, 0xffu);
+    dst_p[1] |= pack_right_shift_u16(ax1_abs_int, 8u, 0xffu);
+    ay1_abs_int = (uint16_t)abs_bremse_51_ay1_abs_int_encode(src_p->ay1_abs_int);
+    dst_p[2] |= pack_left_shift_u16(ay1_abs_int, 0u, 0xffu);
+    dst_p[3] |= pack_right_shift_u16(ay1_abs_int, 8u, 0xffu);
     dst_p[6] |= pack_left_shift_u8(src_p->if_variant, 0u, 0x3fu);
     dst_p[6] |= pack_left_shift_u8(src_p->if_revision, 6u, 0xc0u);
     dst_p[7] |= pack_right_shift_u8(src_p->if_revision, 2u, 0x0fu);
@@ -949,20 +1015,24 @@ int abs_bremse_51_pack(
 
     return (8);
 }
-
 int abs_bremse_51_unpack(
     struct abs_bremse_51_t *dst_p,
     const uint8_t *src_p,
     size_t size)
 {
+    uint16_t ax1_abs_int;
+    uint16_t ay1_abs_int;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
-    dst_p->ax1_abs_int = unpack_right_shift_u16(src_p[0], 0u, 0xffu);
-    dst_p->ax1_abs_int |= unpack_left_shift_u16(src_p[1], 8u, 0xffu);
-    dst_p->ay1_abs_int = unpack_right_shift_u16(src_p[2], 0u, 0xffu);
-    dst_p->ay1_abs_int |= unpack_left_shift_u16(src_p[3], 8u, 0xffu);
+    ax1_abs_int = unpack_right_shift_u16(src_p[0], 0u, 0xffu);
+    ax1_abs_int |= unpack_left_shift_u16(src_p[1], 8u, 0xffu);
+    dst_p->ax1_abs_int = abs_bremse_51_ax1_abs_int_decode((uint16_t)ax1_abs_int);
+    ay1_abs_int = unpack_right_shift_u16(src_p[2], 0u, 0xffu);
+    ay1_abs_int |= unpack_left_shift_u16(src_p[3], 8u, 0xffu);
+    dst_p->ay1_abs_int = abs_bremse_51_ay1_abs_int_decode((uint16_t)ay1_abs_int);
     dst_p->if_variant = unpack_right_shift_u8(src_p[6], 0u, 0x3fu);
     dst_p->if_revision = unpack_right_shift_u8(src_p[6], 6u, 0xc0u);
     dst_p->if_revision |= unpack_left_shift_u8(src_p[7], 2u, 0x0fu);
@@ -971,14 +1041,14 @@ int abs_bremse_51_unpack(
     return (0);
 }
 
-uint16_t abs_bremse_51_ax1_abs_int_encode(double value)
+uint16_t abs_bremse_51_ax1_abs_int_encode(float value)
 {
-    return (uint16_t)((value - -4.1768) / 0.00012742);
+    return (uint16_t)((value - -4.1768f) / 0.00012742f);
 }
 
-double abs_bremse_51_ax1_abs_int_decode(uint16_t value)
+float abs_bremse_51_ax1_abs_int_decode(uint16_t value)
 {
-    return (((double)value * 0.00012742) + -4.1768);
+    return (((float)value * 0.00012742f) + -4.1768f);
 }
 
 bool abs_bremse_51_ax1_abs_int_is_in_range(uint16_t value)
@@ -988,14 +1058,14 @@ bool abs_bremse_51_ax1_abs_int_is_in_range(uint16_t value)
     return (true);
 }
 
-uint16_t abs_bremse_51_ay1_abs_int_encode(double value)
+uint16_t abs_bremse_51_ay1_abs_int_encode(float value)
 {
-    return (uint16_t)((value - -4.1768) / 0.00012742);
+    return (uint16_t)((value - -4.1768f) / 0.00012742f);
 }
 
-double abs_bremse_51_ay1_abs_int_decode(uint16_t value)
+float abs_bremse_51_ay1_abs_int_decode(uint16_t value)
 {
-    return (((double)value * 0.00012742) + -4.1768);
+    return (((float)value * 0.00012742f) + -4.1768f);
 }
 
 bool abs_bremse_51_ay1_abs_int_is_in_range(uint16_t value)
@@ -1005,14 +1075,14 @@ bool abs_bremse_51_ay1_abs_int_is_in_range(uint16_t value)
     return (true);
 }
 
-uint8_t abs_bremse_51_if_variant_encode(double value)
+uint8_t abs_bremse_51_if_variant_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_51_if_variant_decode(uint8_t value)
+float abs_bremse_51_if_variant_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_51_if_variant_is_in_range(uint8_t value)
@@ -1020,14 +1090,14 @@ bool abs_bremse_51_if_variant_is_in_range(uint8_t value)
     return (value <= 63u);
 }
 
-uint8_t abs_bremse_51_if_revision_encode(double value)
+uint8_t abs_bremse_51_if_revision_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_51_if_revision_decode(uint8_t value)
+float abs_bremse_51_if_revision_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_51_if_revision_is_in_range(uint8_t value)
@@ -1035,14 +1105,14 @@ bool abs_bremse_51_if_revision_is_in_range(uint8_t value)
     return (value <= 63u);
 }
 
-uint8_t abs_bremse_51_if_chksum_encode(double value)
+uint8_t abs_bremse_51_if_chksum_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_51_if_chksum_decode(uint8_t value)
+float abs_bremse_51_if_chksum_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_51_if_chksum_is_in_range(uint8_t value)
@@ -1133,7 +1203,6 @@ int abs_bremse_52_pack(
 
     return (8);
 }
-
 int abs_bremse_52_unpack(
     struct abs_bremse_52_t *dst_p,
     const uint8_t *src_p,
@@ -1216,14 +1285,14 @@ int abs_bremse_52_unpack(
     return (0);
 }
 
-uint8_t abs_bremse_52_mplx_sw_info_encode(double value)
+uint8_t abs_bremse_52_mplx_sw_info_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_mplx_sw_info_decode(uint8_t value)
+float abs_bremse_52_mplx_sw_info_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_mplx_sw_info_is_in_range(uint8_t value)
@@ -1233,14 +1302,14 @@ bool abs_bremse_52_mplx_sw_info_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_sw_version_high_upper_encode(double value)
+uint8_t abs_bremse_52_sw_version_high_upper_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_sw_version_high_upper_decode(uint8_t value)
+float abs_bremse_52_sw_version_high_upper_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_sw_version_high_upper_is_in_range(uint8_t value)
@@ -1250,14 +1319,14 @@ bool abs_bremse_52_sw_version_high_upper_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_bb_dig1_encode(double value)
+uint8_t abs_bremse_52_bb_dig1_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_bb_dig1_decode(uint8_t value)
+float abs_bremse_52_bb_dig1_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_bb_dig1_is_in_range(uint8_t value)
@@ -1267,14 +1336,14 @@ bool abs_bremse_52_bb_dig1_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_01_encode(double value)
+uint8_t abs_bremse_52_appl_id_01_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_01_decode(uint8_t value)
+float abs_bremse_52_appl_id_01_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_01_is_in_range(uint8_t value)
@@ -1284,14 +1353,14 @@ bool abs_bremse_52_appl_id_01_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_08_encode(double value)
+uint8_t abs_bremse_52_appl_id_08_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_08_decode(uint8_t value)
+float abs_bremse_52_appl_id_08_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_08_is_in_range(uint8_t value)
@@ -1301,14 +1370,14 @@ bool abs_bremse_52_appl_id_08_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_date_01_encode(double value)
+uint8_t abs_bremse_52_appl_date_01_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_date_01_decode(uint8_t value)
+float abs_bremse_52_appl_date_01_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_date_01_is_in_range(uint8_t value)
@@ -1316,14 +1385,14 @@ bool abs_bremse_52_appl_date_01_is_in_range(uint8_t value)
     return (value <= 99u);
 }
 
-uint8_t abs_bremse_52_sw_can_ident_encode(double value)
+uint8_t abs_bremse_52_sw_can_ident_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_sw_can_ident_decode(uint8_t value)
+float abs_bremse_52_sw_can_ident_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_sw_can_ident_is_in_range(uint8_t value)
@@ -1333,14 +1402,14 @@ bool abs_bremse_52_sw_can_ident_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_hu_date_year_encode(double value)
+uint8_t abs_bremse_52_hu_date_year_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_hu_date_year_decode(uint8_t value)
+float abs_bremse_52_hu_date_year_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_hu_date_year_is_in_range(uint8_t value)
@@ -1348,14 +1417,14 @@ bool abs_bremse_52_hu_date_year_is_in_range(uint8_t value)
     return (value <= 99u);
 }
 
-uint8_t abs_bremse_52_sw_version_high_lower_encode(double value)
+uint8_t abs_bremse_52_sw_version_high_lower_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_sw_version_high_lower_decode(uint8_t value)
+float abs_bremse_52_sw_version_high_lower_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_sw_version_high_lower_is_in_range(uint8_t value)
@@ -1365,14 +1434,14 @@ bool abs_bremse_52_sw_version_high_lower_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_bb_dig2_encode(double value)
+uint8_t abs_bremse_52_bb_dig2_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_bb_dig2_decode(uint8_t value)
+float abs_bremse_52_bb_dig2_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_bb_dig2_is_in_range(uint8_t value)
@@ -1382,14 +1451,14 @@ bool abs_bremse_52_bb_dig2_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_02_encode(double value)
+uint8_t abs_bremse_52_appl_id_02_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_02_decode(uint8_t value)
+float abs_bremse_52_appl_id_02_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_02_is_in_range(uint8_t value)
@@ -1399,14 +1468,14 @@ bool abs_bremse_52_appl_id_02_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_09_encode(double value)
+uint8_t abs_bremse_52_appl_id_09_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_09_decode(uint8_t value)
+float abs_bremse_52_appl_id_09_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_09_is_in_range(uint8_t value)
@@ -1416,14 +1485,14 @@ bool abs_bremse_52_appl_id_09_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_date_02_encode(double value)
+uint8_t abs_bremse_52_appl_date_02_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_date_02_decode(uint8_t value)
+float abs_bremse_52_appl_date_02_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_date_02_is_in_range(uint8_t value)
@@ -1431,14 +1500,14 @@ bool abs_bremse_52_appl_date_02_is_in_range(uint8_t value)
     return ((value >= 1u) && (value <= 12u));
 }
 
-uint8_t abs_bremse_52_hu_date_month_encode(double value)
+uint8_t abs_bremse_52_hu_date_month_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_hu_date_month_decode(uint8_t value)
+float abs_bremse_52_hu_date_month_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_hu_date_month_is_in_range(uint8_t value)
@@ -1446,14 +1515,14 @@ bool abs_bremse_52_hu_date_month_is_in_range(uint8_t value)
     return ((value >= 1u) && (value <= 12u));
 }
 
-uint8_t abs_bremse_52_sw_version_mid_upper_encode(double value)
+uint8_t abs_bremse_52_sw_version_mid_upper_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_sw_version_mid_upper_decode(uint8_t value)
+float abs_bremse_52_sw_version_mid_upper_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_sw_version_mid_upper_is_in_range(uint8_t value)
@@ -1463,14 +1532,14 @@ bool abs_bremse_52_sw_version_mid_upper_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_bb_dig3_encode(double value)
+uint8_t abs_bremse_52_bb_dig3_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_bb_dig3_decode(uint8_t value)
+float abs_bremse_52_bb_dig3_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_bb_dig3_is_in_range(uint8_t value)
@@ -1480,14 +1549,14 @@ bool abs_bremse_52_bb_dig3_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_03_encode(double value)
+uint8_t abs_bremse_52_appl_id_03_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_03_decode(uint8_t value)
+float abs_bremse_52_appl_id_03_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_03_is_in_range(uint8_t value)
@@ -1497,14 +1566,14 @@ bool abs_bremse_52_appl_id_03_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_10_encode(double value)
+uint8_t abs_bremse_52_appl_id_10_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_10_decode(uint8_t value)
+float abs_bremse_52_appl_id_10_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_10_is_in_range(uint8_t value)
@@ -1514,14 +1583,14 @@ bool abs_bremse_52_appl_id_10_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_date_03_encode(double value)
+uint8_t abs_bremse_52_appl_date_03_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_date_03_decode(uint8_t value)
+float abs_bremse_52_appl_date_03_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_date_03_is_in_range(uint8_t value)
@@ -1529,14 +1598,14 @@ bool abs_bremse_52_appl_date_03_is_in_range(uint8_t value)
     return ((value >= 1u) && (value <= 31u));
 }
 
-uint8_t abs_bremse_52_hu_date_day_encode(double value)
+uint8_t abs_bremse_52_hu_date_day_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_hu_date_day_decode(uint8_t value)
+float abs_bremse_52_hu_date_day_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_hu_date_day_is_in_range(uint8_t value)
@@ -1544,14 +1613,14 @@ bool abs_bremse_52_hu_date_day_is_in_range(uint8_t value)
     return ((value >= 1u) && (value <= 31u));
 }
 
-uint8_t abs_bremse_52_sw_version_mid_lower_encode(double value)
+uint8_t abs_bremse_52_sw_version_mid_lower_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_sw_version_mid_lower_decode(uint8_t value)
+float abs_bremse_52_sw_version_mid_lower_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_sw_version_mid_lower_is_in_range(uint8_t value)
@@ -1561,14 +1630,14 @@ bool abs_bremse_52_sw_version_mid_lower_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_bb_dig4_encode(double value)
+uint8_t abs_bremse_52_bb_dig4_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_bb_dig4_decode(uint8_t value)
+float abs_bremse_52_bb_dig4_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_bb_dig4_is_in_range(uint8_t value)
@@ -1578,14 +1647,14 @@ bool abs_bremse_52_bb_dig4_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_04_encode(double value)
+uint8_t abs_bremse_52_appl_id_04_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_04_decode(uint8_t value)
+float abs_bremse_52_appl_id_04_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_04_is_in_range(uint8_t value)
@@ -1595,14 +1664,14 @@ bool abs_bremse_52_appl_id_04_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_11_encode(double value)
+uint8_t abs_bremse_52_appl_id_11_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_11_decode(uint8_t value)
+float abs_bremse_52_appl_id_11_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_11_is_in_range(uint8_t value)
@@ -1612,14 +1681,14 @@ bool abs_bremse_52_appl_id_11_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_date_04_encode(double value)
+uint8_t abs_bremse_52_appl_date_04_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_date_04_decode(uint8_t value)
+float abs_bremse_52_appl_date_04_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_date_04_is_in_range(uint8_t value)
@@ -1627,14 +1696,14 @@ bool abs_bremse_52_appl_date_04_is_in_range(uint8_t value)
     return (value <= 24u);
 }
 
-uint32_t abs_bremse_52_ecu_serial_encode(double value)
+uint32_t abs_bremse_52_ecu_serial_encode(float value)
 {
     return (uint32_t)(value);
 }
 
-double abs_bremse_52_ecu_serial_decode(uint32_t value)
+float abs_bremse_52_ecu_serial_decode(uint32_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_ecu_serial_is_in_range(uint32_t value)
@@ -1642,14 +1711,14 @@ bool abs_bremse_52_ecu_serial_is_in_range(uint32_t value)
     return (value <= 99999u);
 }
 
-uint8_t abs_bremse_52_sw_version_low_upper_encode(double value)
+uint8_t abs_bremse_52_sw_version_low_upper_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_sw_version_low_upper_decode(uint8_t value)
+float abs_bremse_52_sw_version_low_upper_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_sw_version_low_upper_is_in_range(uint8_t value)
@@ -1659,14 +1728,14 @@ bool abs_bremse_52_sw_version_low_upper_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_bb_dig5_encode(double value)
+uint8_t abs_bremse_52_bb_dig5_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_bb_dig5_decode(uint8_t value)
+float abs_bremse_52_bb_dig5_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_bb_dig5_is_in_range(uint8_t value)
@@ -1676,14 +1745,14 @@ bool abs_bremse_52_bb_dig5_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_05_encode(double value)
+uint8_t abs_bremse_52_appl_id_05_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_05_decode(uint8_t value)
+float abs_bremse_52_appl_id_05_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_05_is_in_range(uint8_t value)
@@ -1693,14 +1762,14 @@ bool abs_bremse_52_appl_id_05_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_12_encode(double value)
+uint8_t abs_bremse_52_appl_id_12_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_12_decode(uint8_t value)
+float abs_bremse_52_appl_id_12_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_12_is_in_range(uint8_t value)
@@ -1710,14 +1779,14 @@ bool abs_bremse_52_appl_id_12_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_date_05_encode(double value)
+uint8_t abs_bremse_52_appl_date_05_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_date_05_decode(uint8_t value)
+float abs_bremse_52_appl_date_05_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_date_05_is_in_range(uint8_t value)
@@ -1725,14 +1794,14 @@ bool abs_bremse_52_appl_date_05_is_in_range(uint8_t value)
     return (value <= 59u);
 }
 
-uint8_t abs_bremse_52_sw_version_low_lower_encode(double value)
+uint8_t abs_bremse_52_sw_version_low_lower_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_sw_version_low_lower_decode(uint8_t value)
+float abs_bremse_52_sw_version_low_lower_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_sw_version_low_lower_is_in_range(uint8_t value)
@@ -1742,14 +1811,14 @@ bool abs_bremse_52_sw_version_low_lower_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_bb_dig6_encode(double value)
+uint8_t abs_bremse_52_bb_dig6_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_bb_dig6_decode(uint8_t value)
+float abs_bremse_52_bb_dig6_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_bb_dig6_is_in_range(uint8_t value)
@@ -1759,14 +1828,14 @@ bool abs_bremse_52_bb_dig6_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_06_encode(double value)
+uint8_t abs_bremse_52_appl_id_06_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_06_decode(uint8_t value)
+float abs_bremse_52_appl_id_06_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_06_is_in_range(uint8_t value)
@@ -1776,14 +1845,14 @@ bool abs_bremse_52_appl_id_06_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_13_encode(double value)
+uint8_t abs_bremse_52_appl_id_13_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_13_decode(uint8_t value)
+float abs_bremse_52_appl_id_13_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_13_is_in_range(uint8_t value)
@@ -1793,14 +1862,14 @@ bool abs_bremse_52_appl_id_13_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_date_06_encode(double value)
+uint8_t abs_bremse_52_appl_date_06_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_date_06_decode(uint8_t value)
+float abs_bremse_52_appl_date_06_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_date_06_is_in_range(uint8_t value)
@@ -1808,14 +1877,14 @@ bool abs_bremse_52_appl_date_06_is_in_range(uint8_t value)
     return (value <= 59u);
 }
 
-uint8_t abs_bremse_52_bb_dig7_encode(double value)
+uint8_t abs_bremse_52_bb_dig7_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_bb_dig7_decode(uint8_t value)
+float abs_bremse_52_bb_dig7_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_bb_dig7_is_in_range(uint8_t value)
@@ -1825,14 +1894,14 @@ bool abs_bremse_52_bb_dig7_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_07_encode(double value)
+uint8_t abs_bremse_52_appl_id_07_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_07_decode(uint8_t value)
+float abs_bremse_52_appl_id_07_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_07_is_in_range(uint8_t value)
@@ -1842,14 +1911,14 @@ bool abs_bremse_52_appl_id_07_is_in_range(uint8_t value)
     return (true);
 }
 
-uint8_t abs_bremse_52_appl_id_14_encode(double value)
+uint8_t abs_bremse_52_appl_id_14_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_52_appl_id_14_decode(uint8_t value)
+float abs_bremse_52_appl_id_14_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_52_appl_id_14_is_in_range(uint8_t value)
@@ -1864,49 +1933,58 @@ int abs_bremse_50_pack(
     const struct abs_bremse_50_t *src_p,
     size_t size)
 {
+    uint16_t brake_bal_at50;
+    uint16_t brake_bal_pct;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
     memset(&dst_p[0], 0, 8);
 
-    dst_p[2] |= pack_left_shift_u16(src_p->brake_bal_at50, 0u, 0xffu);
-    dst_p[3] |= pack_right_shift_u16(src_p->brake_bal_at50, 8u, 0xffu);
+    brake_bal_at50 = (uint16_t)abs_bremse_50_brake_bal_at50_encode(src_p->brake_bal_at50);
+    dst_p[2] |= pack_left_shift_u16(brake_bal_at50, 0u, 0xffu);
+    dst_p[3] |= pack_right_shift_u16(brake_bal_at50, 8u, 0xffu);
     dst_p[4] |= pack_left_shift_u8(src_p->brake_bal_at50_advice, 0u, 0xffu);
-    dst_p[5] |= pack_left_shift_u16(src_p->brake_bal_pct, 0u, 0xffu);
-    dst_p[6] |= pack_right_shift_u16(src_p->brake_bal_pct, 8u, 0xffu);
+    brake_bal_pct = (uint16_t)abs_bremse_50_brake_bal_pct_encode(src_p->brake_bal_pct);
+    dst_p[5] |= pack_left_shift_u16(brake_bal_pct, 0u, 0xffu);
+    dst_p[6] |= pack_right_shift_u16(brake_bal_pct, 8u, 0xffu);
     dst_p[7] |= pack_left_shift_u8(src_p->brake_bal_pct_advice, 0u, 0xffu);
 
     return (8);
 }
-
 int abs_bremse_50_unpack(
     struct abs_bremse_50_t *dst_p,
     const uint8_t *src_p,
     size_t size)
 {
+    uint16_t brake_bal_at50;
+    uint16_t brake_bal_pct;
+
     if (size < 8u) {
         return (-EINVAL);
     }
 
-    dst_p->brake_bal_at50 = unpack_right_shift_u16(src_p[2], 0u, 0xffu);
-    dst_p->brake_bal_at50 |= unpack_left_shift_u16(src_p[3], 8u, 0xffu);
+    brake_bal_at50 = unpack_right_shift_u16(src_p[2], 0u, 0xffu);
+    brake_bal_at50 |= unpack_left_shift_u16(src_p[3], 8u, 0xffu);
+    dst_p->brake_bal_at50 = abs_bremse_50_brake_bal_at50_decode((uint16_t)brake_bal_at50);
     dst_p->brake_bal_at50_advice = unpack_right_shift_u8(src_p[4], 0u, 0xffu);
-    dst_p->brake_bal_pct = unpack_right_shift_u16(src_p[5], 0u, 0xffu);
-    dst_p->brake_bal_pct |= unpack_left_shift_u16(src_p[6], 8u, 0xffu);
+    brake_bal_pct = unpack_right_shift_u16(src_p[5], 0u, 0xffu);
+    brake_bal_pct |= unpack_left_shift_u16(src_p[6], 8u, 0xffu);
+    dst_p->brake_bal_pct = abs_bremse_50_brake_bal_pct_decode((uint16_t)brake_bal_pct);
     dst_p->brake_bal_pct_advice = unpack_right_shift_u8(src_p[7], 0u, 0xffu);
 
     return (0);
 }
 
-uint16_t abs_bremse_50_brake_bal_at50_encode(double value)
+uint16_t abs_bremse_50_brake_bal_at50_encode(float value)
 {
-    return (uint16_t)(value / 0.1);
+    return (uint16_t)(value / 0.1f);
 }
 
-double abs_bremse_50_brake_bal_at50_decode(uint16_t value)
+float abs_bremse_50_brake_bal_at50_decode(uint16_t value)
 {
-    return ((double)value * 0.1);
+    return ((float)value * 0.1f);
 }
 
 bool abs_bremse_50_brake_bal_at50_is_in_range(uint16_t value)
@@ -1914,14 +1992,14 @@ bool abs_bremse_50_brake_bal_at50_is_in_range(uint16_t value)
     return (value <= 1000u);
 }
 
-uint8_t abs_bremse_50_brake_bal_at50_advice_encode(double value)
+uint8_t abs_bremse_50_brake_bal_at50_advice_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_50_brake_bal_at50_advice_decode(uint8_t value)
+float abs_bremse_50_brake_bal_at50_advice_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_50_brake_bal_at50_advice_is_in_range(uint8_t value)
@@ -1929,14 +2007,14 @@ bool abs_bremse_50_brake_bal_at50_advice_is_in_range(uint8_t value)
     return (value <= 100u);
 }
 
-uint16_t abs_bremse_50_brake_bal_pct_encode(double value)
+uint16_t abs_bremse_50_brake_bal_pct_encode(float value)
 {
-    return (uint16_t)(value / 0.1);
+    return (uint16_t)(value / 0.1f);
 }
 
-double abs_bremse_50_brake_bal_pct_decode(uint16_t value)
+float abs_bremse_50_brake_bal_pct_decode(uint16_t value)
 {
-    return ((double)value * 0.1);
+    return ((float)value * 0.1f);
 }
 
 bool abs_bremse_50_brake_bal_pct_is_in_range(uint16_t value)
@@ -1944,14 +2022,14 @@ bool abs_bremse_50_brake_bal_pct_is_in_range(uint16_t value)
     return (value <= 1000u);
 }
 
-uint8_t abs_bremse_50_brake_bal_pct_advice_encode(double value)
+uint8_t abs_bremse_50_brake_bal_pct_advice_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_50_brake_bal_pct_advice_decode(uint8_t value)
+float abs_bremse_50_brake_bal_pct_advice_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_50_brake_bal_pct_advice_is_in_range(uint8_t value)
@@ -1974,7 +2052,7 @@ int abs_bremse_53_pack(
     memset(&dst_p[0], 0, 8);
 
     dst_p[0] |= pack_left_shift_u8(src_p->switch_position, 0u, 0xffu);
-    p_fa = (uint16_t)src_p->p_fa;
+    p_fa = (uint16_t)abs_bremse_53_p_fa_encode(src_p->p_fa);
     dst_p[1] |= pack_left_shift_u16(p_fa, 0u, 0xffu);
     dst_p[2] |= pack_right_shift_u16(p_fa, 8u, 0xffu);
     dst_p[3] |= pack_left_shift_u8(src_p->bls, 0u, 0x01u);
@@ -1994,13 +2072,12 @@ int abs_bremse_53_pack(
     dst_p[5] |= pack_left_shift_u8(src_p->diag_p_ra, 4u, 0x10u);
     dst_p[5] |= pack_left_shift_u8(src_p->diag_yrs, 5u, 0x20u);
     dst_p[5] |= pack_left_shift_u8(src_p->abs_fault_info, 6u, 0xc0u);
-    p_ra = (uint16_t)src_p->p_ra;
+    p_ra = (uint16_t)abs_bremse_53_p_ra_encode(src_p->p_ra);
     dst_p[6] |= pack_left_shift_u16(p_ra, 0u, 0xffu);
     dst_p[7] |= pack_right_shift_u16(p_ra, 8u, 0xffu);
 
     return (8);
 }
-
 int abs_bremse_53_unpack(
     struct abs_bremse_53_t *dst_p,
     const uint8_t *src_p,
@@ -2016,7 +2093,7 @@ int abs_bremse_53_unpack(
     dst_p->switch_position = unpack_right_shift_u8(src_p[0], 0u, 0xffu);
     p_fa = unpack_right_shift_u16(src_p[1], 0u, 0xffu);
     p_fa |= unpack_left_shift_u16(src_p[2], 8u, 0xffu);
-    dst_p->p_fa = (int16_t)p_fa;
+    dst_p->p_fa = abs_bremse_53_p_fa_decode((int16_t)p_fa);
     dst_p->bls = unpack_right_shift_u8(src_p[3], 0u, 0x01u);
     dst_p->bremse_53_cnt = unpack_right_shift_u8(src_p[3], 2u, 0x0cu);
     dst_p->abs_malfunction = unpack_right_shift_u8(src_p[3], 4u, 0x10u);
@@ -2036,19 +2113,19 @@ int abs_bremse_53_unpack(
     dst_p->abs_fault_info = unpack_right_shift_u8(src_p[5], 6u, 0xc0u);
     p_ra = unpack_right_shift_u16(src_p[6], 0u, 0xffu);
     p_ra |= unpack_left_shift_u16(src_p[7], 8u, 0xffu);
-    dst_p->p_ra = (int16_t)p_ra;
+    dst_p->p_ra = abs_bremse_53_p_ra_decode((int16_t)p_ra);
 
     return (0);
 }
 
-uint8_t abs_bremse_53_switch_position_encode(double value)
+uint8_t abs_bremse_53_switch_position_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_switch_position_decode(uint8_t value)
+float abs_bremse_53_switch_position_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_switch_position_is_in_range(uint8_t value)
@@ -2056,14 +2133,14 @@ bool abs_bremse_53_switch_position_is_in_range(uint8_t value)
     return ((value >= 1u) && (value <= 12u));
 }
 
-int16_t abs_bremse_53_p_fa_encode(double value)
+int16_t abs_bremse_53_p_fa_encode(float value)
 {
-    return (int16_t)(value / 0.01526);
+    return (int16_t)(value / 0.01526f);
 }
 
-double abs_bremse_53_p_fa_decode(int16_t value)
+float abs_bremse_53_p_fa_decode(int16_t value)
 {
-    return ((double)value * 0.01526);
+    return ((float)value * 0.01526f);
 }
 
 bool abs_bremse_53_p_fa_is_in_range(int16_t value)
@@ -2071,14 +2148,14 @@ bool abs_bremse_53_p_fa_is_in_range(int16_t value)
     return ((value >= -2785) && (value <= 27850));
 }
 
-uint8_t abs_bremse_53_bls_encode(double value)
+uint8_t abs_bremse_53_bls_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_bls_decode(uint8_t value)
+float abs_bremse_53_bls_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_bls_is_in_range(uint8_t value)
@@ -2086,14 +2163,14 @@ bool abs_bremse_53_bls_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t abs_bremse_53_bremse_53_cnt_encode(double value)
+uint8_t abs_bremse_53_bremse_53_cnt_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_bremse_53_cnt_decode(uint8_t value)
+float abs_bremse_53_bremse_53_cnt_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_bremse_53_cnt_is_in_range(uint8_t value)
@@ -2101,14 +2178,14 @@ bool abs_bremse_53_bremse_53_cnt_is_in_range(uint8_t value)
     return (value <= 3u);
 }
 
-uint8_t abs_bremse_53_abs_malfunction_encode(double value)
+uint8_t abs_bremse_53_abs_malfunction_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_abs_malfunction_decode(uint8_t value)
+float abs_bremse_53_abs_malfunction_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_abs_malfunction_is_in_range(uint8_t value)
@@ -2116,14 +2193,14 @@ bool abs_bremse_53_abs_malfunction_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t abs_bremse_53_abs_active_encode(double value)
+uint8_t abs_bremse_53_abs_active_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_abs_active_decode(uint8_t value)
+float abs_bremse_53_abs_active_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_abs_active_is_in_range(uint8_t value)
@@ -2131,14 +2208,14 @@ bool abs_bremse_53_abs_active_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t abs_bremse_53_ebd_lamp_encode(double value)
+uint8_t abs_bremse_53_ebd_lamp_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_ebd_lamp_decode(uint8_t value)
+float abs_bremse_53_ebd_lamp_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_ebd_lamp_is_in_range(uint8_t value)
@@ -2146,14 +2223,14 @@ bool abs_bremse_53_ebd_lamp_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t abs_bremse_53_abs_lamp_encode(double value)
+uint8_t abs_bremse_53_abs_lamp_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_abs_lamp_decode(uint8_t value)
+float abs_bremse_53_abs_lamp_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_abs_lamp_is_in_range(uint8_t value)
@@ -2161,14 +2238,14 @@ bool abs_bremse_53_abs_lamp_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t abs_bremse_53_diag_fl_encode(double value)
+uint8_t abs_bremse_53_diag_fl_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_diag_fl_decode(uint8_t value)
+float abs_bremse_53_diag_fl_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_diag_fl_is_in_range(uint8_t value)
@@ -2176,14 +2253,14 @@ bool abs_bremse_53_diag_fl_is_in_range(uint8_t value)
     return (value <= 3u);
 }
 
-uint8_t abs_bremse_53_diag_fr_encode(double value)
+uint8_t abs_bremse_53_diag_fr_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_diag_fr_decode(uint8_t value)
+float abs_bremse_53_diag_fr_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_diag_fr_is_in_range(uint8_t value)
@@ -2191,14 +2268,14 @@ bool abs_bremse_53_diag_fr_is_in_range(uint8_t value)
     return (value <= 3u);
 }
 
-uint8_t abs_bremse_53_diag_rl_encode(double value)
+uint8_t abs_bremse_53_diag_rl_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_diag_rl_decode(uint8_t value)
+float abs_bremse_53_diag_rl_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_diag_rl_is_in_range(uint8_t value)
@@ -2206,14 +2283,14 @@ bool abs_bremse_53_diag_rl_is_in_range(uint8_t value)
     return (value <= 3u);
 }
 
-uint8_t abs_bremse_53_diag_rr_encode(double value)
+uint8_t abs_bremse_53_diag_rr_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_diag_rr_decode(uint8_t value)
+float abs_bremse_53_diag_rr_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_diag_rr_is_in_range(uint8_t value)
@@ -2221,14 +2298,14 @@ bool abs_bremse_53_diag_rr_is_in_range(uint8_t value)
     return (value <= 3u);
 }
 
-uint8_t abs_bremse_53_diag_abs_unit_encode(double value)
+uint8_t abs_bremse_53_diag_abs_unit_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_diag_abs_unit_decode(uint8_t value)
+float abs_bremse_53_diag_abs_unit_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_diag_abs_unit_is_in_range(uint8_t value)
@@ -2236,14 +2313,14 @@ bool abs_bremse_53_diag_abs_unit_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t abs_bremse_53_diag_fuse_valve_encode(double value)
+uint8_t abs_bremse_53_diag_fuse_valve_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_diag_fuse_valve_decode(uint8_t value)
+float abs_bremse_53_diag_fuse_valve_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_diag_fuse_valve_is_in_range(uint8_t value)
@@ -2251,14 +2328,14 @@ bool abs_bremse_53_diag_fuse_valve_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t abs_bremse_53_diag_fuse_pump_encode(double value)
+uint8_t abs_bremse_53_diag_fuse_pump_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_diag_fuse_pump_decode(uint8_t value)
+float abs_bremse_53_diag_fuse_pump_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_diag_fuse_pump_is_in_range(uint8_t value)
@@ -2266,14 +2343,14 @@ bool abs_bremse_53_diag_fuse_pump_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t abs_bremse_53_diag_p_fa_encode(double value)
+uint8_t abs_bremse_53_diag_p_fa_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_diag_p_fa_decode(uint8_t value)
+float abs_bremse_53_diag_p_fa_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_diag_p_fa_is_in_range(uint8_t value)
@@ -2281,14 +2358,14 @@ bool abs_bremse_53_diag_p_fa_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t abs_bremse_53_diag_p_ra_encode(double value)
+uint8_t abs_bremse_53_diag_p_ra_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_diag_p_ra_decode(uint8_t value)
+float abs_bremse_53_diag_p_ra_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_diag_p_ra_is_in_range(uint8_t value)
@@ -2296,14 +2373,14 @@ bool abs_bremse_53_diag_p_ra_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t abs_bremse_53_diag_yrs_encode(double value)
+uint8_t abs_bremse_53_diag_yrs_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_diag_yrs_decode(uint8_t value)
+float abs_bremse_53_diag_yrs_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_diag_yrs_is_in_range(uint8_t value)
@@ -2311,14 +2388,14 @@ bool abs_bremse_53_diag_yrs_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t abs_bremse_53_abs_fault_info_encode(double value)
+uint8_t abs_bremse_53_abs_fault_info_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double abs_bremse_53_abs_fault_info_decode(uint8_t value)
+float abs_bremse_53_abs_fault_info_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool abs_bremse_53_abs_fault_info_is_in_range(uint8_t value)
@@ -2326,17 +2403,190 @@ bool abs_bremse_53_abs_fault_info_is_in_range(uint8_t value)
     return (value <= 3u);
 }
 
-int16_t abs_bremse_53_p_ra_encode(double value)
+int16_t abs_bremse_53_p_ra_encode(float value)
 {
-    return (int16_t)(value / 0.01526);
+    return (int16_t)(value / 0.01526f);
 }
 
-double abs_bremse_53_p_ra_decode(int16_t value)
+float abs_bremse_53_p_ra_decode(int16_t value)
 {
-    return ((double)value * 0.01526);
+    return ((float)value * 0.01526f);
 }
 
 bool abs_bremse_53_p_ra_is_in_range(int16_t value)
 {
     return ((value >= -2785) && (value <= 27850));
 }
+
+const struct abs_message_descriptor_t
+abs_message_descriptors[ABS_MESSAGES_LENGTH] = {
+    { ABS_MM5_10_TX1_FRAME_ID, 8u, false, 10u },
+    { ABS_DRS_RX_ID0_FRAME_ID, 8u, false, 10u },
+    { ABS_MM5_10_TX2_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_10_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_11_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_12_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_13_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_2_FRAME_ID, 8u, false, 10u },
+    { ABS_ABS_SWITCH_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_30_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_31_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_32_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_33_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_51_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_52_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_50_FRAME_ID, 8u, false, 10u },
+    { ABS_MM5_10_TX3_FRAME_ID, 8u, false, 10u },
+    { ABS_BREMSE_53_FRAME_ID, 8u, false, 10u }
+};
+
+const struct abs_message_descriptor_t *
+abs_message_descriptor_by_frame_id(uint32_t frame_id)
+{
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    low = 0;
+    high = ABS_MESSAGES_LENGTH;
+
+    while (low < high) {
+        middle = (low + ((high - low) / 2u));
+
+        if (abs_message_descriptors[middle].frame_id < frame_id) {
+            low = (middle + 1u);
+        } else {
+            high = middle;
+        }
+    }
+
+    if ((low < ABS_MESSAGES_LENGTH)
+        && (abs_message_descriptors[low].frame_id == frame_id)) {
+        return (&abs_message_descriptors[low]);
+    }
+
+    return (NULL);
+}
+
+int abs_unpack_by_frame_id(
+    uint32_t frame_id,
+    union abs_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    switch (frame_id) {
+
+    case ABS_MM5_10_TX1_FRAME_ID:
+        return (abs_mm5_10_tx1_unpack(
+                    &dst_p->mm5_10_tx1,
+                    src_p,
+                    size));
+
+    case ABS_DRS_RX_ID0_FRAME_ID:
+        return (abs_drs_rx_id0_unpack(
+                    &dst_p->drs_rx_id0,
+                    src_p,
+                    size));
+
+    case ABS_MM5_10_TX2_FRAME_ID:
+        return (abs_mm5_10_tx2_unpack(
+                    &dst_p->mm5_10_tx2,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_10_FRAME_ID:
+        return (abs_bremse_10_unpack(
+                    &dst_p->bremse_10,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_11_FRAME_ID:
+        return (abs_bremse_11_unpack(
+                    &dst_p->bremse_11,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_12_FRAME_ID:
+        return (abs_bremse_12_unpack(
+                    &dst_p->bremse_12,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_13_FRAME_ID:
+        return (abs_bremse_13_unpack(
+                    &dst_p->bremse_13,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_2_FRAME_ID:
+        return (abs_bremse_2_unpack(
+                    &dst_p->bremse_2,
+                    src_p,
+                    size));
+
+    case ABS_ABS_SWITCH_FRAME_ID:
+        return (abs_abs_switch_unpack(
+                    &dst_p->abs_switch,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_30_FRAME_ID:
+        return (abs_bremse_30_unpack(
+                    &dst_p->bremse_30,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_31_FRAME_ID:
+        return (abs_bremse_31_unpack(
+                    &dst_p->bremse_31,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_32_FRAME_ID:
+        return (abs_bremse_32_unpack(
+                    &dst_p->bremse_32,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_33_FRAME_ID:
+        return (abs_bremse_33_unpack(
+                    &dst_p->bremse_33,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_51_FRAME_ID:
+        return (abs_bremse_51_unpack(
+                    &dst_p->bremse_51,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_52_FRAME_ID:
+        return (abs_bremse_52_unpack(
+                    &dst_p->bremse_52,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_50_FRAME_ID:
+        return (abs_bremse_50_unpack(
+                    &dst_p->bremse_50,
+                    src_p,
+                    size));
+
+    case ABS_MM5_10_TX3_FRAME_ID:
+        return (abs_mm5_10_tx3_unpack(
+                    &dst_p->mm5_10_tx3,
+                    src_p,
+                    size));
+
+    case ABS_BREMSE_53_FRAME_ID:
+        return (abs_bremse_53_unpack(
+                    &dst_p->bremse_53,
+                    src_p,
+                    size));
+
+    default:
+        break;
+    }
+
+    return (-EINVAL);
+}
@@ -157,7 +157,7 @@ struct abs_bremse_33_t {
      * Scale: 0.015625
      * Offset: 0
      */
-    uint16_t whlspeed_fl;
+    float whlspeed_fl;
 
     /**
      * Radgeschwindigkeit / wheel speed absCtrl FR
@@ -166,7 +166,7 @@ struct abs_bremse_33_t {
      * Scale: 0.015625
      * Offset: 0
      */
-    uint16_t whlspeed_fr;
+    float whlspeed_fr;
 
     /**
      * Radgeschwindigkeit / wheel speed absCtrl RL
@@ -175,7 +175,7 @@ struct abs_bremse_33_t {
      * Scale: 0.015625
      * Offset: 0
      */
-    uint16_t whlspeed_rl;
+    float whlspeed_rl;
 
     /**
      * Radgeschwindigkeit / wheel speed absCtrl RR
@@ -184,7 +184,7 @@ struct abs_bremse_33_t {
      * Scale: 0.015625
      * Offset: 0
      */
-    uint16_t whlspeed_rr;
+    float whlspeed_rr;
 };
 
 /**
@@ -260,16 +260,16 @@ struct abs_mm5_10_tx1_t {
      * Scale: 0.005
      * Offset: -163.84
      */
-    uint16_t yaw_rate;
+    float yaw_rate;
 
     /**
      * Measured lateral acceleration.
      *
-     * Range: 0..65534.06817557760953987369082 (-4.1768..4.1765 g)
+     * Range: 0..65534.0681756f (-4.1768..4.1765 g)
      * Scale: 0.000127465
      * Offset: -4.1768
      */
-    uint16_t ay1;
+    float ay1;
 };
 
 /**
@@ -285,16 +285,16 @@ struct abs_mm5_10_tx2_t {
      * Scale: 0.005
      * Offset: -163.84
      */
-    uint16_t roll_rate;
+    float roll_rate;
 
     /**
      * Measured longitudional acceleration.
      *
-     * Range: 0..65534.06817557760953987369082 (-4.1768..4.1765 g)
+     * Range: 0..65534.0681756f (-4.1768..4.1765 g)
      * Scale: 0.000127465
      * Offset: -4.1768
      */
-    uint16_t ax1;
+    float ax1;
 };
 
 /**
@@ -306,11 +306,11 @@ struct abs_mm5_10_tx3_t {
     /**
      * Measured vertical acceleration.
      *
-     * Range: 0..65534.06817557760953987369082 (-4.1768..4.1765 g)
+     * Range: 0..65534.0681756f (-4.1768..4.1765 g)
      * Scale: 0.000127465
      * Offset: -4.1768
      */
-    uint16_t az;
+    float az;
 };
 
 /**
@@ -326,7 +326,7 @@ struct abs_bremse_2_t {
      * Scale: 0.015625
      * Offset: 0
      */
-    uint16_t whlspeed_fl_bremse2;
+    float whlspeed_fl_bremse2;
 
     /**
      * Radgeschwindigkeit / wheel speed direct FR
@@ -335,7 +335,7 @@ struct abs_bremse_2_t {
      * Scale: 0.015625
      * Offset: 0
      */
-    uint16_t whlspeed_fr_bremse2;
+    float whlspeed_fr_bremse2;
 
     /**
      * Radgeschwindigkeit / wheel speed direct RL
@@ -344,7 +344,7 @@ struct abs_bremse_2_t {
      * Scale: 0.015625
      * Offset: 0
      */
-    uint16_t whlspeed_rl_bremse2;
+    float whlspeed_rl_bremse2;
 
     /**
      * Radgeschwindigkeit / wheel speed direct RR
@@ -353,7 +353,7 @@ struct abs_bremse_2_t {
      * Scale: 0.015625
      * Offset: 0
      */
-    uint16_t whlspeed_rr_bremse2;
+    float whlspeed_rr_bremse2;
 };
 
 /**
@@ -365,7 +365,7 @@ struct abs_abs_switch_t {
     /**
      * Channel to send the swich position via CAN to the ABS.
      *
-     * Range: 0..11 (0..11 -)
+     * Range: 0..11 (0..11 )
      * Scale: 1
      * Offset: 0
      */
@@ -411,7 +411,7 @@ struct abs_bremse_32_t {
      * Scale: 0.05
      * Offset: 0
      */
-    uint8_t acc_fa;
+    float acc_fa;
 
     /**
      * Fill level of the fluid reservoir of the rear axle.
@@ -420,7 +420,7 @@ struct abs_bremse_32_t {
      * Scale: 0.05
      * Offset: 0
      */
-    uint8_t acc_ra;
+    float acc_ra;
 
     /**
      * Bit matrix
@@ -433,7 +433,7 @@ struct abs_bremse_32_t {
      * Bit6 (64) Invalid Generic
      * Bit7 (128) Invalid Individual
      *
-     * Range: 0..32 (0..32 -)
+     * Range: 0..32 (0..32 )
      * Scale: 1
      * Offset: 0
      */
@@ -450,7 +450,7 @@ struct abs_bremse_32_t {
      * Bit6 (64) Invalid Generic
      * Bit7 (128) Invalid Individual
      *
-     * Range: 0..32 (0..32 -)
+     * Range: 0..32 (0..32 )
      * Scale: 1
      * Offset: 0
      */
@@ -467,7 +467,7 @@ struct abs_bremse_32_t {
      * Bit6 (64) Invalid Generic
      * Bit7 (128) Invalid Individual
      *
-     * Range: 0..32 (0..32 -)
+     * Range: 0..32 (0..32 )
      * Scale: 1
      * Offset: 0
      */
@@ -484,7 +484,7 @@ struct abs_bremse_32_t {
      * Bit6 (64) Invalid Generic
      * Bit7 (128) Invalid Individual
      *
-     * Range: 0..32 (0..32 -)
+     * Range: 0..32 (0..32 )
      * Scale: 1
      * Offset: 0
      */
@@ -504,21 +504,21 @@ struct abs_bremse_51_t {
      * Scale: 0.00012742
      * Offset: -4.1768
      */
-    uint16_t ax1_abs_int;
+    float ax1_abs_int;
 
     /**
      * Used lateral acceleration value in the ABS.
      *
-     * Range: 0..65557.21236854496939256003767 (-4.1768..4.1765 g)
+     * Range: 0..65557.2123685f (-4.1768..4.1765 g)
      * Scale: 0.00012742
      * Offset: -4.1768
      */
-    uint16_t ay1_abs_int;
+    float ay1_abs_int;
 
     /**
      * external info to e.g. MS6 which dbc has to be used. This index increments on changes that make the MS6 interface incompatible to the predecessor CAN interface implementation
      *
-     * Range: 0..63 (0..63 -)
+     * Range: 0..63 (0..63 )
      * Scale: 1
      * Offset: 0
      */
@@ -527,7 +527,7 @@ struct abs_bremse_51_t {
     /**
      * external info to e.g. MS6 which dbc has to be used. This index increments with added features (rest of MS6 interface stays intact.)
      *
-     * Range: 0..63 (0..63 -)
+     * Range: 0..63 (0..63 )
      * Scale: 1
      * Offset: 0
      */
@@ -536,7 +536,7 @@ struct abs_bremse_51_t {
     /**
      * external info to e.g. MS6 which dbc has to be used. Checksum
      *
-     * Range: 0..15 (0..15 -)
+     * Range: 0..15 (0..15 )
      * Scale: 1
      * Offset: 0
      */
@@ -552,7 +552,7 @@ struct abs_bremse_52_t {
     /**
      * 1=SW version; 2=BB#; 3,4=application name; 5=application date (UTC); 6=deviceType (SW CAN ident, ABS M5=2, ABS M6=3); 7=Serial#
      *
-     * Range: 0..255 (0..255 -)
+     * Range: 0..255 (0..255 )
      * Scale: 1
      * Offset: 0
      */
@@ -561,7 +561,7 @@ struct abs_bremse_52_t {
     /**
      * version 1.0 as 0x01(upper), version 100.20 as 0x64(upper)
      *
-     * Range: 0..255 (0..255 -)
+     * Range: 0..255 (0..255 )
      * Scale: 1
      * Offset: 0
      */
@@ -591,21 +591,21 @@ struct abs_bremse_52_t {
     /**
      * year
      *
-     * Range: 0..99 (0..99 -)
+     * Range: 0..99 (0..99 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t appl_date_01;
 
     /**
-     * Range: 0..255 (0..255 -)
+     * Range: 0..255 (0..255 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t sw_can_ident;
 
     /**
-     * Range: 0..99 (0..99 -)
+     * Range: 0..99 (0..99 )
      * Scale: 1
      * Offset: 0
      */
@@ -614,7 +614,7 @@ struct abs_bremse_52_t {
     /**
      * version 1.0 as 0x00(lower), version 100.20 as 0x14(lower)
      *
-     * Range: 0..255 (0..255 -)
+     * Range: 0..255 (0..255 )
      * Scale: 1
      * Offset: 0
      */
@@ -644,14 +644,14 @@ struct abs_bremse_52_t {
     /**
      * month
      *
-     * Range: 1..12 (1..12 -)
+     * Range: 1..12 (1..12 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t appl_date_02;
 
     /**
-     * Range: 1..12 (1..12 -)
+     * Range: 1..12 (1..12 )
      * Scale: 1
      * Offset: 0
      */
@@ -660,7 +660,7 @@ struct abs_bremse_52_t {
     /**
      * version 1.0 as 0x01(upper), version 100.20 as 0x64(upper)
      *
-     * Range: 0..255 (0..255 -)
+     * Range: 0..255 (0..255 )
      * Scale: 1
      * Offset: 0
      */
@@ -690,14 +690,14 @@ struct abs_bremse_52_t {
     /**
      * day
      *
-     * Range: 1..31 (1..31 -)
+     * Range: 1..31 (1..31 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t appl_date_03;
 
     /**
-     * Range: 1..31 (1..31 -)
+     * Range: 1..31 (1..31 )
      * Scale: 1
      * Offset: 0
      */
@@ -706,7 +706,7 @@ struct abs_bremse_52_t {
     /**
      * version 1.0 as 0x00(lower), version 100.20 as 0x14(lower)
      *
-     * Range: 0..255 (0..255 -)
+     * Range: 0..255 (0..255 )
      * Scale: 1
      * Offset: 0
      */
@@ -736,14 +736,14 @@ struct abs_bremse_52_t {
     /**
      * hour
      *
-     * Range: 0..24 (0..24 -)
+     * Range: 0..24 (0..24 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t appl_date_04;
 
     /**
-     * Range: 0..99999 (0..99999 -)
+     * Range: 0..99999 (0..99999 )
      * Scale: 1
      * Offset: 0
      */
@@ -752,7 +752,7 @@ struct abs_bremse_52_t {
     /**
      * version 1.0 as 0x01(upper), version 100.20 as 0x64(upper)
      *
-     * Range: 0..255 (0..255 -)
+     * Range: 0..255 (0..255 )
      * Scale: 1
      * Offset: 0
      */
@@ -782,7 +782,7 @@ struct abs_bremse_52_t {
     /**
      * minute
      *
-     * Range: 0..59 (0..59 -)
+     * Range: 0..59 (0..59 )
      * Scale: 1
      * Offset: 0
      */
@@ -791,7 +791,7 @@ struct abs_bremse_52_t {
     /**
      * version 1.0 as 0x00(lower), version 100.20 as 0x14(lower)
      *
-     * Range: 0..255 (0..255 -)
+     * Range: 0..255 (0..255 )
      * Scale: 1
      * Offset: 0
      */
@@ -821,7 +821,7 @@ struct abs_bremse_52_t {
     /**
      * seconds
      *
-     * Range: 0..59 (0..59 -)
+     * Range: 0..59 (0..59 )
      * Scale: 1
      * Offset: 0
      */
@@ -862,7 +862,7 @@ struct abs_bremse_50_t {
      * Scale: 0.1
      * Offset: 0
      */
-    uint16_t brake_bal_at50;
+    float brake_bal_at50;
 
     /**
      * Recommended rear axle brake pressure if the front pressure is at 50 bar.
@@ -880,7 +880,7 @@ struct abs_bremse_50_t {
      * Scale: 0.1
      * Offset: 0
      */
-    uint16_t brake_bal_pct;
+    float brake_bal_pct;
 
     /**
      * Recommended percental brake balance on the front axle.
@@ -901,7 +901,7 @@ struct abs_bremse_53_t {
     /**
      * Used switch position of the ABS.
      *
-     * Range: 1..12 (1..12 -)
+     * Range: 1..12 (1..12 )
      * Scale: 1
      * Offset: 0
      */
@@ -910,23 +910,23 @@ struct abs_bremse_53_t {
     /**
      * Brake pressure on the front axle.
      *
-     * Range: -2785.058977719528178243774574..27850.58977719528178243774574 (-42.5..425 bar)
+     * Range: -2785.05897772f..27850.5897772f (-42.5..425 bar)
      * Scale: 0.01526
      * Offset: 0
      */
-    int16_t p_fa;
+    float p_fa;
 
     /**
      * Bit for the brake light switch.
      *
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t bls;
 
     /**
-     * Range: 0..3 (0..3 -)
+     * Range: 0..3 (0..3 )
      * Scale: 1
      * Offset: 0
      */
@@ -935,7 +935,7 @@ struct abs_bremse_53_t {
     /**
      * Bit will jump to 1, if the ABS control is deactivated by a fault.
      *
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
@@ -944,7 +944,7 @@ struct abs_bremse_53_t {
     /**
      * Bit will jump to 1, when the ABS control is active.
      *
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
@@ -953,7 +953,7 @@ struct abs_bremse_53_t {
     /**
      * Bit will jump to 1, when the EBD is deactivated due to a fault.
      *
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
@@ -962,7 +962,7 @@ struct abs_bremse_53_t {
     /**
      * Bit will jump to 1, when the ABS control is deactivated due to a fault, switch to the off position or while working with RaceABS.
      *
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
@@ -972,7 +972,7 @@ struct abs_bremse_53_t {
      * Value to show faults related to the wheel speed sensor.
      * 0 - Signal ok, 1 - Wiring related fault, 2 - Signal related fault
      *
-     * Range: 0..3 (0..3 -)
+     * Range: 0..3 (0..3 )
      * Scale: 1
      * Offset: 0
      */
@@ -982,7 +982,7 @@ struct abs_bremse_53_t {
      * Value to show faults related to the wheel speed sensor.
      * 0 - Signal ok, 1 - Wiring related fault, 2 - Signal related fault
      *
-     * Range: 0..3 (0..3 -)
+     * Range: 0..3 (0..3 )
      * Scale: 1
      * Offset: 0
      */
@@ -992,7 +992,7 @@ struct abs_bremse_53_t {
      * Value to show faults related to the wheel speed sensor.
      * 0 - Signal ok, 1 - Wiring related fault, 2 - Signal related fault
      *
-     * Range: 0..3 (0..3 -)
+     * Range: 0..3 (0..3 )
      * Scale: 1
      * Offset: 0
      */
@@ -1002,7 +1002,7 @@ struct abs_bremse_53_t {
      * Value to show faults related to the wheel speed sensor.
      * 0 - Signal ok, 1 - Wiring related fault, 2 - Signal related fault
      *
-     * Range: 0..3 (0..3 -)
+     * Range: 0..3 (0..3 )
      * Scale: 1
      * Offset: 0
      */
@@ -1011,7 +1011,7 @@ struct abs_bremse_53_t {
     /**
      * Bit to show, if a ABS error related to the hydraulic unit is present
      *
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
@@ -1020,7 +1020,7 @@ struct abs_bremse_53_t {
     /**
      * Bit to show, if a ABS error related to the fuse or power supply of the ABS valves is present.
      *
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
@@ -1029,7 +1029,7 @@ struct abs_bremse_53_t {
     /**
      * Bit to show, if a ABS error related to the fuse or power supply of the ABS pump is present.
      *
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
@@ -1038,7 +1038,7 @@ struct abs_bremse_53_t {
     /**
      * Bit to show, if the pressure sensor FA is working properly. An error is pressent, if the bit is 1.
      *
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
@@ -1047,7 +1047,7 @@ struct abs_bremse_53_t {
     /**
      * Bit to show, if the pressure sensor RA is working properly. An error is pressent, if the bit is 1.
      *
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
@@ -1056,7 +1056,7 @@ struct abs_bremse_53_t {
     /**
      * Bit to show, if the yaw rate sensor is working properly. An error is pressent, if the bit is 1.
      *
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
@@ -1065,7 +1065,7 @@ struct abs_bremse_53_t {
     /**
      * Bit matrix to show if a fault or a active fault is stored in the ABS. Bit will also show minor errors which do  not shut down the ABS controller.
      *
-     * Range: 0..3 (0..3 -)
+     * Range: 0..3 (0..3 )
      * Scale: 1
      * Offset: 0
      */
@@ -1074,11 +1074,11 @@ struct abs_bremse_53_t {
     /**
      * Brake pressure on the rear axle.
      *
-     * Range: -2785.058977719528178243774574..27850.58977719528178243774574 (-42.5..425 bar)
+     * Range: -2785.05897772f..27850.5897772f (-42.5..425 bar)
      * Scale: 0.01526
      * Offset: 0
      */
-    int16_t p_ra;
+    float p_ra;
 };
 
 /**
@@ -1094,7 +1094,6 @@ int abs_bremse_33_pack(
     uint8_t *dst_p,
     const struct abs_bremse_33_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_33.
  *
@@ -1116,7 +1115,7 @@ int abs_bremse_33_unpack(
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_33_whlspeed_fl_encode(double value);
+uint16_t abs_bremse_33_whlspeed_fl_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1125,7 +1124,7 @@ uint16_t abs_bremse_33_whlspeed_fl_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_33_whlspeed_fl_decode(uint16_t value);
+float abs_bremse_33_whlspeed_fl_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1143,7 +1142,7 @@ bool abs_bremse_33_whlspeed_fl_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_33_whlspeed_fr_encode(double value);
+uint16_t abs_bremse_33_whlspeed_fr_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1152,7 +1151,7 @@ uint16_t abs_bremse_33_whlspeed_fr_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_33_whlspeed_fr_decode(uint16_t value);
+float abs_bremse_33_whlspeed_fr_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1170,7 +1169,7 @@ bool abs_bremse_33_whlspeed_fr_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_33_whlspeed_rl_encode(double value);
+uint16_t abs_bremse_33_whlspeed_rl_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1179,7 +1178,7 @@ uint16_t abs_bremse_33_whlspeed_rl_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_33_whlspeed_rl_decode(uint16_t value);
+float abs_bremse_33_whlspeed_rl_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1197,7 +1196,7 @@ bool abs_bremse_33_whlspeed_rl_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_33_whlspeed_rr_encode(double value);
+uint16_t abs_bremse_33_whlspeed_rr_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1206,7 +1205,7 @@ uint16_t abs_bremse_33_whlspeed_rr_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_33_whlspeed_rr_decode(uint16_t value);
+float abs_bremse_33_whlspeed_rr_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1230,7 +1229,6 @@ int abs_bremse_10_pack(
     uint8_t *dst_p,
     const struct abs_bremse_10_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_10.
  *
@@ -1258,7 +1256,6 @@ int abs_bremse_11_pack(
     uint8_t *dst_p,
     const struct abs_bremse_11_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_11.
  *
@@ -1286,7 +1283,6 @@ int abs_bremse_12_pack(
     uint8_t *dst_p,
     const struct abs_bremse_12_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_12.
  *
@@ -1314,7 +1310,6 @@ int abs_bremse_13_pack(
     uint8_t *dst_p,
     const struct abs_bremse_13_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_13.
  *
@@ -1342,7 +1337,6 @@ int abs_drs_rx_id0_pack(
     uint8_t *dst_p,
     const struct abs_drs_rx_id0_t *src_p,
     size_t size);
-
 /**
  * Unpack message DRS_RX_ID0.
  *
@@ -1370,7 +1364,6 @@ int abs_mm5_10_tx1_pack(
     uint8_t *dst_p,
     const struct abs_mm5_10_tx1_t *src_p,
     size_t size);
-
 /**
  * Unpack message MM5_10_TX1.
  *
@@ -1392,7 +1385,7 @@ int abs_mm5_10_tx1_unpack(
  *
  * @return Encoded signal.
  */
-uint16_t abs_mm5_10_tx1_yaw_rate_encode(double value);
+uint16_t abs_mm5_10_tx1_yaw_rate_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1401,7 +1394,7 @@ uint16_t abs_mm5_10_tx1_yaw_rate_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_mm5_10_tx1_yaw_rate_decode(uint16_t value);
+float abs_mm5_10_tx1_yaw_rate_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1419,7 +1412,7 @@ bool abs_mm5_10_tx1_yaw_rate_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint16_t abs_mm5_10_tx1_ay1_encode(double value);
+uint16_t abs_mm5_10_tx1_ay1_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1428,7 +1421,7 @@ uint16_t abs_mm5_10_tx1_ay1_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_mm5_10_tx1_ay1_decode(uint16_t value);
+float abs_mm5_10_tx1_ay1_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1452,7 +1445,6 @@ int abs_mm5_10_tx2_pack(
     uint8_t *dst_p,
     const struct abs_mm5_10_tx2_t *src_p,
     size_t size);
-
 /**
  * Unpack message MM5_10_TX2.
  *
@@ -1474,7 +1466,7 @@ int abs_mm5_10_tx2_unpack(
  *
  * @return Encoded signal.
  */
-uint16_t abs_mm5_10_tx2_roll_rate_encode(double value);
+uint16_t abs_mm5_10_tx2_roll_rate_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1483,7 +1475,7 @@ uint16_t abs_mm5_10_tx2_roll_rate_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_mm5_10_tx2_roll_rate_decode(uint16_t value);
+float abs_mm5_10_tx2_roll_rate_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1501,7 +1493,7 @@ bool abs_mm5_10_tx2_roll_rate_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint16_t abs_mm5_10_tx2_ax1_encode(double value);
+uint16_t abs_mm5_10_tx2_ax1_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1510,7 +1502,7 @@ uint16_t abs_mm5_10_tx2_ax1_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_mm5_10_tx2_ax1_decode(uint16_t value);
+float abs_mm5_10_tx2_ax1_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1534,7 +1526,6 @@ int abs_mm5_10_tx3_pack(
     uint8_t *dst_p,
     const struct abs_mm5_10_tx3_t *src_p,
     size_t size);
-
 /**
  * Unpack message MM5_10_TX3.
  *
@@ -1556,7 +1547,7 @@ int abs_mm5_10_tx3_unpack(
  *
  * @return Encoded signal.
  */
-uint16_t abs_mm5_10_tx3_az_encode(double value);
+uint16_t abs_mm5_10_tx3_az_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1565,7 +1556,7 @@ uint16_t abs_mm5_10_tx3_az_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_mm5_10_tx3_az_decode(uint16_t value);
+float abs_mm5_10_tx3_az_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1589,7 +1580,6 @@ int abs_bremse_2_pack(
     uint8_t *dst_p,
     const struct abs_bremse_2_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_2.
  *
@@ -1611,7 +1601,7 @@ int abs_bremse_2_unpack(
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_2_whlspeed_fl_bremse2_encode(double value);
+uint16_t abs_bremse_2_whlspeed_fl_bremse2_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1620,7 +1610,7 @@ uint16_t abs_bremse_2_whlspeed_fl_bremse2_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_2_whlspeed_fl_bremse2_decode(uint16_t value);
+float abs_bremse_2_whlspeed_fl_bremse2_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1638,7 +1628,7 @@ bool abs_bremse_2_whlspeed_fl_bremse2_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_2_whlspeed_fr_bremse2_encode(double value);
+uint16_t abs_bremse_2_whlspeed_fr_bremse2_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1647,7 +1637,7 @@ uint16_t abs_bremse_2_whlspeed_fr_bremse2_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_2_whlspeed_fr_bremse2_decode(uint16_t value);
+float abs_bremse_2_whlspeed_fr_bremse2_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1665,7 +1655,7 @@ bool abs_bremse_2_whlspeed_fr_bremse2_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_2_whlspeed_rl_bremse2_encode(double value);
+uint16_t abs_bremse_2_whlspeed_rl_bremse2_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1674,7 +1664,7 @@ uint16_t abs_bremse_2_whlspeed_rl_bremse2_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_2_whlspeed_rl_bremse2_decode(uint16_t value);
+float abs_bremse_2_whlspeed_rl_bremse2_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1692,7 +1682,7 @@ bool abs_bremse_2_whlspeed_rl_bremse2_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_2_whlspeed_rr_bremse2_encode(double value);
+uint16_t abs_bremse_2_whlspeed_rr_bremse2_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1701,7 +1691,7 @@ uint16_t abs_bremse_2_whlspeed_rr_bremse2_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_2_whlspeed_rr_bremse2_decode(uint16_t value);
+float abs_bremse_2_whlspeed_rr_bremse2_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1725,7 +1715,6 @@ int abs_abs_switch_pack(
     uint8_t *dst_p,
     const struct abs_abs_switch_t *src_p,
     size_t size);
-
 /**
  * Unpack message ABS_Switch.
  *
@@ -1747,7 +1736,7 @@ int abs_abs_switch_unpack(
  *
  * @return Encoded signal.
  */
-uint8_t abs_abs_switch_abs_switchposition_encode(double value);
+uint8_t abs_abs_switch_abs_switchposition_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1756,7 +1745,7 @@ uint8_t abs_abs_switch_abs_switchposition_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_abs_switch_abs_switchposition_decode(uint8_t value);
+float abs_abs_switch_abs_switchposition_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1780,7 +1769,6 @@ int abs_bremse_30_pack(
     uint8_t *dst_p,
     const struct abs_bremse_30_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_30.
  *
@@ -1808,7 +1796,6 @@ int abs_bremse_31_pack(
     uint8_t *dst_p,
     const struct abs_bremse_31_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_31.
  *
@@ -1830,7 +1817,7 @@ int abs_bremse_31_unpack(
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_31_idle_time_encode(double value);
+uint16_t abs_bremse_31_idle_time_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1839,7 +1826,7 @@ uint16_t abs_bremse_31_idle_time_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_31_idle_time_decode(uint16_t value);
+float abs_bremse_31_idle_time_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1863,7 +1850,6 @@ int abs_bremse_32_pack(
     uint8_t *dst_p,
     const struct abs_bremse_32_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_32.
  *
@@ -1885,7 +1871,7 @@ int abs_bremse_32_unpack(
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_32_acc_fa_encode(double value);
+uint8_t abs_bremse_32_acc_fa_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1894,7 +1880,7 @@ uint8_t abs_bremse_32_acc_fa_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_32_acc_fa_decode(uint8_t value);
+float abs_bremse_32_acc_fa_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1912,7 +1898,7 @@ bool abs_bremse_32_acc_fa_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_32_acc_ra_encode(double value);
+uint8_t abs_bremse_32_acc_ra_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1921,7 +1907,7 @@ uint8_t abs_bremse_32_acc_ra_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_32_acc_ra_decode(uint8_t value);
+float abs_bremse_32_acc_ra_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1939,7 +1925,7 @@ bool abs_bremse_32_acc_ra_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_32_wheel_quality_fl_encode(double value);
+uint8_t abs_bremse_32_wheel_quality_fl_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1948,7 +1934,7 @@ uint8_t abs_bremse_32_wheel_quality_fl_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_32_wheel_quality_fl_decode(uint8_t value);
+float abs_bremse_32_wheel_quality_fl_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1966,7 +1952,7 @@ bool abs_bremse_32_wheel_quality_fl_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_32_wheel_quality_fr_encode(double value);
+uint8_t abs_bremse_32_wheel_quality_fr_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1975,7 +1961,7 @@ uint8_t abs_bremse_32_wheel_quality_fr_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_32_wheel_quality_fr_decode(uint8_t value);
+float abs_bremse_32_wheel_quality_fr_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1993,7 +1979,7 @@ bool abs_bremse_32_wheel_quality_fr_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_32_wheel_quality_rl_encode(double value);
+uint8_t abs_bremse_32_wheel_quality_rl_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2002,7 +1988,7 @@ uint8_t abs_bremse_32_wheel_quality_rl_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_32_wheel_quality_rl_decode(uint8_t value);
+float abs_bremse_32_wheel_quality_rl_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2020,7 +2006,7 @@ bool abs_bremse_32_wheel_quality_rl_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_32_wheel_quality_rr_encode(double value);
+uint8_t abs_bremse_32_wheel_quality_rr_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2029,7 +2015,7 @@ uint8_t abs_bremse_32_wheel_quality_rr_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_32_wheel_quality_rr_decode(uint8_t value);
+float abs_bremse_32_wheel_quality_rr_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2053,7 +2039,6 @@ int abs_bremse_51_pack(
     uint8_t *dst_p,
     const struct abs_bremse_51_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_51.
  *
@@ -2075,7 +2060,7 @@ int abs_bremse_51_unpack(
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_51_ax1_abs_int_encode(double value);
+uint16_t abs_bremse_51_ax1_abs_int_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2084,7 +2069,7 @@ uint16_t abs_bremse_51_ax1_abs_int_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_51_ax1_abs_int_decode(uint16_t value);
+float abs_bremse_51_ax1_abs_int_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2102,7 +2087,7 @@ bool abs_bremse_51_ax1_abs_int_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_51_ay1_abs_int_encode(double value);
+uint16_t abs_bremse_51_ay1_abs_int_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2111,7 +2096,7 @@ uint16_t abs_bremse_51_ay1_abs_int_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_51_ay1_abs_int_decode(uint16_t value);
+float abs_bremse_51_ay1_abs_int_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2129,7 +2114,7 @@ bool abs_bremse_51_ay1_abs_int_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_51_if_variant_encode(double value);
+uint8_t abs_bremse_51_if_variant_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2138,7 +2123,7 @@ uint8_t abs_bremse_51_if_variant_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_51_if_variant_decode(uint8_t value);
+float abs_bremse_51_if_variant_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2156,7 +2141,7 @@ bool abs_bremse_51_if_variant_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_51_if_revision_encode(double value);
+uint8_t abs_bremse_51_if_revision_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2165,7 +2150,7 @@ uint8_t abs_bremse_51_if_revision_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_51_if_revision_decode(uint8_t value);
+float abs_bremse_51_if_revision_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2183,7 +2168,7 @@ bool abs_bremse_51_if_revision_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_51_if_chksum_encode(double value);
+uint8_t abs_bremse_51_if_chksum_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2192,7 +2177,7 @@ uint8_t abs_bremse_51_if_chksum_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_51_if_chksum_decode(uint8_t value);
+float abs_bremse_51_if_chksum_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2216,7 +2201,6 @@ int abs_bremse_52_pack(
     uint8_t *dst_p,
     const struct abs_bremse_52_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_52.
  *
@@ -2238,7 +2222,7 @@ int abs_bremse_52_unpack(
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_mplx_sw_info_encode(double value);
+uint8_t abs_bremse_52_mplx_sw_info_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2247,7 +2231,7 @@ uint8_t abs_bremse_52_mplx_sw_info_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_mplx_sw_info_decode(uint8_t value);
+float abs_bremse_52_mplx_sw_info_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2265,7 +2249,7 @@ bool abs_bremse_52_mplx_sw_info_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_sw_version_high_upper_encode(double value);
+uint8_t abs_bremse_52_sw_version_high_upper_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2274,7 +2258,7 @@ uint8_t abs_bremse_52_sw_version_high_upper_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_sw_version_high_upper_decode(uint8_t value);
+float abs_bremse_52_sw_version_high_upper_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2292,7 +2276,7 @@ bool abs_bremse_52_sw_version_high_upper_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_bb_dig1_encode(double value);
+uint8_t abs_bremse_52_bb_dig1_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2301,7 +2285,7 @@ uint8_t abs_bremse_52_bb_dig1_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_bb_dig1_decode(uint8_t value);
+float abs_bremse_52_bb_dig1_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2319,7 +2303,7 @@ bool abs_bremse_52_bb_dig1_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_01_encode(double value);
+uint8_t abs_bremse_52_appl_id_01_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2328,7 +2312,7 @@ uint8_t abs_bremse_52_appl_id_01_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_01_decode(uint8_t value);
+float abs_bremse_52_appl_id_01_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2346,7 +2330,7 @@ bool abs_bremse_52_appl_id_01_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_08_encode(double value);
+uint8_t abs_bremse_52_appl_id_08_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2355,7 +2339,7 @@ uint8_t abs_bremse_52_appl_id_08_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_08_decode(uint8_t value);
+float abs_bremse_52_appl_id_08_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2373,7 +2357,7 @@ bool abs_bremse_52_appl_id_08_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_date_01_encode(double value);
+uint8_t abs_bremse_52_appl_date_01_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2382,7 +2366,7 @@ uint8_t abs_bremse_52_appl_date_01_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_date_01_decode(uint8_t value);
+float abs_bremse_52_appl_date_01_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2400,7 +2384,7 @@ bool abs_bremse_52_appl_date_01_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_sw_can_ident_encode(double value);
+uint8_t abs_bremse_52_sw_can_ident_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2409,7 +2393,7 @@ uint8_t abs_bremse_52_sw_can_ident_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_sw_can_ident_decode(uint8_t value);
+float abs_bremse_52_sw_can_ident_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2427,7 +2411,7 @@ bool abs_bremse_52_sw_can_ident_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_hu_date_year_encode(double value);
+uint8_t abs_bremse_52_hu_date_year_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2436,7 +2420,7 @@ uint8_t abs_bremse_52_hu_date_year_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_hu_date_year_decode(uint8_t value);
+float abs_bremse_52_hu_date_year_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2454,7 +2438,7 @@ bool abs_bremse_52_hu_date_year_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_sw_version_high_lower_encode(double value);
+uint8_t abs_bremse_52_sw_version_high_lower_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2463,7 +2447,7 @@ uint8_t abs_bremse_52_sw_version_high_lower_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_sw_version_high_lower_decode(uint8_t value);
+float abs_bremse_52_sw_version_high_lower_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2481,7 +2465,7 @@ bool abs_bremse_52_sw_version_high_lower_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_bb_dig2_encode(double value);
+uint8_t abs_bremse_52_bb_dig2_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2490,7 +2474,7 @@ uint8_t abs_bremse_52_bb_dig2_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_bb_dig2_decode(uint8_t value);
+float abs_bremse_52_bb_dig2_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2508,7 +2492,7 @@ bool abs_bremse_52_bb_dig2_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_02_encode(double value);
+uint8_t abs_bremse_52_appl_id_02_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2517,7 +2501,7 @@ uint8_t abs_bremse_52_appl_id_02_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_02_decode(uint8_t value);
+float abs_bremse_52_appl_id_02_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2535,7 +2519,7 @@ bool abs_bremse_52_appl_id_02_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_09_encode(double value);
+uint8_t abs_bremse_52_appl_id_09_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2544,7 +2528,7 @@ uint8_t abs_bremse_52_appl_id_09_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_09_decode(uint8_t value);
+float abs_bremse_52_appl_id_09_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2562,7 +2546,7 @@ bool abs_bremse_52_appl_id_09_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_date_02_encode(double value);
+uint8_t abs_bremse_52_appl_date_02_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2571,7 +2555,7 @@ uint8_t abs_bremse_52_appl_date_02_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_date_02_decode(uint8_t value);
+float abs_bremse_52_appl_date_02_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2589,7 +2573,7 @@ bool abs_bremse_52_appl_date_02_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_hu_date_month_encode(double value);
+uint8_t abs_bremse_52_hu_date_month_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2598,7 +2582,7 @@ uint8_t abs_bremse_52_hu_date_month_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_hu_date_month_decode(uint8_t value);
+float abs_bremse_52_hu_date_month_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2616,7 +2600,7 @@ bool abs_bremse_52_hu_date_month_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_sw_version_mid_upper_encode(double value);
+uint8_t abs_bremse_52_sw_version_mid_upper_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2625,7 +2609,7 @@ uint8_t abs_bremse_52_sw_version_mid_upper_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_sw_version_mid_upper_decode(uint8_t value);
+float abs_bremse_52_sw_version_mid_upper_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2643,7 +2627,7 @@ bool abs_bremse_52_sw_version_mid_upper_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_bb_dig3_encode(double value);
+uint8_t abs_bremse_52_bb_dig3_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2652,7 +2636,7 @@ uint8_t abs_bremse_52_bb_dig3_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_bb_dig3_decode(uint8_t value);
+float abs_bremse_52_bb_dig3_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2670,7 +2654,7 @@ bool abs_bremse_52_bb_dig3_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_03_encode(double value);
+uint8_t abs_bremse_52_appl_id_03_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2679,7 +2663,7 @@ uint8_t abs_bremse_52_appl_id_03_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_03_decode(uint8_t value);
+float abs_bremse_52_appl_id_03_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2697,7 +2681,7 @@ bool abs_bremse_52_appl_id_03_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_10_encode(double value);
+uint8_t abs_bremse_52_appl_id_10_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2706,7 +2690,7 @@ uint8_t abs_bremse_52_appl_id_10_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_10_decode(uint8_t value);
+float abs_bremse_52_appl_id_10_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2724,7 +2708,7 @@ bool abs_bremse_52_appl_id_10_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_date_03_encode(double value);
+uint8_t abs_bremse_52_appl_date_03_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2733,7 +2717,7 @@ uint8_t abs_bremse_52_appl_date_03_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_date_03_decode(uint8_t value);
+float abs_bremse_52_appl_date_03_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2751,7 +2735,7 @@ bool abs_bremse_52_appl_date_03_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_hu_date_day_encode(double value);
+uint8_t abs_bremse_52_hu_date_day_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2760,7 +2744,7 @@ uint8_t abs_bremse_52_hu_date_day_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_hu_date_day_decode(uint8_t value);
+float abs_bremse_52_hu_date_day_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2778,7 +2762,7 @@ bool abs_bremse_52_hu_date_day_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_sw_version_mid_lower_encode(double value);
+uint8_t abs_bremse_52_sw_version_mid_lower_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2787,7 +2771,7 @@ uint8_t abs_bremse_52_sw_version_mid_lower_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_sw_version_mid_lower_decode(uint8_t value);
+float abs_bremse_52_sw_version_mid_lower_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2805,7 +2789,7 @@ bool abs_bremse_52_sw_version_mid_lower_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_bb_dig4_encode(double value);
+uint8_t abs_bremse_52_bb_dig4_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2814,7 +2798,7 @@ uint8_t abs_bremse_52_bb_dig4_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_bb_dig4_decode(uint8_t value);
+float abs_bremse_52_bb_dig4_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2832,7 +2816,7 @@ bool abs_bremse_52_bb_dig4_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_04_encode(double value);
+uint8_t abs_bremse_52_appl_id_04_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2841,7 +2825,7 @@ uint8_t abs_bremse_52_appl_id_04_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_04_decode(uint8_t value);
+float abs_bremse_52_appl_id_04_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2859,7 +2843,7 @@ bool abs_bremse_52_appl_id_04_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_11_encode(double value);
+uint8_t abs_bremse_52_appl_id_11_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2868,7 +2852,7 @@ uint8_t abs_bremse_52_appl_id_11_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_11_decode(uint8_t value);
+float abs_bremse_52_appl_id_11_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2886,7 +2870,7 @@ bool abs_bremse_52_appl_id_11_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_date_04_encode(double value);
+uint8_t abs_bremse_52_appl_date_04_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2895,7 +2879,7 @@ uint8_t abs_bremse_52_appl_date_04_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_date_04_decode(uint8_t value);
+float abs_bremse_52_appl_date_04_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2913,7 +2897,7 @@ bool abs_bremse_52_appl_date_04_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint32_t abs_bremse_52_ecu_serial_encode(double value);
+uint32_t abs_bremse_52_ecu_serial_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2922,7 +2906,7 @@ uint32_t abs_bremse_52_ecu_serial_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_ecu_serial_decode(uint32_t value);
+float abs_bremse_52_ecu_serial_decode(uint32_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2940,7 +2924,7 @@ bool abs_bremse_52_ecu_serial_is_in_range(uint32_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_sw_version_low_upper_encode(double value);
+uint8_t abs_bremse_52_sw_version_low_upper_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2949,7 +2933,7 @@ uint8_t abs_bremse_52_sw_version_low_upper_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_sw_version_low_upper_decode(uint8_t value);
+float abs_bremse_52_sw_version_low_upper_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2967,7 +2951,7 @@ bool abs_bremse_52_sw_version_low_upper_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_bb_dig5_encode(double value);
+uint8_t abs_bremse_52_bb_dig5_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -2976,7 +2960,7 @@ uint8_t abs_bremse_52_bb_dig5_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_bb_dig5_decode(uint8_t value);
+float abs_bremse_52_bb_dig5_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -2994,7 +2978,7 @@ bool abs_bremse_52_bb_dig5_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_05_encode(double value);
+uint8_t abs_bremse_52_appl_id_05_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3003,7 +2987,7 @@ uint8_t abs_bremse_52_appl_id_05_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_05_decode(uint8_t value);
+float abs_bremse_52_appl_id_05_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3021,7 +3005,7 @@ bool abs_bremse_52_appl_id_05_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_12_encode(double value);
+uint8_t abs_bremse_52_appl_id_12_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3030,7 +3014,7 @@ uint8_t abs_bremse_52_appl_id_12_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_12_decode(uint8_t value);
+float abs_bremse_52_appl_id_12_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3048,7 +3032,7 @@ bool abs_bremse_52_appl_id_12_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_date_05_encode(double value);
+uint8_t abs_bremse_52_appl_date_05_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3057,7 +3041,7 @@ uint8_t abs_bremse_52_appl_date_05_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_date_05_decode(uint8_t value);
+float abs_bremse_52_appl_date_05_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3075,7 +3059,7 @@ bool abs_bremse_52_appl_date_05_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_sw_version_low_lower_encode(double value);
+uint8_t abs_bremse_52_sw_version_low_lower_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3084,7 +3068,7 @@ uint8_t abs_bremse_52_sw_version_low_lower_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_sw_version_low_lower_decode(uint8_t value);
+float abs_bremse_52_sw_version_low_lower_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3102,7 +3086,7 @@ bool abs_bremse_52_sw_version_low_lower_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_bb_dig6_encode(double value);
+uint8_t abs_bremse_52_bb_dig6_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3111,7 +3095,7 @@ uint8_t abs_bremse_52_bb_dig6_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_bb_dig6_decode(uint8_t value);
+float abs_bremse_52_bb_dig6_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3129,7 +3113,7 @@ bool abs_bremse_52_bb_dig6_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_06_encode(double value);
+uint8_t abs_bremse_52_appl_id_06_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3138,7 +3122,7 @@ uint8_t abs_bremse_52_appl_id_06_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_06_decode(uint8_t value);
+float abs_bremse_52_appl_id_06_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3156,7 +3140,7 @@ bool abs_bremse_52_appl_id_06_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_13_encode(double value);
+uint8_t abs_bremse_52_appl_id_13_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3165,7 +3149,7 @@ uint8_t abs_bremse_52_appl_id_13_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_13_decode(uint8_t value);
+float abs_bremse_52_appl_id_13_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3183,7 +3167,7 @@ bool abs_bremse_52_appl_id_13_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_date_06_encode(double value);
+uint8_t abs_bremse_52_appl_date_06_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3192,7 +3176,7 @@ uint8_t abs_bremse_52_appl_date_06_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_date_06_decode(uint8_t value);
+float abs_bremse_52_appl_date_06_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3210,7 +3194,7 @@ bool abs_bremse_52_appl_date_06_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_bb_dig7_encode(double value);
+uint8_t abs_bremse_52_bb_dig7_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3219,7 +3203,7 @@ uint8_t abs_bremse_52_bb_dig7_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_bb_dig7_decode(uint8_t value);
+float abs_bremse_52_bb_dig7_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3237,7 +3221,7 @@ bool abs_bremse_52_bb_dig7_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_07_encode(double value);
+uint8_t abs_bremse_52_appl_id_07_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3246,7 +3230,7 @@ uint8_t abs_bremse_52_appl_id_07_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_07_decode(uint8_t value);
+float abs_bremse_52_appl_id_07_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3264,7 +3248,7 @@ bool abs_bremse_52_appl_id_07_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_52_appl_id_14_encode(double value);
+uint8_t abs_bremse_52_appl_id_14_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3273,7 +3257,7 @@ uint8_t abs_bremse_52_appl_id_14_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_52_appl_id_14_decode(uint8_t value);
+float abs_bremse_52_appl_id_14_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3297,7 +3281,6 @@ int abs_bremse_50_pack(
     uint8_t *dst_p,
     const struct abs_bremse_50_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_50.
  *
@@ -3319,7 +3302,7 @@ int abs_bremse_50_unpack(
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_50_brake_bal_at50_encode(double value);
+uint16_t abs_bremse_50_brake_bal_at50_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3328,7 +3311,7 @@ uint16_t abs_bremse_50_brake_bal_at50_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_50_brake_bal_at50_decode(uint16_t value);
+float abs_bremse_50_brake_bal_at50_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3346,7 +3329,7 @@ bool abs_bremse_50_brake_bal_at50_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_50_brake_bal_at50_advice_encode(double value);
+uint8_t abs_bremse_50_brake_bal_at50_advice_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3355,7 +3338,7 @@ uint8_t abs_bremse_50_brake_bal_at50_advice_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_50_brake_bal_at50_advice_decode(uint8_t value);
+float abs_bremse_50_brake_bal_at50_advice_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3373,7 +3356,7 @@ bool abs_bremse_50_brake_bal_at50_advice_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint16_t abs_bremse_50_brake_bal_pct_encode(double value);
+uint16_t abs_bremse_50_brake_bal_pct_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3382,7 +3365,7 @@ uint16_t abs_bremse_50_brake_bal_pct_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_50_brake_bal_pct_decode(uint16_t value);
+float abs_bremse_50_brake_bal_pct_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3400,7 +3383,7 @@ bool abs_bremse_50_brake_bal_pct_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_50_brake_bal_pct_advice_encode(double value);
+uint8_t abs_bremse_50_brake_bal_pct_advice_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3409,7 +3392,7 @@ uint8_t abs_bremse_50_brake_bal_pct_advice_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_50_brake_bal_pct_advice_decode(uint8_t value);
+float abs_bremse_50_brake_bal_pct_advice_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3433,7 +3416,6 @@ int abs_bremse_53_pack(
     uint8_t *dst_p,
     const struct abs_bremse_53_t *src_p,
     size_t size);
-
 /**
  * Unpack message BREMSE_53.
  *
@@ -3455,7 +3437,7 @@ int abs_bremse_53_unpack(
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_switch_position_encode(double value);
+uint8_t abs_bremse_53_switch_position_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3464,7 +3446,7 @@ uint8_t abs_bremse_53_switch_position_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_switch_position_decode(uint8_t value);
+float abs_bremse_53_switch_position_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3482,7 +3464,7 @@ bool abs_bremse_53_switch_position_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-int16_t abs_bremse_53_p_fa_encode(double value);
+int16_t abs_bremse_53_p_fa_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3491,7 +3473,7 @@ int16_t abs_bremse_53_p_fa_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_p_fa_decode(int16_t value);
+float abs_bremse_53_p_fa_decode(int16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3509,7 +3491,7 @@ bool abs_bremse_53_p_fa_is_in_range(int16_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_bls_encode(double value);
+uint8_t abs_bremse_53_bls_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3518,7 +3500,7 @@ uint8_t abs_bremse_53_bls_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_bls_decode(uint8_t value);
+float abs_bremse_53_bls_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3536,7 +3518,7 @@ bool abs_bremse_53_bls_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_bremse_53_cnt_encode(double value);
+uint8_t abs_bremse_53_bremse_53_cnt_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3545,7 +3527,7 @@ uint8_t abs_bremse_53_bremse_53_cnt_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_bremse_53_cnt_decode(uint8_t value);
+float abs_bremse_53_bremse_53_cnt_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3563,7 +3545,7 @@ bool abs_bremse_53_bremse_53_cnt_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_abs_malfunction_encode(double value);
+uint8_t abs_bremse_53_abs_malfunction_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3572,7 +3554,7 @@ uint8_t abs_bremse_53_abs_malfunction_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_abs_malfunction_decode(uint8_t value);
+float abs_bremse_53_abs_malfunction_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3590,7 +3572,7 @@ bool abs_bremse_53_abs_malfunction_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_abs_active_encode(double value);
+uint8_t abs_bremse_53_abs_active_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3599,7 +3581,7 @@ uint8_t abs_bremse_53_abs_active_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_abs_active_decode(uint8_t value);
+float abs_bremse_53_abs_active_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3617,7 +3599,7 @@ bool abs_bremse_53_abs_active_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_ebd_lamp_encode(double value);
+uint8_t abs_bremse_53_ebd_lamp_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3626,7 +3608,7 @@ uint8_t abs_bremse_53_ebd_lamp_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_ebd_lamp_decode(uint8_t value);
+float abs_bremse_53_ebd_lamp_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3644,7 +3626,7 @@ bool abs_bremse_53_ebd_lamp_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_abs_lamp_encode(double value);
+uint8_t abs_bremse_53_abs_lamp_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3653,7 +3635,7 @@ uint8_t abs_bremse_53_abs_lamp_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_abs_lamp_decode(uint8_t value);
+float abs_bremse_53_abs_lamp_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3671,7 +3653,7 @@ bool abs_bremse_53_abs_lamp_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_diag_fl_encode(double value);
+uint8_t abs_bremse_53_diag_fl_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3680,7 +3662,7 @@ uint8_t abs_bremse_53_diag_fl_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_diag_fl_decode(uint8_t value);
+float abs_bremse_53_diag_fl_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3698,7 +3680,7 @@ bool abs_bremse_53_diag_fl_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_diag_fr_encode(double value);
+uint8_t abs_bremse_53_diag_fr_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3707,7 +3689,7 @@ uint8_t abs_bremse_53_diag_fr_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_diag_fr_decode(uint8_t value);
+float abs_bremse_53_diag_fr_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3725,7 +3707,7 @@ bool abs_bremse_53_diag_fr_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_diag_rl_encode(double value);
+uint8_t abs_bremse_53_diag_rl_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3734,7 +3716,7 @@ uint8_t abs_bremse_53_diag_rl_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_diag_rl_decode(uint8_t value);
+float abs_bremse_53_diag_rl_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3752,7 +3734,7 @@ bool abs_bremse_53_diag_rl_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_diag_rr_encode(double value);
+uint8_t abs_bremse_53_diag_rr_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3761,7 +3743,7 @@ uint8_t abs_bremse_53_diag_rr_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_diag_rr_decode(uint8_t value);
+float abs_bremse_53_diag_rr_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3779,7 +3761,7 @@ bool abs_bremse_53_diag_rr_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_diag_abs_unit_encode(double value);
+uint8_t abs_bremse_53_diag_abs_unit_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3788,7 +3770,7 @@ uint8_t abs_bremse_53_diag_abs_unit_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_diag_abs_unit_decode(uint8_t value);
+float abs_bremse_53_diag_abs_unit_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3806,7 +3788,7 @@ bool abs_bremse_53_diag_abs_unit_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_diag_fuse_valve_encode(double value);
+uint8_t abs_bremse_53_diag_fuse_valve_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3815,7 +3797,7 @@ uint8_t abs_bremse_53_diag_fuse_valve_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_diag_fuse_valve_decode(uint8_t value);
+float abs_bremse_53_diag_fuse_valve_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3833,7 +3815,7 @@ bool abs_bremse_53_diag_fuse_valve_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_diag_fuse_pump_encode(double value);
+uint8_t abs_bremse_53_diag_fuse_pump_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3842,7 +3824,7 @@ uint8_t abs_bremse_53_diag_fuse_pump_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_diag_fuse_pump_decode(uint8_t value);
+float abs_bremse_53_diag_fuse_pump_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3860,7 +3842,7 @@ bool abs_bremse_53_diag_fuse_pump_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_diag_p_fa_encode(double value);
+uint8_t abs_bremse_53_diag_p_fa_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3869,7 +3851,7 @@ uint8_t abs_bremse_53_diag_p_fa_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_diag_p_fa_decode(uint8_t value);
+float abs_bremse_53_diag_p_fa_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3887,7 +3869,7 @@ bool abs_bremse_53_diag_p_fa_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_diag_p_ra_encode(double value);
+uint8_t abs_bremse_53_diag_p_ra_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3896,7 +3878,7 @@ uint8_t abs_bremse_53_diag_p_ra_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_diag_p_ra_decode(uint8_t value);
+float abs_bremse_53_diag_p_ra_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3914,7 +3896,7 @@ bool abs_bremse_53_diag_p_ra_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_diag_yrs_encode(double value);
+uint8_t abs_bremse_53_diag_yrs_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3923,7 +3905,7 @@ uint8_t abs_bremse_53_diag_yrs_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_diag_yrs_decode(uint8_t value);
+float abs_bremse_53_diag_yrs_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3941,7 +3923,7 @@ bool abs_bremse_53_diag_yrs_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t abs_bremse_53_abs_fault_info_encode(double value);
+uint8_t abs_bremse_53_abs_fault_info_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3950,7 +3932,7 @@ uint8_t abs_bremse_53_abs_fault_info_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_abs_fault_info_decode(uint8_t value);
+float abs_bremse_53_abs_fault_info_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3968,7 +3950,7 @@ bool abs_bremse_53_abs_fault_info_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-int16_t abs_bremse_53_p_ra_encode(double value);
+int16_t abs_bremse_53_p_ra_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -3977,7 +3959,7 @@ int16_t abs_bremse_53_p_ra_encode(double value);
  *
  * @return Decoded signal.
  */
-double abs_bremse_53_p_ra_decode(int16_t value);
+float abs_bremse_53_p_ra_decode(int16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -3988,6 +3970,76 @@ double abs_bremse_53_p_ra_decode(int16_t value);
  */
 bool abs_bremse_53_p_ra_is_in_range(int16_t value);
 
+/**
+ * Frame id, length, extended flag and cycle time of a message. The
+ * cycle time is zero(0) if not given in the database.
+ */
+struct abs_message_descriptor_t {
+    uint32_t frame_id;
+    uint8_t length;
+    bool is_extended;
+    uint32_t cycle_time_ms;
+};
+
+/**
+ * Storage for any message in the database.
+ */
+union abs_message_t {
+    struct abs_bremse_33_t bremse_33;
+    struct abs_bremse_10_t bremse_10;
+    struct abs_bremse_11_t bremse_11;
+    struct abs_bremse_12_t bremse_12;
+    struct abs_bremse_13_t bremse_13;
+    struct abs_drs_rx_id0_t drs_rx_id0;
+    struct abs_mm5_10_tx1_t mm5_10_tx1;
+    struct abs_mm5_10_tx2_t mm5_10_tx2;
+    struct abs_mm5_10_tx3_t mm5_10_tx3;
+    struct abs_bremse_2_t bremse_2;
+    struct abs_abs_switch_t abs_switch;
+    struct abs_bremse_30_t bremse_30;
+    struct abs_bremse_31_t bremse_31;
+    struct abs_bremse_32_t bremse_32;
+    struct abs_bremse_51_t bremse_51;
+    struct abs_bremse_52_t bremse_52;
+    struct abs_bremse_50_t bremse_50;
+    struct abs_bremse_53_t bremse_53;
+};
+
+/* Number of messages in the database. */
+#define ABS_MESSAGES_LENGTH (18u)
+
+/**
+ * Message descriptors sorted by frame id.
+ */
+extern const struct abs_message_descriptor_t
+abs_message_descriptors[ABS_MESSAGES_LENGTH];
+
+/**
+ * Find the descriptor of the message with given frame id using a
+ * binary search in the descriptors table.
+ *
+ * @param[in] frame_id Frame id of the message.
+ *
+ * @return Message descriptor, or NULL if not found.
+ */
+const struct abs_message_descriptor_t *
+abs_message_descriptor_by_frame_id(uint32_t frame_id);
+
+/**
+ * Unpack the message with given frame id.
+ *
+ * @param[in] frame_id Frame id of the message.
+ * @param[out] dst_p Object to unpack the message into.
+ * @param[in] src_p Message to unpack.
+ * @param[in] size Size of src_p.
+ *
+ * @return zero(0) or negative error code.
+ */
+int abs_unpack_by_frame_id(
+    uint32_t frame_id,
+    union abs_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size);
 
 #ifdef __cplusplus
 }
@@ -32,6 +32,9 @@
 
 #include "camel_case_empty.h"
 
+#define encode_scale_offset(value, scale, offset) ((value - offset) * scale)
+#define decode_scale_offset(value, factor, offset) ((value * factor) + offset)
+
 int camel_case_empty_message1_pack(
     uint8_t *dst_p,
     const struct camel_case_empty_message1_t *src_p,
@@ -47,7 +50,6 @@ int camel_case_empty_message1_pack(
 
     return (5);
 }
-
 int camel_case_empty_message1_unpack(
     struct camel_case_empty_message1_t *dst_p,
     const uint8_t *src_p,
@@ -62,3 +64,57 @@ int camel_case_empty_message1_unpack(
 
     return (0);
 }
+
+const struct camel_case_empty_message_descriptor_t
+camel_case_empty_message_descriptors[CAMEL_CASE_EMPTY_MESSAGES_LENGTH] = {
+    { CAMEL_CASE_EMPTY_MESSAGE1_FRAME_ID, 5u, false, 0u }
+};
+
+const struct camel_case_empty_message_descriptor_t *
+camel_case_empty_message_descriptor_by_frame_id(uint32_t frame_id)
+{
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    low = 0;
+    high = CAMEL_CASE_EMPTY_MESSAGES_LENGTH;
+
+    while (low < high) {
+        middle = (low + ((high - low) / 2u));
+
+        if (camel_case_empty_message_descriptors[middle].frame_id < frame_id) {
+            low = (middle + 1u);
+        } else {
+            high = middle;
+        }
+    }
+
+    if ((low < CAMEL_CASE_EMPTY_MESSAGES_LENGTH)
+        && (camel_case_empty_message_descriptors[low].frame_id == frame_id)) {
+        return (&camel_case_empty_message_descriptors[low]);
+    }
+
+    return (NULL);
+}
+
+int camel_case_empty_unpack_by_frame_id(
+    uint32_t frame_id,
+    union camel_case_empty_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    switch (frame_id) {
+
+    case CAMEL_CASE_EMPTY_MESSAGE1_FRAME_ID:
+        return (camel_case_empty_message1_unpack(
+                    &dst_p->message1,
+                    src_p,
+                    size));
+
+    default:
+        break;
+    }
+
+    return (-EINVAL);
+}
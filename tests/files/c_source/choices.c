@@ -32,6 +32,9 @@
 
 #include "choices.h"
 
+#define encode_scale_offset(value, scale, offset) ((value - offset) * scale)
+#define decode_scale_offset(value, factor, offset) ((value * factor) + offset)
+
 static inline uint8_t pack_left_shift_u8(
     uint8_t value,
     uint8_t shift,
@@ -66,7 +69,6 @@ int choices_foo_pack(
 
     return (8);
 }
-
 int choices_foo_unpack(
     struct choices_foo_t *dst_p,
     const uint8_t *src_p,
@@ -84,14 +86,14 @@ int choices_foo_unpack(
     return (0);
 }
 
-int8_t choices_foo_foo_encode(double value)
+int8_t choices_foo_foo_encode(float value)
 {
     return (int8_t)(value);
 }
 
-double choices_foo_foo_decode(int8_t value)
+float choices_foo_foo_decode(int8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool choices_foo_foo_is_in_range(int8_t value)
@@ -100,3 +102,57 @@ bool choices_foo_foo_is_in_range(int8_t value)
 
     return (true);
 }
+
+const struct choices_message_descriptor_t
+choices_message_descriptors[CHOICES_MESSAGES_LENGTH] = {
+    { CHOICES_FOO_FRAME_ID, 8u, false, 0u }
+};
+
+const struct choices_message_descriptor_t *
+choices_message_descriptor_by_frame_id(uint32_t frame_id)
+{
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    low = 0;
+    high = CHOICES_MESSAGES_LENGTH;
+
+    while (low < high) {
+        middle = (low + ((high - low) / 2u));
+
+        if (choices_message_descriptors[middle].frame_id < frame_id) {
+            low = (middle + 1u);
+        } else {
+            high = middle;
+        }
+    }
+
+    if ((low < CHOICES_MESSAGES_LENGTH)
+        && (choices_message_descriptors[low].frame_id == frame_id)) {
+        return (&choices_message_descriptors[low]);
+    }
+
+    return (NULL);
+}
+
+int choices_unpack_by_frame_id(
+    uint32_t frame_id,
+    union choices_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    switch (frame_id) {
+
+    case CHOICES_FOO_FRAME_ID:
+        return (choices_foo_unpack(
+                    &dst_p->foo,
+                    src_p,
+                    size));
+
+    default:
+        break;
+    }
+
+    return (-EINVAL);
+}
@@ -72,7 +72,7 @@ extern "C" {
  */
 struct choices_foo_t {
     /**
-     * Range: -128..127 (-128..127 -)
+     * Range: -128..127 (-128..127 )
      * Scale: 1
      * Offset: 0
      */
@@ -92,7 +92,6 @@ int choices_foo_pack(
     uint8_t *dst_p,
     const struct choices_foo_t *src_p,
     size_t size);
-
 /**
  * Unpack message Foo.
  *
@@ -114,7 +113,7 @@ int choices_foo_unpack(
  *
  * @return Encoded signal.
  */
-int8_t choices_foo_foo_encode(double value);
+int8_t choices_foo_foo_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -123,7 +122,7 @@ int8_t choices_foo_foo_encode(double value);
  *
  * @return Decoded signal.
  */
-double choices_foo_foo_decode(int8_t value);
+float choices_foo_foo_decode(int8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -134,6 +133,59 @@ double choices_foo_foo_decode(int8_t value);
  */
 bool choices_foo_foo_is_in_range(int8_t value);
 
+/**
+ * Frame id, length, extended flag and cycle time of a message. The
+ * cycle time is zero(0) if not given in the database.
+ */
+struct choices_message_descriptor_t {
+    uint32_t frame_id;
+    uint8_t length;
+    bool is_extended;
+    uint32_t cycle_time_ms;
+};
+
+/**
+ * Storage for any message in the database.
+ */
+union choices_message_t {
+    struct choices_foo_t foo;
+};
+
+/* Number of messages in the database. */
+#define CHOICES_MESSAGES_LENGTH (1u)
+
+/**
+ * Message descriptors sorted by frame id.
+ */
+extern const struct choices_message_descriptor_t
+choices_message_descriptors[CHOICES_MESSAGES_LENGTH];
+
+/**
+ * Find the descriptor of the message with given frame id using a
+ * binary search in the descriptors table.
+ *
+ * @param[in] frame_id Frame id of the message.
+ *
+ * @return Message descriptor, or NULL if not found.
+ */
+const struct choices_message_descriptor_t *
+choices_message_descriptor_by_frame_id(uint32_t frame_id);
+
+/**
+ * Unpack the message with given frame id.
+ *
+ * @param[in] frame_id Frame id of the message.
+ * @param[out] dst_p Object to unpack the message into.
+ * @param[in] src_p Message to unpack.
+ * @param[in] size Size of src_p.
+ *
+ * @return zero(0) or negative error code.
+ */
+int choices_unpack_by_frame_id(
+    uint32_t frame_id,
+    union choices_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size);
 
 #ifdef __cplusplus
 }
@@ -32,6 +32,9 @@
 
 #include "letter_terminated_can_id_6_0.h"
 
+#define encode_scale_offset(value, scale, offset) ((value - offset) * scale)
+#define decode_scale_offset(value, factor, offset) ((value * factor) + offset)
+
 int letter_terminated_can_id_6_0_symbol1_pack(
     uint8_t *dst_p,
     const struct letter_terminated_can_id_6_0_symbol1_t *src_p,
@@ -47,7 +50,6 @@ int letter_terminated_can_id_6_0_symbol1_pack(
 
     return (8);
 }
-
 int letter_terminated_can_id_6_0_symbol1_unpack(
     struct letter_terminated_can_id_6_0_symbol1_t *dst_p,
     const uint8_t *src_p,
@@ -62,3 +64,57 @@ int letter_terminated_can_id_6_0_symbol1_unpack(
 
     return (0);
 }
+
+const struct letter_terminated_can_id_6_0_message_descriptor_t
+letter_terminated_can_id_6_0_message_descriptors[LETTER_TERMINATED_CAN_ID_6_0_MESSAGES_LENGTH] = {
+    { LETTER_TERMINATED_CAN_ID_6_0_SYMBOL1_FRAME_ID, 8u, false, 0u }
+};
+
+const struct letter_terminated_can_id_6_0_message_descriptor_t *
+letter_terminated_can_id_6_0_message_descriptor_by_frame_id(uint32_t frame_id)
+{
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    low = 0;
+    high = LETTER_TERMINATED_CAN_ID_6_0_MESSAGES_LENGTH;
+
+    while (low < high) {
+        middle = (low + ((high - low) / 2u));
+
+        if (letter_terminated_can_id_6_0_message_descriptors[middle].frame_id < frame_id) {
+            low = (middle + 1u);
+        } else {
+            high = middle;
+        }
+    }
+
+    if ((low < LETTER_TERMINATED_CAN_ID_6_0_MESSAGES_LENGTH)
+        && (letter_terminated_can_id_6_0_message_descriptors[low].frame_id == frame_id)) {
+        return (&letter_terminated_can_id_6_0_message_descriptors[low]);
+    }
+
+    return (NULL);
+}
+
+int letter_terminated_can_id_6_0_unpack_by_frame_id(
+    uint32_t frame_id,
+    union letter_terminated_can_id_6_0_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    switch (frame_id) {
+
+    case LETTER_TERMINATED_CAN_ID_6_0_SYMBOL1_FRAME_ID:
+        return (letter_terminated_can_id_6_0_symbol1_unpack(
+                    &dst_p->symbol1,
+                    src_p,
+                    size));
+
+    default:
+        break;
+    }
+
+    return (-EINVAL);
+}
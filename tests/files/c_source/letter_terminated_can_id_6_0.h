@@ -83,7 +83,6 @@ int letter_terminated_can_id_6_0_symbol1_pack(
     uint8_t *dst_p,
     const struct letter_terminated_can_id_6_0_symbol1_t *src_p,
     size_t size);
-
 /**
  * Unpack message Symbol1.
  *
@@ -98,6 +97,59 @@ int letter_terminated_can_id_6_0_symbol1_unpack(
     const uint8_t *src_p,
     size_t size);
 
+/**
+ * Frame id, length, extended flag and cycle time of a message. The
+ * cycle time is zero(0) if not given in the database.
+ */
+struct letter_terminated_can_id_6_0_message_descriptor_t {
+    uint32_t frame_id;
+    uint8_t length;
+    bool is_extended;
+    uint32_t cycle_time_ms;
+};
+
+/**
+ * Storage for any message in the database.
+ */
+union letter_terminated_can_id_6_0_message_t {
+    struct letter_terminated_can_id_6_0_symbol1_t symbol1;
+};
+
+/* Number of messages in the database. */
+#define LETTER_TERMINATED_CAN_ID_6_0_MESSAGES_LENGTH (1u)
+
+/**
+ * Message descriptors sorted by frame id.
+ */
+extern const struct letter_terminated_can_id_6_0_message_descriptor_t
+letter_terminated_can_id_6_0_message_descriptors[LETTER_TERMINATED_CAN_ID_6_0_MESSAGES_LENGTH];
+
+/**
+ * Find the descriptor of the message with given frame id using a
+ * binary search in the descriptors table.
+ *
+ * @param[in] frame_id Frame id of the message.
+ *
+ * @return Message descriptor, or NULL if not found.
+ */
+const struct letter_terminated_can_id_6_0_message_descriptor_t *
+letter_terminated_can_id_6_0_message_descriptor_by_frame_id(uint32_t frame_id);
+
+/**
+ * Unpack the message with given frame id.
+ *
+ * @param[in] frame_id Frame id of the message.
+ * @param[out] dst_p Object to unpack the message into.
+ * @param[in] src_p Message to unpack.
+ * @param[in] size Size of src_p.
+ *
+ * @return zero(0) or negative error code.
+ */
+int letter_terminated_can_id_6_0_unpack_by_frame_id(
+    uint32_t frame_id,
+    union letter_terminated_can_id_6_0_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size);
 
 #ifdef __cplusplus
 }
@@ -32,6 +32,9 @@
 
 #include "min_max_only_6_0.h"
 
+#define encode_scale_offset(value, scale, offset) ((value - offset) * scale)
+#define decode_scale_offset(value, factor, offset) ((value * factor) + offset)
+
 static inline uint8_t pack_left_shift_u8(
     uint8_t value,
     uint8_t shift,
@@ -121,7 +124,6 @@ int min_max_only_6_0_symbol1_pack(
 
     return (8);
 }
-
 int min_max_only_6_0_symbol1_unpack(
     struct min_max_only_6_0_symbol1_t *dst_p,
     const uint8_t *src_p,
@@ -142,7 +144,6 @@ int min_max_only_6_0_symbol1_unpack(
     if ((signal4 & (1u << 5)) != 0u) {
         signal4 |= 0xc0u;
     }
-
     dst_p->signal4 = (int8_t)signal4;
     signal3 = unpack_left_shift_u16(src_p[3], 1u, 0xffu);
     signal3 |= unpack_right_shift_u16(src_p[4], 7u, 0x80u);
@@ -150,20 +151,19 @@ int min_max_only_6_0_symbol1_unpack(
     if ((signal3 & (1u << 8)) != 0u) {
         signal3 |= 0xfe00u;
     }
-
     dst_p->signal3 = (int16_t)signal3;
 
     return (0);
 }
 
-uint8_t min_max_only_6_0_symbol1_signal1_encode(double value)
+uint8_t min_max_only_6_0_symbol1_signal1_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double min_max_only_6_0_symbol1_signal1_decode(uint8_t value)
+float min_max_only_6_0_symbol1_signal1_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool min_max_only_6_0_symbol1_signal1_is_in_range(uint8_t value)
@@ -171,14 +171,14 @@ bool min_max_only_6_0_symbol1_signal1_is_in_range(uint8_t value)
     return (value <= 254u);
 }
 
-uint8_t min_max_only_6_0_symbol1_signal2_encode(double value)
+uint8_t min_max_only_6_0_symbol1_signal2_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double min_max_only_6_0_symbol1_signal2_decode(uint8_t value)
+float min_max_only_6_0_symbol1_signal2_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool min_max_only_6_0_symbol1_signal2_is_in_range(uint8_t value)
@@ -186,14 +186,14 @@ bool min_max_only_6_0_symbol1_signal2_is_in_range(uint8_t value)
     return ((value >= 5u) && (value <= 127u));
 }
 
-int8_t min_max_only_6_0_symbol1_signal4_encode(double value)
+int8_t min_max_only_6_0_symbol1_signal4_encode(float value)
 {
     return (int8_t)(value);
 }
 
-double min_max_only_6_0_symbol1_signal4_decode(int8_t value)
+float min_max_only_6_0_symbol1_signal4_decode(int8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool min_max_only_6_0_symbol1_signal4_is_in_range(int8_t value)
@@ -201,17 +201,71 @@ bool min_max_only_6_0_symbol1_signal4_is_in_range(int8_t value)
     return ((value >= -32) && (value <= 5));
 }
 
-int16_t min_max_only_6_0_symbol1_signal3_encode(double value)
+int16_t min_max_only_6_0_symbol1_signal3_encode(float value)
 {
     return (int16_t)(value);
 }
 
-double min_max_only_6_0_symbol1_signal3_decode(int16_t value)
+float min_max_only_6_0_symbol1_signal3_decode(int16_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool min_max_only_6_0_symbol1_signal3_is_in_range(int16_t value)
 {
     return ((value >= -2) && (value <= 255));
 }
+
+const struct min_max_only_6_0_message_descriptor_t
+min_max_only_6_0_message_descriptors[MIN_MAX_ONLY_6_0_MESSAGES_LENGTH] = {
+    { MIN_MAX_ONLY_6_0_SYMBOL1_FRAME_ID, 8u, false, 0u }
+};
+
+const struct min_max_only_6_0_message_descriptor_t *
+min_max_only_6_0_message_descriptor_by_frame_id(uint32_t frame_id)
+{
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    low = 0;
+    high = MIN_MAX_ONLY_6_0_MESSAGES_LENGTH;
+
+    while (low < high) {
+        middle = (low + ((high - low) / 2u));
+
+        if (min_max_only_6_0_message_descriptors[middle].frame_id < frame_id) {
+            low = (middle + 1u);
+        } else {
+            high = middle;
+        }
+    }
+
+    if ((low < MIN_MAX_ONLY_6_0_MESSAGES_LENGTH)
+        && (min_max_only_6_0_message_descriptors[low].frame_id == frame_id)) {
+        return (&min_max_only_6_0_message_descriptors[low]);
+    }
+
+    return (NULL);
+}
+
+int min_max_only_6_0_unpack_by_frame_id(
+    uint32_t frame_id,
+    union min_max_only_6_0_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    switch (frame_id) {
+
+    case MIN_MAX_ONLY_6_0_SYMBOL1_FRAME_ID:
+        return (min_max_only_6_0_symbol1_unpack(
+                    &dst_p->symbol1,
+                    src_p,
+                    size));
+
+    default:
+        break;
+    }
+
+    return (-EINVAL);
+}
@@ -65,28 +65,28 @@ extern "C" {
  */
 struct min_max_only_6_0_symbol1_t {
     /**
-     * Range: ..254 (..254 -)
+     * Range: ..254 (..254 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t signal1;
 
     /**
-     * Range: 5.. (5.. -)
+     * Range: 5.. (5.. )
      * Scale: 1
      * Offset: 0
      */
     uint8_t signal2;
 
     /**
-     * Range: ..5 (..5 -)
+     * Range: ..5 (..5 )
      * Scale: 1
      * Offset: 0
      */
     int8_t signal4;
 
     /**
-     * Range: -2.. (-2.. -)
+     * Range: -2.. (-2.. )
      * Scale: 1
      * Offset: 0
      */
@@ -106,7 +106,6 @@ int min_max_only_6_0_symbol1_pack(
     uint8_t *dst_p,
     const struct min_max_only_6_0_symbol1_t *src_p,
     size_t size);
-
 /**
  * Unpack message Symbol1.
  *
@@ -128,7 +127,7 @@ int min_max_only_6_0_symbol1_unpack(
  *
  * @return Encoded signal.
  */
-uint8_t min_max_only_6_0_symbol1_signal1_encode(double value);
+uint8_t min_max_only_6_0_symbol1_signal1_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -137,7 +136,7 @@ uint8_t min_max_only_6_0_symbol1_signal1_encode(double value);
  *
  * @return Decoded signal.
  */
-double min_max_only_6_0_symbol1_signal1_decode(uint8_t value);
+float min_max_only_6_0_symbol1_signal1_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -155,7 +154,7 @@ bool min_max_only_6_0_symbol1_signal1_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t min_max_only_6_0_symbol1_signal2_encode(double value);
+uint8_t min_max_only_6_0_symbol1_signal2_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -164,7 +163,7 @@ uint8_t min_max_only_6_0_symbol1_signal2_encode(double value);
  *
  * @return Decoded signal.
  */
-double min_max_only_6_0_symbol1_signal2_decode(uint8_t value);
+float min_max_only_6_0_symbol1_signal2_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -182,7 +181,7 @@ bool min_max_only_6_0_symbol1_signal2_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-int8_t min_max_only_6_0_symbol1_signal4_encode(double value);
+int8_t min_max_only_6_0_symbol1_signal4_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -191,7 +190,7 @@ int8_t min_max_only_6_0_symbol1_signal4_encode(double value);
  *
  * @return Decoded signal.
  */
-double min_max_only_6_0_symbol1_signal4_decode(int8_t value);
+float min_max_only_6_0_symbol1_signal4_decode(int8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -209,7 +208,7 @@ bool min_max_only_6_0_symbol1_signal4_is_in_range(int8_t value);
  *
  * @return Encoded signal.
  */
-int16_t min_max_only_6_0_symbol1_signal3_encode(double value);
+int16_t min_max_only_6_0_symbol1_signal3_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -218,7 +217,7 @@ int16_t min_max_only_6_0_symbol1_signal3_encode(double value);
  *
  * @return Decoded signal.
  */
-double min_max_only_6_0_symbol1_signal3_decode(int16_t value);
+float min_max_only_6_0_symbol1_signal3_decode(int16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -229,6 +228,59 @@ double min_max_only_6_0_symbol1_signal3_decode(int16_t value);
  */
 bool min_max_only_6_0_symbol1_signal3_is_in_range(int16_t value);
 
+/**
+ * Frame id, length, extended flag and cycle time of a message. The
+ * cycle time is zero(0) if not given in the database.
+ */
+struct min_max_only_6_0_message_descriptor_t {
+    uint32_t frame_id;
+    uint8_t length;
+    bool is_extended;
+    uint32_t cycle_time_ms;
+};
+
+/**
+ * Storage for any message in the database.
+ */
+union min_max_only_6_0_message_t {
+    struct min_max_only_6_0_symbol1_t symbol1;
+};
+
+/* Number of messages in the database. */
+#define MIN_MAX_ONLY_6_0_MESSAGES_LENGTH (1u)
+
+/**
+ * Message descriptors sorted by frame id.
+ */
+extern const struct min_max_only_6_0_message_descriptor_t
+min_max_only_6_0_message_descriptors[MIN_MAX_ONLY_6_0_MESSAGES_LENGTH];
+
+/**
+ * Find the descriptor of the message with given frame id using a
+ * binary search in the descriptors table.
+ *
+ * @param[in] frame_id Frame id of the message.
+ *
+ * @return Message descriptor, or NULL if not found.
+ */
+const struct min_max_only_6_0_message_descriptor_t *
+min_max_only_6_0_message_descriptor_by_frame_id(uint32_t frame_id);
+
+/**
+ * Unpack the message with given frame id.
+ *
+ * @param[in] frame_id Frame id of the message.
+ * @param[out] dst_p Object to unpack the message into.
+ * @param[in] src_p Message to unpack.
+ * @param[in] size Size of src_p.
+ *
+ * @return zero(0) or negative error code.
+ */
+int min_max_only_6_0_unpack_by_frame_id(
+    uint32_t frame_id,
+    union min_max_only_6_0_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size);
 
 #ifdef __cplusplus
 }
@@ -32,6 +32,9 @@
 
 #include "motohawk.h"
 
+#define encode_scale_offset(value, scale, offset) ((value - offset) * scale)
+#define decode_scale_offset(value, factor, offset) ((value * factor) + offset)
+
 static inline uint8_t pack_left_shift_u8(
     uint8_t value,
     uint8_t shift,
@@ -86,6 +89,7 @@ int motohawk_example_message_pack(
     size_t size)
 {
     uint16_t temperature;
+    uint8_t average_radius;
 
     if (size < 8u) {
         return (-EINVAL);
@@ -94,28 +98,30 @@ int motohawk_example_message_pack(
     memset(&dst_p[0], 0, 8);
 
     dst_p[0] |= pack_left_shift_u8(src_p->enable, 7u, 0x80u);
-    dst_p[0] |= pack_left_shift_u8(src_p->average_radius, 1u, 0x7eu);
-    temperature = (uint16_t)src_p->temperature;
+    average_radius = (uint8_t)motohawk_example_message_average_radius_encode(src_p->average_radius);
+    dst_p[0] |= pack_left_shift_u8(average_radius, 1u, 0x7eu);
+    temperature = (uint16_t)motohawk_example_message_temperature_encode(src_p->temperature);
     dst_p[0] |= pack_right_shift_u16(temperature, 11u, 0x01u);
     dst_p[1] |= pack_right_shift_u16(temperature, 3u, 0xffu);
     dst_p[2] |= pack_left_shift_u16(temperature, 5u, 0xe0u);
 
     return (8);
 }
-
 int motohawk_example_message_unpack(
     struct motohawk_example_message_t *dst_p,
     const uint8_t *src_p,
     size_t size)
 {
     uint16_t temperature;
+    uint8_t average_radius;
 
     if (size < 8u) {
         return (-EINVAL);
     }
 
     dst_p->enable = unpack_right_shift_u8(src_p[0], 7u, 0x80u);
-    dst_p->average_radius = unpack_right_shift_u8(src_p[0], 1u, 0x7eu);
+    average_radius = unpack_right_shift_u8(src_p[0], 1u, 0x7eu);
+    dst_p->average_radius = motohawk_example_message_average_radius_decode((uint8_t)average_radius);
     temperature = unpack_left_shift_u16(src_p[0], 11u, 0x01u);
     temperature |= unpack_left_shift_u16(src_p[1], 3u, 0xffu);
     temperature |= unpack_right_shift_u16(src_p[2], 5u, 0xe0u);
@@ -123,20 +129,19 @@ int motohawk_example_message_unpack(
     if ((temperature & (1u << 11)) != 0u) {
         temperature |= 0xf000u;
     }
-
-    dst_p->temperature = (int16_t)temperature;
+    dst_p->temperature = motohawk_example_message_temperature_decode((int16_t)temperature);
 
     return (0);
 }
 
-uint8_t motohawk_example_message_enable_encode(double value)
+uint8_t motohawk_example_message_enable_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double motohawk_example_message_enable_decode(uint8_t value)
+float motohawk_example_message_enable_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool motohawk_example_message_enable_is_in_range(uint8_t value)
@@ -144,14 +149,14 @@ bool motohawk_example_message_enable_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t motohawk_example_message_average_radius_encode(double value)
+uint8_t motohawk_example_message_average_radius_encode(float value)
 {
-    return (uint8_t)(value / 0.1);
+    return (uint8_t)(value / 0.1f);
 }
 
-double motohawk_example_message_average_radius_decode(uint8_t value)
+float motohawk_example_message_average_radius_decode(uint8_t value)
 {
-    return ((double)value * 0.1);
+    return ((float)value * 0.1f);
 }
 
 bool motohawk_example_message_average_radius_is_in_range(uint8_t value)
@@ -159,17 +164,71 @@ bool motohawk_example_message_average_radius_is_in_range(uint8_t value)
     return (value <= 50u);
 }
 
-int16_t motohawk_example_message_temperature_encode(double value)
+int16_t motohawk_example_message_temperature_encode(float value)
 {
-    return (int16_t)((value - 250.0) / 0.01);
+    return (int16_t)((value - 250.0f) / 0.01f);
 }
 
-double motohawk_example_message_temperature_decode(int16_t value)
+float motohawk_example_message_temperature_decode(int16_t value)
 {
-    return (((double)value * 0.01) + 250.0);
+    return (((float)value * 0.01f) + 250.0f);
 }
 
 bool motohawk_example_message_temperature_is_in_range(int16_t value)
 {
     return ((value >= -2048) && (value <= 2047));
 }
+
+const struct motohawk_message_descriptor_t
+motohawk_message_descriptors[MOTOHAWK_MESSAGES_LENGTH] = {
+    { MOTOHAWK_EXAMPLE_MESSAGE_FRAME_ID, 8u, false, 0u }
+};
+
+const struct motohawk_message_descriptor_t *
+motohawk_message_descriptor_by_frame_id(uint32_t frame_id)
+{
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    low = 0;
+    high = MOTOHAWK_MESSAGES_LENGTH;
+
+    while (low < high) {
+        middle = (low + ((high - low) / 2u));
+
+        if (motohawk_message_descriptors[middle].frame_id < frame_id) {
+            low = (middle + 1u);
+        } else {
+            high = middle;
+        }
+    }
+
+    if ((low < MOTOHAWK_MESSAGES_LENGTH)
+        && (motohawk_message_descriptors[low].frame_id == frame_id)) {
+        return (&motohawk_message_descriptors[low]);
+    }
+
+    return (NULL);
+}
+
+int motohawk_unpack_by_frame_id(
+    uint32_t frame_id,
+    union motohawk_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    switch (frame_id) {
+
+    case MOTOHAWK_EXAMPLE_MESSAGE_FRAME_ID:
+        return (motohawk_example_message_unpack(
+                    &dst_p->example_message,
+                    src_p,
+                    size));
+
+    default:
+        break;
+    }
+
+    return (-EINVAL);
+}
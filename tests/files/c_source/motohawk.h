@@ -79,14 +79,14 @@ struct motohawk_example_message_t {
      * Scale: 0.1
      * Offset: 0
      */
-    uint8_t average_radius;
+    float average_radius;
 
     /**
      * Range: -2048..2047 (229.52..270.47 degK)
      * Scale: 0.01
      * Offset: 250
      */
-    int16_t temperature;
+    float temperature;
 };
 
 /**
@@ -102,7 +102,6 @@ int motohawk_example_message_pack(
     uint8_t *dst_p,
     const struct motohawk_example_message_t *src_p,
     size_t size);
-
 /**
  * Unpack message ExampleMessage.
  *
@@ -124,7 +123,7 @@ int motohawk_example_message_unpack(
  *
  * @return Encoded signal.
  */
-uint8_t motohawk_example_message_enable_encode(double value);
+uint8_t motohawk_example_message_enable_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -133,7 +132,7 @@ uint8_t motohawk_example_message_enable_encode(double value);
  *
  * @return Decoded signal.
  */
-double motohawk_example_message_enable_decode(uint8_t value);
+float motohawk_example_message_enable_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -151,7 +150,7 @@ bool motohawk_example_message_enable_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t motohawk_example_message_average_radius_encode(double value);
+uint8_t motohawk_example_message_average_radius_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -160,7 +159,7 @@ uint8_t motohawk_example_message_average_radius_encode(double value);
  *
  * @return Decoded signal.
  */
-double motohawk_example_message_average_radius_decode(uint8_t value);
+float motohawk_example_message_average_radius_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -178,7 +177,7 @@ bool motohawk_example_message_average_radius_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-int16_t motohawk_example_message_temperature_encode(double value);
+int16_t motohawk_example_message_temperature_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -187,7 +186,7 @@ int16_t motohawk_example_message_temperature_encode(double value);
  *
  * @return Decoded signal.
  */
-double motohawk_example_message_temperature_decode(int16_t value);
+float motohawk_example_message_temperature_decode(int16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -198,6 +197,59 @@ double motohawk_example_message_temperature_decode(int16_t value);
  */
 bool motohawk_example_message_temperature_is_in_range(int16_t value);
 
+/**
+ * Frame id, length, extended flag and cycle time of a message. The
+ * cycle time is zero(0) if not given in the database.
+ */
+struct motohawk_message_descriptor_t {
+    uint32_t frame_id;
+    uint8_t length;
+    bool is_extended;
+    uint32_t cycle_time_ms;
+};
+
+/**
+ * Storage for any message in the database.
+ */
+union motohawk_message_t {
+    struct motohawk_example_message_t example_message;
+};
+
+/* Number of messages in the database. */
+#define MOTOHAWK_MESSAGES_LENGTH (1u)
+
+/**
+ * Message descriptors sorted by frame id.
+ */
+extern const struct motohawk_message_descriptor_t
+motohawk_message_descriptors[MOTOHAWK_MESSAGES_LENGTH];
+
+/**
+ * Find the descriptor of the message with given frame id using a
+ * binary search in the descriptors table.
+ *
+ * @param[in] frame_id Frame id of the message.
+ *
+ * @return Message descriptor, or NULL if not found.
+ */
+const struct motohawk_message_descriptor_t *
+motohawk_message_descriptor_by_frame_id(uint32_t frame_id);
+
+/**
+ * Unpack the message with given frame id.
+ *
+ * @param[in] frame_id Frame id of the message.
+ * @param[out] dst_p Object to unpack the message into.
+ * @param[in] src_p Message to unpack.
+ * @param[in] size Size of src_p.
+ *
+ * @return zero(0) or negative error code.
+ */
+int motohawk_unpack_by_frame_id(
+    uint32_t frame_id,
+    union motohawk_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size);
 
 #ifdef __cplusplus
 }
@@ -32,6 +32,9 @@
 
 #include "multiplex.h"
 
+#define encode_scale_offset(value, scale, offset) ((value - offset) * scale)
+#define decode_scale_offset(value, factor, offset) ((value * factor) + offset)
+
 static inline uint8_t pack_left_shift_u8(
     uint8_t value,
     uint8_t shift,
@@ -97,7 +100,6 @@ int multiplex_message1_pack(
 
     return (8);
 }
-
 int multiplex_message1_unpack(
     struct multiplex_message1_t *dst_p,
     const uint8_t *src_p,
@@ -146,14 +148,14 @@ int multiplex_message1_unpack(
     return (0);
 }
 
-uint8_t multiplex_message1_multiplexor_encode(double value)
+uint8_t multiplex_message1_multiplexor_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_multiplexor_decode(uint8_t value)
+float multiplex_message1_multiplexor_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_multiplexor_is_in_range(uint8_t value)
@@ -161,14 +163,14 @@ bool multiplex_message1_multiplexor_is_in_range(uint8_t value)
     return (value <= 63u);
 }
 
-uint8_t multiplex_message1_bit_j_encode(double value)
+uint8_t multiplex_message1_bit_j_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_bit_j_decode(uint8_t value)
+float multiplex_message1_bit_j_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_bit_j_is_in_range(uint8_t value)
@@ -176,14 +178,14 @@ bool multiplex_message1_bit_j_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t multiplex_message1_bit_c_encode(double value)
+uint8_t multiplex_message1_bit_c_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_bit_c_decode(uint8_t value)
+float multiplex_message1_bit_c_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_bit_c_is_in_range(uint8_t value)
@@ -191,14 +193,14 @@ bool multiplex_message1_bit_c_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t multiplex_message1_bit_g_encode(double value)
+uint8_t multiplex_message1_bit_g_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_bit_g_decode(uint8_t value)
+float multiplex_message1_bit_g_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_bit_g_is_in_range(uint8_t value)
@@ -206,14 +208,14 @@ bool multiplex_message1_bit_g_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t multiplex_message1_bit_l_encode(double value)
+uint8_t multiplex_message1_bit_l_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_bit_l_decode(uint8_t value)
+float multiplex_message1_bit_l_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_bit_l_is_in_range(uint8_t value)
@@ -221,14 +223,14 @@ bool multiplex_message1_bit_l_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t multiplex_message1_bit_a_encode(double value)
+uint8_t multiplex_message1_bit_a_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_bit_a_decode(uint8_t value)
+float multiplex_message1_bit_a_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_bit_a_is_in_range(uint8_t value)
@@ -236,14 +238,14 @@ bool multiplex_message1_bit_a_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t multiplex_message1_bit_k_encode(double value)
+uint8_t multiplex_message1_bit_k_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_bit_k_decode(uint8_t value)
+float multiplex_message1_bit_k_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_bit_k_is_in_range(uint8_t value)
@@ -251,14 +253,14 @@ bool multiplex_message1_bit_k_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t multiplex_message1_bit_e_encode(double value)
+uint8_t multiplex_message1_bit_e_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_bit_e_decode(uint8_t value)
+float multiplex_message1_bit_e_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_bit_e_is_in_range(uint8_t value)
@@ -266,14 +268,14 @@ bool multiplex_message1_bit_e_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t multiplex_message1_bit_d_encode(double value)
+uint8_t multiplex_message1_bit_d_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_bit_d_decode(uint8_t value)
+float multiplex_message1_bit_d_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_bit_d_is_in_range(uint8_t value)
@@ -281,14 +283,14 @@ bool multiplex_message1_bit_d_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t multiplex_message1_bit_b_encode(double value)
+uint8_t multiplex_message1_bit_b_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_bit_b_decode(uint8_t value)
+float multiplex_message1_bit_b_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_bit_b_is_in_range(uint8_t value)
@@ -296,14 +298,14 @@ bool multiplex_message1_bit_b_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t multiplex_message1_bit_h_encode(double value)
+uint8_t multiplex_message1_bit_h_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_bit_h_decode(uint8_t value)
+float multiplex_message1_bit_h_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_bit_h_is_in_range(uint8_t value)
@@ -311,17 +313,71 @@ bool multiplex_message1_bit_h_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint8_t multiplex_message1_bit_f_encode(double value)
+uint8_t multiplex_message1_bit_f_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double multiplex_message1_bit_f_decode(uint8_t value)
+float multiplex_message1_bit_f_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool multiplex_message1_bit_f_is_in_range(uint8_t value)
 {
     return (value <= 1u);
 }
+
+const struct multiplex_message_descriptor_t
+multiplex_message_descriptors[MULTIPLEX_MESSAGES_LENGTH] = {
+    { MULTIPLEX_MESSAGE1_FRAME_ID, 8u, true, 0u }
+};
+
+const struct multiplex_message_descriptor_t *
+multiplex_message_descriptor_by_frame_id(uint32_t frame_id)
+{
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    low = 0;
+    high = MULTIPLEX_MESSAGES_LENGTH;
+
+    while (low < high) {
+        middle = (low + ((high - low) / 2u));
+
+        if (multiplex_message_descriptors[middle].frame_id < frame_id) {
+            low = (middle + 1u);
+        } else {
+            high = middle;
+        }
+    }
+
+    if ((low < MULTIPLEX_MESSAGES_LENGTH)
+        && (multiplex_message_descriptors[low].frame_id == frame_id)) {
+        return (&multiplex_message_descriptors[low]);
+    }
+
+    return (NULL);
+}
+
+int multiplex_unpack_by_frame_id(
+    uint32_t frame_id,
+    union multiplex_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    switch (frame_id) {
+
+    case MULTIPLEX_MESSAGE1_FRAME_ID:
+        return (multiplex_message1_unpack(
+                    &dst_p->message1,
+                    src_p,
+                    size));
+
+    default:
+        break;
+    }
+
+    return (-EINVAL);
+}
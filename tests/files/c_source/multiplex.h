@@ -164,7 +164,6 @@ int multiplex_message1_pack(
     uint8_t *dst_p,
     const struct multiplex_message1_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message1.
  *
@@ -186,7 +185,7 @@ int multiplex_message1_unpack(
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_multiplexor_encode(double value);
+uint8_t multiplex_message1_multiplexor_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -195,7 +194,7 @@ uint8_t multiplex_message1_multiplexor_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_multiplexor_decode(uint8_t value);
+float multiplex_message1_multiplexor_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -213,7 +212,7 @@ bool multiplex_message1_multiplexor_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_bit_j_encode(double value);
+uint8_t multiplex_message1_bit_j_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -222,7 +221,7 @@ uint8_t multiplex_message1_bit_j_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_bit_j_decode(uint8_t value);
+float multiplex_message1_bit_j_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -240,7 +239,7 @@ bool multiplex_message1_bit_j_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_bit_c_encode(double value);
+uint8_t multiplex_message1_bit_c_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -249,7 +248,7 @@ uint8_t multiplex_message1_bit_c_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_bit_c_decode(uint8_t value);
+float multiplex_message1_bit_c_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -267,7 +266,7 @@ bool multiplex_message1_bit_c_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_bit_g_encode(double value);
+uint8_t multiplex_message1_bit_g_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -276,7 +275,7 @@ uint8_t multiplex_message1_bit_g_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_bit_g_decode(uint8_t value);
+float multiplex_message1_bit_g_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -294,7 +293,7 @@ bool multiplex_message1_bit_g_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_bit_l_encode(double value);
+uint8_t multiplex_message1_bit_l_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -303,7 +302,7 @@ uint8_t multiplex_message1_bit_l_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_bit_l_decode(uint8_t value);
+float multiplex_message1_bit_l_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -321,7 +320,7 @@ bool multiplex_message1_bit_l_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_bit_a_encode(double value);
+uint8_t multiplex_message1_bit_a_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -330,7 +329,7 @@ uint8_t multiplex_message1_bit_a_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_bit_a_decode(uint8_t value);
+float multiplex_message1_bit_a_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -348,7 +347,7 @@ bool multiplex_message1_bit_a_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_bit_k_encode(double value);
+uint8_t multiplex_message1_bit_k_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -357,7 +356,7 @@ uint8_t multiplex_message1_bit_k_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_bit_k_decode(uint8_t value);
+float multiplex_message1_bit_k_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -375,7 +374,7 @@ bool multiplex_message1_bit_k_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_bit_e_encode(double value);
+uint8_t multiplex_message1_bit_e_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -384,7 +383,7 @@ uint8_t multiplex_message1_bit_e_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_bit_e_decode(uint8_t value);
+float multiplex_message1_bit_e_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -402,7 +401,7 @@ bool multiplex_message1_bit_e_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_bit_d_encode(double value);
+uint8_t multiplex_message1_bit_d_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -411,7 +410,7 @@ uint8_t multiplex_message1_bit_d_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_bit_d_decode(uint8_t value);
+float multiplex_message1_bit_d_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -429,7 +428,7 @@ bool multiplex_message1_bit_d_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_bit_b_encode(double value);
+uint8_t multiplex_message1_bit_b_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -438,7 +437,7 @@ uint8_t multiplex_message1_bit_b_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_bit_b_decode(uint8_t value);
+float multiplex_message1_bit_b_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -456,7 +455,7 @@ bool multiplex_message1_bit_b_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_bit_h_encode(double value);
+uint8_t multiplex_message1_bit_h_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -465,7 +464,7 @@ uint8_t multiplex_message1_bit_h_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_bit_h_decode(uint8_t value);
+float multiplex_message1_bit_h_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -483,7 +482,7 @@ bool multiplex_message1_bit_h_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t multiplex_message1_bit_f_encode(double value);
+uint8_t multiplex_message1_bit_f_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -492,7 +491,7 @@ uint8_t multiplex_message1_bit_f_encode(double value);
  *
  * @return Decoded signal.
  */
-double multiplex_message1_bit_f_decode(uint8_t value);
+float multiplex_message1_bit_f_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -503,6 +502,59 @@ double multiplex_message1_bit_f_decode(uint8_t value);
  */
 bool multiplex_message1_bit_f_is_in_range(uint8_t value);
 
+/**
+ * Frame id, length, extended flag and cycle time of a message. The
+ * cycle time is zero(0) if not given in the database.
+ */
+struct multiplex_message_descriptor_t {
+    uint32_t frame_id;
+    uint8_t length;
+    bool is_extended;
+    uint32_t cycle_time_ms;
+};
+
+/**
+ * Storage for any message in the database.
+ */
+union multiplex_message_t {
+    struct multiplex_message1_t message1;
+};
+
+/* Number of messages in the database. */
+#define MULTIPLEX_MESSAGES_LENGTH (1u)
+
+/**
+ * Message descriptors sorted by frame id.
+ */
+extern const struct multiplex_message_descriptor_t
+multiplex_message_descriptors[MULTIPLEX_MESSAGES_LENGTH];
+
+/**
+ * Find the descriptor of the message with given frame id using a
+ * binary search in the descriptors table.
+ *
+ * @param[in] frame_id Frame id of the message.
+ *
+ * @return Message descriptor, or NULL if not found.
+ */
+const struct multiplex_message_descriptor_t *
+multiplex_message_descriptor_by_frame_id(uint32_t frame_id);
+
+/**
+ * Unpack the message with given frame id.
+ *
+ * @param[in] frame_id Frame id of the message.
+ * @param[out] dst_p Object to unpack the message into.
+ * @param[in] src_p Message to unpack.
+ * @param[in] size Size of src_p.
+ *
+ * @return zero(0) or negative error code.
+ */
+int multiplex_unpack_by_frame_id(
+    uint32_t frame_id,
+    union multiplex_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size);
 
 #ifdef __cplusplus
 }
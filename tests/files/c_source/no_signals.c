@@ -32,6 +32,9 @@
 
 #include "no_signals.h"
 
+#define encode_scale_offset(value, scale, offset) ((value - offset) * scale)
+#define decode_scale_offset(value, factor, offset) ((value * factor) + offset)
+
 int no_signals_message1_pack(
     uint8_t *dst_p,
     const struct no_signals_message1_t *src_p,
@@ -47,7 +50,6 @@ int no_signals_message1_pack(
 
     return (5);
 }
-
 int no_signals_message1_unpack(
     struct no_signals_message1_t *dst_p,
     const uint8_t *src_p,
@@ -86,3 +88,61 @@ int no_signals_message2_unpack(
 
     return (0);
 }
+
+const struct no_signals_message_descriptor_t
+no_signals_message_descriptors[NO_SIGNALS_MESSAGES_LENGTH] = {
+    { NO_SIGNALS_MESSAGE1_FRAME_ID, 5u, false, 0u },
+    { NO_SIGNALS_MESSAGE2_FRAME_ID, 0u, false, 0u }
+};
+
+const struct no_signals_message_descriptor_t *
+no_signals_message_descriptor_by_frame_id(uint32_t frame_id)
+{
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    low = 0;
+    high = NO_SIGNALS_MESSAGES_LENGTH;
+
+    while (low < high) {
+        middle = (low + ((high - low) / 2u));
+
+        if (no_signals_message_descriptors[middle].frame_id < frame_id) {
+            low = (middle + 1u);
+        } else {
+            high = middle;
+        }
+    }
+
+    if ((low < NO_SIGNALS_MESSAGES_LENGTH)
+        && (no_signals_message_descriptors[low].frame_id == frame_id)) {
+        return (&no_signals_message_descriptors[low]);
+    }
+
+    return (NULL);
+}
+
+int no_signals_unpack_by_frame_id(
+    uint32_t frame_id,
+    union no_signals_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    switch (frame_id) {
+
+    case NO_SIGNALS_MESSAGE1_FRAME_ID:
+        return (no_signals_message1_unpack(
+                    &dst_p->message1,
+                    src_p,
+                    size));
+
+    case NO_SIGNALS_MESSAGE2_FRAME_ID:
+        return (0);
+
+    default:
+        break;
+    }
+
+    return (-EINVAL);
+}
@@ -98,7 +98,6 @@ int no_signals_message1_pack(
     uint8_t *dst_p,
     const struct no_signals_message1_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message1.
  *
@@ -126,7 +125,6 @@ int no_signals_message2_pack(
     uint8_t *dst_p,
     const struct no_signals_message2_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message2.
  *
@@ -141,6 +139,60 @@ int no_signals_message2_unpack(
     const uint8_t *src_p,
     size_t size);
 
+/**
+ * Frame id, length, extended flag and cycle time of a message. The
+ * cycle time is zero(0) if not given in the database.
+ */
+struct no_signals_message_descriptor_t {
+    uint32_t frame_id;
+    uint8_t length;
+    bool is_extended;
+    uint32_t cycle_time_ms;
+};
+
+/**
+ * Storage for any message in the database.
+ */
+union no_signals_message_t {
+    struct no_signals_message1_t message1;
+    struct no_signals_message2_t message2;
+};
+
+/* Number of messages in the database. */
+#define NO_SIGNALS_MESSAGES_LENGTH (2u)
+
+/**
+ * Message descriptors sorted by frame id.
+ */
+extern const struct no_signals_message_descriptor_t
+no_signals_message_descriptors[NO_SIGNALS_MESSAGES_LENGTH];
+
+/**
+ * Find the descriptor of the message with given frame id using a
+ * binary search in the descriptors table.
+ *
+ * @param[in] frame_id Frame id of the message.
+ *
+ * @return Message descriptor, or NULL if not found.
+ */
+const struct no_signals_message_descriptor_t *
+no_signals_message_descriptor_by_frame_id(uint32_t frame_id);
+
+/**
+ * Unpack the message with given frame id.
+ *
+ * @param[in] frame_id Frame id of the message.
+ * @param[out] dst_p Object to unpack the message into.
+ * @param[in] src_p Message to unpack.
+ * @param[in] size Size of src_p.
+ *
+ * @return zero(0) or negative error code.
+ */
+int no_signals_unpack_by_frame_id(
+    uint32_t frame_id,
+    union no_signals_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size);
 
 #ifdef __cplusplus
 }
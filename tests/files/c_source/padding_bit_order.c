@@ -32,6 +32,9 @@
 
 #include "padding_bit_order.h"
 
+#define encode_scale_offset(value, scale, offset) ((value - offset) * scale)
+#define decode_scale_offset(value, factor, offset) ((value * factor) + offset)
+
 static inline uint8_t pack_left_shift_u8(
     uint8_t value,
     uint8_t shift,
@@ -132,7 +135,6 @@ int padding_bit_order_msg0_pack(
 
     return (8);
 }
-
 int padding_bit_order_msg0_unpack(
     struct padding_bit_order_msg0_t *dst_p,
     const uint8_t *src_p,
@@ -152,14 +154,14 @@ int padding_bit_order_msg0_unpack(
     return (0);
 }
 
-uint8_t padding_bit_order_msg0_b_encode(double value)
+uint8_t padding_bit_order_msg0_b_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double padding_bit_order_msg0_b_decode(uint8_t value)
+float padding_bit_order_msg0_b_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg0_b_is_in_range(uint8_t value)
@@ -167,14 +169,14 @@ bool padding_bit_order_msg0_b_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint16_t padding_bit_order_msg0_a_encode(double value)
+uint16_t padding_bit_order_msg0_a_encode(float value)
 {
     return (uint16_t)(value);
 }
 
-double padding_bit_order_msg0_a_decode(uint16_t value)
+float padding_bit_order_msg0_a_decode(uint16_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg0_a_is_in_range(uint16_t value)
@@ -182,14 +184,14 @@ bool padding_bit_order_msg0_a_is_in_range(uint16_t value)
     return (value <= 32767u);
 }
 
-uint8_t padding_bit_order_msg0_d_encode(double value)
+uint8_t padding_bit_order_msg0_d_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double padding_bit_order_msg0_d_decode(uint8_t value)
+float padding_bit_order_msg0_d_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg0_d_is_in_range(uint8_t value)
@@ -197,14 +199,14 @@ bool padding_bit_order_msg0_d_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint16_t padding_bit_order_msg0_c_encode(double value)
+uint16_t padding_bit_order_msg0_c_encode(float value)
 {
     return (uint16_t)(value);
 }
 
-double padding_bit_order_msg0_c_decode(uint16_t value)
+float padding_bit_order_msg0_c_decode(uint16_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg0_c_is_in_range(uint16_t value)
@@ -232,7 +234,6 @@ int padding_bit_order_msg1_pack(
 
     return (8);
 }
-
 int padding_bit_order_msg1_unpack(
     struct padding_bit_order_msg1_t *dst_p,
     const uint8_t *src_p,
@@ -252,14 +253,14 @@ int padding_bit_order_msg1_unpack(
     return (0);
 }
 
-uint8_t padding_bit_order_msg1_e_encode(double value)
+uint8_t padding_bit_order_msg1_e_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double padding_bit_order_msg1_e_decode(uint8_t value)
+float padding_bit_order_msg1_e_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg1_e_is_in_range(uint8_t value)
@@ -267,14 +268,14 @@ bool padding_bit_order_msg1_e_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint16_t padding_bit_order_msg1_f_encode(double value)
+uint16_t padding_bit_order_msg1_f_encode(float value)
 {
     return (uint16_t)(value);
 }
 
-double padding_bit_order_msg1_f_decode(uint16_t value)
+float padding_bit_order_msg1_f_decode(uint16_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg1_f_is_in_range(uint16_t value)
@@ -282,14 +283,14 @@ bool padding_bit_order_msg1_f_is_in_range(uint16_t value)
     return (value <= 32767u);
 }
 
-uint8_t padding_bit_order_msg1_g_encode(double value)
+uint8_t padding_bit_order_msg1_g_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double padding_bit_order_msg1_g_decode(uint8_t value)
+float padding_bit_order_msg1_g_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg1_g_is_in_range(uint8_t value)
@@ -297,14 +298,14 @@ bool padding_bit_order_msg1_g_is_in_range(uint8_t value)
     return (value <= 1u);
 }
 
-uint16_t padding_bit_order_msg1_h_encode(double value)
+uint16_t padding_bit_order_msg1_h_encode(float value)
 {
     return (uint16_t)(value);
 }
 
-double padding_bit_order_msg1_h_decode(uint16_t value)
+float padding_bit_order_msg1_h_decode(uint16_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg1_h_is_in_range(uint16_t value)
@@ -329,7 +330,6 @@ int padding_bit_order_msg2_pack(
 
     return (8);
 }
-
 int padding_bit_order_msg2_unpack(
     struct padding_bit_order_msg2_t *dst_p,
     const uint8_t *src_p,
@@ -346,14 +346,14 @@ int padding_bit_order_msg2_unpack(
     return (0);
 }
 
-uint8_t padding_bit_order_msg2_i_encode(double value)
+uint8_t padding_bit_order_msg2_i_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double padding_bit_order_msg2_i_decode(uint8_t value)
+float padding_bit_order_msg2_i_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg2_i_is_in_range(uint8_t value)
@@ -361,14 +361,14 @@ bool padding_bit_order_msg2_i_is_in_range(uint8_t value)
     return (value <= 15u);
 }
 
-uint8_t padding_bit_order_msg2_j_encode(double value)
+uint8_t padding_bit_order_msg2_j_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double padding_bit_order_msg2_j_decode(uint8_t value)
+float padding_bit_order_msg2_j_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg2_j_is_in_range(uint8_t value)
@@ -376,14 +376,14 @@ bool padding_bit_order_msg2_j_is_in_range(uint8_t value)
     return (value <= 15u);
 }
 
-uint8_t padding_bit_order_msg2_k_encode(double value)
+uint8_t padding_bit_order_msg2_k_encode(float value)
 {
     return (uint8_t)(value);
 }
 
-double padding_bit_order_msg2_k_decode(uint8_t value)
+float padding_bit_order_msg2_k_decode(uint8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg2_k_is_in_range(uint8_t value)
@@ -413,7 +413,6 @@ int padding_bit_order_msg3_pack(
 
     return (8);
 }
-
 int padding_bit_order_msg3_unpack(
     struct padding_bit_order_msg3_t *dst_p,
     const uint8_t *src_p,
@@ -435,14 +434,14 @@ int padding_bit_order_msg3_unpack(
     return (0);
 }
 
-uint64_t padding_bit_order_msg3_l_encode(double value)
+uint64_t padding_bit_order_msg3_l_encode(float value)
 {
     return (uint64_t)(value);
 }
 
-double padding_bit_order_msg3_l_decode(uint64_t value)
+float padding_bit_order_msg3_l_decode(uint64_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg3_l_is_in_range(uint64_t value)
@@ -474,7 +473,6 @@ int padding_bit_order_msg4_pack(
 
     return (8);
 }
-
 int padding_bit_order_msg4_unpack(
     struct padding_bit_order_msg4_t *dst_p,
     const uint8_t *src_p,
@@ -496,14 +494,14 @@ int padding_bit_order_msg4_unpack(
     return (0);
 }
 
-uint64_t padding_bit_order_msg4_m_encode(double value)
+uint64_t padding_bit_order_msg4_m_encode(float value)
 {
     return (uint64_t)(value);
 }
 
-double padding_bit_order_msg4_m_decode(uint64_t value)
+float padding_bit_order_msg4_m_decode(uint64_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool padding_bit_order_msg4_m_is_in_range(uint64_t value)
@@ -512,3 +510,85 @@ bool padding_bit_order_msg4_m_is_in_range(uint64_t value)
 
     return (true);
 }
+
+const struct padding_bit_order_message_descriptor_t
+padding_bit_order_message_descriptors[PADDING_BIT_ORDER_MESSAGES_LENGTH] = {
+    { PADDING_BIT_ORDER_MSG0_FRAME_ID, 8u, false, 0u },
+    { PADDING_BIT_ORDER_MSG1_FRAME_ID, 8u, false, 0u },
+    { PADDING_BIT_ORDER_MSG2_FRAME_ID, 8u, false, 0u },
+    { PADDING_BIT_ORDER_MSG3_FRAME_ID, 8u, false, 0u },
+    { PADDING_BIT_ORDER_MSG4_FRAME_ID, 8u, false, 0u }
+};
+
+const struct padding_bit_order_message_descriptor_t *
+padding_bit_order_message_descriptor_by_frame_id(uint32_t frame_id)
+{
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    low = 0;
+    high = PADDING_BIT_ORDER_MESSAGES_LENGTH;
+
+    while (low < high) {
+        middle = (low + ((high - low) / 2u));
+
+        if (padding_bit_order_message_descriptors[middle].frame_id < frame_id) {
+            low = (middle + 1u);
+        } else {
+            high = middle;
+        }
+    }
+
+    if ((low < PADDING_BIT_ORDER_MESSAGES_LENGTH)
+        && (padding_bit_order_message_descriptors[low].frame_id == frame_id)) {
+        return (&padding_bit_order_message_descriptors[low]);
+    }
+
+    return (NULL);
+}
+
+int padding_bit_order_unpack_by_frame_id(
+    uint32_t frame_id,
+    union padding_bit_order_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    switch (frame_id) {
+
+    case PADDING_BIT_ORDER_MSG0_FRAME_ID:
+        return (padding_bit_order_msg0_unpack(
+                    &dst_p->msg0,
+                    src_p,
+                    size));
+
+    case PADDING_BIT_ORDER_MSG1_FRAME_ID:
+        return (padding_bit_order_msg1_unpack(
+                    &dst_p->msg1,
+                    src_p,
+                    size));
+
+    case PADDING_BIT_ORDER_MSG2_FRAME_ID:
+        return (padding_bit_order_msg2_unpack(
+                    &dst_p->msg2,
+                    src_p,
+                    size));
+
+    case PADDING_BIT_ORDER_MSG3_FRAME_ID:
+        return (padding_bit_order_msg3_unpack(
+                    &dst_p->msg3,
+                    src_p,
+                    size));
+
+    case PADDING_BIT_ORDER_MSG4_FRAME_ID:
+        return (padding_bit_order_msg4_unpack(
+                    &dst_p->msg4,
+                    src_p,
+                    size));
+
+    default:
+        break;
+    }
+
+    return (-EINVAL);
+}
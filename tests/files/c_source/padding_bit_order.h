@@ -77,28 +77,28 @@ extern "C" {
  */
 struct padding_bit_order_msg0_t {
     /**
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t b;
 
     /**
-     * Range: 0..32767 (0..32767 -)
+     * Range: 0..32767 (0..32767 )
      * Scale: 1
      * Offset: 0
      */
     uint16_t a;
 
     /**
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t d;
 
     /**
-     * Range: 0..32767 (0..32767 -)
+     * Range: 0..32767 (0..32767 )
      * Scale: 1
      * Offset: 0
      */
@@ -112,28 +112,28 @@ struct padding_bit_order_msg0_t {
  */
 struct padding_bit_order_msg1_t {
     /**
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t e;
 
     /**
-     * Range: 0..32767 (0..32767 -)
+     * Range: 0..32767 (0..32767 )
      * Scale: 1
      * Offset: 0
      */
     uint16_t f;
 
     /**
-     * Range: 0..1 (0..1 -)
+     * Range: 0..1 (0..1 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t g;
 
     /**
-     * Range: 0..32767 (0..32767 -)
+     * Range: 0..32767 (0..32767 )
      * Scale: 1
      * Offset: 0
      */
@@ -147,21 +147,21 @@ struct padding_bit_order_msg1_t {
  */
 struct padding_bit_order_msg2_t {
     /**
-     * Range: 0..15 (0..15 -)
+     * Range: 0..15 (0..15 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t i;
 
     /**
-     * Range: 0..15 (0..15 -)
+     * Range: 0..15 (0..15 )
      * Scale: 1
      * Offset: 0
      */
     uint8_t j;
 
     /**
-     * Range: 0..15 (0..15 -)
+     * Range: 0..15 (0..15 )
      * Scale: 1
      * Offset: 0
      */
@@ -175,7 +175,7 @@ struct padding_bit_order_msg2_t {
  */
 struct padding_bit_order_msg3_t {
     /**
-     * Range: 0..18446744073709551615 (0..18446744073709551615 -)
+     * Range: 0..18446744073709551615 (0..18446744073709551615 )
      * Scale: 1
      * Offset: 0
      */
@@ -189,7 +189,7 @@ struct padding_bit_order_msg3_t {
  */
 struct padding_bit_order_msg4_t {
     /**
-     * Range: 0..18446744073709551615 (0..18446744073709551615 -)
+     * Range: 0..18446744073709551615 (0..18446744073709551615 )
      * Scale: 1
      * Offset: 0
      */
@@ -209,7 +209,6 @@ int padding_bit_order_msg0_pack(
     uint8_t *dst_p,
     const struct padding_bit_order_msg0_t *src_p,
     size_t size);
-
 /**
  * Unpack message MSG0.
  *
@@ -231,7 +230,7 @@ int padding_bit_order_msg0_unpack(
  *
  * @return Encoded signal.
  */
-uint8_t padding_bit_order_msg0_b_encode(double value);
+uint8_t padding_bit_order_msg0_b_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -240,7 +239,7 @@ uint8_t padding_bit_order_msg0_b_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg0_b_decode(uint8_t value);
+float padding_bit_order_msg0_b_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -258,7 +257,7 @@ bool padding_bit_order_msg0_b_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint16_t padding_bit_order_msg0_a_encode(double value);
+uint16_t padding_bit_order_msg0_a_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -267,7 +266,7 @@ uint16_t padding_bit_order_msg0_a_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg0_a_decode(uint16_t value);
+float padding_bit_order_msg0_a_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -285,7 +284,7 @@ bool padding_bit_order_msg0_a_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint8_t padding_bit_order_msg0_d_encode(double value);
+uint8_t padding_bit_order_msg0_d_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -294,7 +293,7 @@ uint8_t padding_bit_order_msg0_d_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg0_d_decode(uint8_t value);
+float padding_bit_order_msg0_d_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -312,7 +311,7 @@ bool padding_bit_order_msg0_d_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint16_t padding_bit_order_msg0_c_encode(double value);
+uint16_t padding_bit_order_msg0_c_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -321,7 +320,7 @@ uint16_t padding_bit_order_msg0_c_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg0_c_decode(uint16_t value);
+float padding_bit_order_msg0_c_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -345,7 +344,6 @@ int padding_bit_order_msg1_pack(
     uint8_t *dst_p,
     const struct padding_bit_order_msg1_t *src_p,
     size_t size);
-
 /**
  * Unpack message MSG1.
  *
@@ -367,7 +365,7 @@ int padding_bit_order_msg1_unpack(
  *
  * @return Encoded signal.
  */
-uint8_t padding_bit_order_msg1_e_encode(double value);
+uint8_t padding_bit_order_msg1_e_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -376,7 +374,7 @@ uint8_t padding_bit_order_msg1_e_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg1_e_decode(uint8_t value);
+float padding_bit_order_msg1_e_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -394,7 +392,7 @@ bool padding_bit_order_msg1_e_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint16_t padding_bit_order_msg1_f_encode(double value);
+uint16_t padding_bit_order_msg1_f_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -403,7 +401,7 @@ uint16_t padding_bit_order_msg1_f_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg1_f_decode(uint16_t value);
+float padding_bit_order_msg1_f_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -421,7 +419,7 @@ bool padding_bit_order_msg1_f_is_in_range(uint16_t value);
  *
  * @return Encoded signal.
  */
-uint8_t padding_bit_order_msg1_g_encode(double value);
+uint8_t padding_bit_order_msg1_g_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -430,7 +428,7 @@ uint8_t padding_bit_order_msg1_g_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg1_g_decode(uint8_t value);
+float padding_bit_order_msg1_g_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -448,7 +446,7 @@ bool padding_bit_order_msg1_g_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint16_t padding_bit_order_msg1_h_encode(double value);
+uint16_t padding_bit_order_msg1_h_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -457,7 +455,7 @@ uint16_t padding_bit_order_msg1_h_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg1_h_decode(uint16_t value);
+float padding_bit_order_msg1_h_decode(uint16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -481,7 +479,6 @@ int padding_bit_order_msg2_pack(
     uint8_t *dst_p,
     const struct padding_bit_order_msg2_t *src_p,
     size_t size);
-
 /**
  * Unpack message MSG2.
  *
@@ -503,7 +500,7 @@ int padding_bit_order_msg2_unpack(
  *
  * @return Encoded signal.
  */
-uint8_t padding_bit_order_msg2_i_encode(double value);
+uint8_t padding_bit_order_msg2_i_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -512,7 +509,7 @@ uint8_t padding_bit_order_msg2_i_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg2_i_decode(uint8_t value);
+float padding_bit_order_msg2_i_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -530,7 +527,7 @@ bool padding_bit_order_msg2_i_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t padding_bit_order_msg2_j_encode(double value);
+uint8_t padding_bit_order_msg2_j_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -539,7 +536,7 @@ uint8_t padding_bit_order_msg2_j_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg2_j_decode(uint8_t value);
+float padding_bit_order_msg2_j_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -557,7 +554,7 @@ bool padding_bit_order_msg2_j_is_in_range(uint8_t value);
  *
  * @return Encoded signal.
  */
-uint8_t padding_bit_order_msg2_k_encode(double value);
+uint8_t padding_bit_order_msg2_k_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -566,7 +563,7 @@ uint8_t padding_bit_order_msg2_k_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg2_k_decode(uint8_t value);
+float padding_bit_order_msg2_k_decode(uint8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -590,7 +587,6 @@ int padding_bit_order_msg3_pack(
     uint8_t *dst_p,
     const struct padding_bit_order_msg3_t *src_p,
     size_t size);
-
 /**
  * Unpack message MSG3.
  *
@@ -612,7 +608,7 @@ int padding_bit_order_msg3_unpack(
  *
  * @return Encoded signal.
  */
-uint64_t padding_bit_order_msg3_l_encode(double value);
+uint64_t padding_bit_order_msg3_l_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -621,7 +617,7 @@ uint64_t padding_bit_order_msg3_l_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg3_l_decode(uint64_t value);
+float padding_bit_order_msg3_l_decode(uint64_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -645,7 +641,6 @@ int padding_bit_order_msg4_pack(
     uint8_t *dst_p,
     const struct padding_bit_order_msg4_t *src_p,
     size_t size);
-
 /**
  * Unpack message MSG4.
  *
@@ -667,7 +662,7 @@ int padding_bit_order_msg4_unpack(
  *
  * @return Encoded signal.
  */
-uint64_t padding_bit_order_msg4_m_encode(double value);
+uint64_t padding_bit_order_msg4_m_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -676,7 +671,7 @@ uint64_t padding_bit_order_msg4_m_encode(double value);
  *
  * @return Decoded signal.
  */
-double padding_bit_order_msg4_m_decode(uint64_t value);
+float padding_bit_order_msg4_m_decode(uint64_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -687,6 +682,63 @@ double padding_bit_order_msg4_m_decode(uint64_t value);
  */
 bool padding_bit_order_msg4_m_is_in_range(uint64_t value);
 
+/**
+ * Frame id, length, extended flag and cycle time of a message. The
+ * cycle time is zero(0) if not given in the database.
+ */
+struct padding_bit_order_message_descriptor_t {
+    uint32_t frame_id;
+    uint8_t length;
+    bool is_extended;
+    uint32_t cycle_time_ms;
+};
+
+/**
+ * Storage for any message in the database.
+ */
+union padding_bit_order_message_t {
+    struct padding_bit_order_msg0_t msg0;
+    struct padding_bit_order_msg1_t msg1;
+    struct padding_bit_order_msg2_t msg2;
+    struct padding_bit_order_msg3_t msg3;
+    struct padding_bit_order_msg4_t msg4;
+};
+
+/* Number of messages in the database. */
+#define PADDING_BIT_ORDER_MESSAGES_LENGTH (5u)
+
+/**
+ * Message descriptors sorted by frame id.
+ */
+extern const struct padding_bit_order_message_descriptor_t
+padding_bit_order_message_descriptors[PADDING_BIT_ORDER_MESSAGES_LENGTH];
+
+/**
+ * Find the descriptor of the message with given frame id using a
+ * binary search in the descriptors table.
+ *
+ * @param[in] frame_id Frame id of the message.
+ *
+ * @return Message descriptor, or NULL if not found.
+ */
+const struct padding_bit_order_message_descriptor_t *
+padding_bit_order_message_descriptor_by_frame_id(uint32_t frame_id);
+
+/**
+ * Unpack the message with given frame id.
+ *
+ * @param[in] frame_id Frame id of the message.
+ * @param[out] dst_p Object to unpack the message into.
+ * @param[in] src_p Message to unpack.
+ * @param[in] size Size of src_p.
+ *
+ * @return zero(0) or negative error code.
+ */
+int padding_bit_order_unpack_by_frame_id(
+    uint32_t frame_id,
+    union padding_bit_order_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size);
 
 #ifdef __cplusplus
 }
@@ -32,6 +32,9 @@
 
 #include "signed.h"
 
+#define encode_scale_offset(value, scale, offset) ((value - offset) * scale)
+#define decode_scale_offset(value, factor, offset) ((value * factor) + offset)
+
 static inline uint8_t pack_left_shift_u8(
     uint8_t value,
     uint8_t shift,
@@ -204,7 +207,6 @@ int signed_message378910_pack(
 
     return (8);
 }
-
 int signed_message378910_unpack(
     struct signed_message378910_t *dst_p,
     const uint8_t *src_p,
@@ -228,7 +230,6 @@ int signed_message378910_unpack(
     if ((s7 & (1u << 6)) != 0u) {
         s7 |= 0x80u;
     }
-
     dst_p->s7 = (int8_t)s7;
     s8big = unpack_left_shift_u8(src_p[0], 7u, 0x01u);
     s8big |= unpack_right_shift_u8(src_p[1], 1u, 0xfeu);
@@ -239,7 +240,6 @@ int signed_message378910_unpack(
     if ((s9 & (1u << 8)) != 0u) {
         s9 |= 0xfe00u;
     }
-
     dst_p->s9 = (int16_t)s9;
     s8 = unpack_right_shift_u8(src_p[3], 2u, 0xfcu);
     s8 |= unpack_left_shift_u8(src_p[4], 6u, 0x03u);
@@ -249,14 +249,12 @@ int signed_message378910_unpack(
     if ((s3big & (1u << 2)) != 0u) {
         s3big |= 0xf8u;
     }
-
     dst_p->s3big = (int8_t)s3big;
     s3 = unpack_right_shift_u8(src_p[4], 2u, 0x1cu);
 
     if ((s3 & (1u << 2)) != 0u) {
         s3 |= 0xf8u;
     }
-
     dst_p->s3 = (int8_t)s3;
     s10big = unpack_left_shift_u16(src_p[5], 9u, 0x01u);
     s10big |= unpack_left_shift_u16(src_p[6], 1u, 0xffu);
@@ -265,27 +263,25 @@ int signed_message378910_unpack(
     if ((s10big & (1u << 9)) != 0u) {
         s10big |= 0xfc00u;
     }
-
     dst_p->s10big = (int16_t)s10big;
     s7big = unpack_right_shift_u8(src_p[7], 0u, 0x7fu);
 
     if ((s7big & (1u << 6)) != 0u) {
         s7big |= 0x80u;
     }
-
     dst_p->s7big = (int8_t)s7big;
 
     return (0);
 }
 
-int8_t signed_message378910_s7_encode(double value)
+int8_t signed_message378910_s7_encode(float value)
 {
     return (int8_t)(value);
 }
 
-double signed_message378910_s7_decode(int8_t value)
+float signed_message378910_s7_decode(int8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message378910_s7_is_in_range(int8_t value)
@@ -293,14 +289,14 @@ bool signed_message378910_s7_is_in_range(int8_t value)
     return ((value >= -64) && (value <= 63));
 }
 
-int8_t signed_message378910_s8big_encode(double value)
+int8_t signed_message378910_s8big_encode(float value)
 {
     return (int8_t)(value);
 }
 
-double signed_message378910_s8big_decode(int8_t value)
+float signed_message378910_s8big_decode(int8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message378910_s8big_is_in_range(int8_t value)
@@ -310,14 +306,14 @@ bool signed_message378910_s8big_is_in_range(int8_t value)
     return (true);
 }
 
-int16_t signed_message378910_s9_encode(double value)
+int16_t signed_message378910_s9_encode(float value)
 {
     return (int16_t)(value);
 }
 
-double signed_message378910_s9_decode(int16_t value)
+float signed_message378910_s9_decode(int16_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message378910_s9_is_in_range(int16_t value)
@@ -325,14 +321,14 @@ bool signed_message378910_s9_is_in_range(int16_t value)
     return ((value >= -256) && (value <= 255));
 }
 
-int8_t signed_message378910_s8_encode(double value)
+int8_t signed_message378910_s8_encode(float value)
 {
     return (int8_t)(value);
 }
 
-double signed_message378910_s8_decode(int8_t value)
+float signed_message378910_s8_decode(int8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message378910_s8_is_in_range(int8_t value)
@@ -342,14 +338,14 @@ bool signed_message378910_s8_is_in_range(int8_t value)
     return (true);
 }
 
-int8_t signed_message378910_s3big_encode(double value)
+int8_t signed_message378910_s3big_encode(float value)
 {
     return (int8_t)(value);
 }
 
-double signed_message378910_s3big_decode(int8_t value)
+float signed_message378910_s3big_decode(int8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message378910_s3big_is_in_range(int8_t value)
@@ -357,14 +353,14 @@ bool signed_message378910_s3big_is_in_range(int8_t value)
     return ((value >= -4) && (value <= 3));
 }
 
-int8_t signed_message378910_s3_encode(double value)
+int8_t signed_message378910_s3_encode(float value)
 {
     return (int8_t)(value);
 }
 
-double signed_message378910_s3_decode(int8_t value)
+float signed_message378910_s3_decode(int8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message378910_s3_is_in_range(int8_t value)
@@ -372,14 +368,14 @@ bool signed_message378910_s3_is_in_range(int8_t value)
     return ((value >= -4) && (value <= 3));
 }
 
-int16_t signed_message378910_s10big_encode(double value)
+int16_t signed_message378910_s10big_encode(float value)
 {
     return (int16_t)(value);
 }
 
-double signed_message378910_s10big_decode(int16_t value)
+float signed_message378910_s10big_decode(int16_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message378910_s10big_is_in_range(int16_t value)
@@ -387,14 +383,14 @@ bool signed_message378910_s10big_is_in_range(int16_t value)
     return ((value >= -512) && (value <= 511));
 }
 
-int8_t signed_message378910_s7big_encode(double value)
+int8_t signed_message378910_s7big_encode(float value)
 {
     return (int8_t)(value);
 }
 
-double signed_message378910_s7big_decode(int8_t value)
+float signed_message378910_s7big_decode(int8_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message378910_s7big_is_in_range(int8_t value)
@@ -427,7 +423,6 @@ int signed_message63big_1_pack(
 
     return (8);
 }
-
 int signed_message63big_1_unpack(
     struct signed_message63big_1_t *dst_p,
     const uint8_t *src_p,
@@ -451,20 +446,19 @@ int signed_message63big_1_unpack(
     if ((s63big & (1ull << 62)) != 0ull) {
         s63big |= 0x8000000000000000ull;
     }
-
     dst_p->s63big = (int64_t)s63big;
 
     return (0);
 }
 
-int64_t signed_message63big_1_s63big_encode(double value)
+int64_t signed_message63big_1_s63big_encode(float value)
 {
     return (int64_t)(value);
 }
 
-double signed_message63big_1_s63big_decode(int64_t value)
+float signed_message63big_1_s63big_decode(int64_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message63big_1_s63big_is_in_range(int64_t value)
@@ -497,7 +491,6 @@ int signed_message63_1_pack(
 
     return (8);
 }
-
 int signed_message63_1_unpack(
     struct signed_message63_1_t *dst_p,
     const uint8_t *src_p,
@@ -521,20 +514,19 @@ int signed_message63_1_unpack(
     if ((s63 & (1ull << 62)) != 0ull) {
         s63 |= 0x8000000000000000ull;
     }
-
     dst_p->s63 = (int64_t)s63;
 
     return (0);
 }
 
-int64_t signed_message63_1_s63_encode(double value)
+int64_t signed_message63_1_s63_encode(float value)
 {
     return (int64_t)(value);
 }
 
-double signed_message63_1_s63_decode(int64_t value)
+float signed_message63_1_s63_decode(int64_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message63_1_s63_is_in_range(int64_t value)
@@ -567,7 +559,6 @@ int signed_message63big_pack(
 
     return (8);
 }
-
 int signed_message63big_unpack(
     struct signed_message63big_t *dst_p,
     const uint8_t *src_p,
@@ -591,20 +582,19 @@ int signed_message63big_unpack(
     if ((s63big & (1ull << 62)) != 0ull) {
         s63big |= 0x8000000000000000ull;
     }
-
     dst_p->s63big = (int64_t)s63big;
 
     return (0);
 }
 
-int64_t signed_message63big_s63big_encode(double value)
+int64_t signed_message63big_s63big_encode(float value)
 {
     return (int64_t)(value);
 }
 
-double signed_message63big_s63big_decode(int64_t value)
+float signed_message63big_s63big_decode(int64_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message63big_s63big_is_in_range(int64_t value)
@@ -637,7 +627,6 @@ int signed_message63_pack(
 
     return (8);
 }
-
 int signed_message63_unpack(
     struct signed_message63_t *dst_p,
     const uint8_t *src_p,
@@ -661,20 +650,19 @@ int signed_message63_unpack(
     if ((s63 & (1ull << 62)) != 0ull) {
         s63 |= 0x8000000000000000ull;
     }
-
     dst_p->s63 = (int64_t)s63;
 
     return (0);
 }
 
-int64_t signed_message63_s63_encode(double value)
+int64_t signed_message63_s63_encode(float value)
 {
     return (int64_t)(value);
 }
 
-double signed_message63_s63_decode(int64_t value)
+float signed_message63_s63_decode(int64_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message63_s63_is_in_range(int64_t value)
@@ -703,7 +691,6 @@ int signed_message32big_pack(
 
     return (8);
 }
-
 int signed_message32big_unpack(
     struct signed_message32big_t *dst_p,
     const uint8_t *src_p,
@@ -724,14 +711,14 @@ int signed_message32big_unpack(
     return (0);
 }
 
-int32_t signed_message32big_s32big_encode(double value)
+int32_t signed_message32big_s32big_encode(float value)
 {
     return (int32_t)(value);
 }
 
-double signed_message32big_s32big_decode(int32_t value)
+float signed_message32big_s32big_decode(int32_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message32big_s32big_is_in_range(int32_t value)
@@ -763,7 +750,6 @@ int signed_message33big_pack(
 
     return (8);
 }
-
 int signed_message33big_unpack(
     struct signed_message33big_t *dst_p,
     const uint8_t *src_p,
@@ -784,20 +770,19 @@ int signed_message33big_unpack(
     if ((s33big & (1ull << 32)) != 0ull) {
         s33big |= 0xfffffffe00000000ull;
     }
-
     dst_p->s33big = (int64_t)s33big;
 
     return (0);
 }
 
-int64_t signed_message33big_s33big_encode(double value)
+int64_t signed_message33big_s33big_encode(float value)
 {
     return (int64_t)(value);
 }
 
-double signed_message33big_s33big_decode(int64_t value)
+float signed_message33big_s33big_decode(int64_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message33big_s33big_is_in_range(int64_t value)
@@ -830,7 +815,6 @@ int signed_message64big_pack(
 
     return (8);
 }
-
 int signed_message64big_unpack(
     struct signed_message64big_t *dst_p,
     const uint8_t *src_p,
@@ -855,14 +839,14 @@ int signed_message64big_unpack(
     return (0);
 }
 
-int64_t signed_message64big_s64big_encode(double value)
+int64_t signed_message64big_s64big_encode(float value)
 {
     return (int64_t)(value);
 }
 
-double signed_message64big_s64big_decode(int64_t value)
+float signed_message64big_s64big_decode(int64_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message64big_s64big_is_in_range(int64_t value)
@@ -897,7 +881,6 @@ int signed_message64_pack(
 
     return (8);
 }
-
 int signed_message64_unpack(
     struct signed_message64_t *dst_p,
     const uint8_t *src_p,
@@ -922,14 +905,14 @@ int signed_message64_unpack(
     return (0);
 }
 
-int64_t signed_message64_s64_encode(double value)
+int64_t signed_message64_s64_encode(float value)
 {
     return (int64_t)(value);
 }
 
-double signed_message64_s64_decode(int64_t value)
+float signed_message64_s64_decode(int64_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message64_s64_is_in_range(int64_t value)
@@ -961,7 +944,6 @@ int signed_message33_pack(
 
     return (8);
 }
-
 int signed_message33_unpack(
     struct signed_message33_t *dst_p,
     const uint8_t *src_p,
@@ -982,20 +964,19 @@ int signed_message33_unpack(
     if ((s33 & (1ull << 32)) != 0ull) {
         s33 |= 0xfffffffe00000000ull;
     }
-
     dst_p->s33 = (int64_t)s33;
 
     return (0);
 }
 
-int64_t signed_message33_s33_encode(double value)
+int64_t signed_message33_s33_encode(float value)
 {
     return (int64_t)(value);
 }
 
-double signed_message33_s33_decode(int64_t value)
+float signed_message33_s33_decode(int64_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message33_s33_is_in_range(int64_t value)
@@ -1024,7 +1005,6 @@ int signed_message32_pack(
 
     return (8);
 }
-
 int signed_message32_unpack(
     struct signed_message32_t *dst_p,
     const uint8_t *src_p,
@@ -1045,14 +1025,14 @@ int signed_message32_unpack(
     return (0);
 }
 
-int32_t signed_message32_s32_encode(double value)
+int32_t signed_message32_s32_encode(float value)
 {
     return (int32_t)(value);
 }
 
-double signed_message32_s32_decode(int32_t value)
+float signed_message32_s32_decode(int32_t value)
 {
-    return ((double)value);
+    return ((float)value);
 }
 
 bool signed_message32_s32_is_in_range(int32_t value)
@@ -1061,3 +1041,127 @@ bool signed_message32_s32_is_in_range(int32_t value)
 
     return (true);
 }
+
+const struct signed_message_descriptor_t
+signed_message_descriptors[SIGNED_MESSAGES_LENGTH] = {
+    { SIGNED_MESSAGE32_FRAME_ID, 8u, false, 0u },
+    { SIGNED_MESSAGE33_FRAME_ID, 8u, false, 0u },
+    { SIGNED_MESSAGE64_FRAME_ID, 8u, false, 0u },
+    { SIGNED_MESSAGE64BIG_FRAME_ID, 8u, false, 0u },
+    { SIGNED_MESSAGE33BIG_FRAME_ID, 8u, false, 0u },
+    { SIGNED_MESSAGE32BIG_FRAME_ID, 8u, false, 0u },
+    { SIGNED_MESSAGE63_FRAME_ID, 8u, false, 0u },
+    { SIGNED_MESSAGE63BIG_FRAME_ID, 8u, false, 0u },
+    { SIGNED_MESSAGE63_1_FRAME_ID, 8u, false, 0u },
+    { SIGNED_MESSAGE63BIG_1_FRAME_ID, 8u, false, 0u },
+    { SIGNED_MESSAGE378910_FRAME_ID, 8u, false, 0u }
+};
+
+const struct signed_message_descriptor_t *
+signed_message_descriptor_by_frame_id(uint32_t frame_id)
+{
+    size_t low;
+    size_t high;
+    size_t middle;
+
+    low = 0;
+    high = SIGNED_MESSAGES_LENGTH;
+
+    while (low < high) {
+        middle = (low + ((high - low) / 2u));
+
+        if (signed_message_descriptors[middle].frame_id < frame_id) {
+            low = (middle + 1u);
+        } else {
+            high = middle;
+        }
+    }
+
+    if ((low < SIGNED_MESSAGES_LENGTH)
+        && (signed_message_descriptors[low].frame_id == frame_id)) {
+        return (&signed_message_descriptors[low]);
+    }
+
+    return (NULL);
+}
+
+int signed_unpack_by_frame_id(
+    uint32_t frame_id,
+    union signed_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size)
+{
+    switch (frame_id) {
+
+    case SIGNED_MESSAGE32_FRAME_ID:
+        return (signed_message32_unpack(
+                    &dst_p->message32,
+                    src_p,
+                    size));
+
+    case SIGNED_MESSAGE33_FRAME_ID:
+        return (signed_message33_unpack(
+                    &dst_p->message33,
+                    src_p,
+                    size));
+
+    case SIGNED_MESSAGE64_FRAME_ID:
+        return (signed_message64_unpack(
+                    &dst_p->message64,
+                    src_p,
+                    size));
+
+    case SIGNED_MESSAGE64BIG_FRAME_ID:
+        return (signed_message64big_unpack(
+                    &dst_p->message64big,
+                    src_p,
+                    size));
+
+    case SIGNED_MESSAGE33BIG_FRAME_ID:
+        return (signed_message33big_unpack(
+                    &dst_p->message33big,
+                    src_p,
+                    size));
+
+    case SIGNED_MESSAGE32BIG_FRAME_ID:
+        return (signed_message32big_unpack(
+                    &dst_p->message32big,
+                    src_p,
+                    size));
+
+    case SIGNED_MESSAGE63_FRAME_ID:
+        return (signed_message63_unpack(
+                    &dst_p->message63,
+                    src_p,
+                    size));
+
+    case SIGNED_MESSAGE63BIG_FRAME_ID:
+        return (signed_message63big_unpack(
+                    &dst_p->message63big,
+                    src_p,
+                    size));
+
+    case SIGNED_MESSAGE63_1_FRAME_ID:
+        return (signed_message63_1_unpack(
+                    &dst_p->message63_1,
+                    src_p,
+                    size));
+
+    case SIGNED_MESSAGE63BIG_1_FRAME_ID:
+        return (signed_message63big_1_unpack(
+                    &dst_p->message63big_1,
+                    src_p,
+                    size));
+
+    case SIGNED_MESSAGE378910_FRAME_ID:
+        return (signed_message378910_unpack(
+                    &dst_p->message378910,
+                    src_p,
+                    size));
+
+    default:
+        break;
+    }
+
+    return (-EINVAL);
+}
@@ -256,7 +256,7 @@ struct signed_message64big_t {
  */
 struct signed_message64_t {
     /**
-     * Range: -9223372036854780000..9223372036854780000 (-9.22337203685478E+18..9.22337203685478E+18 -)
+     * Range: -9223372036854780000..9223372036854780000 (-9.22337203685478E+18..9.22337203685478E+18 )
      * Scale: 1
      * Offset: 0
      */
@@ -270,7 +270,7 @@ struct signed_message64_t {
  */
 struct signed_message33_t {
     /**
-     * Range: -4294967296..4294967295 (-4294967296..4294967295 -)
+     * Range: -4294967296..4294967295 (-4294967296..4294967295 )
      * Scale: 1
      * Offset: 0
      */
@@ -304,7 +304,6 @@ int signed_message378910_pack(
     uint8_t *dst_p,
     const struct signed_message378910_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message378910.
  *
@@ -326,7 +325,7 @@ int signed_message378910_unpack(
  *
  * @return Encoded signal.
  */
-int8_t signed_message378910_s7_encode(double value);
+int8_t signed_message378910_s7_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -335,7 +334,7 @@ int8_t signed_message378910_s7_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message378910_s7_decode(int8_t value);
+float signed_message378910_s7_decode(int8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -353,7 +352,7 @@ bool signed_message378910_s7_is_in_range(int8_t value);
  *
  * @return Encoded signal.
  */
-int8_t signed_message378910_s8big_encode(double value);
+int8_t signed_message378910_s8big_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -362,7 +361,7 @@ int8_t signed_message378910_s8big_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message378910_s8big_decode(int8_t value);
+float signed_message378910_s8big_decode(int8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -380,7 +379,7 @@ bool signed_message378910_s8big_is_in_range(int8_t value);
  *
  * @return Encoded signal.
  */
-int16_t signed_message378910_s9_encode(double value);
+int16_t signed_message378910_s9_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -389,7 +388,7 @@ int16_t signed_message378910_s9_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message378910_s9_decode(int16_t value);
+float signed_message378910_s9_decode(int16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -407,7 +406,7 @@ bool signed_message378910_s9_is_in_range(int16_t value);
  *
  * @return Encoded signal.
  */
-int8_t signed_message378910_s8_encode(double value);
+int8_t signed_message378910_s8_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -416,7 +415,7 @@ int8_t signed_message378910_s8_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message378910_s8_decode(int8_t value);
+float signed_message378910_s8_decode(int8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -434,7 +433,7 @@ bool signed_message378910_s8_is_in_range(int8_t value);
  *
  * @return Encoded signal.
  */
-int8_t signed_message378910_s3big_encode(double value);
+int8_t signed_message378910_s3big_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -443,7 +442,7 @@ int8_t signed_message378910_s3big_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message378910_s3big_decode(int8_t value);
+float signed_message378910_s3big_decode(int8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -461,7 +460,7 @@ bool signed_message378910_s3big_is_in_range(int8_t value);
  *
  * @return Encoded signal.
  */
-int8_t signed_message378910_s3_encode(double value);
+int8_t signed_message378910_s3_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -470,7 +469,7 @@ int8_t signed_message378910_s3_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message378910_s3_decode(int8_t value);
+float signed_message378910_s3_decode(int8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -488,7 +487,7 @@ bool signed_message378910_s3_is_in_range(int8_t value);
  *
  * @return Encoded signal.
  */
-int16_t signed_message378910_s10big_encode(double value);
+int16_t signed_message378910_s10big_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -497,7 +496,7 @@ int16_t signed_message378910_s10big_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message378910_s10big_decode(int16_t value);
+float signed_message378910_s10big_decode(int16_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -515,7 +514,7 @@ bool signed_message378910_s10big_is_in_range(int16_t value);
  *
  * @return Encoded signal.
  */
-int8_t signed_message378910_s7big_encode(double value);
+int8_t signed_message378910_s7big_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -524,7 +523,7 @@ int8_t signed_message378910_s7big_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message378910_s7big_decode(int8_t value);
+float signed_message378910_s7big_decode(int8_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -548,7 +547,6 @@ int signed_message63big_1_pack(
     uint8_t *dst_p,
     const struct signed_message63big_1_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message63big_1.
  *
@@ -570,7 +568,7 @@ int signed_message63big_1_unpack(
  *
  * @return Encoded signal.
  */
-int64_t signed_message63big_1_s63big_encode(double value);
+int64_t signed_message63big_1_s63big_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -579,7 +577,7 @@ int64_t signed_message63big_1_s63big_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message63big_1_s63big_decode(int64_t value);
+float signed_message63big_1_s63big_decode(int64_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -603,7 +601,6 @@ int signed_message63_1_pack(
     uint8_t *dst_p,
     const struct signed_message63_1_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message63_1.
  *
@@ -625,7 +622,7 @@ int signed_message63_1_unpack(
  *
  * @return Encoded signal.
  */
-int64_t signed_message63_1_s63_encode(double value);
+int64_t signed_message63_1_s63_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -634,7 +631,7 @@ int64_t signed_message63_1_s63_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message63_1_s63_decode(int64_t value);
+float signed_message63_1_s63_decode(int64_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -658,7 +655,6 @@ int signed_message63big_pack(
     uint8_t *dst_p,
     const struct signed_message63big_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message63big.
  *
@@ -680,7 +676,7 @@ int signed_message63big_unpack(
  *
  * @return Encoded signal.
  */
-int64_t signed_message63big_s63big_encode(double value);
+int64_t signed_message63big_s63big_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -689,7 +685,7 @@ int64_t signed_message63big_s63big_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message63big_s63big_decode(int64_t value);
+float signed_message63big_s63big_decode(int64_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -713,7 +709,6 @@ int signed_message63_pack(
     uint8_t *dst_p,
     const struct signed_message63_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message63.
  *
@@ -735,7 +730,7 @@ int signed_message63_unpack(
  *
  * @return Encoded signal.
  */
-int64_t signed_message63_s63_encode(double value);
+int64_t signed_message63_s63_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -744,7 +739,7 @@ int64_t signed_message63_s63_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message63_s63_decode(int64_t value);
+float signed_message63_s63_decode(int64_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -768,7 +763,6 @@ int signed_message32big_pack(
     uint8_t *dst_p,
     const struct signed_message32big_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message32big.
  *
@@ -790,7 +784,7 @@ int signed_message32big_unpack(
  *
  * @return Encoded signal.
  */
-int32_t signed_message32big_s32big_encode(double value);
+int32_t signed_message32big_s32big_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -799,7 +793,7 @@ int32_t signed_message32big_s32big_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message32big_s32big_decode(int32_t value);
+float signed_message32big_s32big_decode(int32_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -823,7 +817,6 @@ int signed_message33big_pack(
     uint8_t *dst_p,
     const struct signed_message33big_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message33big.
  *
@@ -845,7 +838,7 @@ int signed_message33big_unpack(
  *
  * @return Encoded signal.
  */
-int64_t signed_message33big_s33big_encode(double value);
+int64_t signed_message33big_s33big_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -854,7 +847,7 @@ int64_t signed_message33big_s33big_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message33big_s33big_decode(int64_t value);
+float signed_message33big_s33big_decode(int64_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -878,7 +871,6 @@ int signed_message64big_pack(
     uint8_t *dst_p,
     const struct signed_message64big_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message64big.
  *
@@ -900,7 +892,7 @@ int signed_message64big_unpack(
  *
  * @return Encoded signal.
  */
-int64_t signed_message64big_s64big_encode(double value);
+int64_t signed_message64big_s64big_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -909,7 +901,7 @@ int64_t signed_message64big_s64big_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message64big_s64big_decode(int64_t value);
+float signed_message64big_s64big_decode(int64_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -933,7 +925,6 @@ int signed_message64_pack(
     uint8_t *dst_p,
     const struct signed_message64_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message64.
  *
@@ -955,7 +946,7 @@ int signed_message64_unpack(
  *
  * @return Encoded signal.
  */
-int64_t signed_message64_s64_encode(double value);
+int64_t signed_message64_s64_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -964,7 +955,7 @@ int64_t signed_message64_s64_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message64_s64_decode(int64_t value);
+float signed_message64_s64_decode(int64_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -988,7 +979,6 @@ int signed_message33_pack(
     uint8_t *dst_p,
     const struct signed_message33_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message33.
  *
@@ -1010,7 +1000,7 @@ int signed_message33_unpack(
  *
  * @return Encoded signal.
  */
-int64_t signed_message33_s33_encode(double value);
+int64_t signed_message33_s33_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1019,7 +1009,7 @@ int64_t signed_message33_s33_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message33_s33_decode(int64_t value);
+float signed_message33_s33_decode(int64_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1043,7 +1033,6 @@ int signed_message32_pack(
     uint8_t *dst_p,
     const struct signed_message32_t *src_p,
     size_t size);
-
 /**
  * Unpack message Message32.
  *
@@ -1065,7 +1054,7 @@ int signed_message32_unpack(
  *
  * @return Encoded signal.
  */
-int32_t signed_message32_s32_encode(double value);
+int32_t signed_message32_s32_encode(float value);
 
 /**
  * Decode given signal by applying scaling and offset.
@@ -1074,7 +1063,7 @@ int32_t signed_message32_s32_encode(double value);
  *
  * @return Decoded signal.
  */
-double signed_message32_s32_decode(int32_t value);
+float signed_message32_s32_decode(int32_t value);
 
 /**
  * Check that given signal is in allowed range.
@@ -1085,6 +1074,69 @@ double signed_message32_s32_decode(int32_t value);
  */
 bool signed_message32_s32_is_in_range(int32_t value);
 
+/**
+ * Frame id, length, extended flag and cycle time of a message. The
+ * cycle time is zero(0) if not given in the database.
+ */
+struct signed_message_descriptor_t {
+    uint32_t frame_id;
+    uint8_t length;
+    bool is_extended;
+    uint32_t cycle_time_ms;
+};
+
+/**
+ * Storage for any message in the database.
+ */
+union signed_message_t {
+    struct signed_message378910_t message378910;
+    struct signed_message63big_1_t message63big_1;
+    struct signed_message63_1_t message63_1;
+    struct signed_message63big_t message63big;
+    struct signed_message63_t message63;
+    struct signed_message32big_t message32big;
+    struct signed_message33big_t message33big;
+    struct signed_message64big_t message64big;
+    struct signed_message64_t message64;
+    struct signed_message33_t message33;
+    struct signed_message32_t message32;
+};
+
+/* Number of messages in the database. */
+#define SIGNED_MESSAGES_LENGTH (11u)
+
+/**
+ * Message descriptors sorted by frame id.
+ */
+extern const struct signed_message_descriptor_t
+signed_message_descriptors[SIGNED_MESSAGES_LENGTH];
+
+/**
+ * Find the descriptor of the message with given frame id using a
+ * binary search in the descriptors table.
+ *
+ * @param[in] frame_id Frame id of the message.
+ *
+ * @return Message descriptor, or NULL if not found.
+ */
+const struct signed_message_descriptor_t *
+signed_message_descriptor_by_frame_id(uint32_t frame_id);
+
+/**
+ * Unpack the message with given frame id.
+ *
+ * @param[in] frame_id Frame id of the message.
+ * @param[out] dst_p Object to unpack the message into.
+ * @param[in] src_p Message to unpack.
+ * @param[in] size Size of src_p.
+ *
+ * @return zero(0) or negative error code.
+ */
+int signed_unpack_by_frame_id(
+    uint32_t frame_id,
+    union signed_message_t *dst_p,
+    const uint8_t *src_p,
+    size_t size);
 
 #ifdef __cplusplus
 }
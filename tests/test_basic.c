@@ -15,6 +15,7 @@
 #include <stdio.h>
 #include <stdint.h>
 #include <string.h>
+#include <errno.h>
 #include <math.h>
 #include "nala.h"
 
@@ -31,15 +32,15 @@ TEST(motohawk_example_message)
     } datas[3] = {
         {
             .unpacked = {
-                .temperature = 55,
-                .average_radius = 32,
+                .temperature = 250.55f,
+                .average_radius = 3.2f,
                 .enable = 1
             },
             .packed = "\xc0\x06\xe0\x00\x00\x00\x00\x00"
         },
         {
             .unpacked = {
-                .temperature = -2047,
+                .temperature = 229.53f,
                 .average_radius = 0,
                 .enable = 0
             },
@@ -47,7 +48,7 @@ TEST(motohawk_example_message)
         },
         {
             .unpacked = {
-                .temperature = -2048,
+                .temperature = 229.5199f,
                 .average_radius = 0,
                 .enable = 0
             },
@@ -68,16 +69,21 @@ TEST(motohawk_example_message)
         ASSERT_EQ(motohawk_example_message_unpack(&unpacked,
                                                   &buf[0],
                                                   sizeof(buf)), 0);
-        ASSERT_TRUE(unpacked.temperature == datas[i].unpacked.temperature);
-        ASSERT_TRUE(unpacked.average_radius == datas[i].unpacked.average_radius);
+        /* Scaled values are truncated to a multiple of the scale. */
+        ASSERT_TRUE(fabsf(unpacked.temperature
+                          - datas[i].unpacked.temperature) < 0.005f);
+        ASSERT_TRUE(fabsf(unpacked.average_radius
+                          - datas[i].unpacked.average_radius) < 0.05f);
         ASSERT_TRUE(unpacked.enable == datas[i].unpacked.enable);
 
         ASSERT_TRUE(motohawk_example_message_enable_is_in_range(
                    unpacked.enable));
         ASSERT_TRUE(motohawk_example_message_average_radius_is_in_range(
-                        unpacked.average_radius));
+                        motohawk_example_message_average_radius_encode(
+                            unpacked.average_radius)));
         ASSERT_TRUE(motohawk_example_message_temperature_is_in_range(
-                        unpacked.temperature));
+                        motohawk_example_message_temperature_encode(
+                            unpacked.temperature)));
     }
 }
 
@@ -636,3 +642,87 @@ TEST(unpack_does_not_modify_other_mux_signals)
     ASSERT_EQ(unpacked.bit_k, 1);
     ASSERT_EQ(unpacked.bit_l, 0);
 }
+
+TEST(unpack_by_frame_id)
+{
+    union padding_bit_order_message_t message;
+    union motohawk_message_t motohawk_message;
+    const uint8_t packed[] = "\x82\xc9\x00\x00\x02\xc9\x00\x00";
+
+    /* Known frame ids are unpacked into their union member. */
+    memset(&message, 0, sizeof(message));
+    ASSERT_EQ(padding_bit_order_unpack_by_frame_id(
+                  PADDING_BIT_ORDER_MSG0_FRAME_ID,
+                  &message,
+                  &packed[0],
+                  8), 0);
+    ASSERT_EQ(message.msg0.a, 0x2c9);
+    ASSERT_EQ(message.msg0.b, 1);
+    ASSERT_EQ(message.msg0.c, 0x2c9);
+    ASSERT_EQ(message.msg0.d, 0);
+
+    memset(&motohawk_message, 0, sizeof(motohawk_message));
+    ASSERT_EQ(motohawk_unpack_by_frame_id(
+                  MOTOHAWK_EXAMPLE_MESSAGE_FRAME_ID,
+                  &motohawk_message,
+                  (const uint8_t *)"\xc0\x06\xe0\x00\x00\x00\x00\x00",
+                  8), 0);
+    ASSERT_EQ(motohawk_message.example_message.enable, 1);
+    ASSERT_TRUE(fabsf(motohawk_message.example_message.temperature
+                      - 250.55f) < 0.005f);
+
+    /* Errors of the message unpack function are returned. */
+    ASSERT_EQ(padding_bit_order_unpack_by_frame_id(
+                  PADDING_BIT_ORDER_MSG0_FRAME_ID,
+                  &message,
+                  &packed[0],
+                  7), -EINVAL);
+
+    /* Unknown frame ids. */
+    ASSERT_EQ(padding_bit_order_unpack_by_frame_id(0,
+                                                   &message,
+                                                   &packed[0],
+                                                   8), -EINVAL);
+    ASSERT_EQ(padding_bit_order_unpack_by_frame_id(6,
+                                                   &message,
+                                                   &packed[0],
+                                                   8), -EINVAL);
+    ASSERT_EQ(motohawk_unpack_by_frame_id(0x1f1,
+                                          &motohawk_message,
+                                          &packed[0],
+                                          8), -EINVAL);
+}
+
+TEST(message_descriptor_by_frame_id)
+{
+    const struct abs_message_descriptor_t *descriptor_p;
+    size_t i;
+
+    /* All messages are found. */
+    for (i = 0; i < ABS_MESSAGES_LENGTH; i++) {
+        descriptor_p = abs_message_descriptor_by_frame_id(
+            abs_message_descriptors[i].frame_id);
+        ASSERT_TRUE(descriptor_p == &abs_message_descriptors[i]);
+    }
+
+    descriptor_p = abs_message_descriptor_by_frame_id(ABS_BREMSE_2_FRAME_ID);
+    ASSERT_TRUE(descriptor_p != NULL);
+    ASSERT_EQ(descriptor_p->frame_id, ABS_BREMSE_2_FRAME_ID);
+    ASSERT_EQ(descriptor_p->length, 8);
+    ASSERT_FALSE(descriptor_p->is_extended);
+    ASSERT_EQ(descriptor_p->cycle_time_ms, 10);
+
+    /* Frame ids below, between and above the known frame ids. */
+    ASSERT_TRUE(abs_message_descriptor_by_frame_id(0) == NULL);
+    ASSERT_TRUE(abs_message_descriptor_by_frame_id(0x71) == NULL);
+    ASSERT_TRUE(abs_message_descriptor_by_frame_id(0x24b) == NULL);
+    ASSERT_TRUE(abs_message_descriptor_by_frame_id(0x5c1) == NULL);
+    ASSERT_TRUE(abs_message_descriptor_by_frame_id(0xffffffff) == NULL);
+
+    /* Single message. */
+    ASSERT_TRUE(motohawk_message_descriptor_by_frame_id(
+                    MOTOHAWK_EXAMPLE_MESSAGE_FRAME_ID)
+                == &motohawk_message_descriptors[0]);
+    ASSERT_TRUE(motohawk_message_descriptor_by_frame_id(0x1ef) == NULL);
+    ASSERT_TRUE(motohawk_message_descriptor_by_frame_id(0x1f1) == NULL);
+}
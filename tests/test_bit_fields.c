@@ -22,15 +22,15 @@ TEST(motohawk_bit_fields_example_message)
     } datas[3] = {
         {
             .unpacked = {
-                .temperature = 55,
-                .average_radius = 32,
+                .temperature = 250.55f,
+                .average_radius = 3.2f,
                 .enable = 1
             },
             .packed = "\xc0\x06\xe0\x00\x00\x00\x00\x00"
         },
         {
             .unpacked = {
-                .temperature = -2047,
+                .temperature = 229.53f,
                 .average_radius = 0,
                 .enable = 0
             },
@@ -38,7 +38,7 @@ TEST(motohawk_bit_fields_example_message)
         },
         {
             .unpacked = {
-                .temperature = -2048,
+                .temperature = 229.5199f,
                 .average_radius = 0,
                 .enable = 0
             },
@@ -59,16 +59,21 @@ TEST(motohawk_bit_fields_example_message)
         ASSERT_EQ(motohawk_bit_fields_example_message_unpack(&unpacked,
                                                              &buf[0],
                                                              sizeof(buf)), 0);
-        ASSERT_TRUE(unpacked.temperature == datas[i].unpacked.temperature);
-        ASSERT_TRUE(unpacked.average_radius == datas[i].unpacked.average_radius);
+        /* Scaled values are truncated to a multiple of the scale. */
+        ASSERT_TRUE(fabsf(unpacked.temperature
+                          - datas[i].unpacked.temperature) < 0.005f);
+        ASSERT_TRUE(fabsf(unpacked.average_radius
+                          - datas[i].unpacked.average_radius) < 0.05f);
         ASSERT_TRUE(unpacked.enable == datas[i].unpacked.enable);
 
         ASSERT_TRUE(motohawk_bit_fields_example_message_enable_is_in_range(
                         unpacked.enable));
         ASSERT_TRUE(motohawk_bit_fields_example_message_average_radius_is_in_range(
-                        unpacked.average_radius));
+                        motohawk_bit_fields_example_message_average_radius_encode(
+                            unpacked.average_radius)));
         ASSERT_TRUE(motohawk_bit_fields_example_message_temperature_is_in_range(
-                        unpacked.temperature));
+                        motohawk_bit_fields_example_message_temperature_encode(
+                            unpacked.temperature)));
     }
 }
 
@@ -302,8 +307,8 @@ TEST(is_in_range)
 
 TEST(sizeof_types)
 {
-    ASSERT_EQ(sizeof(struct motohawk_example_message_t), 4);
-    ASSERT_EQ(sizeof(struct motohawk_bit_fields_example_message_t), 3);
+    ASSERT_EQ(sizeof(struct motohawk_example_message_t), 9);
+    ASSERT_EQ(sizeof(struct motohawk_bit_fields_example_message_t), 9);
 
     ASSERT_EQ(sizeof(struct floating_point_message1_t), 8);
     ASSERT_EQ(sizeof(struct floating_point_bit_fields_message1_t), 8);
@@ -1,7 +1,7 @@
 import sys
 import os
 import re
-import shutil
+import tempfile
 import unittest
 
 try:
@@ -15,6 +15,7 @@ except ImportError:
     from io import StringIO
 
 import cantools
+from cantools.subparsers import decode
 
 
 def remove_date_time(string):
@@ -89,6 +90,93 @@ IO_DEBUG(
                     actual_output = stdout.getvalue()
                     self.assertEqual(actual_output, expected_output)
 
+    def test_decode_jobs(self):
+        argv = [
+            'cantools',
+            'decode',
+            '--jobs', '2',
+            'tests/files/dbc/socialledge.dbc'
+        ]
+        input_lines = [
+            'garbage',
+            '  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00',
+            '  vcan0  1F3   [3]  01 02 03',
+            '  vcan0  064   [8]  F0 01 FF FF FF FF FF FF',
+            '  vcan0  1F4   [4]  01 02 03 04',
+            '  vcan0  1F4   [3]  01 02 03'
+        ]
+        expected_lines = [
+            'garbage',
+            '  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00 :: SENSOR_SONARS('
+            'SENSOR_SONARS_mux: 0, SENSOR_SONARS_err_count: 15, '
+            'SENSOR_SONARS_left: 0.0, SENSOR_SONARS_middle: 0.0, '
+            'SENSOR_SONARS_right: 0.0, SENSOR_SONARS_rear: 0.0)',
+            '  vcan0  1F3   [3]  01 02 03 :: Unknown frame id 499 (0x1f3)',
+            '  vcan0  064   [8]  F0 01 FF FF FF FF FF FF :: '
+            'DRIVER_HEARTBEAT(DRIVER_HEARTBEAT_cmd: 240)',
+            '  vcan0  1F4   [4]  01 02 03 04 :: IO_DEBUG('
+            'IO_DEBUG_test_unsigned: 1, '
+            "IO_DEBUG_test_enum: 'IO_DEBUG_test2_enum_two', "
+            'IO_DEBUG_test_signed: 3, IO_DEBUG_test_float: 2.0)',
+            '  vcan0  1F4   [3]  01 02 03 :: Short data.'
+        ]
+        input_data = 2000 * (input_lines[1:] + input_lines[:1])
+        expected_output = 2000 * (expected_lines[1:] + expected_lines[:1])
+        input_data = '\n'.join(input_lines[:1] + input_data) + '\n'
+        expected_output = '\n'.join(expected_lines[:1] + expected_output) + '\n'
+
+        with patch('cantools.subparsers.decode.BLOCK_SIZE', 4096):
+            # Frames are decoded in batches if numpy is installed.
+            for jobs, numpy in [('1', decode.numpy),
+                                ('2', decode.numpy),
+                                ('1', None)]:
+                argv[3] = jobs
+                stdout = StringIO()
+
+                with patch('cantools.subparsers.decode.numpy', numpy):
+                    with patch('sys.stdin', StringIO(input_data)):
+                        with patch('sys.stdout', stdout):
+                            with patch('sys.argv', argv + ['--single-line']):
+                                cantools._main()
+                                actual_output = stdout.getvalue()
+                                self.assertEqual(actual_output,
+                                                 expected_output)
+
+    def test_decode_jobs_partial_block(self):
+        # Available lines are handed over without waiting for a full
+        # block or the end of the input.
+        read_fd, write_fd = os.pipe()
+
+        with os.fdopen(read_fd, 'r') as stream:
+            os.write(write_fd, b'  vcan0  064   [8]  F0 01 FF FF FF FF FF FF\n'
+                               b'  vcan0  1F3   [3]  01')
+            blocks = decode._read_blocks(stream)
+            lines, pattern = next(blocks)
+            self.assertEqual(lines,
+                             ['  vcan0  064   [8]  F0 01 FF FF FF FF FF FF\n'])
+            self.assertIsNotNone(pattern)
+
+            os.write(write_fd, b' 02 03\n')
+            os.close(write_fd)
+            self.assertEqual(next(blocks)[0], ['  vcan0  1F3   [3]  01 02 03\n'])
+
+            with self.assertRaises(StopIteration):
+                next(blocks)
+
+    def test_decode_buffered_input(self):
+        # Lines already buffered by earlier reads of the stream are not
+        # lost.
+        read_fd, write_fd = os.pipe()
+
+        with os.fdopen(read_fd, 'r') as stream:
+            os.write(write_fd, b'  vcan0  064   [8]  F0 01 FF FF FF FF FF FF\n'
+                               b'  vcan0  1F3   [3]  01 02 03\n')
+            os.close(write_fd)
+            self.assertEqual(stream.buffer.readline(),
+                             b'  vcan0  064   [8]  F0 01 FF FF FF FF FF FF\n')
+            self.assertEqual(list(decode._read_blocks(stream))[0][0],
+                             ['  vcan0  1F3   [3]  01 02 03\n'])
+
     def test_decode_timestamp_absolute(self):
         argv = ['cantools', 'decode', 'tests/files/dbc/socialledge.dbc']
         input_data = """\
@@ -1155,41 +1243,40 @@ BATTERY_VT(
                 self.assertEqual(actual_output, expected_output)
 
     def test_convert(self):
-        # DBC to KCD.
-        argv = [
-            'cantools',
-            'convert',
-            'tests/files/dbc/motohawk.dbc',
-            'test_command_line_convert.kcd'
-        ]
-
-        if os.path.exists('test_command_line_convert.kcd'):
-            os.remove('test_command_line_convert.kcd')
-
-        with patch('sys.argv', argv):
-            cantools._main()
+        with tempfile.TemporaryDirectory() as output_directory:
+            # DBC to KCD.
+            kcd_filename = os.path.join(output_directory,
+                                        'test_command_line_convert.kcd')
+            argv = [
+                'cantools',
+                'convert',
+                'tests/files/dbc/motohawk.dbc',
+                kcd_filename
+            ]
 
-        db = cantools.database.Database()
-        db.add_kcd_file('test_command_line_convert.kcd')
-        self.assertEqual(db.version, '1.0')
+            with patch('sys.argv', argv):
+                cantools._main()
 
-        # KCD to DBC.
-        argv = [
-            'cantools',
-            'convert',
-            'test_command_line_convert.kcd',
-            'test_command_line_convert.dbc'
-        ]
+            db = cantools.database.Database()
+            db.add_kcd_file(kcd_filename)
+            self.assertEqual(db.version, '1.0')
 
-        if os.path.exists('test_command_line_convert.dbc'):
-            os.remove('test_command_line_convert.dbc')
+            # KCD to DBC.
+            dbc_filename = os.path.join(output_directory,
+                                        'test_command_line_convert.dbc')
+            argv = [
+                'cantools',
+                'convert',
+                kcd_filename,
+                dbc_filename
+            ]
 
-        with patch('sys.argv', argv):
-            cantools._main()
+            with patch('sys.argv', argv):
+                cantools._main()
 
-        db = cantools.database.Database()
-        db.add_dbc_file('test_command_line_convert.dbc')
-        self.assertEqual(db.version, '1.0')
+            db = cantools.database.Database()
+            db.add_dbc_file(dbc_filename)
+            self.assertEqual(db.version, '1.0')
 
     def test_convert_bad_outfile(self):
         argv = [
@@ -1228,40 +1315,25 @@ BATTERY_VT(
             else:
                 basename = database
 
-            argv = [
-                'cantools',
-                'generate_c_source',
-                'tests/files/dbc/{}.dbc'.format(database)
-            ]
-
-            database_h = basename + '.h'
-            database_c = basename + '.c'
-            fuzzer_c = basename + '_fuzzer.c'
-            fuzzer_mk = basename + '_fuzzer.mk'
-
-            if os.path.exists(database_h):
-                os.remove(database_h)
-
-            if os.path.exists(database_c):
-                os.remove(database_c)
-
-            if os.path.exists(fuzzer_c):
-                os.remove(fuzzer_c)
-
-            if os.path.exists(fuzzer_mk):
-                os.remove(fuzzer_mk)
-
-            with patch('sys.argv', argv):
-                cantools._main()
+            with tempfile.TemporaryDirectory() as output_directory:
+                argv = [
+                    'cantools',
+                    'generate_c_source',
+                    '--output-directory', output_directory,
+                    'tests/files/dbc/{}.dbc'.format(database)
+                ]
 
-            if sys.version_info[0] > 2:
-                self.assert_files_equal(database_h,
-                                        'tests/files/c_source/' + database_h)
-                self.assert_files_equal(database_c,
-                                        'tests/files/c_source/' + database_c)
+                with patch('sys.argv', argv):
+                    cantools._main()
 
-            self.assertFalse(os.path.exists(fuzzer_c))
-            self.assertFalse(os.path.exists(fuzzer_mk))
+                self.assert_files_equal(
+                    os.path.join(output_directory, basename + '.h'),
+                    'tests/files/c_source/' + basename + '.h')
+                self.assert_files_equal(
+                    os.path.join(output_directory, basename + '.c'),
+                    'tests/files/c_source/' + basename + '.c')
+                self.assertEqual(sorted(os.listdir(output_directory)),
+                                 [basename + '.c', basename + '.h'])
 
     def test_generate_c_source_no_signal_encode_decode(self):
         databases = [
@@ -1269,34 +1341,26 @@ BATTERY_VT(
         ]
 
         for database in databases:
-            argv = [
-                'cantools',
-                'generate_c_source',
-                '--no-floating-point-numbers',
-                'tests/files/dbc/{}.dbc'.format(database)
-            ]
-
-            database_h = database + '.h'
-            database_c = database + '.c'
-            expected_database_h = database + '_no_floating_point_numbers.h'
-            expected_database_c = database + '_no_floating_point_numbers.c'
-
-            if os.path.exists(database_h):
-                os.remove(database_h)
+            with tempfile.TemporaryDirectory() as output_directory:
+                argv = [
+                    'cantools',
+                    'generate_c_source',
+                    '--no-floating-point-numbers',
+                    '--output-directory', output_directory,
+                    'tests/files/dbc/{}.dbc'.format(database)
+                ]
 
-            if os.path.exists(database_c):
-                os.remove(database_c)
-
-            with patch('sys.argv', argv):
-                cantools._main()
+                with patch('sys.argv', argv):
+                    cantools._main()
 
-            if sys.version_info[0] > 2:
                 self.assert_files_equal(
-                    database_h,
-                    'tests/files/c_source/' + expected_database_h)
+                    os.path.join(output_directory, database + '.h'),
+                    'tests/files/c_source/'
+                    + database + '_no_floating_point_numbers.h')
                 self.assert_files_equal(
-                    database_c,
-                    'tests/files/c_source/' + expected_database_c)
+                    os.path.join(output_directory, database + '.c'),
+                    'tests/files/c_source/'
+                    + database + '_no_floating_point_numbers.c')
 
     def test_generate_c_source_database_name(self):
         databases = [
@@ -1304,127 +1368,300 @@ BATTERY_VT(
         ]
 
         for database in databases:
+            with tempfile.TemporaryDirectory() as output_directory:
+                argv = [
+                    'cantools',
+                    'generate_c_source',
+                    '--database-name', 'my_database_name',
+                    '--output-directory', output_directory,
+                    'tests/files/dbc/{}.dbc'.format(database)
+                ]
+
+                with patch('sys.argv', argv):
+                    cantools._main()
+
+                for filename in ['my_database_name.h', 'my_database_name.c']:
+                    self.assert_files_equal(
+                        os.path.join(output_directory, filename),
+                        'tests/files/c_source/' + filename)
+
+    def test_generate_c_source_output_directory(self):
+        database = 'motohawk'
+
+        with tempfile.TemporaryDirectory() as tmp_directory:
+            # The output directory is created if missing.
+            output_directory = os.path.join(tmp_directory, 'some_dir')
+
             argv = [
                 'cantools',
                 'generate_c_source',
-                '--database-name', 'my_database_name',
+                '--output-directory', output_directory,
                 'tests/files/dbc/{}.dbc'.format(database)
             ]
 
-            database_h = 'my_database_name.h'
-            database_c = 'my_database_name.c'
-
-            if os.path.exists(database_h):
-                os.remove(database_h)
-
-            if os.path.exists(database_c):
-                os.remove(database_c)
-
             with patch('sys.argv', argv):
                 cantools._main()
 
-            if sys.version_info[0] > 2:
-                self.assert_files_equal(database_h,
-                                        'tests/files/c_source/' + database_h)
-                self.assert_files_equal(database_c,
-                                        'tests/files/c_source/' + database_c)
+            for filename in [f'{database}.h', f'{database}.c']:
+                self.assert_files_equal(os.path.join(output_directory, filename),
+                                        'tests/files/c_source/' + filename)
 
-    def test_generate_c_source_output_directory(self):
-        database = 'motohawk'
-        
-        output_directory = 'some_dir'
-
-        argv = [
-            'cantools',
-            'generate_c_source',
-            '--output-directory', output_directory,
-            'tests/files/dbc/{}.dbc'.format(database)
-        ]
+    def generate_qt_source(self, *options):
+        """Generate Qt source code of tests/files/dbc/qt.dbc with given
+        options and return the header and source.
 
-        database_h = os.path.join(output_directory, f'{database}.h')
-        database_c = os.path.join(output_directory, f'{database}.c')
+        """
 
-        shutil.rmtree(output_directory, ignore_errors=True)
+        with tempfile.TemporaryDirectory() as output_directory:
+            argv = [
+                'cantools',
+                'generate_qt_source',
+                '--signals', '',
+                '--output-directory', output_directory,
+                *options,
+                'tests/files/dbc/qt.dbc'
+            ]
 
-        with patch('sys.argv', argv):
-            cantools._main()
+            with patch('sys.argv', argv):
+                with patch('sys.stdout', StringIO()):
+                    cantools._main()
 
-        self.assert_files_equal(database_h,
-                                'tests/files/c_source/' + os.path.basename(database_h))
-        self.assert_files_equal(database_c,
-                                'tests/files/c_source/' + os.path.basename(database_c))
+            return (read_file(os.path.join(output_directory, 'qt_qt.h')),
+                    read_file(os.path.join(output_directory, 'qt_qt.cpp')))
+
+    def test_generate_qt_source(self):
+        header, source = self.generate_qt_source()
+
+        # Received frames are dispatched with a switch on the frame id,
+        # with sorted cases, to final message classes.
+        self.assertIn(
+            '    switch (offset + frame.frameId()) {\n'
+            '    case 0x100:\n'
+            '        m_message_status->received(frame);\n'
+            '        break;\n'
+            '    case 0x200:\n'
+            '        m_message_command->received(frame);\n'
+            '        break;\n'
+            '    case 0x201:\n'
+            '        m_message_counter->received(frame);\n'
+            '        break;\n'
+            '    default:\n'
+            '        break;\n'
+            '    }\n',
+            source)
+        self.assertIn('class qtQtMessage_status final : public qtQtMessage',
+                      header)
+        self.assertIn('qtQtMessage_status *m_message_status;', header)
+        self.assertIn(
+            '        map[0x100] = m_message_status = new qtQtMessage_status( '
+            '0x100, false, 8, 100);',
+            header)
+        self.assertIn('void can_receive_frame_callback(const QCanBusFrame &frame);',
+                      header)
+
+    def test_generate_qt_source_for_modbus(self):
+        header, source = self.generate_qt_source('--for-modbus')
+
+        # The station address of the sending node is given to each
+        # message, and the frame id is the register address.
+        self.assertIn(
+            '    switch (offset + static_cast<uint>(frame.result().startAddress())) {\n'
+            '    case 0x100:\n'
+            '        m_message_status->received(frame);\n'
+            '        break;\n',
+            source)
+        self.assertIn(
+            '        map[0x100] = m_message_status = new qtQtMessage_status(3, '
+            '0x100, false, 8, 100);',
+            header)
+        self.assertIn(
+            '        map[0x200] = m_message_command = new qtQtMessage_command(4, '
+            '0x200, false, 2, 0);',
+            header)
+        self.assertIn('void can_receive_frame_callback(const QModbusReply &frame);',
+                      header)
+
+    def test_generate_qt_source_history(self):
+        # Only persistent signals have a history. The HistoryCapacity
+        # and HistoryDecimation attributes override the command line
+        # options.
+        for options, speed_history in [
+                ([], 'm_history(1000, 0)'),
+                (['--history-capacity', '10', '--history-decimation', '5'],
+                 'm_history(10, 5)')
+        ]:
+            header, _ = self.generate_qt_source(*options)
+
+            self.assertIn(
+                'class QVariantSignal_speed : public QVariantHistorySignalqt {\n'
+                'public:\n'
+                '    QVariantSignal_speed(qtQtMessage *p, QVariant max, '
+                'QVariant min, QVariant precision, QString unit) :\n'
+                '        QVariantHistorySignalqt(p, max, min, precision, unit),\n'
+                '        ' + speed_history + ',\n',
+                header)
+            self.assertIn(
+                '    QVariantSignal_temperature(qtQtMessage *p, QVariant max, '
+                'QVariant min, QVariant precision, QString unit) :\n'
+                '        QVariantHistorySignalqt(p, max, min, precision, unit),\n'
+                '        m_history(50, 200),\n',
+                header)
+            self.assertIn(
+                'class QVariantSignal_enabled : public QVariantSignalqt {',
+                header)
+            self.assertEqual(header.count('qtSignalHistoryBuffer<double> m_history;'),
+                             2)
+
+        # Histories store values of the signal type when floating point
+        # numbers are not used.
+        header, _ = self.generate_qt_source('--no-floating-point-numbers')
+        self.assertIn('qtSignalHistoryBuffer<int8_t> m_history;', header)
+
+        for options in [['--history-capacity', '0'],
+                        ['--history-decimation', '-1']]:
+            with self.assertRaises(SystemExit):
+                with patch('sys.stderr', StringIO()):
+                    self.generate_qt_source(*options)
+
+    def test_generate_qt_source_batch_notifications(self):
+        # The MaxNotificationRate attribute overrides the command line
+        # option.
+        header, _ = self.generate_qt_source('--batch-notifications',
+                                            '--max-notification-rate', '4')
+
+        self.assertIn('    struct qt_status_t store;\n'
+                      '    static const quint64 speed_changed = (quint64(1) << 0);\n'
+                      '    static const quint64 temperature_changed = (quint64(1) << 1);\n'
+                      '    static const quint64 enabled_changed = (quint64(1) << 2);\n',
+                      header)
+        self.assertIn('            changed |= temperature_changed;\n', header)
+        self.assertEqual(header.count('notify(changed, 50);'), 1)
+        self.assertEqual(header.count('notify(changed, 250);'), 2)
+        self.assertIn('        qint64 now = m_validity_timers.elapsed();\n', header)
+        self.assertIn('m_message_status->flush_notification(now, 50);', header)
+        self.assertIn('m_message_counter->flush_notification(now, 250);', header)
+        self.assertIn('m_message_command->flush_notification(now, 250);', header)
+
+        # Debug output is only compiled in on request.
+        for options in [[], ['--batch-notifications']]:
+            header, _ = self.generate_qt_source(*options)
+            lines = header.splitlines()
+            debug_lines = [
+                i for i, line in enumerate(lines) if 'qDebug()' in line
+            ]
 
-    def test_generate_c_source_bit_fields(self):
-        databases = [
-            'motohawk',
-            'floating_point',
-            'signed'
-        ]
+            self.assertEqual(len(debug_lines), 5)
+
+            for i in debug_lines:
+                self.assertEqual(lines[i - 1], '#ifdef QT_QT_DEBUG')
+
+        for rate in ['0', '-1', 'nan']:
+            with self.assertRaises(SystemExit):
+                with patch('sys.stderr', StringIO()):
+                    self.generate_qt_source('--max-notification-rate', rate)
+
+    def test_generate_qt_source_validity_timers(self):
+        header, _ = self.generate_qt_source()
+
+        # The wheel resolution is a quarter of the shortest cycle time,
+        # and the number of slots is the smallest power of two spanning
+        # the longest cycle time.
+        self.assertIn('    qtQtValidityTimers() : m_slots(64), m_time(0) {\n',
+                      header)
+        self.assertIn('        qint64 first = (now / 25 - 64) * 25;\n', header)
+        self.assertIn('            m_due.swap(m_slots[(m_time / 25) % 64]);\n',
+                      header)
+        self.assertIn('        m_slots[tick % 64].append(message);\n', header)
+        self.assertEqual(header.count('        if (m_cycle_time > 0) {\n'
+                                      '            restart_validity_timer();\n'
+                                      '        }\n'),
+                         3)
+        self.assertIn('        m_validity_timers.advance();\n', header)
+        self.assertNotIn('check_exipiration_timestamp', header)
+
+    def test_generate_c_source_unpack_by_frame_id(self):
+        database = 'motohawk'
 
-        for database in databases:
+        with tempfile.TemporaryDirectory() as output_directory:
             argv = [
                 'cantools',
                 'generate_c_source',
-                '--bit-fields',
-                '--database-name', '{}_bit_fields'.format(database),
+                '--output-directory', output_directory,
                 'tests/files/dbc/{}.dbc'.format(database)
             ]
 
-            database_h = database + '_bit_fields.h'
-            database_c = database + '_bit_fields.c'
-
-            if os.path.exists(database_h):
-                os.remove(database_h)
-
-            if os.path.exists(database_c):
-                os.remove(database_c)
-
             with patch('sys.argv', argv):
                 cantools._main()
 
-            if sys.version_info[0] > 2:
-                self.assert_files_equal(database_h,
-                                        'tests/files/c_source/' + database_h)
-                self.assert_files_equal(database_c,
-                                        'tests/files/c_source/' + database_c)
+            header = read_file(os.path.join(output_directory, f'{database}.h'))
+            source = read_file(os.path.join(output_directory, f'{database}.c'))
+
+        self.assertIn('union motohawk_message_t {\n'
+                      '    struct motohawk_example_message_t example_message;\n'
+                      '};',
+                      header)
+        self.assertIn('#define MOTOHAWK_MESSAGES_LENGTH (1u)', header)
+        self.assertIn('int motohawk_unpack_by_frame_id(\n'
+                      '    uint32_t frame_id,\n'
+                      '    union motohawk_message_t *dst_p,\n'
+                      '    const uint8_t *src_p,\n'
+                      '    size_t size);',
+                      header)
+        self.assertIn('    { MOTOHAWK_EXAMPLE_MESSAGE_FRAME_ID, 8u, false, 0u }',
+                      source)
+        self.assertIn('    case MOTOHAWK_EXAMPLE_MESSAGE_FRAME_ID:\n'
+                      '        return (motohawk_example_message_unpack(\n'
+                      '                    &dst_p->example_message,\n'
+                      '                    src_p,\n'
+                      '                    size));',
+                      source)
 
-    def test_generate_c_source_generate_fuzzer(self):
-        argv = [
-            'cantools',
-            'generate_c_source',
-            '--generate-fuzzer',
-            'tests/files/dbc/multiplex_2.dbc'
+    def test_generate_c_source_bit_fields(self):
+        databases = [
+            'motohawk',
+            'floating_point',
+            'signed'
         ]
 
-        database_h = 'multiplex_2.h'
-        database_c = 'multiplex_2.c'
-        fuzzer_c = 'multiplex_2_fuzzer.c'
-        fuzzer_mk = 'multiplex_2_fuzzer.mk'
+        for database in databases:
+            with tempfile.TemporaryDirectory() as output_directory:
+                argv = [
+                    'cantools',
+                    'generate_c_source',
+                    '--bit-fields',
+                    '--database-name', '{}_bit_fields'.format(database),
+                    '--output-directory', output_directory,
+                    'tests/files/dbc/{}.dbc'.format(database)
+                ]
 
-        if os.path.exists(database_h):
-            os.remove(database_h)
+                with patch('sys.argv', argv):
+                    cantools._main()
 
-        if os.path.exists(database_c):
-            os.remove(database_c)
+                for filename in [database + '_bit_fields.h',
+                                 database + '_bit_fields.c']:
+                    self.assert_files_equal(
+                        os.path.join(output_directory, filename),
+                        'tests/files/c_source/' + filename)
 
-        if os.path.exists(fuzzer_c):
-            os.remove(fuzzer_c)
+    def test_generate_c_source_generate_fuzzer(self):
+        with tempfile.TemporaryDirectory() as output_directory:
+            argv = [
+                'cantools',
+                'generate_c_source',
+                '--generate-fuzzer',
+                '--output-directory', output_directory,
+                'tests/files/dbc/multiplex_2.dbc'
+            ]
 
-        if os.path.exists(fuzzer_mk):
-            os.remove(fuzzer_mk)
+            with patch('sys.argv', argv):
+                cantools._main()
 
-        with patch('sys.argv', argv):
-            cantools._main()
-
-        if sys.version_info[0] > 2:
-            self.assert_files_equal(database_h,
-                                    'tests/files/c_source/' + database_h)
-            self.assert_files_equal(database_c,
-                                    'tests/files/c_source/' + database_c)
-            self.assert_files_equal(fuzzer_c,
-                                    'tests/files/c_source/' + fuzzer_c)
-            self.assert_files_equal(fuzzer_mk,
-                                    'tests/files/c_source/' + fuzzer_mk)
+            for filename in ['multiplex_2.h',
+                             'multiplex_2.c',
+                             'multiplex_2_fuzzer.c',
+                             'multiplex_2_fuzzer.mk']:
+                self.assert_files_equal(os.path.join(output_directory, filename),
+                                        'tests/files/c_source/' + filename)
 
     def test_generate_c_source_sym(self):
         databases = [
@@ -1432,46 +1669,26 @@ BATTERY_VT(
             ('letter-terminated-can-id-6.0', 'letter_terminated_can_id_6_0')
         ]
 
-        for database in databases:
-            if isinstance(database, tuple):
-                database, basename = database
-            else:
-                basename = database
-
-            argv = [
-                'cantools',
-                'generate_c_source',
-                'tests/files/sym/{}.sym'.format(database)
-            ]
-
-            database_h = basename + '.h'
-            database_c = basename + '.c'
-            fuzzer_c = basename + '_fuzzer.c'
-            fuzzer_mk = basename + '_fuzzer.mk'
-
-            if os.path.exists(database_h):
-                os.remove(database_h)
-
-            if os.path.exists(database_c):
-                os.remove(database_c)
-
-            if os.path.exists(fuzzer_c):
-                os.remove(fuzzer_c)
+        for database, basename in databases:
+            with tempfile.TemporaryDirectory() as output_directory:
+                argv = [
+                    'cantools',
+                    'generate_c_source',
+                    '--output-directory', output_directory,
+                    'tests/files/sym/{}.sym'.format(database)
+                ]
 
-            if os.path.exists(fuzzer_mk):
-                os.remove(fuzzer_mk)
-
-            with patch('sys.argv', argv):
-                cantools._main()
-
-            if sys.version_info[0] > 2:
-                self.assert_files_equal(database_h,
-                                        'tests/files/c_source/' + database_h)
-                self.assert_files_equal(database_c,
-                                        'tests/files/c_source/' + database_c)
+                with patch('sys.argv', argv):
+                    cantools._main()
 
-            self.assertFalse(os.path.exists(fuzzer_c))
-            self.assertFalse(os.path.exists(fuzzer_mk))
+                self.assert_files_equal(
+                    os.path.join(output_directory, basename + '.h'),
+                    'tests/files/c_source/' + basename + '.h')
+                self.assert_files_equal(
+                    os.path.join(output_directory, basename + '.c'),
+                    'tests/files/c_source/' + basename + '.c')
+                self.assertEqual(sorted(os.listdir(output_directory)),
+                                 [basename + '.c', basename + '.h'])
 
 
 if __name__ == '__main__':
@@ -12,6 +12,14 @@ import re
 import logging
 from xml.etree import ElementTree
 import timeit
+import pickle
+import tempfile
+import diskcache
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 try:
     from StringIO import StringIO
@@ -343,6 +351,7 @@ class CanToolsDatabaseTest(unittest.TestCase):
 
         for frame_id in frame_ids:
             db.get_message_by_frame_id(frame_id)
+            db.decode_message(frame_id, 8 * b'\x00')
 
     def test_dbc_dump_val_table(self):
         filename = 'tests/files/dbc/val_table.dbc'
@@ -815,6 +824,223 @@ class CanToolsDatabaseTest(unittest.TestCase):
         decoded = db.decode_message(frame_id, encoded)
         self.assertEqual(decoded, decoded_message)
 
+    def test_decode_generated_decoder(self):
+        """Check that the generated decode functions give the same result
+        as the generic codec tree decoder.
+
+        """
+
+        filenames = [
+            'tests/files/dbc/vehicle.dbc',
+            'tests/files/dbc/floating_point.dbc',
+            'tests/files/dbc/multiplex_choices.dbc',
+            'tests/files/dbc/issue_184_extended_mux_cascaded.dbc',
+            'tests/files/kcd/the_homer.kcd'
+        ]
+
+        for filename in filenames:
+            db = cantools.database.load_file(filename)
+
+            for message in db.messages:
+                for data in [bytes(message.length),
+                             bytes(range(message.length)),
+                             message.length * b'\xa5']:
+                    for decode_choices in [True, False]:
+                        for scaling in [True, False]:
+                            try:
+                                expected = message._decode(message._codecs,
+                                                           data,
+                                                           decode_choices,
+                                                           scaling)
+                            except cantools.database.DecodeError:
+                                with self.assertRaises(
+                                        cantools.database.DecodeError):
+                                    message.decode(data,
+                                                   decode_choices,
+                                                   scaling)
+
+                                continue
+
+                            decoded = message.decode(data,
+                                                     decode_choices,
+                                                     scaling)
+                            self.assertEqual(list(decoded), list(expected))
+
+                            for name, value in expected.items():
+                                if isinstance(value, float) and math.isnan(value):
+                                    self.assertTrue(math.isnan(decoded[name]))
+                                else:
+                                    self.assertEqual(decoded[name], value)
+                                    self.assertIs(type(decoded[name]),
+                                                  type(value))
+
+    def test_decode_after_refresh(self):
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        message = db.get_message_by_name('ExampleMessage')
+        data = b'\xc0\x06\xe0\x00\x00\x00\x00\x00'
+        self.assertEqual(message.decode(data)['AverageRadius'], 3.2)
+
+        message.get_signal_by_name('AverageRadius').scale = 1
+        message.refresh()
+        self.assertEqual(message.decode(data)['AverageRadius'], 32)
+
+    def test_decode_into(self):
+        db = cantools.database.load_file('tests/files/dbc/socialledge.dbc')
+        message = db.get_message_by_frame_id(200)
+        decoded = {}
+
+        self.assertIs(message.decode_into(bytearray(b'\x10\x00\x14\xe0'
+                                                    b'\x01( \x03\xff'),
+                                          decoded),
+                      decoded)
+        self.assertEqual(decoded,
+                         {
+                             'SENSOR_SONARS_mux': 0,
+                             'SENSOR_SONARS_err_count': 1,
+                             'SENSOR_SONARS_left': 2,
+                             'SENSOR_SONARS_middle': 3,
+                             'SENSOR_SONARS_right': 4,
+                             'SENSOR_SONARS_rear': 5
+                         })
+
+        # Signals of the previous multiplexer id are kept.
+        message.decode_into(memoryview(b'!\x00\x1e\x80\x022\xc0\x03'),
+                            decoded)
+        self.assertEqual(decoded['SENSOR_SONARS_mux'], 1)
+        self.assertEqual(decoded['SENSOR_SONARS_no_filt_rear'], 6)
+        self.assertEqual(decoded['SENSOR_SONARS_rear'], 5)
+
+        with self.assertRaises(ValueError) as cm:
+            message.decode_into(b'\x00', {})
+
+        self.assertEqual(str(cm.exception), 'Short data.')
+
+    def test_decode_signals_outside_payload(self):
+        # Signals outside the payload, or overlapping signals, are only
+        # possible in non-strict databases.
+        db = cantools.database.load_file('tests/files/kcd/message_layout.kcd',
+                                         strict=False)
+
+        for name in ['Message3', 'Message5']:
+            message = db.get_message_by_name(name)
+            data = message.length * b'\x00'
+
+            with self.assertRaises(ValueError) as cm:
+                message.decode(data)
+
+            self.assertEqual(str(cm.exception), 'Short data.')
+
+            with self.assertRaises(ValueError) as cm:
+                message.decode_into(bytearray(data), {})
+
+            self.assertEqual(str(cm.exception), 'Short data.')
+
+    def test_decode_into_signals(self):
+        db = cantools.database.load_file('tests/files/dbc/socialledge.dbc')
+        message = db.get_message_by_frame_id(200)
+
+        # Multiplexers needed to find selected signals are decoded.
+        decoded = message.decode_into(b'\x10\x00\x14\xe0\x01( \x03\xff',
+                                      {},
+                                      signals=['SENSOR_SONARS_left'])
+        self.assertEqual(decoded,
+                         {
+                             'SENSOR_SONARS_mux': 0,
+                             'SENSOR_SONARS_left': 2
+                         })
+
+        decoded = message.decode_into(b'!\x00\x1e\x80\x022\xc0\x03',
+                                      {},
+                                      signals={'SENSOR_SONARS_err_count'})
+        self.assertEqual(decoded, {'SENSOR_SONARS_err_count': 2})
+
+        decoded = message.decode_into(b'!\x00\x1e\x80\x022\xc0\x03',
+                                      {},
+                                      signals=[])
+        self.assertEqual(decoded, {})
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_decode_batch(self):
+        db = cantools.db.load_file('tests/files/dbc/motohawk.dbc')
+        message = db.get_message_by_name('ExampleMessage')
+        frames = [
+            message.encode({
+                'Temperature': 250.1 + index / 100,
+                'AverageRadius': index / 10,
+                'Enable': index % 2
+            })
+            for index in range(20)
+        ]
+
+        for data in [frames, b''.join(frames)]:
+            decoded, choices = message.decode_batch(data, return_choices=True)
+
+            self.assertEqual(sorted(decoded),
+                             ['AverageRadius', 'Enable', 'Temperature'])
+            self.assertEqual(list(choices), ['Enable'])
+
+            for index, frame in enumerate(frames):
+                expected = message.decode(frame, decode_choices=False)
+
+                for name, value in expected.items():
+                    self.assertAlmostEqual(decoded[name][index], value)
+
+                self.assertEqual(choices['Enable'][index], index % 2)
+
+        decoded = message.decode_batch(frames, scaling=False)
+        self.assertEqual(decoded['Temperature'][5],
+                         message.decode(frames[5], scaling=False)['Temperature'])
+
+        with self.assertRaises(cantools.database.DecodeError):
+            message.decode_batch(b'\x00' * 9)
+
+        with self.assertRaises(cantools.database.DecodeError):
+            message.decode_batch([b'\x00' * 7])
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_decode_batch_signals_outside_payload(self):
+        db = cantools.database.load_file('tests/files/kcd/message_layout.kcd',
+                                         strict=False)
+
+        for name in ['Message3', 'Message5']:
+            message = db.get_message_by_name(name)
+
+            with self.assertRaises(ValueError) as cm:
+                message.decode_batch([message.length * b'\x00'])
+
+            self.assertEqual(str(cm.exception), 'Short data.')
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_decode_batch_long_signals(self):
+        db = cantools.database.load_file('tests/files/kcd/message_layout.kcd',
+                                         strict=False)
+        message = db.get_message_by_name('Message7')
+
+        with self.assertRaises(cantools.database.DecodeError) as cm:
+            message.decode_batch([message.length * b'\x00'])
+
+        self.assertEqual(
+            str(cm.exception),
+            'Signal Signal1 is 128 bits, but at most 64 bits can be batch '
+            'decoded.')
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_decode_batch_multiplexed(self):
+        db = cantools.db.load_file('tests/files/dbc/socialledge.dbc')
+        message = db.get_message_by_frame_id(200)
+        frames = numpy.frombuffer(b'\x10\x00\x14\xe0\x01( \x03'
+                                  b'!\x00\x1e\x80\x022\xc0\x03',
+                                  dtype=numpy.uint8).reshape(2, 8)
+        decoded = message.decode_batch(frames)
+
+        self.assertEqual(list(decoded['SENSOR_SONARS_mux']), [0, 1])
+        self.assertEqual(list(decoded['SENSOR_SONARS_err_count']), [1, 2])
+        self.assertEqual(decoded['SENSOR_SONARS_left'][0], 2)
+        self.assertIs(decoded['SENSOR_SONARS_left'][1], numpy.ma.masked)
+        self.assertIs(decoded['SENSOR_SONARS_no_filt_rear'][0],
+                      numpy.ma.masked)
+        self.assertEqual(decoded['SENSOR_SONARS_no_filt_rear'][1], 6)
+
     def test_get_message_by_frame_id_and_name(self):
         with open('tests/files/dbc/motohawk.dbc', 'r') as fin:
             db = cantools.db.load(fin)
@@ -2416,6 +2642,35 @@ class CanToolsDatabaseTest(unittest.TestCase):
             "error: line 1, column 0\", SYM: \"Only SYM version 6.0 is "
             "supported.\", CDD: \"syntax error: line 1, column 0\"")
 
+    def test_dbc_fast_parser(self):
+        filenames = sorted(os.listdir('tests/files/dbc'))
+
+        for filename in filenames:
+            if not filename.endswith('.dbc'):
+                continue
+
+            with open(os.path.join('tests/files/dbc', filename),
+                      'r',
+                      encoding='cp1252') as fin:
+                string = fin.read()
+
+            try:
+                expected = dbc.Parser().parse(string)
+            except textparser.ParseError:
+                with self.assertRaises(dbc.FastParserError):
+                    dbc.FastParser().parse(string)
+            else:
+                self.assertEqual(dbc.FastParser().parse(string), expected,
+                                 filename)
+
+        for string in ['abc',
+                       'VERSION "1.0"\nBO_ dssd\n',
+                       'CM_ BO_ "Foo.";',
+                       'BO_ 1 M: 8 N\n SG_ S : 0|8@1+ (1,0) [0|0] "" N,\n',
+                       'BU_: N ?']:
+            with self.assertRaises(dbc.FastParserError):
+                dbc.FastParser().parse(string)
+
     def test_get_node_by_name(self):
         db = cantools.db.load_file('tests/files/kcd/the_homer.kcd')
 
@@ -2497,6 +2752,46 @@ class CanToolsDatabaseTest(unittest.TestCase):
             r"VWXYZ[\]^_`abcdefghijklmnopqrstuvwxyz{|}~"
             + replaced)
 
+    def test_load_file_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            filename = 'tests/files/dbc/motohawk.dbc'
+            db = cantools.database.load_file(filename, cache_dir=cache_dir)
+            message = db.get_message_by_name('ExampleMessage')
+            decoded = message.decode(b'\xc0\x06\xe0\x00\x00\x00\x00\x00')
+
+            # Loaded from the cache, with generated decoders not
+            # pickled.
+            cached_db = cantools.database.load_file(filename,
+                                                    cache_dir=cache_dir)
+            cached_message = cached_db.get_message_by_name('ExampleMessage')
+            self.assertIsNot(cached_db, db)
+            self.assertEqual(cached_message._decoders, {})
+            self.assertEqual(
+                cached_message.decode(b'\xc0\x06\xe0\x00\x00\x00\x00\x00'),
+                decoded)
+            self.assertEqual(str(cached_db), str(db))
+
+            # Pickle a database with generated encoders and decoders.
+            cached_db = cantools.database.load_file(
+                filename,
+                cache_dir=cache_dir,
+                cache_size_limit=1024 * 1024)
+            cached_message = cached_db.get_message_by_name('ExampleMessage')
+            self.assertEqual(cached_message._decoders, {})
+            self.assertEqual(cached_message.decode(cached_message.encode(decoded)),
+                             decoded)
+            self.assertEqual(len(pickle.loads(pickle.dumps(cached_db)).messages),
+                             1)
+
+            # Load options are part of the cache key.
+            cached_db = cantools.database.load_file(filename,
+                                                    frame_id_mask=0xff,
+                                                    cache_dir=cache_dir)
+            self.assertEqual(cached_db._frame_id_mask, 0xff)
+
+            with diskcache.Cache(cache_dir) as cache:
+                self.assertEqual(len(cache), 2)
+
     def test_performance_big_endian_signals(self):
         """Test encode/decode performance of a frame with big endian signals.
 
@@ -2544,6 +2839,131 @@ class CanToolsDatabaseTest(unittest.TestCase):
 
         print("Decode time: {} s ({} s/decode)".format(time, time / iterations))
 
+    def test_performance_encode_decode_generated(self):
+        """Compare encode/decode performance of the generated encoder and
+        decoder with the generic codec tree implementation.
+
+        """
+
+        iterations = 10000
+
+        db = cantools.database.load_file('tests/files/dbc/vehicle.dbc')
+        message = db.get_message_by_name('RT_SB_INS_Vel_Body_Axes')
+        encoded = b'\x00\x01\x02\x03\x04\x05\x06\x07'
+        decoded = message.decode(encoded)
+        self.assertEqual(message.encode(decoded), encoded)
+
+        def encode():
+            message.encode(decoded)
+
+        def encode_generic():
+            message._encode(message._codecs, decoded, True, True)
+
+        def decode():
+            message.decode(encoded)
+
+        def decode_generic():
+            message._decode(message._codecs, encoded, True, True)
+
+        print()
+
+        for kind, function in [('Encode', encode),
+                               ('Generic encode', encode_generic),
+                               ('Decode', decode),
+                               ('Generic decode', decode_generic)]:
+            time = timeit.timeit(function, number=iterations)
+            print("{} time: {} s ({} s/frame)".format(kind,
+                                                     time,
+                                                     time / iterations))
+
+    def test_encode_generated_encoder_exact_scaling(self):
+        """Values that are not exactly representable after scaling are
+        rounded as by the generic Decimal encoder.
+
+        """
+
+        signals = [
+            cantools.db.Signal('S0', 0, 16, scale=0.1, offset=-40.0),
+            cantools.db.Signal('S1', 16, 16, is_signed=True, scale=3, offset=1),
+            cantools.db.Signal('S2', 32, 32, is_float=True, scale=0.5)
+        ]
+        message = cantools.db.Message(frame_id=1,
+                                      name='M0',
+                                      length=8,
+                                      signals=signals)
+
+        for data in [{'S0': 3.2, 'S1': -7, 'S2': 1.5},
+                     {'S0': -39.95, 'S1': 2, 'S2': -1},
+                     {'S0': 12, 'S1': 0.5, 'S2': 0.1},
+                     {'S0': 6513.45, 'S1': 1, 'S2': 1e38}]:
+            for scaling in [True, False]:
+                try:
+                    expected, _ = message._encode(message._codecs,
+                                                  data,
+                                                  scaling,
+                                                  False)
+                except Exception as e:
+                    with self.assertRaises(type(e)):
+                        message.encode(data, scaling, strict=False)
+                else:
+                    self.assertEqual(message.encode(data, scaling, strict=False),
+                                     expected.to_bytes(8, 'big'))
+
+    def test_encode_generated_encoder_fallback(self):
+        """Data the generated encoder cannot encode is encoded, or
+        rejected, by the generic encoder. Other errors are not hidden.
+
+        """
+
+        signals = [
+            cantools.db.Signal('S0', 0, 16, scale=0.1, offset=-40.0),
+            cantools.db.Signal('S1', 16, 32, is_float=True),
+            cantools.db.Signal('S2', 48, 16, is_float=True)
+        ]
+        message = cantools.db.Message(frame_id=1,
+                                      name='M0',
+                                      length=8,
+                                      signals=signals)
+
+        for data in [{'S0': 1, 'S1': 1e300, 'S2': 0},
+                     {'S0': 1, 'S1': 2 ** 1100, 'S2': 0},
+                     {'S0': 1, 'S1': 0, 'S2': 65519.0},
+                     {'S0': 1, 'S1': 0, 'S2': 70000},
+                     {'S0': 'Off', 'S1': 0, 'S2': 0},
+                     {'S0': 1, 'S1': 0},
+                     {'S0': 1, 'S1': None, 'S2': 0}]:
+            try:
+                expected, _ = message._encode(message._codecs,
+                                              data,
+                                              True,
+                                              False)
+            except Exception as e:
+                with self.assertRaises(type(e)):
+                    message.encode(data, strict=False)
+            else:
+                self.assertEqual(message.encode(data, strict=False),
+                                 expected.to_bytes(8, 'big'))
+
+        # Signals outside the payload are always encoded by the generic
+        # encoder.
+        db = cantools.database.load_file('tests/files/kcd/message_layout.kcd',
+                                         strict=False)
+
+        for name in ['Message3', 'Message5']:
+            message = db.get_message_by_name(name)
+            data = {signal.name: 0 for signal in message.signals}
+            self.assertIsNone(message._create_encoder(True, True))
+            self.assertEqual(message.encode(data), message.length * b'\x00')
+
+        # Unexpected errors are raised.
+        def encoder(data):
+            raise ZeroDivisionError()
+
+        message._encoders[(True, True)] = encoder
+
+        with self.assertRaises(ZeroDivisionError):
+            message.encode(data)
+
     def test_padding_one(self):
         """Test to encode a message with padding as one.
 
@@ -3224,6 +3644,59 @@ class CanToolsDatabaseTest(unittest.TestCase):
             self.assertEqual(message_1.signals[0].start, 8)
             self.assertEqual(message_1.signals[0].length, 1)
 
+    def test_lazy_load(self):
+        filenames = [
+            'tests/files/kcd/bad_message_length.kcd',
+            'tests/files/dbc/bad_message_length.dbc',
+            'tests/files/sym/bad_message_length.sym'
+        ]
+
+        for filename in filenames:
+            # Strict checks are done on first use.
+            db = cantools.database.load_file(filename, strict=True, lazy=True)
+            message_1 = db.get_message_by_frame_id(1)
+            self.assertIsNone(message_1._codecs)
+
+            with self.assertRaises(cantools.database.Error) as cm:
+                message_1.decode(b'\x00')
+
+            self.assertEqual(str(cm.exception),
+                             'The signal Signal1 does not fit in message Message1.')
+
+            with self.assertRaises(cantools.database.Error):
+                message_1.signal_tree
+
+        filenames = [
+            'tests/files/dbc/multiplex_2.dbc',
+            'tests/files/kcd/the_homer.kcd',
+            'tests/files/sym/jopp-6.0.sym',
+            'tests/files/arxml/system-4.2.arxml',
+            'tests/files/arxml/system-3.2.3.arxml',
+            'tests/files/arxml/ecu-extract-4.2.arxml'
+        ]
+
+        for filename in filenames:
+            db = cantools.database.load_file(filename)
+            lazy_db = cantools.database.load_file(filename, lazy=True)
+            self.assertEqual(len(lazy_db.messages), len(db.messages))
+
+            for message, lazy_message in zip(db.messages, lazy_db.messages):
+                self.assertIsNone(lazy_message._codecs)
+                data = bytes(range(message.length))
+
+                try:
+                    decoded = message.decode(data)
+                except Exception as e:
+                    with self.assertRaises(type(e)):
+                        lazy_message.decode(data)
+                else:
+                    self.assertEqual(lazy_message.decode(data), decoded)
+
+                self.assertIsNotNone(lazy_message._codecs)
+                self.assertEqual(lazy_message.signal_tree, message.signal_tree)
+                self.assertEqual(lazy_message.is_multiplexed(),
+                                 message.is_multiplexed())
+
     def test_database_signals_check_failure(self):
         signal = cantools.database.can.Signal('S',
                                               7,
@@ -3319,6 +3792,42 @@ class CanToolsDatabaseTest(unittest.TestCase):
         signal = db.messages[1].signals[0]
         self.assertEqual(signal.spn, None)
 
+    def test_j1939_get_message_by_frame_id(self):
+        db = cantools.database.load_file('tests/files/dbc/j1939.dbc')
+
+        # Priority, source address and, for PDU format 1, destination
+        # address are ignored.
+        frame_ids = [
+            (0x15340201, 'Message1'),
+            (0x19340201, 'Message1'),
+            (0x153402fe, 'Message1'),
+            (0x15347701, 'Message1'),
+            (0x15f01002, 'Message2'),
+            (0x0df010aa, 'Message2'),
+            (0x15f01102, None),
+            (0x15350201, None),
+            (0x14340201, None),
+            (0x123, None),
+            (0x7fffffff, None)
+        ]
+
+        for _ in range(2):
+            for frame_id, name in frame_ids:
+                message = db.find_message_by_frame_id(frame_id)
+
+                if name is None:
+                    self.assertIsNone(message)
+
+                    with self.assertRaises(KeyError):
+                        db.get_message_by_frame_id(frame_id)
+                else:
+                    self.assertEqual(message.name, name)
+                    self.assertEqual(db.get_message_by_frame_id(frame_id).name,
+                                     name)
+
+        self.assertEqual(db.decode_message(0x0df010aa, b'\x00' * 8),
+                         db.decode_message('Message2', b'\x00' * 8))
+
     def test_j1939_frame_id_pack_unpack(self):
         Data = namedtuple('Data',
                           [
@@ -4122,6 +4631,78 @@ class CanToolsDatabaseTest(unittest.TestCase):
             no_base_elem = loader._get_unique_arxml_child(loader._root, ["AR-PACKAGES", "*AR-PACKAGE"])
         self.assertEqual(str(cm.exception), "['AR-PACKAGES', '*AR-PACKAGE'] does not resolve into a unique node")
 
+    def test_system_arxml_reference_index(self):
+        root = ElementTree.parse('tests/files/arxml/system-4.2.arxml').getroot()
+        loader = cantools.db.can.formats.arxml.SystemLoader(root, strict=True)
+
+        message1 = loader._follow_arxml_reference(None,
+                                                  '/CanFrame/Message1',
+                                                  'CAN-FRAME')
+        self.assertEqual(message1.tag,
+                         '{http://autosar.org/schema/r4.2.1}CAN-FRAME')
+        self.assertIs(loader._get_arxml_reference_index()['/CanFrame/Message1'],
+                      message1)
+
+        # The destination tag must match.
+        self.assertIsNone(loader._follow_arxml_reference(None,
+                                                         '/CanFrame/Message1',
+                                                         'I-SIGNAL'))
+        self.assertIsNone(loader._follow_arxml_reference(None,
+                                                         '/CanFrame/Missing',
+                                                         'CAN-FRAME'))
+
+    def test_system_arxml_jobs(self):
+        for filename in ['tests/files/arxml/system-4.2.arxml',
+                         'tests/files/arxml/system-3.2.3.arxml']:
+            db = cantools.db.Database()
+            db.add_arxml_file(filename)
+            db_jobs = cantools.db.Database()
+            db_jobs.add_arxml_file(filename, jobs=2)
+
+            self.assertEqual([repr(message) for message in db.messages],
+                             [repr(message) for message in db_jobs.messages])
+            self.assertEqual([[repr(signal) for signal in message.signals]
+                              for message in db.messages],
+                             [[repr(signal) for signal in message.signals]
+                              for message in db_jobs.messages])
+            self.assertEqual(db.messages[0].decode(b'\x01\x02\x03\x04\x05\x06\x07\x08'[:db.messages[0].length]),
+                             db_jobs.messages[0].decode(b'\x01\x02\x03\x04\x05\x06\x07\x08'[:db.messages[0].length]))
+
+    def test_system_arxml_streaming(self):
+        for filename in ['tests/files/arxml/system-4.2.arxml',
+                         'tests/files/arxml/system-3.2.3.arxml']:
+            db = cantools.db.Database()
+            db.add_arxml_file(filename)
+            db_streaming = cantools.db.Database()
+            db_streaming.add_arxml_file(filename, streaming=True)
+
+            self.assertEqual([repr(message) for message in db.messages],
+                             [repr(message) for message in db_streaming.messages])
+            self.assertEqual([[repr(signal) for signal in message.signals]
+                              for message in db.messages],
+                             [[repr(signal) for signal in message.signals]
+                              for message in db_streaming.messages])
+            self.assertEqual([message.comments for message in db.messages],
+                             [message.comments for message in db_streaming.messages])
+
+        db = cantools.db.Database()
+
+        with self.assertRaises(ValueError) as cm:
+            db.add_arxml_file('tests/files/arxml/ecu-extract-4.2.arxml',
+                              streaming=True)
+
+        self.assertEqual(str(cm.exception),
+                         'ECU extracts cannot be loaded incrementally.')
+
+        with self.assertRaises(ValueError) as cm:
+            db.add_arxml_file(
+                'tests/files/arxml/system-dangling-reference-4.2.arxml',
+                streaming=True)
+
+        self.assertEqual(str(cm.exception),
+                         'Encountered dangling reference FRAME-REF: '
+                         '/PackageDoesNotExist/Message1')
+
     def test_system_missing_factor_arxml(self):
         with self.assertRaises(UnsupportedDatabaseFormatError) as cm:
             cantools.db.load_file(
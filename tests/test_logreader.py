@@ -1,5 +1,14 @@
 import unittest
 import io
+import os
+import datetime
+import tempfile
+from unittest.mock import patch
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 import cantools
 
@@ -220,3 +229,171 @@ class TestLogreaderStreams(unittest.TestCase):
         self.assertEqual(f3.frame_id, 0x1f4)
         f4 = next(frame_iter)
         self.assertEqual(f4.frame_id, 0x1f3)
+
+
+class TestLogreaderFiles(unittest.TestCase):
+
+    def create_file(self, contents):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        filename = os.path.join(tmpdir.name, 'candump.log')
+
+        with open(filename, 'w') as fout:
+            fout.write(contents)
+
+        return filename
+
+    def assert_same_frames(self, contents):
+        filename = self.create_file(contents)
+        expected = list(cantools.logreader.Parser(
+            io.StringIO(contents)).iterlines(keep_unknowns=True))
+
+        with cantools.logreader.Parser.from_file(filename) as parser:
+            actual = list(parser.iterlines(keep_unknowns=True))
+
+        self.assertEqual(len(actual), len(expected))
+
+        for (actual_line, actual_frame), (line, frame) in zip(actual, expected):
+            self.assertEqual(actual_line, line)
+
+            if frame is None:
+                self.assertIsNone(actual_frame)
+            else:
+                self.assertEqual(actual_frame.channel, frame.channel)
+                self.assertEqual(actual_frame.frame_id, frame.frame_id)
+                self.assertEqual(actual_frame.data, frame.data)
+                self.assertEqual(actual_frame.timestamp, frame.timestamp)
+                self.assertEqual(actual_frame.timestamp_format,
+                                 frame.timestamp_format)
+                self.assertEqual(actual_frame.seconds, frame.seconds)
+
+    def test_same_as_stream(self):
+        self.assert_same_frames("""\
+  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
+  vcan0  064   [10]  F0 01 FF FF FF FF FF FF FF FF
+  vcan0  ERROR
+
+  vcan0  1F3   [3]  01 02 03""")
+        self.assert_same_frames("""\
+ (2020-12-19 12:04:45.485261)  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
+ (2020-12-19 12:04:59.085517)  vcan0  1F3   [3]  01 02 03
+""")
+        self.assert_same_frames("""\
+ (000.000000)  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
+ (1594172462.126542)  vcan0  064   [8]  F0 01 FF FF FF FF FF FF
+""")
+        self.assert_same_frames("""\
+(1594172461.968006) vcan0 0C8#F000000000000000\r
+(1594172462.127684) vcan0 ERROR\r
+  (1613656104.493702) can2 102##1150B7F0102010010000064A0020000100000000000E41F
+""")
+        self.assert_same_frames('')
+
+    def test_chunks(self):
+        lines = [
+            f'({i}.000000) vcan0 {i:03X}#{i:04X}\n'
+            for i in range(1000)
+        ]
+
+        with patch('cantools.logreader.CHUNK_SIZE', 100):
+            self.assert_same_frames(''.join(lines))
+
+    def test_lazy_timestamp(self):
+        filename = self.create_file(
+            '(1594172461.968006) vcan0 0C8#F000000000000000\n')
+
+        with cantools.logreader.Parser.from_file(filename) as parser:
+            frame = next(iter(parser))
+
+        self.assertEqual(frame.seconds, 1594172461.968006)
+        self.assertIsNone(frame._timestamp)
+        self.assertEqual(frame.timestamp,
+                         datetime.datetime(2020, 7, 8, 1, 41, 1, 968006))
+
+    def test_seek(self):
+        filename = self.create_file(''.join([
+            'header\n',
+            '(0.100000) vcan0 001#01\n',
+            '(0.200000) vcan0 002#02\n',
+            '(0.200000) vcan0 ERROR\n',
+            '(0.300000) vcan0 003#03\n',
+            '(0.300000) vcan0 004#04\n',
+            '(0.400000) vcan0 005#05\n'
+        ]))
+
+        with cantools.logreader.Parser.from_file(filename) as parser:
+            def frame_ids():
+                return [frame.frame_id for frame in parser]
+
+            parser.seek_line(5)
+            self.assertEqual(frame_ids(), [4, 5])
+            parser.seek_line(0)
+            self.assertEqual(frame_ids(), [1, 2, 3, 4, 5])
+            parser.seek_line(100)
+            self.assertEqual(frame_ids(), [])
+
+            for seconds, expected in [(0.0, [1, 2, 3, 4, 5]),
+                                      (0.1, [1, 2, 3, 4, 5]),
+                                      (0.15, [2, 3, 4, 5]),
+                                      (0.25, [3, 4, 5]),
+                                      (0.3, [3, 4, 5]),
+                                      (0.4, [5]),
+                                      (0.5, [])]:
+                parser.seek_timestamp(seconds)
+                self.assertEqual(frame_ids(), expected)
+
+    def test_seek_stream(self):
+        parser = cantools.logreader.Parser(io.StringIO(''))
+
+        with self.assertRaises(ValueError):
+            parser.seek_line(0)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_read_table(self):
+        filename = self.create_file("""\
+(1594172461.968006) vcan0 0C8#F000000000000000
+(1594172462.127684) vcan0 ERROR
+
+(1594172462.356874) vcan1 1F4#01020304
+  (1613656104.493702) vcan0 102##1150B7F0102010010000064A0020000100000000000E41F000000000090D1FF000020A600000000210100000000000000
+""")
+
+        with patch('cantools.logreader.CHUNK_SIZE', 50):
+            table = cantools.logreader.read_table(filename)
+
+        self.assertEqual(table.timestamp.dtype, numpy.float64)
+        self.assertEqual(table.timestamp.tolist(),
+                         [1594172461.968006, 1594172462.356874, 1613656104.493702])
+        self.assertEqual(table.timestamp_format,
+                         cantools.logreader.TimestampFormat.ABSOLUTE)
+        self.assertEqual(table.channel.dtype, numpy.uint16)
+        self.assertEqual(table.channel.tolist(), [0, 1, 0])
+        self.assertEqual(table.channels, ['vcan0', 'vcan1'])
+        self.assertEqual(table.frame_id.dtype, numpy.uint32)
+        self.assertEqual(table.frame_id.tolist(), [0xc8, 0x1f4, 0x102])
+        self.assertEqual(table.dlc.dtype, numpy.uint8)
+        self.assertEqual(table.dlc.tolist(), [8, 4, 48])
+        self.assertEqual(table.data.dtype, numpy.uint8)
+        self.assertEqual(table.data.shape, (3, 64))
+        self.assertEqual(table.data[0].tobytes(), b'\xf0' + 63 * b'\x00')
+        self.assertEqual(table.data[1].tobytes(),
+                         b'\x01\x02\x03\x04' + 60 * b'\x00')
+        self.assertEqual(table.data[2, :4].tobytes(), b'\x15\x0b\x7f\x01')
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_read_table_missing_timestamps(self):
+        filename = self.create_file("""\
+  vcan0  ERROR
+  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
+""")
+        table = cantools.logreader.read_table(filename)
+
+        self.assertTrue(numpy.isnan(table.timestamp).all())
+        self.assertEqual(table.timestamp_format,
+                         cantools.logreader.TimestampFormat.MISSING)
+        self.assertEqual(table.frame_id.tolist(), [0xc8])
+
+        table = cantools.logreader.read_table(self.create_file(''))
+
+        self.assertEqual(len(table.frame_id), 0)
+        self.assertEqual(table.data.shape, (0, 64))
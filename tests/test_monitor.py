@@ -1,6 +1,7 @@
 import unittest
 import curses
 import traceback
+import time
 
 try:
     from unittest.mock import Mock
@@ -12,6 +13,7 @@ except ImportError:
     from mock import call
 
 import can
+import cantools
 from cantools.subparsers.monitor import Monitor
 
 
@@ -29,6 +31,7 @@ class Args(object):
         self.fd = False
         self.bus_type = 'socketcan'
         self.channel = 'vcan0'
+        self.refresh_rate = float('inf')
 
 
 class StdScr(object):
@@ -49,6 +52,7 @@ class StdScr(object):
 
         self.getkey = Mock(side_effect=user_input)
         self.move = Mock()
+        self.clrtoeol = Mock()
 
 
 class CanToolsMonitorTest(unittest.TestCase):
@@ -115,7 +119,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                      'Received: 0, Discarded: 0, Errors: 0'),
                 call(1,
                      0,
-                     '   TIMESTAMP  MESSAGE                                           ',
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
                      'green'),
                 call(29,
                      0,
@@ -186,13 +190,13 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
                 call(1,
                      0,
-                     '   TIMESTAMP  MESSAGE                                           ',
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
                      'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
+                call(2, 0, '       0.000             ExampleMessage('),
+                call(3, 0, "                             Enable: 'Enabled' -,"),
+                call(4, 0, '                             AverageRadius: 3.2 m,'),
+                call(5, 0, '                             Temperature: 250.55 degK'),
+                call(6, 0, '                         )'),
                 call(29,
                      0,
                      'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
@@ -235,11 +239,11 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
                 call(1,
                      0,
-                     '   TIMESTAMP  MESSAGE                                           ',
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
                      'green'),
                 call(2,
                      0,
-                     "       0.000  ExampleMessage(Enable: 'Enabled' -, "
+                     "       0.000             ExampleMessage(Enable: 'Enabled' -, "
                      "AverageRadius: 3.2 m, Temperature: 250.55 degK)"),
                 call(29,
                      0,
@@ -282,7 +286,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(0, 0, 'Received: 1, Discarded: 1, Errors: 0'),
                 call(1,
                      0,
-                     '   TIMESTAMP  MESSAGE                                           ',
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
                      'green'),
                 call(29,
                      0,
@@ -325,13 +329,13 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
                 call(1,
                      0,
-                     '   TIMESTAMP  MESSAGE                                           ',
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
                      'green'),
-                call(2, 0, '       0.000  BATTERY_VT('),
-                call(3, 0, "                  BATTERY_VT_INDEX: 0,"),
-                call(4, 0, '                  MODULE_VOLTAGE_00: 39064,'),
-                call(5, 0, '                  MODULE_TEMP_00: 11'),
-                call(6, 0, '              )'),
+                call(2, 0, '       0.000             BATTERY_VT('),
+                call(3, 0, "                             BATTERY_VT_INDEX: 0,"),
+                call(4, 0, '                             MODULE_VOLTAGE_00: 39064,'),
+                call(5, 0, '                             MODULE_TEMP_00: 11'),
+                call(6, 0, '                         )'),
                 call(29,
                      0,
                      'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
@@ -374,11 +378,11 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
                 call(1,
                      0,
-                     '   TIMESTAMP  MESSAGE                                           ',
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
                      'green'),
                 call(2,
                      0,
-                     "       0.000  BATTERY_VT(BATTERY_VT_INDEX: 0, "
+                     "       0.000             BATTERY_VT(BATTERY_VT_INDEX: 0, "
                      "MODULE_VOLTAGE_00: 39064, MODULE_TEMP_00: 11)"),
                 call(29,
                      0,
@@ -435,20 +439,20 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(0, 0, 'Received: 4, Discarded: 0, Errors: 0'),
                 call(1,
                      0,
-                     '   TIMESTAMP  MESSAGE                                           ',
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
                      'green'),
                 call(2,
                      0,
-                     "       1.000  Extended(S0: 0, S1: 0, S2: 0, S3: 0, S6: 1, S7: 0)"),
+                     "       1.000             Extended(S0: 0, S1: 0, S2: 0, S3: 0, S6: 1, S7: 0)"),
                 call(3,
                      0,
-                     "       0.000  Extended(S0: 0, S1: 0, S2: 0, S3: 0, S6: 2, S8: 0)"),
+                     "       0.000             Extended(S0: 0, S1: 0, S2: 0, S3: 0, S6: 2, S8: 0)"),
                 call(4,
                      0,
-                     "       3.000  Extended(S0: 0, S1: 2, S4: 0, S6: 1, S7: 0)"),
+                     "       3.000             Extended(S0: 0, S1: 2, S4: 0, S6: 1, S7: 0)"),
                 call(5,
                      0,
-                     "       2.000  Extended(S0: 1, S5: 0, S6: 1, S7: 0)"),
+                     "       2.000             Extended(S0: 1, S5: 0, S6: 1, S7: 0)"),
                 call(29,
                      0,
                      'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
@@ -495,13 +499,13 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(0, 0, 'Received: 2, Discarded: 0, Errors: 0'),
                 call(1,
                      0,
-                     '   TIMESTAMP  MESSAGE                                           ',
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
                      'green'),
-                call(2, 0, '       1.100  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.54 degK'),
-                call(6, 0, '              )'),
+                call(2, 0, '       1.100     0.9 Hz  ExampleMessage('),
+                call(3, 0, "                             Enable: 'Enabled' -,"),
+                call(4, 0, '                             AverageRadius: 3.2 m,'),
+                call(5, 0, '                             Temperature: 250.54 degK'),
+                call(6, 0, '                         )'),
                 call(29,
                      0,
                      'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
@@ -544,96 +548,68 @@ class CanToolsMonitorTest(unittest.TestCase):
             [
                 # No filter.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
+                call(1, 0, '   TIMESTAMP       RATE  MESSAGE                                ', 'green'),
+                call(2, 0, '       0.000             ExampleMessage('),
+                call(3, 0, "                             Enable: 'Enabled' -,"),
+                call(4, 0, '                             AverageRadius: 3.2 m,'),
+                call(5, 0, '                             Temperature: 250.55 degK'),
+                call(6, 0, '                         )'),
                 call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
 
                 # 'f' pressed.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
                 call(29, 0, 'Filter regex: ', 'cyan'),
                 call(29, 14, ' ', 'cyan inverted'),
                 call(29, 15, '                                                 ', 'cyan'),
 
                 # No match on 'Y'.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0, Filter: Y'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(29, 0, 'Filter regex: Y', 'cyan'),
                 call(29, 15, ' ', 'cyan inverted'),
                 call(29, 16, '                                                ', 'cyan'),
 
                 # Invalid filter 'Y['.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0, Filter: Y['),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
+                call(2, 0, '       0.000             ExampleMessage('),
+                call(3, 0, "                             Enable: 'Enabled' -,"),
+                call(4, 0, '                             AverageRadius: 3.2 m,'),
+                call(5, 0, '                             Temperature: 250.55 degK'),
+                call(6, 0, '                         )'),
                 call(29, 0, 'Filter regex: Y[', 'cyan'),
                 call(29, 16, ' ', 'cyan inverted'),
                 call(29, 17, '                                               ', 'cyan'),
 
                 # No match on 'Y'.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0, Filter: Y'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(29, 0, 'Filter regex: Y', 'cyan'),
                 call(29, 15, ' ', 'cyan inverted'),
                 call(29, 16, '                                                ', 'cyan'),
 
                 # Hit enter to hide filter prompt.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0, Filter: Y'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
 
                 # 'f' pressed again.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0, Filter: Y'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(29, 0, 'Filter regex: Y', 'cyan'),
                 call(29, 15, ' ', 'cyan inverted'),
                 call(29, 16, '                                                ', 'cyan'),
 
                 # Backspace.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
+                call(2, 0, '       0.000             ExampleMessage('),
+                call(3, 0, "                             Enable: 'Enabled' -,"),
+                call(4, 0, '                             AverageRadius: 3.2 m,'),
+                call(5, 0, '                             Temperature: 250.55 degK'),
+                call(6, 0, '                         )'),
                 call(29, 0, 'Filter regex: ', 'cyan'),
                 call(29, 14, ' ', 'cyan inverted'),
                 call(29, 15, '                                                 ', 'cyan'),
 
                 # Match on 'E'.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0, Filter: E'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
                 call(29, 0, 'Filter regex: E', 'cyan'),
                 call(29, 15, ' ', 'cyan inverted'),
                 call(29, 16, '                                                ', 'cyan'),
 
                 # Hit enter to hide filter.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0, Filter: E'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
                 call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
             ])
 
@@ -709,75 +685,48 @@ class CanToolsMonitorTest(unittest.TestCase):
             [
                 # One ok and one with bad frame id.
                 call(0, 0, 'Received: 2, Discarded: 1, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
+                call(1, 0, '   TIMESTAMP       RATE  MESSAGE                                ', 'green'),
+                call(2, 0, '       0.000             ExampleMessage('),
+                call(3, 0, "                             Enable: 'Enabled' -,"),
+                call(4, 0, '                             AverageRadius: 3.2 m,'),
+                call(5, 0, '                             Temperature: 250.55 degK'),
+                call(6, 0, '                         )'),
                 call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
 
                 # 'f' pressed.
-                call(0, 0, 'Received: 2, Discarded: 1, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
                 call(29, 0, 'Filter regex: ', 'cyan'),
                 call(29, 14, ' ', 'cyan inverted'),
                 call(29, 15, '                                                 ', 'cyan'),
                 
                 # 'E' pressed.
                 call(0, 0, 'Received: 2, Discarded: 1, Errors: 0, Filter: E'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
                 call(29, 0, 'Filter regex: E', 'cyan'),
                 call(29, 15, ' ', 'cyan inverted'),
                 call(29, 16, '                                                ', 'cyan'),
 
                 # '\n' pressed.
                 call(0, 0, 'Received: 3, Discarded: 1, Errors: 0, Filter: E'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       4.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.54 degK'),
-                call(6, 0, '              )'),
+                call(2, 0, '       4.000     0.2 Hz  ExampleMessage('),
+                call(5, 0, '                             Temperature: 250.54 degK'),
                 call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
 
                 # 'p' pressed. Input frame not displayed.
 
                 # 'r' pressed.
                 call(0, 0, 'Received: 0, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
 
                 # Input after reset. 'f' pressed.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.48 degK'),
-                call(6, 0, '              )'),
+                call(2, 0, '       0.000             ExampleMessage('),
+                call(3, 0, "                             Enable: 'Enabled' -,"),
+                call(4, 0, '                             AverageRadius: 3.2 m,'),
+                call(5, 0, '                             Temperature: 250.48 degK'),
+                call(6, 0, '                         )'),
                 call(29, 0, 'Filter regex: ', 'cyan'),
                 call(29, 14, ' ', 'cyan inverted'),
                 call(29, 15, '                                                 ', 'cyan'),
 
                 # '\n' pressed.
-                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.48 degK'),
-                call(6, 0, '              )'),
                 call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
 
                 # 'q' pressed, no redraw.
@@ -840,94 +789,34 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
                 call(1,
                      0,
-                     '   TIMESTAMP  MESSAGE                                           ',
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
                      'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
+                call(2, 0, '       0.000             ExampleMessage('),
+                call(3, 0, "                             Enable: 'Enabled' -,"),
+                call(4, 0, '                             AverageRadius: 3.2 m,'),
+                call(5, 0, '                             Temperature: 250.55 degK'),
+                call(6, 0, '                         )'),
                 call(29
                      ,
                      0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
                      'cyan'),
 
                 call(0, 0, 'Received: 2, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(2, 0, '       1.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
-                call(29
-                     ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
-                     'cyan'),
+                call(2, 0, '       1.000     1.0 Hz  ExampleMessage('),
 
                 call(0, 0, 'Received: 3, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(2, 0, '       2.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
-                call(29
-                     ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
-                     'cyan'),
+                call(2, 0, '       2.000     1.0 Hz  ExampleMessage('),
 
                 # Received when paused, displayed at unpause.
                 call(0, 0, 'Received: 4, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(2, 0, '       3.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
-                call(29
-                     ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
-                     'cyan'),
+                call(2, 0, '       3.000     1.0 Hz  ExampleMessage('),
 
                 # Received when playing.
                 call(0, 0, 'Received: 5, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(2, 0, '       5.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
-                call(29
-                     ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
-                     'cyan'),
+                call(2, 0, '       5.000     0.5 Hz  ExampleMessage('),
 
                 call(0, 0, 'Received: 6, Discarded: 0, Errors: 0'),
-                call(1,
-                     0,
-                     '   TIMESTAMP  MESSAGE                                           ',
-                     'green'),
-                call(2, 0, '       6.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
-                call(29,
-                     0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
-                     'cyan')
+                call(2, 0, '       6.000     1.0 Hz  ExampleMessage('),
             ])
 
     @patch('can.Notifier')
@@ -969,32 +858,32 @@ class CanToolsMonitorTest(unittest.TestCase):
             [
                 # 25 x 35.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE              ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
+                call(1, 0, '   TIMESTAMP       RATE  MESSAGE   ', 'green'),
+                call(2, 0, '       0.000             ExampleMessage('),
+                call(3, 0, "                             Enable: 'Enabled' -,"),
+                call(4, 0, '                             AverageRadius: 3.2 m,'),
+                call(5, 0, '                             Temperature: 250.55 degK'),
+                call(6, 0, '                         )'),
                 call(24, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset', 'cyan'),
 
                 # 25 x 35.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE              ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
+                call(1, 0, '   TIMESTAMP       RATE  MESSAGE   ', 'green'),
+                call(2, 0, '       0.000             ExampleMessage('),
+                call(3, 0, "                             Enable: 'Enabled' -,"),
+                call(4, 0, '                             AverageRadius: 3.2 m,'),
+                call(5, 0, '                             Temperature: 250.55 degK'),
+                call(6, 0, '                         )'),
                 call(24, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset', 'cyan'),
 
                 # 20 x 30.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE         ', 'green'),
-                call(2, 0, '       0.000  ExampleMessage('),
-                call(3, 0, "                  Enable: 'Enabled' -,"),
-                call(4, 0, '                  AverageRadius: 3.2 m,'),
-                call(5, 0, '                  Temperature: 250.55 degK'),
-                call(6, 0, '              )'),
+                call(1, 0, '   TIMESTAMP       RATE  MESSAGE', 'green'),
+                call(2, 0, '       0.000             ExampleMessage('),
+                call(3, 0, "                             Enable: 'Enabled' -,"),
+                call(4, 0, '                             AverageRadius: 3.2 m,'),
+                call(5, 0, '                             Temperature: 250.55 degK'),
+                call(6, 0, '                         )'),
                 call(19, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset', 'cyan')
             ])
 
@@ -1111,165 +1000,475 @@ class CanToolsMonitorTest(unittest.TestCase):
             [
                 # Start on page 1
                 call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '       0.000  BATTERY_VT('),
-                call(3, 0, '                  BATTERY_VT_INDEX: 0,'),
-                call(4, 0, '                  MODULE_VOLTAGE_00: 39064,'),
-                call(5, 0, '                  MODULE_TEMP_00: 11'),
-                call(6, 0, '              )'),
-                call(7, 0, '       1.000  BATTERY_VT('),
-                call(8, 0, '                  BATTERY_VT_INDEX: 1,'),
-                call(9, 0, '                  MODULE_VOLTAGE_01: 39064,'),
-                call(10, 0, '                  MODULE_TEMP_01: 11'),
-                call(11, 0, '              )'),
-                call(12, 0, '      10.000  BATTERY_VT('),
-                call(13, 0, '                  BATTERY_VT_INDEX: 10,'),
-                call(14, 0, '                  MODULE_VOLTAGE_10: 39064,'),
-                call(15, 0, '                  MODULE_TEMP_10: 11'),
-                call(16, 0, '              )'),
-                call(17, 0, '      11.000  BATTERY_VT('),
-                call(18, 0, '                  BATTERY_VT_INDEX: 11,'),
-                call(19, 0, '                  MODULE_VOLTAGE_11: 39064,'),
-                call(20, 0, '                  MODULE_TEMP_11: 11'),
-                call(21, 0, '              )'),
-                call(22, 0, '      12.000  BATTERY_VT('),
-                call(23, 0, '                  BATTERY_VT_INDEX: 12,'),
-                call(24, 0, '                  MODULE_VOLTAGE_12: 39064,'),
-                call(25, 0, '                  MODULE_TEMP_12: 11'),
-                call(26, 0, '              )'),
-                call(27, 0, '      13.000  BATTERY_VT('),
-                call(28, 0, '                  BATTERY_VT_INDEX: 13,'),
+                call(1, 0, '   TIMESTAMP       RATE  MESSAGE                                ', 'green'),
+                call(2, 0, '       0.000             BATTERY_VT('),
+                call(3, 0, '                             BATTERY_VT_INDEX: 0,'),
+                call(4, 0, '                             MODULE_VOLTAGE_00: 39064,'),
+                call(5, 0, '                             MODULE_TEMP_00: 11'),
+                call(6, 0, '                         )'),
+                call(7, 0, '       1.000             BATTERY_VT('),
+                call(8, 0, '                             BATTERY_VT_INDEX: 1,'),
+                call(9, 0, '                             MODULE_VOLTAGE_01: 39064,'),
+                call(10, 0, '                             MODULE_TEMP_01: 11'),
+                call(11, 0, '                         )'),
+                call(12, 0, '      10.000             BATTERY_VT('),
+                call(13, 0, '                             BATTERY_VT_INDEX: 10,'),
+                call(14, 0, '                             MODULE_VOLTAGE_10: 39064,'),
+                call(15, 0, '                             MODULE_TEMP_10: 11'),
+                call(16, 0, '                         )'),
+                call(17, 0, '      11.000             BATTERY_VT('),
+                call(18, 0, '                             BATTERY_VT_INDEX: 11,'),
+                call(19, 0, '                             MODULE_VOLTAGE_11: 39064,'),
+                call(20, 0, '                             MODULE_TEMP_11: 11'),
+                call(21, 0, '                         )'),
+                call(22, 0, '      12.000             BATTERY_VT('),
+                call(23, 0, '                             BATTERY_VT_INDEX: 12,'),
+                call(24, 0, '                             MODULE_VOLTAGE_12: 39064,'),
+                call(25, 0, '                             MODULE_TEMP_12: 11'),
+                call(26, 0, '                         )'),
+                call(27, 0, '      13.000             BATTERY_VT('),
+                call(28, 0, '                             BATTERY_VT_INDEX: 13,'),
                 call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
 
                 # Move to page 2
-                call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '                  MODULE_VOLTAGE_13: 39064,'),
-                call(3, 0, '                  MODULE_TEMP_13: 11'),
-                call(4, 0, '              )'),
-                call(5, 0, '      14.000  BATTERY_VT('),
-                call(6, 0, '                  BATTERY_VT_INDEX: 14,'),
-                call(7, 0, '                  MODULE_VOLTAGE_14: 39064,'),
-                call(8, 0, '                  MODULE_TEMP_14: 11'),
-                call(9, 0, '              )'),
-                call(10, 0, '      15.000  BATTERY_VT('),
-                call(11, 0, '                  BATTERY_VT_INDEX: 15,'),
-                call(12, 0, '                  MODULE_VOLTAGE_15: 39064,'),
-                call(13, 0, '                  MODULE_TEMP_15: 11'),
-                call(14, 0, '              )'),
-                call(15, 0, '      16.000  BATTERY_VT('),
-                call(16, 0, '                  BATTERY_VT_INDEX: 16,'),
-                call(17, 0, '                  MODULE_VOLTAGE_16: 39064,'),
-                call(18, 0, '                  MODULE_TEMP_16: 11'),
-                call(19, 0, '              )'),
-                call(20, 0, '      17.000  BATTERY_VT('),
-                call(21, 0, '                  BATTERY_VT_INDEX: 17,'),
-                call(22, 0, '                  MODULE_VOLTAGE_17: 39064,'),
-                call(23, 0, '                  MODULE_TEMP_17: 11'),
-                call(24, 0, '              )'),
-                call(25, 0, '      18.000  BATTERY_VT('),
-                call(26, 0, '                  BATTERY_VT_INDEX: 18,'),
-                call(27, 0, '                  MODULE_VOLTAGE_18: 39064,'),
-                call(28, 0, '                  MODULE_TEMP_18: 11'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(2, 0, '                             MODULE_VOLTAGE_13: 39064,'),
+                call(3, 0, '                             MODULE_TEMP_13: 11'),
+                call(4, 0, '                         )'),
+                call(5, 0, '      14.000             BATTERY_VT('),
+                call(6, 0, '                             BATTERY_VT_INDEX: 14,'),
+                call(7, 0, '                             MODULE_VOLTAGE_14: 39064,'),
+                call(8, 0, '                             MODULE_TEMP_14: 11'),
+                call(9, 0, '                         )'),
+                call(10, 0, '      15.000             BATTERY_VT('),
+                call(11, 0, '                             BATTERY_VT_INDEX: 15,'),
+                call(12, 0, '                             MODULE_VOLTAGE_15: 39064,'),
+                call(13, 0, '                             MODULE_TEMP_15: 11'),
+                call(14, 0, '                         )'),
+                call(15, 0, '      16.000             BATTERY_VT('),
+                call(16, 0, '                             BATTERY_VT_INDEX: 16,'),
+                call(17, 0, '                             MODULE_VOLTAGE_16: 39064,'),
+                call(18, 0, '                             MODULE_TEMP_16: 11'),
+                call(19, 0, '                         )'),
+                call(20, 0, '      17.000             BATTERY_VT('),
+                call(21, 0, '                             BATTERY_VT_INDEX: 17,'),
+                call(22, 0, '                             MODULE_VOLTAGE_17: 39064,'),
+                call(23, 0, '                             MODULE_TEMP_17: 11'),
+                call(24, 0, '                         )'),
+                call(25, 0, '      18.000             BATTERY_VT('),
+                call(26, 0, '                             BATTERY_VT_INDEX: 18,'),
+                call(27, 0, '                             MODULE_VOLTAGE_18: 39064,'),
+                call(28, 0, '                             MODULE_TEMP_18: 11'),
 
                 # Move to page 3
-                call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '              )'),
-                call(3, 0, '       2.000  BATTERY_VT('),
-                call(4, 0, '                  BATTERY_VT_INDEX: 2,'),
-                call(5, 0, '                  MODULE_VOLTAGE_02: 39064,'),
-                call(6, 0, '                  MODULE_TEMP_02: 11'),
-                call(7, 0, '              )'),
-                call(8, 0, '       3.000  BATTERY_VT('),
-                call(9, 0, '                  BATTERY_VT_INDEX: 3,'),
-                call(10, 0, '                  MODULE_VOLTAGE_03: 39064,'),
-                call(11, 0, '                  MODULE_TEMP_03: 11'),
-                call(12, 0, '              )'),
-                call(13, 0, '       4.000  BATTERY_VT('),
-                call(14, 0, '                  BATTERY_VT_INDEX: 4,'),
-                call(15, 0, '                  MODULE_VOLTAGE_04: 39064,'),
-                call(16, 0, '                  MODULE_TEMP_04: 11'),
-                call(17, 0, '              )'),
-                call(18, 0, '       5.000  BATTERY_VT('),
-                call(19, 0, '                  BATTERY_VT_INDEX: 5,'),
-                call(20, 0, '                  MODULE_VOLTAGE_05: 39064,'),
-                call(21, 0, '                  MODULE_TEMP_05: 11'),
-                call(22, 0, '              )'),
-                call(23, 0, '       6.000  BATTERY_VT('),
-                call(24, 0, '                  BATTERY_VT_INDEX: 6,'),
-                call(25, 0, '                  MODULE_VOLTAGE_06: 39064,'),
-                call(26, 0, '                  MODULE_TEMP_06: 11'),
-                call(27, 0, '              )'),
-                call(28, 0, '       7.000  BATTERY_VT('),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(2, 0, '                         )'),
+                call(3, 0, '       2.000             BATTERY_VT('),
+                call(4, 0, '                             BATTERY_VT_INDEX: 2,'),
+                call(5, 0, '                             MODULE_VOLTAGE_02: 39064,'),
+                call(6, 0, '                             MODULE_TEMP_02: 11'),
+                call(7, 0, '                         )'),
+                call(8, 0, '       3.000             BATTERY_VT('),
+                call(9, 0, '                             BATTERY_VT_INDEX: 3,'),
+                call(10, 0, '                             MODULE_VOLTAGE_03: 39064,'),
+                call(11, 0, '                             MODULE_TEMP_03: 11'),
+                call(12, 0, '                         )'),
+                call(13, 0, '       4.000             BATTERY_VT('),
+                call(14, 0, '                             BATTERY_VT_INDEX: 4,'),
+                call(15, 0, '                             MODULE_VOLTAGE_04: 39064,'),
+                call(16, 0, '                             MODULE_TEMP_04: 11'),
+                call(17, 0, '                         )'),
+                call(18, 0, '       5.000             BATTERY_VT('),
+                call(19, 0, '                             BATTERY_VT_INDEX: 5,'),
+                call(20, 0, '                             MODULE_VOLTAGE_05: 39064,'),
+                call(21, 0, '                             MODULE_TEMP_05: 11'),
+                call(22, 0, '                         )'),
+                call(23, 0, '       6.000             BATTERY_VT('),
+                call(24, 0, '                             BATTERY_VT_INDEX: 6,'),
+                call(25, 0, '                             MODULE_VOLTAGE_06: 39064,'),
+                call(26, 0, '                             MODULE_TEMP_06: 11'),
+                call(27, 0, '                         )'),
+                call(28, 0, '       7.000             BATTERY_VT('),
 
                 # Move to page 4
-                call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '                  MODULE_TEMP_04: 11'),
-                call(3, 0, '              )'),
-                call(4, 0, '       5.000  BATTERY_VT('),
-                call(5, 0, '                  BATTERY_VT_INDEX: 5,'),
-                call(6, 0, '                  MODULE_VOLTAGE_05: 39064,'),
-                call(7, 0, '                  MODULE_TEMP_05: 11'),
-                call(8, 0, '              )'),
-                call(9, 0, '       6.000  BATTERY_VT('),
-                call(10, 0, '                  BATTERY_VT_INDEX: 6,'),
-                call(11, 0, '                  MODULE_VOLTAGE_06: 39064,'),
-                call(12, 0, '                  MODULE_TEMP_06: 11'),
-                call(13, 0, '              )'),
-                call(14, 0, '       7.000  BATTERY_VT('),
-                call(15, 0, '                  BATTERY_VT_INDEX: 7,'),
-                call(16, 0, '                  MODULE_VOLTAGE_07: 39064,'),
-                call(17, 0, '                  MODULE_TEMP_07: 11'),
-                call(18, 0, '              )'),
-                call(19, 0, '       8.000  BATTERY_VT('),
-                call(20, 0, '                  BATTERY_VT_INDEX: 8,'),
-                call(21, 0, '                  MODULE_VOLTAGE_08: 39064,'),
-                call(22, 0, '                  MODULE_TEMP_08: 11'),
-                call(23, 0, '              )'),
-                call(24, 0, '       9.000  BATTERY_VT('),
-                call(25, 0, '                  BATTERY_VT_INDEX: 9,'),
-                call(26, 0, '                  MODULE_VOLTAGE_09: 39064,'),
-                call(27, 0, '                  MODULE_TEMP_09: 11'),
-                call(28, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(2, 0, '                             MODULE_TEMP_04: 11'),
+                call(3, 0, '                         )'),
+                call(4, 0, '       5.000             BATTERY_VT('),
+                call(5, 0, '                             BATTERY_VT_INDEX: 5,'),
+                call(6, 0, '                             MODULE_VOLTAGE_05: 39064,'),
+                call(7, 0, '                             MODULE_TEMP_05: 11'),
+                call(8, 0, '                         )'),
+                call(9, 0, '       6.000             BATTERY_VT('),
+                call(10, 0, '                             BATTERY_VT_INDEX: 6,'),
+                call(11, 0, '                             MODULE_VOLTAGE_06: 39064,'),
+                call(12, 0, '                             MODULE_TEMP_06: 11'),
+                call(13, 0, '                         )'),
+                call(14, 0, '       7.000             BATTERY_VT('),
+                call(15, 0, '                             BATTERY_VT_INDEX: 7,'),
+                call(16, 0, '                             MODULE_VOLTAGE_07: 39064,'),
+                call(17, 0, '                             MODULE_TEMP_07: 11'),
+                call(18, 0, '                         )'),
+                call(19, 0, '       8.000             BATTERY_VT('),
+                call(20, 0, '                             BATTERY_VT_INDEX: 8,'),
+                call(21, 0, '                             MODULE_VOLTAGE_08: 39064,'),
+                call(22, 0, '                             MODULE_TEMP_08: 11'),
+                call(23, 0, '                         )'),
+                call(24, 0, '       9.000             BATTERY_VT('),
+                call(25, 0, '                             BATTERY_VT_INDEX: 9,'),
+                call(26, 0, '                             MODULE_VOLTAGE_09: 39064,'),
+                call(27, 0, '                             MODULE_TEMP_09: 11'),
+                call(28, 0, '                         )'),
 
                 # Move back to page 3
-                call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
-                call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(2, 0, '                  BATTERY_VT_INDEX: 16,'),
-                call(3, 0, '                  MODULE_VOLTAGE_16: 39064,'),
-                call(4, 0, '                  MODULE_TEMP_16: 11'),
-                call(5, 0, '              )'),
-                call(6, 0, '      17.000  BATTERY_VT('),
-                call(7, 0, '                  BATTERY_VT_INDEX: 17,'),
-                call(8, 0, '                  MODULE_VOLTAGE_17: 39064,'),
-                call(9, 0, '                  MODULE_TEMP_17: 11'),
-                call(10, 0, '              )'),
-                call(11, 0, '      18.000  BATTERY_VT('),
-                call(12, 0, '                  BATTERY_VT_INDEX: 18,'),
-                call(13, 0, '                  MODULE_VOLTAGE_18: 39064,'),
-                call(14, 0, '                  MODULE_TEMP_18: 11'),
-                call(15, 0, '              )'),
-                call(16, 0, '       2.000  BATTERY_VT('),
-                call(17, 0, '                  BATTERY_VT_INDEX: 2,'),
-                call(18, 0, '                  MODULE_VOLTAGE_02: 39064,'),
-                call(19, 0, '                  MODULE_TEMP_02: 11'),
-                call(20, 0, '              )'),
-                call(21, 0, '       3.000  BATTERY_VT('),
-                call(22, 0, '                  BATTERY_VT_INDEX: 3,'),
-                call(23, 0, '                  MODULE_VOLTAGE_03: 39064,'),
-                call(24, 0, '                  MODULE_TEMP_03: 11'),
-                call(25, 0, '              )'),
-                call(26, 0, '       4.000  BATTERY_VT('),
-                call(27, 0, '                  BATTERY_VT_INDEX: 4,'),
-                call(28, 0, '                  MODULE_VOLTAGE_04: 39064,'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(2, 0, '                             BATTERY_VT_INDEX: 16,'),
+                call(3, 0, '                             MODULE_VOLTAGE_16: 39064,'),
+                call(4, 0, '                             MODULE_TEMP_16: 11'),
+                call(5, 0, '                         )'),
+                call(6, 0, '      17.000             BATTERY_VT('),
+                call(7, 0, '                             BATTERY_VT_INDEX: 17,'),
+                call(8, 0, '                             MODULE_VOLTAGE_17: 39064,'),
+                call(9, 0, '                             MODULE_TEMP_17: 11'),
+                call(10, 0, '                         )'),
+                call(11, 0, '      18.000             BATTERY_VT('),
+                call(12, 0, '                             BATTERY_VT_INDEX: 18,'),
+                call(13, 0, '                             MODULE_VOLTAGE_18: 39064,'),
+                call(14, 0, '                             MODULE_TEMP_18: 11'),
+                call(15, 0, '                         )'),
+                call(16, 0, '       2.000             BATTERY_VT('),
+                call(17, 0, '                             BATTERY_VT_INDEX: 2,'),
+                call(18, 0, '                             MODULE_VOLTAGE_02: 39064,'),
+                call(19, 0, '                             MODULE_TEMP_02: 11'),
+                call(20, 0, '                         )'),
+                call(21, 0, '       3.000             BATTERY_VT('),
+                call(22, 0, '                             BATTERY_VT_INDEX: 3,'),
+                call(23, 0, '                             MODULE_VOLTAGE_03: 39064,'),
+                call(24, 0, '                             MODULE_TEMP_03: 11'),
+                call(25, 0, '                         )'),
+                call(26, 0, '       4.000             BATTERY_VT('),
+                call(27, 0, '                             BATTERY_VT_INDEX: 4,'),
+                call(28, 0, '                             MODULE_VOLTAGE_04: 39064,'),
+            ])
+
+
+    @patch('can.Notifier')
+    @patch('can.Bus')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_dropped_frames(self,
+                            _use_default_colors,
+                            _curs_set,
+                            _init_pair,
+                            is_term_resized,
+                            color_pair,
+                            _bus,
+                            _notifier):
+        # Prepare mocks.
+        stdscr = StdScr()
+        args = Args('tests/files/dbc/motohawk.dbc', single_line=True)
+        color_pair.side_effect = lambda i: self.color_pair_side_effect[i]
+        is_term_resized.return_value = False
+
+        # Run monitor.
+        with patch('cantools.subparsers.monitor.QUEUE_SIZE', 2):
+            monitor = Monitor(stdscr, args)
+
+        for timestamp in range(4):
+            monitor.on_message_received(can.Message(
+                arbitration_id=496,
+                data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+                timestamp=timestamp))
+
+        monitor.run(1)
+
+        # Check mocks.
+        self.assert_called(
+            stdscr.addstr,
+            [
+                call(0, 0, 'Received: 2, Discarded: 0, Errors: 0, Dropped: 2'),
+                call(1,
+                     0,
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
+                     'green'),
+                call(2,
+                     0,
+                     "       1.000     1.0 Hz  ExampleMessage(Enable: 'Enabled' -, "
+                     "AverageRadius: 3.2 m, Temperature: 250.55 degK)"),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'cyan')
             ])
 
+    @patch('can.Notifier')
+    @patch('can.Bus')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_format_visible_messages(self,
+                                     _use_default_colors,
+                                     _curs_set,
+                                     _init_pair,
+                                     is_term_resized,
+                                     color_pair,
+                                     _bus,
+                                     _notifier):
+        # Prepare mocks.
+        stdscr = StdScr(user_input=[' ', ' ', 'q'])
+        args = Args('tests/files/dbc/msxii_system_can.dbc')
+        color_pair.side_effect = lambda i: self.color_pair_side_effect[i]
+        is_term_resized.return_value = False
+
+        # Run monitor.
+        monitor = Monitor(stdscr, args)
+
+        def receive_all(timestamp):
+            for index in range(19):
+                monitor.on_message_received(can.Message(
+                    arbitration_id=1025,
+                    data=bytes([index]) + b'\x00\x98\x98\x0b\x00',
+                    timestamp=timestamp))
+
+        with patch.object(monitor,
+                          'format_message',
+                          wraps=monitor.format_message) as format_message:
+            # All messages are formatted once to know their number
+            # of lines.
+            receive_all(0)
+            monitor.tick(1)
+            self.assertEqual(format_message.call_count, 19)
+
+            # Only the 6 visible messages are formatted again, and only
+            # the last frame of each message.
+            format_message.reset_mock()
+            receive_all(1)
+            receive_all(2)
+            monitor.tick(1)
+            self.assertEqual(format_message.call_count, 6)
+
+            # Nothing is formatted if nothing is received.
+            format_message.reset_mock()
+            monitor.redraw(time.monotonic())
+            self.assertEqual(format_message.call_count, 0)
+
+
+    @patch('can.Notifier')
+    @patch('can.Bus')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_refresh_rate(self,
+                          _use_default_colors,
+                          _curs_set,
+                          _init_pair,
+                          is_term_resized,
+                          color_pair,
+                          _bus,
+                          _notifier):
+        # Prepare mocks.
+        stdscr = StdScr(user_input=[' ', ' ', ' ', ' '])
+        args = Args('tests/files/dbc/motohawk.dbc', single_line=True)
+        args.refresh_rate = 2
+        color_pair.side_effect = lambda i: self.color_pair_side_effect[i]
+        is_term_resized.return_value = False
+
+        # Run monitor.
+        monitor = Monitor(stdscr, args)
+
+        def receive(timestamp):
+            monitor.on_message_received(can.Message(
+                arbitration_id=496,
+                data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+                timestamp=timestamp))
+
+        with patch('time.monotonic') as monotonic:
+            # First redraw at once.
+            monotonic.return_value = 10.0
+            receive(0)
+            monitor.tick(1)
+            self.assertEqual(stdscr.refresh.call_count, 1)
+
+            # Next redraw not until 0.5 seconds later.
+            monotonic.return_value = 10.4
+            receive(1)
+            monitor.tick(1)
+            self.assertEqual(stdscr.refresh.call_count, 1)
+
+            monotonic.return_value = 10.5
+            monitor.tick(1)
+            self.assertEqual(stdscr.refresh.call_count, 2)
+
+            # Nothing to redraw.
+            monotonic.return_value = 11.0
+            monitor.tick(1)
+            self.assertEqual(stdscr.refresh.call_count, 2)
+
+        # Only the changed stats and message rows are drawn the second
+        # time, and the screen is only cleared the first time.
+        self.assertEqual(stdscr.clear.call_count, 1)
+        self.assert_called(
+            stdscr.addstr,
+            [
+                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
+                call(1,
+                     0,
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
+                     'green'),
+                call(2,
+                     0,
+                     "       0.000             ExampleMessage(Enable: 'Enabled' -, "
+                     "AverageRadius: 3.2 m, Temperature: 250.55 degK)"),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'cyan'),
+                call(0, 0, 'Received: 2, Discarded: 0, Errors: 0'),
+                call(2,
+                     0,
+                     "       1.000     1.0 Hz  ExampleMessage(Enable: 'Enabled' -, "
+                     "AverageRadius: 3.2 m, Temperature: 250.55 degK)")
+            ])
+        self.assert_called(stdscr.clrtoeol, [call(), call()])
+
+    @patch('can.Notifier')
+    @patch('can.Bus')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_rate_decay(self,
+                        _use_default_colors,
+                        _curs_set,
+                        _init_pair,
+                        is_term_resized,
+                        color_pair,
+                        _bus,
+                        _notifier):
+        # Prepare mocks.
+        stdscr = StdScr(user_input=[' ', ' ', ' ', ' ', ' '])
+        args = Args('tests/files/dbc/motohawk.dbc', single_line=True)
+        color_pair.side_effect = lambda i: self.color_pair_side_effect[i]
+        is_term_resized.return_value = False
+
+        # Run monitor.
+        monitor = Monitor(stdscr, args)
+
+        def receive(timestamp):
+            monitor.on_message_received(can.Message(
+                arbitration_id=496,
+                data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+                timestamp=timestamp))
+
+        with patch('time.monotonic') as monotonic:
+            monotonic.return_value = 10.0
+            receive(0)
+            monitor.tick(1)
+
+            monotonic.return_value = 11.0
+            receive(0.5)
+            receive(1)
+            monitor.tick(1)
+
+            # No redraw when idle for less than a rate period.
+            monotonic.return_value = 11.5
+            monitor.tick(1)
+            self.assertEqual(stdscr.refresh.call_count, 2)
+
+            # The rate decays when the message is no longer received.
+            monotonic.return_value = 12.0
+            monitor.tick(1)
+            self.assertEqual(stdscr.refresh.call_count, 3)
+
+            monotonic.return_value = 14.0
+            monitor.tick(1)
+            self.assertEqual(stdscr.refresh.call_count, 4)
+
+        self.assert_called(
+            stdscr.addstr,
+            [
+                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
+                call(1,
+                     0,
+                     '   TIMESTAMP       RATE  MESSAGE                                ',
+                     'green'),
+                call(2,
+                     0,
+                     "       0.000             ExampleMessage(Enable: 'Enabled' -, "
+                     "AverageRadius: 3.2 m, Temperature: 250.55 degK)"),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'cyan'),
+                call(0, 0, 'Received: 3, Discarded: 0, Errors: 0'),
+                call(2,
+                     0,
+                     "       1.000     2.0 Hz  ExampleMessage(Enable: 'Enabled' -, "
+                     "AverageRadius: 3.2 m, Temperature: 250.55 degK)"),
+                call(2,
+                     0,
+                     "       1.000     1.0 Hz  ExampleMessage(Enable: 'Enabled' -, "
+                     "AverageRadius: 3.2 m, Temperature: 250.55 degK)"),
+                call(2,
+                     0,
+                     "       1.000     0.3 Hz  ExampleMessage(Enable: 'Enabled' -, "
+                     "AverageRadius: 3.2 m, Temperature: 250.55 degK)")
+            ])
+
+    @patch('can.Notifier')
+    @patch('can.Bus')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_muxed_data_unexpected_error(self,
+                                         _use_default_colors,
+                                         _curs_set,
+                                         _init_pair,
+                                         is_term_resized,
+                                         color_pair,
+                                         _bus,
+                                         _notifier):
+        # Prepare mocks.
+        stdscr = StdScr()
+        args = Args('tests/files/dbc/msxii_system_can.dbc')
+        color_pair.side_effect = lambda i: self.color_pair_side_effect[i]
+        is_term_resized.return_value = False
+
+        # Run monitor.
+        monitor = Monitor(stdscr, args)
+        monitor.on_message_received(can.Message(
+            arbitration_id=1025,
+            data=b'\x00\x00\x98\x98\x0b\x00'))
+
+        # Only decode errors discard the frame, other errors are
+        # raised.
+        with patch('cantools.database.can.message.Message.decode_into',
+                   side_effect=ValueError('Unexpected.')):
+            with self.assertRaises(ValueError) as cm:
+                monitor.tick(1)
+
+        self.assertEqual(str(cm.exception), 'Unexpected.')
+
+    def test_bad_refresh_rate(self):
+        for refresh_rate in ['0', '-1', '0.5']:
+            argv = [
+                'cantools',
+                'monitor',
+                '--refresh-rate', refresh_rate,
+                'tests/files/dbc/motohawk.dbc'
+            ]
+
+            with patch('sys.argv', argv):
+                with patch('sys.stderr'):
+                    with self.assertRaises(SystemExit):
+                        cantools._main()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -51,6 +51,11 @@ class SubplotMock(mock.Mock):
         self.stem.side_effect = self.__stem
         self.twinx.side_effect = self.__twinx
 
+        # Values are plotted as arrays. Record them as lists to compare
+        # them with lists of expected values.
+        for name in ('plot', 'stem'):
+            setattr(self, name, self.__record_as_lists(getattr(self, name)))
+
         if 'ignore_legend' not in kw:
             kw['ignore_legend'] = True
 
@@ -75,6 +80,15 @@ class SubplotMock(mock.Mock):
     def _get_child_mock(self, **kw):
         return mock.Mock(**kw)
 
+    @staticmethod
+    def __record_as_lists(func):
+        def to_list(value):
+            if hasattr(value, 'tolist'):
+                return [None if v is None or v != v else v for v in value.tolist()]
+            return value
+
+        return lambda *args, **kw: func(*[to_list(arg) for arg in args], **kw)
+
     def get_legend_handles_labels(self):
         labels = self.__legend_labels
         handles = [None for i in range(len(labels))]
@@ -2181,6 +2195,126 @@ Failed to parse line: 'invalid syntax'
                             self.assertListEqual(subplots[i].mock_calls, expected_subplot_calls[i], msg="calls don't match for subplot %s" % i)
 
 
+    def test_decode_selected_signals_only(self):
+        argv = ['cantools', 'plot', self.DBC_FILE, '*33.whlspeed_FL']
+        input_data = """\
+ (000.000000)  vcan0  00000343   [8]  C5 04 B7 04 9B 04 C5 04
+ (001.001787)  vcan0  0000024A   [8]  1B 05 22 05 1B 05 22 05
+ (002.003592)  vcan0  00000343   [8]  29 04 30 04 29 04 22 04
+"""
+
+        decode_into = cantools.database.can.Message.decode_into
+
+        with mock.patch('sys.stdin', StringIO(input_data)):
+            with mock.patch('sys.argv', argv):
+                with mock.patch.object(cantools.database.can.Message,
+                                       'decode_into',
+                                       autospec=True,
+                                       side_effect=decode_into) as decode_into_mock:
+                    with PyplotMock() as plt:
+                        cantools._main()
+
+        # Only BREMSE_33 frames are decoded, and only the plotted signal.
+        self.assertEqual(decode_into_mock.call_count, 2)
+
+        for call in decode_into_mock.call_args_list:
+            self.assertEqual(call[0][0].name, 'BREMSE_33')
+            self.assertEqual(call[1]['signals'], {'whlspeed_FL'})
+
+        self.assertEqual(plt.mock_calls[2],
+                         mock.call.subplot().plot([0.0, 2.003592],
+                                                  [19.078125, 16.640625],
+                                                  '',
+                                                  label='BREMSE_33.whlspeed_FL'))
+
+    def test_max_points(self):
+        argv = ['cantools', 'plot', '--max-points', '4', self.DBC_FILE, '*33.whlspeed_FL']
+        input_data = """\
+ (000.000000)  vcan0  00000343   [8]  C5 04 B7 04 9B 04 C5 04
+ (001.001787)  vcan0  00000343   [8]  69 04 69 04 77 04 7E 04
+ (002.003592)  vcan0  00000343   [8]  29 04 30 04 29 04 22 04
+ (003.005400)  vcan0  00000343   [8]  FC 03 20 04 20 04 FC 03
+ (004.006942)  vcan0  00000343   [8]  DE 03 D0 03 D0 03 C9 03
+ (005.008400)  vcan0  00000343   [8]  7E 03 85 03 8C 03 77 03
+ (006.009926)  vcan0  00000343   [8]  65 03 3B 03 50 03 65 03
+ (007.011457)  vcan0  00000343   [8]  17 03 3B 03 34 03 10 03
+ (008.013215)  vcan0  00000343   [8]  00 03 F2 02 15 03 F9 02
+ (009.014779)  vcan0  00000343   [8]  CB 02 BC 02 B5 02 D2 02
+"""
+
+        xs = self.parse_time(input_data, self.parse_seconds)
+        ys = [19.078125, 17.640625, 16.640625, 15.9375, 15.46875, 13.96875, 13.578125, 12.359375, 12.0, 11.171875]
+
+        plt = PyplotMock()
+        subplots = [SubplotMock()]
+        plt.subplot.side_effect = subplots
+
+        with mock.patch('sys.stdin', StringIO(input_data)):
+            with mock.patch('sys.argv', argv):
+                with plt:
+                    cantools._main()
+
+        # The maximum and minimum of each half.
+        subplot = subplots[0]
+        self.assertIn(mock.call.plot([xs[0], xs[4], xs[5], xs[9]],
+                                     [ys[0], ys[4], ys[5], ys[9]],
+                                     '',
+                                     label='BREMSE_33.whlspeed_FL'),
+                      subplot.mock_calls)
+
+        # All values are plotted again when zooming in.
+        self.assertEqual(subplot.callbacks.connect.call_args[0][0], 'xlim_changed')
+        on_xlim_changed = subplot.callbacks.connect.call_args[0][1]
+        axes = mock.Mock()
+        axes.get_xlim.return_value = (1.5, 3.5)
+        line = mock.Mock()
+        on_xlim_changed.__self__.lines[:] = [line]
+        on_xlim_changed(axes)
+        x, y = line.set_data.call_args[0]
+        self.assertEqual(x.tolist(), xs[1:5])
+        self.assertEqual(y.tolist(), ys[1:5])
+
+    def test_jobs(self):
+        input_data = """\
+ (000.000000)  vcan0  00000343   [8]  C5 04 B7 04 9B 04 C5 04
+ (001.001787)  vcan0  00000343   [8]  69 04 69 04 77 04 7E 04
+ (002.003592)  vcan0  00000343   [8]  29 04
+ (003.005400)  vcan0  00000123   [8]  FC 03 20 04 20 04 FC 03
+invalid syntax
+ (004.006942)  vcan0  00000343   [8]  DE 03 D0 03 D0 03 C9 03
+ (025.008400)  vcan0  00000343   [8]  7E 03 85 03 8C 03 77 03
+ (026.009926)  vcan0  00000343   [8]  65 03 3B 03 50 03 65 03
+
+ (027.011457)  vcan0  00000343   [8]  17 03 3B 03 34 03 10 03
+ (048.013215)  vcan0  00000343   [8]  00 03 F2 02 15 03 F9 02
+ (049.014779)  vcan0  00000343   [8]  CB 02 BC 02 B5 02 D2 02
+"""
+
+        for options in [['--break-time', '10'],
+                        ['--show-errors', '--break-time', '3'],
+                        ['--line-numbers', '--break-time', '2'],
+                        ['--start', '1.5', '--stop', '27']]:
+            calls = []
+            outputs = []
+
+            for jobs in ['1', '2']:
+                argv = ['cantools', 'plot', '--jobs', jobs] + options + [self.DBC_FILE]
+                stdout = StringIO()
+
+                # Small blocks to decode the input in more than one block.
+                with mock.patch('cantools.subparsers.plot.BLOCK_SIZE', 200):
+                    with mock.patch('sys.stdin', StringIO(input_data)):
+                        with mock.patch('sys.stdout', stdout):
+                            with mock.patch('sys.argv', argv):
+                                with PyplotMock() as plt:
+                                    cantools._main()
+
+                calls.append(self.normalize_calls(plt.mock_calls))
+                outputs.append(stdout.getvalue())
+
+            self.assertEqual(calls[0], calls[1], msg=options)
+            self.assertEqual(outputs[0], outputs[1], msg=options)
+
     # ------- auxiliary functions -------
 
     def parse_time(self, log, parse, mod=1, offset=0):
@@ -2196,6 +2330,19 @@ Failed to parse line: 'invalid syntax'
             ln_num += 1
         return out
 
+    def normalize_calls(self, calls):
+        """
+        Converts functions in the arguments of given calls to their names,
+        to compare them.
+        """
+        def normalize(value):
+            if callable(value):
+                return value.__qualname__
+            return value
+
+        return [(name, [normalize(arg) for arg in args], kwargs)
+                for name, args, kwargs in calls]
+
     def parse_absolute_time(self, timestamp):
         return datetime.datetime.strptime(timestamp, self.FORMAT_ABSOLUTE_TIMESTAMP)
 
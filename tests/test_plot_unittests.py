@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 
 import unittest
+import unittest.mock
 import datetime
 
+import numpy as np
+
 import cantools.subparsers.plot as plot
 
 class CanToolsPlotUnittests(unittest.TestCase):
@@ -69,6 +72,30 @@ class CanToolsPlotUnittests(unittest.TestCase):
             actual = sut.parse_user_input_relative_time(user_input, first_timestamp=0)
             self.assertEqual(actual, expected, "unexpected result for %r" % user_input)
 
+    def test_decimator(self):
+        x = np.arange(20, dtype=float)
+        y = np.array([0, 5, 1, 2, 3, np.nan, 4, 4, 9, 4,
+                      -3, 1, 1, 1, 1, 1, 1, 1, 1, 8])
+
+        self.assertIsNone(plot.Decimator.create(x, y, 20))
+        self.assertIsNone(plot.Decimator.create(x, np.array(['On', 'Off'] * 10, dtype=object), 10))
+
+        # Minimum and maximum of each interval of five values, the first
+        # and last values, and breaks are kept.
+        sut = plot.Decimator.create(x, y, 8)
+        self.assertEqual(sut.decimate(0, 20).tolist(),
+                         [0, 1, 5, 6, 8, 10, 11, 15, 19])
+
+        # Zooming in gives full resolution.
+        axes = unittest.mock.Mock()
+        axes.get_xlim.return_value = (2.5, 6.5)
+        line = unittest.mock.Mock()
+        sut.lines.append(line)
+        sut.on_xlim_changed(axes)
+        x, y = line.set_data.call_args[0]
+        self.assertEqual(x.tolist(), [2, 3, 4, 5, 6, 7])
+        self.assertEqual(y[:3].tolist(), [1, 2, 3])
+
 
     # ------- auxiliary functions -------
 
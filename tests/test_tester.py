@@ -1,6 +1,8 @@
 import time
 import os
+import asyncio
 import unittest
+from unittest.mock import Mock
 import can
 
 try:
@@ -31,8 +33,8 @@ class CanBus(object):
     def send(self, message):
         self._queue.put(message)
 
-    def wait_for_send(self):
-        return self._queue.get()
+    def wait_for_send(self, timeout=None):
+        return self._queue.get(timeout=timeout)
 
     def send_periodic(self, message, period=None):
         self._periodic_queue.put((message, period))
@@ -69,6 +71,36 @@ def setup_tester(dut_name,
     return tester, can_bus
 
 
+def setup_async_tester(dut_name, on_message=None):
+    database = cantools.db.load_file('tests/files/kcd/tester.kcd')
+    can_bus = CanBus()
+    tester = cantools.tester.AsyncTester(dut_name,
+                                         database,
+                                         can_bus,
+                                         'Bus1',
+                                         on_message=on_message,
+                                         decode_choices=False,
+                                         scaling=False)
+
+    return tester, can_bus
+
+
+def run_async(coroutine):
+    """Run given coroutine in a new event loop and return its result,
+    like asyncio.run() in Python 3.7 and later.
+
+    """
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
 class CanToolsTesterTest(unittest.TestCase):
 
     def test_periodic_message_modify_signal_before_start(self):
@@ -220,6 +252,46 @@ class CanToolsTesterTest(unittest.TestCase):
 
         tester.stop()
 
+    def test_expect_input_buffers(self):
+        """Test that expected messages are found in their own input buffer,
+        and that other messages are neither searched nor decoded.
+
+        """
+
+        tester, can_bus = setup_tester('Node1')
+        message2 = tester.messages['Message2']
+        message2.decode = Mock(wraps=message2.decode)
+        tester.start()
+
+        # Lots of unrelated traffic before the expected message. The
+        # input buffers are bounded.
+        for _ in range(cantools.tester.INPUT_BUFFER_SIZE + 10):
+            can_bus.input_message(can.Message(arbitration_id=0x102,
+                                              data=b'\x00\x00\x00'))
+
+        can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x01\x02'))
+        message = tester.expect('Message1', discard_other_messages=False)
+        self.assertEqual(message, {'Signal1': 1, 'Signal2': 2})
+        self.assertEqual(message2.decode.call_count, 0)
+        self.assertEqual(len(tester._inputs._buffers['Message2']),
+                         cantools.tester.INPUT_BUFFER_SIZE)
+
+        # Message2 is decoded when expected.
+        message = tester.expect('Message2', timeout=0.0)
+        self.assertEqual(message, {'Signal1': 0, 'Signal2': 0, 'Signal3': 0})
+        self.assertEqual(message2.decode.call_count, 1)
+
+        # Message2 frames received before an expected Message1 are
+        # discarded.
+        can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x03\x04'))
+        message = tester.expect('Message1')
+        self.assertEqual(message, {'Signal1': 3, 'Signal2': 4})
+        message = tester.expect('Message2', timeout=0.0)
+        self.assertIsNone(message)
+        self.assertEqual(message2.decode.call_count, 1)
+
+        tester.stop()
+
     def test_send(self):
         """Test the send method.
 
@@ -353,5 +425,122 @@ class CanToolsTesterTest(unittest.TestCase):
         tester.stop()
 
 
+    def test_async_expect(self):
+        """Test the expect coroutine of the async tester.
+
+        """
+
+        async def main():
+            tester, can_bus = setup_async_tester('Node1')
+            await tester.start()
+
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x00\x00'))
+            can_bus.input_message(can.Message(arbitration_id=0x102, data=b'\x03\x00\x00'))
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x00\x01'))
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x02\x03'))
+
+            # Expect Message1 with Signal1 and Signal2 filtering. Other
+            # messages are not discarded.
+            message = await tester.expect('Message1', {'Signal1': 2, 'Signal2': 3})
+            self.assertEqual(message, {'Signal1': 2, 'Signal2': 3})
+            message = await tester.expect('Message2')
+            self.assertEqual(message, {'Signal1': 3, 'Signal2': 0, 'Signal3': 0})
+
+            # Timeouts.
+            message = await tester.expect('Message1', timeout=0.1)
+            self.assertIsNone(message)
+            message = await tester.expect('Message1', timeout=0.0)
+            self.assertIsNone(message)
+
+            # Expect with discard_other_messages set to False.
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x04\x00'))
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x05\x00'))
+            message = await tester.expect('Message1',
+                                          {'Signal1': 5},
+                                          discard_other_messages=False)
+            self.assertEqual(message, {'Signal1': 5, 'Signal2': 0})
+            message = await tester.expect('Message1', timeout=0.0)
+            self.assertEqual(message, {'Signal1': 4, 'Signal2': 0})
+
+            # Flush input.
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x06\x00'))
+            await asyncio.sleep(0.1)
+            tester.flush_input()
+            message = await tester.expect('Message1', timeout=0.0)
+            self.assertIsNone(message)
+
+            await tester.stop()
+
+        run_async(main())
+
+    def test_async_periodic_message(self):
+        """Test that periodic messages are sent by the async tester.
+
+        """
+
+        async def main():
+            loop = asyncio.get_event_loop()
+            tester, can_bus = setup_async_tester('Node2')
+
+            def wait_for_send():
+                return loop.run_in_executor(None, can_bus.wait_for_send, 10)
+
+            tester.messages['PeriodicMessage1']['Signal1'] = 3
+            await tester.start()
+            sent = [await wait_for_send()]
+
+            # Frames sent after the signal is set have the new value.
+            tester.messages['PeriodicMessage1']['Signal1'] = 4
+
+            while sent[-1].data != b'\x04\x00':
+                sent.append(await wait_for_send())
+
+            sent.append(await wait_for_send())
+            await tester.disable('PeriodicMessage1')
+            await tester.stop()
+
+            return sent
+
+        sent = run_async(main())
+
+        self.assertEqual([message.arbitration_id for message in sent],
+                         len(sent) * [1])
+        self.assertEqual([message.data for message in sent],
+                         (len(sent) - 2) * [b'\x03\x00'] + 2 * [b'\x04\x00'])
+
+    def test_async_subscribe(self):
+        """Test subscriptions and the on_message callback of the async
+        tester.
+
+        """
+
+        async def main():
+            received = []
+            tester, can_bus = setup_async_tester('Node1', received.append)
+            subscribed = []
+            tester.subscribe('Message1', subscribed.append)
+            await tester.disable('Message2')
+            await tester.start()
+
+            can_bus.input_message(can.Message(arbitration_id=0x7ff, data=b'\x00\x00'))
+            can_bus.input_message(can.Message(arbitration_id=0x102, data=b'\x00\x00\x00'))
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x01\x00'))
+            message = await tester.expect('Message1')
+            self.assertEqual(message, {'Signal1': 1, 'Signal2': 0})
+
+            tester.unsubscribe('Message1', subscribed.append)
+            can_bus.input_message(can.Message(arbitration_id=0x101, data=b'\x02\x00'))
+            message = await tester.expect('Message1')
+            self.assertEqual(message, {'Signal1': 2, 'Signal2': 0})
+            await tester.stop()
+
+            self.assertEqual([message.name for message in received],
+                             ['Message1', 'Message1'])
+            self.assertEqual([message.signals for message in subscribed],
+                             [{'Signal1': 1, 'Signal2': 0}])
+
+        run_async(main())
+
+
 if __name__ == '__main__':
     unittest.main()